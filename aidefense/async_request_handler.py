@@ -131,6 +131,7 @@ class AsyncRequestHandler(BaseRequestHandler):
         params: Dict = None,
         json_data: Dict = None,
         timeout: int = None,
+        data: bytes = None,
     ) -> Dict:
         """
         Make an HTTP request to the specified URL.
@@ -144,6 +145,8 @@ class AsyncRequestHandler(BaseRequestHandler):
             params (dict, optional): Query parameters.
             json_data (dict, optional): Request body as a JSON-serializable dictionary.
             timeout (int, optional): Request timeout in seconds.
+            data (bytes, optional): Pre-serialized JSON request body. Takes precedence
+                over json_data and is sent as-is, avoiding re-encoding.
 
         Returns:
             Dict: The JSON response from the API.
@@ -154,7 +157,7 @@ class AsyncRequestHandler(BaseRequestHandler):
             ApiError: For other API errors.
         """
         self.config.logger.debug(
-            f"request called | method: {method}, url: {url}, request_id: {request_id}, headers: {headers}, json_data: {json_data}"
+            f"request called | method: {method}, url: {url}, request_id: {request_id}, headers: {headers}, json_data: {json_data if data is None else data}"
         )
 
         if not self._session or self._session.closed:
@@ -180,14 +183,16 @@ class AsyncRequestHandler(BaseRequestHandler):
             if isinstance(timeout, int) and not isinstance(timeout, bool):
                 timeout_instance = aiohttp.ClientTimeout(total=timeout)
 
+            body_kwargs = {"json": json_data} if data is None else {"data": data}
+
             async with self._session.request(
                 method=method,
                 url=url,
                 middlewares=(auth,),
                 headers=request_headers,
                 params=params,
-                json=json_data,
                 timeout=timeout_instance,
+                **body_kwargs,
             ) as response:
                 if response.status >= 400:
                     return await self._handle_error_response(response, request_id)
@@ -16,19 +16,26 @@
 
 """Event management client for the AI Defense Management API."""
 
-from typing import Optional, Dict, Any
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Iterator, Tuple
 
 from .auth import ManagementAuth
 from .base_client import BaseClient
 from .models.event import (
     Event,
     Events,
+    EventMessage,
     EventMessages,
     ListEventsRequest,
 )
 from ..config import Config
 from .routes import EVENTS, event_by_id, event_conversation
 
+# Maximum number of events kept in the per-client get_event cache
+EVENT_CACHE_MAXSIZE = 1024
+
 
 class EventManagementClient(BaseClient):
     """
@@ -36,6 +43,10 @@ class EventManagementClient(BaseClient):
 
     Provides methods for retrieving events and event details
     in the AI Defense Management API.
+
+    Events are immutable once written, so results of ``get_event`` are kept
+    in a small per-client LRU cache. Each call returns a copy of the cached
+    event. Use ``invalidate_event`` to evict entries.
     """
 
     def __init__(
@@ -54,6 +65,8 @@ class EventManagementClient(BaseClient):
             request_handler: Request handler for making API requests (should be an instance of ManagementClient).
         """
         super().__init__(auth, config, request_handler)
+        self._event_cache: "OrderedDict[Tuple[str, Optional[bool]], Event]" = OrderedDict()
+        self._event_cache_lock = threading.Lock()
 
     def list_events(self, request: ListEventsRequest) -> Events:
         """
@@ -98,6 +111,95 @@ class EventManagementClient(BaseClient):
         )
         return events
 
+    def iter_events(
+        self,
+        request: Optional[ListEventsRequest] = None,
+        page_size: int = 100,
+        prefetch: bool = False,
+    ) -> Iterator[Event]:
+        """
+        Iterate over all events matching a request, fetching pages as needed.
+
+        The request body is serialized once; only ``offset`` is advanced
+        between pages. Iteration stops when a short page is returned or the
+        ``paging`` metadata reports that all events have been read.
+
+        When ``prefetch`` is enabled, the next page is requested on a
+        background thread while the current page is being consumed, so
+        network latency overlaps with the caller's processing. A caller that
+        stops early may then have triggered one extra page request. The
+        background thread is shut down when iteration finishes or the
+        iterator is closed.
+
+        Args:
+            request: Optional ListEventsRequest with the filters to apply. Its
+                ``limit`` is replaced by ``page_size`` and its ``offset`` is
+                used as the starting point. The request is not modified.
+            page_size (int): Number of events to fetch per page. Defaults to 100.
+            prefetch (bool): Fetch the next page concurrently. Defaults to False.
+
+        Yields:
+            Event: Each event across all pages.
+
+        Raises:
+            ValidationError, ApiError, SDKError
+
+        Example:
+            .. code-block:: python
+
+                request = ListEventsRequest(start_date=datetime(2025, 5, 1))
+                for event in client.events.iter_events(request, page_size=50):
+                    print(event.event_id)
+        """
+        if page_size <= 0:
+            raise ValueError("page_size must be a positive integer")
+
+        request = (
+            request.model_copy(update={"limit": page_size})
+            if request is not None
+            else ListEventsRequest(limit=page_size)
+        )
+        body = request.to_body_dict()
+        offset = body.get("offset") or 0
+        body["offset"] = offset
+
+        executor: Optional[ThreadPoolExecutor] = None
+        try:
+            response = self.make_request("POST", EVENTS, data=body)
+            while True:
+                events = self._parse_response(
+                    Events, response.get("events", {}), "list events response"
+                )
+                items = events.items
+                offset += len(items)
+                paging = events.paging
+                has_more = len(items) >= page_size and (
+                    paging is None or offset < paging.total
+                )
+
+                if not has_more:
+                    yield from items
+                    return
+
+                # The previous request has completed, so the shared body is free to reuse
+                body["offset"] = offset
+                if not prefetch:
+                    yield from items
+                    response = self.make_request("POST", EVENTS, data=body)
+                    continue
+
+                if executor is None:
+                    executor = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="aidefense-events-prefetch"
+                    )
+                future = executor.submit(self.make_request, "POST", EVENTS, data=body)
+                yield from items
+                response = future.result()
+        finally:
+            if executor is not None:
+                # Drops a pending page if iteration was abandoned before it started
+                executor.shutdown(wait=False, cancel_futures=True)
+
     def get_event(self, event_id: str, expanded: bool = None) -> Event:
         """
         Get an event by ID.
@@ -121,12 +223,41 @@ class EventManagementClient(BaseClient):
         """
         # Validate IDs
         self._ensure_uuid(event_id, "event_id")
+        key = (event_id, expanded)
+        with self._event_cache_lock:
+            event = self._event_cache.get(key)
+            if event is not None:
+                self._event_cache.move_to_end(key)
+                return event.model_copy(deep=True)
+
         params = {"expanded": expanded} if expanded is not None else None
         response = self.make_request("GET", event_by_id(event_id), params=params)
         event = self._parse_response(
             Event, response.get("event", {}), "get event response"
         )
-        return event
+
+        with self._event_cache_lock:
+            self._event_cache[key] = event
+            self._event_cache.move_to_end(key)
+            if len(self._event_cache) > EVENT_CACHE_MAXSIZE:
+                self._event_cache.popitem(last=False)
+        # Callers get their own copy so mutating it cannot alter the cached event
+        return event.model_copy(deep=True)
+
+    def invalidate_event(self, event_id: Optional[str] = None) -> None:
+        """
+        Evict cached results of ``get_event``.
+
+        Args:
+            event_id (str, optional): ID of the event to evict. If omitted,
+                the whole cache is cleared.
+        """
+        with self._event_cache_lock:
+            if event_id is None:
+                self._event_cache.clear()
+                return
+            for key in [k for k in self._event_cache if k[0] == event_id]:
+                del self._event_cache[key]
 
     def get_event_conversation(self, event_id: str) -> Dict[str, Any]:
         """
@@ -147,7 +278,7 @@ class EventManagementClient(BaseClient):
             .. code-block:: python
 
                 event_id = "456e4567-e89b-12d3-a456-426614174456"
-                result = client.events.get_event_conversation(event_id, expanded=True)
+                result = client.events.get_event_conversation(event_id)
                 print(f"Conversation ID: {result['event_conversation_id']}")
                 for message in result['messages'].items:
                     print(f"{message.direction}: {message.content}")
@@ -166,3 +297,34 @@ class EventManagementClient(BaseClient):
 
         # Return a dictionary with both the ID and messages
         return {"event_conversation_id": event_conversation_id, "messages": messages}
+
+    def iter_event_conversation(self, event_id: str) -> Iterator[EventMessage]:
+        """
+        Iterate over the messages of an event conversation, parsing lazily.
+
+        Each message is validated only when it is reached, so callers that stop
+        early (e.g. to show a preview) do not pay for parsing the whole
+        conversation.
+
+        Args:
+            event_id (str): ID of the event
+
+        Yields:
+            EventMessage: Each message in the conversation.
+
+        Raises:
+            ValidationError, ApiError, SDKError
+
+        Example:
+            .. code-block:: python
+
+                event_id = "456e4567-e89b-12d3-a456-426614174456"
+                for message in client.events.iter_event_conversation(event_id):
+                    print(f"{message.direction}: {message.content}")
+        """
+        response = self.make_request("GET", event_conversation(event_id))
+        messages = response.get("messages") or {}
+        for item in messages.get("items") or ():
+            yield self._parse_response(
+                EventMessage, item, "get event conversation response"
+            )
@@ -16,7 +16,6 @@
 
 """SDK-wide base Pydantic model utilities."""
 
-import json
 import warnings
 from datetime import datetime
 from pydantic import BaseModel, ConfigDict, field_serializer
@@ -61,9 +60,11 @@ class AIDefenseModel(BaseModel):
         Args:
             patch: If True, exclude fields that were not explicitly set (PATCH semantics)
         """
-        # Use JSON round-trip so datetimes and other complex types are encoded
-        # the same way as when sending an actual JSON payload.
-        return json.loads(self.to_body_json(patch=patch))
+        # JSON-mode dump encodes datetimes and other complex types the same way
+        # as to_body_json, without serializing to a string and parsing it back.
+        return self.model_dump(
+            mode="json", by_alias=True, exclude_none=True, exclude_unset=patch
+        )
 
     def to_body_json(self, *, patch: bool = False) -> str:
         """Serialize this model to a JSON string for request bodies."""
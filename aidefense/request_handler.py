@@ -182,6 +182,7 @@ class RequestHandler(BaseRequestHandler):
         params: Dict = None,
         json_data: Dict = None,
         timeout: int = None,
+        data: bytes = None,
     ) -> Dict:
         """
         Make an HTTP request to the specified URL.
@@ -195,6 +196,8 @@ class RequestHandler(BaseRequestHandler):
             params (dict, optional): Query parameters.
             json_data (dict, optional): Request body as a JSON-serializable dictionary.
             timeout (int, optional): Request timeout in seconds.
+            data (bytes, optional): Pre-serialized JSON request body. Takes precedence
+                over json_data and is sent as-is, avoiding re-encoding.
 
         Returns:
             Dict: The JSON response from the API.
@@ -205,7 +208,7 @@ class RequestHandler(BaseRequestHandler):
             ApiError: For other API errors.
         """
         self.config.logger.debug(
-            f"request called | method: {method}, url: {url}, request_id: {request_id}, headers: {headers}, json_data: {json_data}"
+            f"request called | method: {method}, url: {url}, request_id: {request_id}, headers: {headers}, json_data: {json_data if data is None else data}"
         )
         try:
             self._validate_method(method)
@@ -220,13 +223,15 @@ class RequestHandler(BaseRequestHandler):
             request_id = request_id or self.get_request_id()
             request_headers[self.REQUEST_ID_HEADER] = request_id
 
+            body_kwargs = {"json": json_data} if data is None else {"data": data}
+
             if auth:
                 request = requests.Request(
                     method=method,
                     url=url,
                     headers=request_headers,
                     params=params,
-                    json=json_data,
+                    **body_kwargs,
                 )
                 prepared_request = auth(request.prepare())
                 request_headers.update(prepared_request.headers)
@@ -236,8 +241,8 @@ class RequestHandler(BaseRequestHandler):
                 url=url,
                 headers=request_headers,
                 params=params,
-                json=json_data,
                 timeout=timeout or self.config.timeout,
+                **body_kwargs,
             )
 
             if response.status_code >= 400:
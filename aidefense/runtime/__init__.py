@@ -33,6 +33,7 @@ __all__ = [
     "ChatInspectRequest",
     # mcp_inspect
     "MCPInspectionClient",
+    "AsyncMCPInspectionClient",
     # models
     "Action",
     "Rule",
@@ -78,6 +79,7 @@ def __getattr__(name: str) -> Any:
         "Role": ("aidefense.runtime.chat_inspect", "Role"),
         "ChatInspectRequest": ("aidefense.runtime.chat_inspect", "ChatInspectRequest"),
         "MCPInspectionClient": ("aidefense.runtime.mcp_inspect", "MCPInspectionClient"),
+        "AsyncMCPInspectionClient": ("aidefense.runtime.mcp_inspect", "AsyncMCPInspectionClient"),
         "Action": ("aidefense.runtime.models", "Action"),
         "Rule": ("aidefense.runtime.models", "Rule"),
         "Classification": ("aidefense.runtime.models", "Classification"),
@@ -149,6 +149,7 @@ def protect(
     api_mode_mcp_api_key: Optional[str] = None,  # AI_DEFENSE_API_MODE_MCP_API_KEY
     api_mode_fail_open_llm: Optional[bool] = None,  # AGENTSEC_API_MODE_FAIL_OPEN_LLM
     api_mode_fail_open_mcp: Optional[bool] = None,  # AGENTSEC_API_MODE_FAIL_OPEN_MCP
+    api_mode_speculative_llm: Optional[bool] = None,  # AGENTSEC_API_MODE_SPECULATIVE_LLM
     api_mode_llm_rules: Optional[List[Any]] = None,  # AGENTSEC_LLM_RULES
     api_mode_llm_entity_types: Optional[List[str]] = None,  # AGENTSEC_LLM_ENTITY_TYPES (new)
     # Gateway mode configuration
@@ -241,6 +242,11 @@ def protect(
             If None, reads from AGENTSEC_API_MODE_FAIL_OPEN_LLM env var (default: True)
         api_mode_fail_open_mcp: Allow MCP calls on API errors
             If None, reads from AGENTSEC_API_MODE_FAIL_OPEN_MCP env var (default: True)
+        api_mode_speculative_llm: Start LLM calls while request inspection is still running
+            (async calls are cancelled if inspection fails closed). Only used outside enforce
+            mode, since a prompt already sent cannot be recalled. Hides inspection latency,
+            but the prompt reaches the provider before inspection completes.
+            If None, reads from AGENTSEC_API_MODE_SPECULATIVE_LLM env var (default: False)
         api_mode_llm_rules: Rules to enable for LLM inspection (e.g., ["jailbreak", "prompt_injection"])
             If None, reads from AGENTSEC_LLM_RULES env var (JSON array or comma-separated)
         api_mode_llm_entity_types: Entity types to filter for (e.g., ["EMAIL", "PHONE_NUMBER"])
@@ -325,6 +331,7 @@ def protect(
             api_mode_mcp_api_key=api_mode_mcp_api_key,
             api_mode_fail_open_llm=api_mode_fail_open_llm,
             api_mode_fail_open_mcp=api_mode_fail_open_mcp,
+            api_mode_speculative_llm=api_mode_speculative_llm,
             api_mode_llm_rules=api_mode_llm_rules,
             api_mode_llm_entity_types=api_mode_llm_entity_types,
             gateway_mode_llm=gateway_mode_llm,
@@ -359,6 +366,7 @@ def _protect_impl(
     api_mode_mcp_api_key: Optional[str],
     api_mode_fail_open_llm: Optional[bool],
     api_mode_fail_open_mcp: Optional[bool],
+    api_mode_speculative_llm: Optional[bool],
     api_mode_llm_rules: Optional[List[Any]],
     api_mode_llm_entity_types: Optional[List[str]],
     gateway_mode_llm: Optional[str],
@@ -433,6 +441,8 @@ def _protect_impl(
         api_mode_fail_open_llm = env_config.get("llm_fail_open", True)
     if api_mode_fail_open_mcp is None:
         api_mode_fail_open_mcp = env_config.get("mcp_fail_open", True)
+    if api_mode_speculative_llm is None:
+        api_mode_speculative_llm = env_config.get("llm_speculative", False)
     
     # Step 5: Get gateway mode settings from parameters or env config
     if gateway_mode_llm is None:
@@ -584,6 +594,7 @@ def _protect_impl(
         api_mode_mcp_api_key=api_mode_mcp_api_key,
         api_mode_fail_open_llm=api_mode_fail_open_llm,
         api_mode_fail_open_mcp=api_mode_fail_open_mcp,
+        api_mode_speculative_llm=api_mode_speculative_llm,
         gateway_mode_llm=gateway_mode_llm,
         gateway_mode_mcp=gateway_mode_mcp,
         gateway_mode_mcp_url=gateway_mode_mcp_url,
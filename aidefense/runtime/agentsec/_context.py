@@ -63,6 +63,29 @@ def get_inspection_context() -> InspectionContext:
     )
 
 
+def get_inspection_metadata() -> Dict[str, Any]:
+    """
+    Get the current request metadata.
+    
+    Cheaper than get_inspection_context().metadata on hot paths, as it
+    reads a single context variable.
+    
+    Returns:
+        Metadata dict for the current request
+    """
+    return _inspection_metadata.get()
+
+
+def is_inspection_done() -> bool:
+    """
+    Check if inspection has already completed for the current request.
+    
+    Returns:
+        True if inspection is done, False otherwise
+    """
+    return _inspection_done.get()
+
+
 def set_inspection_context(
     metadata: Optional[Dict[str, Any]] = None,
     decision: Optional[Decision] = None,
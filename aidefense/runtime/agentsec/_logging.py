@@ -19,15 +19,43 @@
 import json
 import logging
 import os
+import time
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
+from ._redaction import RedactingFormatter
+
+_LOGGER_NAME = "aidefense.runtime.agentsec"
+
+# Cached default agentsec logger (resolved once from the logging manager)
+_default_logger: Optional[logging.Logger] = None
+
 # Module-level storage for custom logger
 _custom_logger_instance: Optional[logging.Logger] = None
 
 # Track file handlers for cleanup
 _file_handlers: list = []
 
+# Bound once so the formatter hot path avoids repeated attribute lookups
+_UTC = timezone.utc
+
+# Most recent (microsecond, ISO timestamp) pair; stored as one tuple so that
+# concurrent formatters never observe a mismatched pair
+_last_timestamp: tuple = (0, "")
+
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time in ISO format, reusing it within the same microsecond."""
+    global _last_timestamp
+    micros = time.time_ns() // 1000
+    cached_micros, cached_str = _last_timestamp
+    if micros == cached_micros:
+        return cached_str
+    seconds, fraction = divmod(micros, 1_000_000)
+    ts = datetime.fromtimestamp(seconds, _UTC).replace(microsecond=fraction).isoformat()
+    _last_timestamp = (micros, ts)
+    return ts
+
 
 def _set_custom_logger(logger: logging.Logger) -> None:
     """Set a custom logger instance for agentsec to use."""
@@ -40,6 +68,14 @@ def _get_custom_logger() -> Optional[logging.Logger]:
     return _custom_logger_instance
 
 
+def _get_default_logger() -> logging.Logger:
+    """Return the default agentsec logger, looking it up only once."""
+    global _default_logger
+    if _default_logger is None:
+        _default_logger = logging.getLogger(_LOGGER_NAME)
+    return _default_logger
+
+
 def _clear_custom_logger() -> None:
     """Clear the custom logger instance. Useful for testing."""
     global _custom_logger_instance
@@ -52,15 +88,16 @@ class JSONFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
         log_data: Dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _utc_timestamp(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
         
         # Add extra fields if present
-        if hasattr(record, "extra_fields") and record.extra_fields:
-            log_data.update(record.extra_fields)
+        extra_fields = getattr(record, "extra_fields", None)
+        if extra_fields:
+            log_data.update(extra_fields)
         
         # Add exception info if present
         if record.exc_info:
@@ -74,18 +111,20 @@ class TextFormatter(logging.Formatter):
     
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as text with optional extras."""
-        base = f"[{record.name}] {record.levelname}: {record.getMessage()}"
+        parts = ["[", record.name, "] ", record.levelname, ": ", record.getMessage()]
         
         # Add extra fields if present
-        if hasattr(record, "extra_fields") and record.extra_fields:
-            extras = " ".join(f"{k}={v}" for k, v in record.extra_fields.items())
-            base = f"{base} {extras}"
+        extra_fields = getattr(record, "extra_fields", None)
+        if extra_fields:
+            parts.append(" ")
+            parts.append(" ".join([f"{k}={v}" for k, v in extra_fields.items()]))
         
         # Add exception info if present
         if record.exc_info:
-            base = f"{base}\n{self.formatException(record.exc_info)}"
+            parts.append("\n")
+            parts.append(self.formatException(record.exc_info))
         
-        return base
+        return "".join(parts)
 
 
 def setup_logging(
@@ -124,7 +163,7 @@ def setup_logging(
         _set_custom_logger(custom_logger)
         return custom_logger
     
-    logger = logging.getLogger("aidefense.runtime.agentsec")
+    logger = _get_default_logger()
     
     # Avoid duplicate handlers on repeated calls
     if logger.handlers:
@@ -152,7 +191,6 @@ def setup_logging(
     # Apply redaction wrapper if enabled
     formatter: logging.Formatter
     if redact:
-        from ._redaction import RedactingFormatter
         formatter = RedactingFormatter(base_formatter)
     else:
         formatter = base_formatter
@@ -188,11 +226,11 @@ def get_logger() -> logging.Logger:
         The configured logger instance.
     """
     # Return custom logger if one is set
-    custom = _get_custom_logger()
+    custom = _custom_logger_instance
     if custom is not None:
         return custom
     
-    logger = logging.getLogger("aidefense.runtime.agentsec")
+    logger = _get_default_logger()
     if not logger.handlers:
         setup_logging()
     return logger
@@ -234,7 +272,7 @@ def cleanup_logging() -> None:
     """
     global _file_handlers
     
-    logger = logging.getLogger("aidefense.runtime.agentsec")
+    logger = _get_default_logger()
     
     for handler in _file_handlers:
         try:
@@ -0,0 +1,154 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Per-event-loop async resources (HTTP clients, sessions) with cleanup."""
+
+import asyncio
+import logging
+import threading
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Generic, Hashable, Tuple, TypeVar
+
+logger = logging.getLogger("aidefense.runtime.agentsec")
+
+T = TypeVar("T")
+
+# How long close_all() waits for a resource owned by a loop running in another thread
+_CROSS_THREAD_CLOSE_TIMEOUT = 2.0
+
+
+class LoopResources(Generic[T]):
+    """
+    Holds one async resource per event loop and closes it with its loop.
+
+    Async clients are bound to the loop they were created on, so each loop
+    gets its own instance instead of loops replacing each other's client.
+    When a loop is shut down through ``asyncio.run`` (or
+    ``loop.shutdown_asyncgens()``), its resource is closed on that loop while
+    it is still usable. ``close_all()`` releases whatever remains, e.g. from
+    a sync ``close()`` or at interpreter exit.
+
+    Args:
+        create: Coroutine function building the resource for the running loop.
+        close: Coroutine function releasing a resource.
+    """
+
+    def __init__(
+        self,
+        create: Callable[[], Awaitable[T]],
+        close: Callable[[T], Awaitable[None]],
+    ) -> None:
+        self._create = create
+        self._close = close
+        # loop -> (resource, key, shutdown guard); the thread lock is never held across an await
+        self._entries: Dict[asyncio.AbstractEventLoop, Tuple[T, Hashable, Any]] = {}
+        self._lock = threading.Lock()
+
+    async def get(self, key: Hashable = None) -> T:
+        """
+        Return the running loop's resource, creating it on first use.
+
+        Args:
+            key: Settings the resource was built with. A resource created with a
+                different key is closed and replaced.
+        """
+        loop = asyncio.get_running_loop()
+        entry = self._entries.get(loop)
+        if entry is not None and entry[1] == key:
+            return entry[0]
+
+        resource = await self._create()
+        stale = []
+        with self._lock:
+            # Loops closed without shutting down their async generators never
+            # finalized their guard; close those resources here (best effort)
+            for dead in [other for other in self._entries if other.is_closed()]:
+                stale.append(self._entries.pop(dead))
+            entry = self._entries.get(loop)
+            if entry is not None and entry[1] == key:
+                # Another task on this loop created one first
+                stale.append((resource, key, None))
+                resource = entry[0]
+                guard = None
+            else:
+                if entry is not None:
+                    stale.append(entry)
+                guard = self._shutdown_guard(loop, resource)
+                self._entries[loop] = (resource, key, guard)
+        if guard is not None:
+            # Runs up to the yield, registering the guard with the loop's async generators
+            await guard.__anext__()
+        for old in stale:
+            await self._release(old)
+        return resource
+
+    async def aclose(self) -> None:
+        """Close the running loop's resource, if any."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entry = self._entries.pop(loop, None)
+        if entry is not None:
+            await self._release(entry)
+
+    def close_all(self) -> None:
+        """Close every loop's resource from synchronous code (best effort)."""
+        with self._lock:
+            entries = list(self._entries.items())
+            self._entries.clear()
+        try:
+            current = asyncio.get_running_loop()
+        except RuntimeError:
+            current = None
+        for loop, entry in entries:
+            if loop.is_closed():
+                continue
+            coro = self._release(entry)
+            try:
+                if loop is current:
+                    loop.create_task(coro)
+                elif loop.is_running():
+                    asyncio.run_coroutine_threadsafe(coro, loop).result(_CROSS_THREAD_CLOSE_TIMEOUT)
+                else:
+                    loop.run_until_complete(coro)
+            except Exception as e:
+                coro.close()
+                logger.debug("Error closing async resource: %s", e)
+
+    async def _shutdown_guard(self, loop: asyncio.AbstractEventLoop, resource: T) -> AsyncIterator[None]:
+        """Async generator whose finalization at loop shutdown closes the resource."""
+        try:
+            yield
+        finally:
+            with self._lock:
+                entry = self._entries.get(loop)
+                owned = entry is not None and entry[0] is resource
+                if owned:
+                    del self._entries[loop]
+            if owned:
+                await self._safe_close(resource)
+
+    async def _release(self, entry: Tuple[T, Hashable, Any]) -> None:
+        """Close an entry's resource and finish its shutdown guard."""
+        resource, _key, guard = entry
+        await self._safe_close(resource)
+        if guard is not None:
+            # The guard no longer owns the resource, so this only finalizes it
+            await guard.aclose()
+
+    async def _safe_close(self, resource: T) -> None:
+        try:
+            await self._close(resource)
+        except Exception as e:
+            logger.debug("Error closing async resource: %s", e)
@@ -1,7 +1,8 @@
 """Global state management for agentsec."""
 
 import threading
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Union
 
 
 # Thread lock for state mutations
@@ -11,9 +12,40 @@ _state_lock = threading.Lock()
 SUPPORTED_PROVIDERS = ["openai", "azure_openai", "vertexai", "bedrock", "google_genai", "cohere", "mistral"]
 
 # Valid configuration values
-VALID_API_MODES = {"off", "monitor", "enforce"}
-VALID_INTEGRATION_MODES = {"api", "gateway"}
-VALID_GATEWAY_MODES = {"off", "on"}
+VALID_API_MODES = frozenset(("off", "monitor", "enforce"))
+VALID_INTEGRATION_MODES = frozenset(("api", "gateway"))
+VALID_GATEWAY_MODES = frozenset(("off", "on"))
+
+# Pre-rendered choices for validation error messages
+_VALID_API_MODES_MSG = ", ".join(sorted(VALID_API_MODES))
+_VALID_INTEGRATION_MODES_MSG = ", ".join(sorted(VALID_INTEGRATION_MODES))
+_VALID_GATEWAY_MODES_MSG = ", ".join(sorted(VALID_GATEWAY_MODES))
+
+
+@dataclass(frozen=True, slots=True)
+class ProviderConfig:
+    """Resolved, read-only URL and API key for a single provider."""
+
+    url: Optional[str] = None
+    api_key: Optional[str] = None
+
+
+_EMPTY_PROVIDER_CONFIG = ProviderConfig()
+
+
+def _to_provider_config(config: Union[ProviderConfig, Mapping[str, Optional[str]], None]) -> ProviderConfig:
+    """Convert a {url, api_key} mapping into a ProviderConfig."""
+    if isinstance(config, ProviderConfig):
+        return config
+    if not config:
+        return _EMPTY_PROVIDER_CONFIG
+    return ProviderConfig(url=config.get("url"), api_key=config.get("api_key"))
+
+
+def _default_provider_configs() -> Dict[str, ProviderConfig]:
+    """Build an unconfigured entry for every supported provider."""
+    return dict.fromkeys(SUPPORTED_PROVIDERS, _EMPTY_PROVIDER_CONFIG)
+
 
 # Global state
 _initialized: bool = False
@@ -59,6 +91,12 @@ _api_mode_mcp_endpoint: Optional[str] = None
 _api_mode_mcp_api_key: Optional[str] = None
 _api_mode_fail_open_llm: bool = True
 _api_mode_fail_open_mcp: bool = True
+_api_mode_speculative_llm: bool = False  # Overlap pre-call inspection with the LLM call
+
+# Precomputed "mode is not off" flags, refreshed whenever the modes are written,
+# so per-call checks are a single global read instead of a string compare
+_llm_inspection_enabled: bool = True
+_mcp_inspection_enabled: bool = True
 
 # Gateway mode configuration (general)
 _gateway_mode_llm: str = "on"  # off/on
@@ -70,26 +108,10 @@ _gateway_mode_fail_open_mcp: bool = True
 
 # Provider-specific gateway configuration
 # Each provider has its own gateway URL and API key
-_provider_gateway_config: Dict[str, Dict[str, Optional[str]]] = {
-    "openai": {"url": None, "api_key": None},
-    "azure_openai": {"url": None, "api_key": None},
-    "vertexai": {"url": None, "api_key": None},
-    "bedrock": {"url": None, "api_key": None},
-    "google_genai": {"url": None, "api_key": None},
-    "cohere": {"url": None, "api_key": None},
-    "mistral": {"url": None, "api_key": None},
-}
+_provider_gateway_config: Dict[str, ProviderConfig] = _default_provider_configs()
 
 # Provider-specific API configuration (for direct calls in API mode)
-_provider_api_config: Dict[str, Dict[str, Optional[str]]] = {
-    "openai": {"url": None, "api_key": None},
-    "azure_openai": {"url": None, "api_key": None},
-    "vertexai": {"url": None, "api_key": None},
-    "bedrock": {"url": None, "api_key": None},
-    "google_genai": {"url": None, "api_key": None},
-    "cohere": {"url": None, "api_key": None},
-    "mistral": {"url": None, "api_key": None},
-}
+_provider_api_config: Dict[str, ProviderConfig] = _default_provider_configs()
 
 
 def is_initialized() -> bool:
@@ -194,6 +216,16 @@ def get_api_mode_mcp() -> Optional[str]:
     return _api_mode_mcp
 
 
+def is_llm_inspection_enabled() -> bool:
+    """Check whether LLM API mode inspection is enabled (mode is not 'off')."""
+    return _llm_inspection_enabled
+
+
+def is_mcp_inspection_enabled() -> bool:
+    """Check whether MCP API mode inspection is enabled (mode is not 'off')."""
+    return _mcp_inspection_enabled
+
+
 def get_api_mode_llm_endpoint() -> Optional[str]:
     """Get the LLM API endpoint."""
     return _api_mode_llm_endpoint
@@ -224,6 +256,11 @@ def get_api_mode_fail_open_mcp() -> bool:
     return _api_mode_fail_open_mcp
 
 
+def get_api_mode_speculative_llm() -> bool:
+    """Get the LLM API mode speculative inspection setting."""
+    return _api_mode_speculative_llm
+
+
 # Gateway mode getters
 def get_gateway_mode_llm() -> str:
     """Get the current LLM gateway mode ('off' or 'on')."""
@@ -266,7 +303,7 @@ def get_provider_gateway_url(provider: str) -> Optional[str]:
     Returns:
         Gateway URL or None if not configured
     """
-    return _provider_gateway_config.get(provider, {}).get("url")
+    return _provider_gateway_config.get(provider, _EMPTY_PROVIDER_CONFIG).url
 
 
 def get_provider_gateway_api_key(provider: str) -> Optional[str]:
@@ -279,7 +316,20 @@ def get_provider_gateway_api_key(provider: str) -> Optional[str]:
     Returns:
         Gateway API key or None if not configured
     """
-    return _provider_gateway_config.get(provider, {}).get("api_key")
+    return _provider_gateway_config.get(provider, _EMPTY_PROVIDER_CONFIG).api_key
+
+
+def get_provider_gateway_config(provider: str) -> ProviderConfig:
+    """
+    Get the gateway URL and API key for a specific provider in one lookup.
+    
+    Args:
+        provider: Provider name (e.g. openai, azure_openai, vertexai, bedrock, google_genai, cohere)
+        
+    Returns:
+        ProviderConfig snapshot (url/api_key are None if not configured)
+    """
+    return _provider_gateway_config.get(provider, _EMPTY_PROVIDER_CONFIG)
 
 
 def get_provider_api_url(provider: str) -> Optional[str]:
@@ -292,7 +342,7 @@ def get_provider_api_url(provider: str) -> Optional[str]:
     Returns:
         API URL or None if not configured
     """
-    return _provider_api_config.get(provider, {}).get("url")
+    return _provider_api_config.get(provider, _EMPTY_PROVIDER_CONFIG).url
 
 
 def get_provider_api_key(provider: str) -> Optional[str]:
@@ -305,7 +355,7 @@ def get_provider_api_key(provider: str) -> Optional[str]:
     Returns:
         API key or None if not configured
     """
-    return _provider_api_config.get(provider, {}).get("api_key")
+    return _provider_api_config.get(provider, _EMPTY_PROVIDER_CONFIG).api_key
 
 
 def set_provider_gateway_config(provider: str, url: Optional[str], api_key: Optional[str]) -> None:
@@ -318,7 +368,7 @@ def set_provider_gateway_config(provider: str, url: Optional[str], api_key: Opti
         api_key: Gateway API key
     """
     if provider in _provider_gateway_config:
-        _provider_gateway_config[provider] = {"url": url, "api_key": api_key}
+        _provider_gateway_config[provider] = ProviderConfig(url=url, api_key=api_key)
 
 
 def set_provider_api_config(provider: str, url: Optional[str], api_key: Optional[str]) -> None:
@@ -331,7 +381,7 @@ def set_provider_api_config(provider: str, url: Optional[str], api_key: Optional
         api_key: API key
     """
     if provider in _provider_api_config:
-        _provider_api_config[provider] = {"url": url, "api_key": api_key}
+        _provider_api_config[provider] = ProviderConfig(url=url, api_key=api_key)
 
 
 # Legacy getters (aliases for backward compatibility)
@@ -413,6 +463,7 @@ def set_state(
     api_mode_mcp_api_key: Optional[str] = None,
     api_mode_fail_open_llm: bool = True,
     api_mode_fail_open_mcp: bool = True,
+    api_mode_speculative_llm: bool = False,
     # Gateway mode configuration
     gateway_mode_llm: str = "on",
     gateway_mode_mcp: str = "on",
@@ -459,6 +510,7 @@ def set_state(
         api_mode_mcp_api_key: API key for MCP inspection
         api_mode_fail_open_llm: Allow LLM requests on API errors
         api_mode_fail_open_mcp: Allow MCP calls on API errors
+        api_mode_speculative_llm: Start LLM calls while request inspection runs
         gateway_mode_llm: Mode for LLM in gateway mode (off/on)
         gateway_mode_mcp: Mode for MCP in gateway mode (off/on)
         gateway_mode_mcp_url: Gateway URL for MCP calls
@@ -487,22 +539,22 @@ def set_state(
     
     # Input validation
     if api_mode_llm is not None and api_mode_llm not in VALID_API_MODES:
-        raise ConfigurationError(f"Invalid api_mode_llm: '{api_mode_llm}'. Must be one of: {', '.join(VALID_API_MODES)}")
+        raise ConfigurationError(f"Invalid api_mode_llm: '{api_mode_llm}'. Must be one of: {_VALID_API_MODES_MSG}")
     
     if api_mode_mcp is not None and api_mode_mcp not in VALID_API_MODES:
-        raise ConfigurationError(f"Invalid api_mode_mcp: '{api_mode_mcp}'. Must be one of: {', '.join(VALID_API_MODES)}")
+        raise ConfigurationError(f"Invalid api_mode_mcp: '{api_mode_mcp}'. Must be one of: {_VALID_API_MODES_MSG}")
     
     if llm_integration_mode not in VALID_INTEGRATION_MODES:
-        raise ConfigurationError(f"Invalid llm_integration_mode: '{llm_integration_mode}'. Must be one of: {', '.join(VALID_INTEGRATION_MODES)}")
+        raise ConfigurationError(f"Invalid llm_integration_mode: '{llm_integration_mode}'. Must be one of: {_VALID_INTEGRATION_MODES_MSG}")
     
     if mcp_integration_mode not in VALID_INTEGRATION_MODES:
-        raise ConfigurationError(f"Invalid mcp_integration_mode: '{mcp_integration_mode}'. Must be one of: {', '.join(VALID_INTEGRATION_MODES)}")
+        raise ConfigurationError(f"Invalid mcp_integration_mode: '{mcp_integration_mode}'. Must be one of: {_VALID_INTEGRATION_MODES_MSG}")
     
     if gateway_mode_llm not in VALID_GATEWAY_MODES:
-        raise ConfigurationError(f"Invalid gateway_mode_llm: '{gateway_mode_llm}'. Must be one of: {', '.join(VALID_GATEWAY_MODES)}")
+        raise ConfigurationError(f"Invalid gateway_mode_llm: '{gateway_mode_llm}'. Must be one of: {_VALID_GATEWAY_MODES_MSG}")
     
     if gateway_mode_mcp not in VALID_GATEWAY_MODES:
-        raise ConfigurationError(f"Invalid gateway_mode_mcp: '{gateway_mode_mcp}'. Must be one of: {', '.join(VALID_GATEWAY_MODES)}")
+        raise ConfigurationError(f"Invalid gateway_mode_mcp: '{gateway_mode_mcp}'. Must be one of: {_VALID_GATEWAY_MODES_MSG}")
     
     # Validate provider configuration keys
     if provider_gateway_config:
@@ -534,9 +586,10 @@ def set_state(
     global _initialized, _llm_rules, _llm_entity_types
     global _llm_integration_mode, _mcp_integration_mode
     global _api_mode_llm, _api_mode_mcp
+    global _llm_inspection_enabled, _mcp_inspection_enabled
     global _api_mode_llm_endpoint, _api_mode_llm_api_key
     global _api_mode_mcp_endpoint, _api_mode_mcp_api_key
-    global _api_mode_fail_open_llm, _api_mode_fail_open_mcp
+    global _api_mode_fail_open_llm, _api_mode_fail_open_mcp, _api_mode_speculative_llm
     global _gateway_mode_llm, _gateway_mode_mcp
     global _gateway_mode_mcp_url, _gateway_mode_mcp_api_key
     global _gateway_mode_fail_open_llm, _gateway_mode_fail_open_mcp
@@ -555,12 +608,15 @@ def set_state(
         _mcp_integration_mode = mcp_integration_mode
         _api_mode_llm = api_mode_llm
         _api_mode_mcp = api_mode_mcp
+        _llm_inspection_enabled = api_mode_llm != "off"
+        _mcp_inspection_enabled = api_mode_mcp != "off"
         _api_mode_llm_endpoint = api_mode_llm_endpoint
         _api_mode_llm_api_key = api_mode_llm_api_key
         _api_mode_mcp_endpoint = api_mode_mcp_endpoint
         _api_mode_mcp_api_key = api_mode_mcp_api_key
         _api_mode_fail_open_llm = api_mode_fail_open_llm
         _api_mode_fail_open_mcp = api_mode_fail_open_mcp
+        _api_mode_speculative_llm = api_mode_speculative_llm
         _gateway_mode_llm = gateway_mode_llm
         _gateway_mode_mcp = gateway_mode_mcp
         _gateway_mode_mcp_url = gateway_mode_mcp_url
@@ -586,12 +642,12 @@ def set_state(
         if provider_gateway_config:
             for provider, config in provider_gateway_config.items():
                 if provider in _provider_gateway_config:
-                    _provider_gateway_config[provider] = config
+                    _provider_gateway_config[provider] = _to_provider_config(config)
         
         if provider_api_config:
             for provider, config in provider_api_config.items():
                 if provider in _provider_api_config:
-                    _provider_api_config[provider] = config
+                    _provider_api_config[provider] = _to_provider_config(config)
 
 
 def reset() -> None:
@@ -599,9 +655,10 @@ def reset() -> None:
     global _initialized, _llm_rules, _llm_entity_types
     global _llm_integration_mode, _mcp_integration_mode
     global _api_mode_llm, _api_mode_mcp
+    global _llm_inspection_enabled, _mcp_inspection_enabled
     global _api_mode_llm_endpoint, _api_mode_llm_api_key
     global _api_mode_mcp_endpoint, _api_mode_mcp_api_key
-    global _api_mode_fail_open_llm, _api_mode_fail_open_mcp
+    global _api_mode_fail_open_llm, _api_mode_fail_open_mcp, _api_mode_speculative_llm
     global _gateway_mode_llm, _gateway_mode_mcp
     global _gateway_mode_mcp_url, _gateway_mode_mcp_api_key
     global _gateway_mode_fail_open_llm, _gateway_mode_fail_open_mcp
@@ -620,12 +677,15 @@ def reset() -> None:
         _mcp_integration_mode = "api"
         _api_mode_llm = None
         _api_mode_mcp = None
+        _llm_inspection_enabled = True
+        _mcp_inspection_enabled = True
         _api_mode_llm_endpoint = None
         _api_mode_llm_api_key = None
         _api_mode_mcp_endpoint = None
         _api_mode_mcp_api_key = None
         _api_mode_fail_open_llm = True
         _api_mode_fail_open_mcp = True
+        _api_mode_speculative_llm = False
         _gateway_mode_llm = "on"
         _gateway_mode_mcp = "on"
         _gateway_mode_mcp_url = None
@@ -648,17 +708,5 @@ def reset() -> None:
         _custom_logger = None
         
         # Reset provider-specific configs
-        _provider_gateway_config = {
-            "openai": {"url": None, "api_key": None},
-            "azure_openai": {"url": None, "api_key": None},
-            "vertexai": {"url": None, "api_key": None},
-            "bedrock": {"url": None, "api_key": None},
-            "google_genai": {"url": None, "api_key": None},
-        }
-        _provider_api_config = {
-            "openai": {"url": None, "api_key": None},
-            "azure_openai": {"url": None, "api_key": None},
-            "vertexai": {"url": None, "api_key": None},
-            "bedrock": {"url": None, "api_key": None},
-            "google_genai": {"url": None, "api_key": None},
-        }
+        _provider_gateway_config = _default_provider_configs()
+        _provider_api_config = _default_provider_configs()
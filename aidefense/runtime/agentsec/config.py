@@ -235,6 +235,7 @@ def load_env_config() -> Dict[str, Any]:
         AGENTSEC_API_MODE_MCP: Mode for MCP tool inspection in API mode (off/monitor/enforce)
         AGENTSEC_API_MODE_FAIL_OPEN_LLM: Allow LLM requests on API errors (true/false)
         AGENTSEC_API_MODE_FAIL_OPEN_MCP: Allow MCP calls on API errors (true/false)
+        AGENTSEC_API_MODE_SPECULATIVE_LLM: Start LLM calls while request inspection runs (true/false)
         AI_DEFENSE_API_MODE_LLM_API_KEY: API key for Cisco AI Defense (used for LLM and MCP if specific not set)
         AI_DEFENSE_API_MODE_LLM_ENDPOINT: API endpoint for Cisco AI Defense (used for LLM and MCP if specific not set)
         AI_DEFENSE_API_MODE_MCP_API_KEY: API key specifically for MCP inspection (overrides AI_DEFENSE_API_MODE_LLM_API_KEY)
@@ -308,6 +309,7 @@ def load_env_config() -> Dict[str, Any]:
         "mcp_mode": os.environ.get("AGENTSEC_API_MODE_MCP"),  # off/monitor/enforce
         "llm_fail_open": _parse_bool_env(os.environ.get("AGENTSEC_API_MODE_FAIL_OPEN_LLM"), True),
         "mcp_fail_open": _parse_bool_env(os.environ.get("AGENTSEC_API_MODE_FAIL_OPEN_MCP"), True),
+        "llm_speculative": _parse_bool_env(os.environ.get("AGENTSEC_API_MODE_SPECULATIVE_LLM"), False),
         
         # Gateway Mode settings (used when integration_mode = 'gateway')
         # Note: Gateway mode only has off/on - gateway handles enforcement internally
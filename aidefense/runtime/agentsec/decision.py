@@ -16,11 +16,19 @@
 
 """Decision type for security inspection results."""
 
+import sys
 from typing import Any, List, Literal, Optional
 
 
 ActionType = Literal["allow", "block", "sanitize", "monitor_only"]
 
+# Interned action strings: comparing an interned action against these resolves
+# on the identity check inside str comparison
+_ALLOW = sys.intern("allow")
+_BLOCK = sys.intern("block")
+_SANITIZE = sys.intern("sanitize")
+_MONITOR_ONLY = sys.intern("monitor_only")
+
 
 class Decision:
     """
@@ -63,7 +71,8 @@ class Decision:
         explanation: Optional[str] = None,
         event_id: Optional[str] = None,
     ) -> None:
-        self.action = action
+        # Only exact str can be interned; str subclasses (e.g. str enums) are kept as given
+        self.action = sys.intern(action) if type(action) is str else action
         self.reasons = reasons or []
         self.sanitized_content = sanitized_content
         self.raw_response = raw_response
@@ -82,7 +91,7 @@ class Decision:
             True if action is allow, sanitize, or monitor_only.
             False if action is block.
         """
-        return self.action != "block"
+        return self.action != _BLOCK
     
     @property
     def is_safe(self) -> bool:
@@ -96,7 +105,7 @@ class Decision:
             True if action is allow, sanitize, or monitor_only.
             False if action is block.
         """
-        return self.action != "block"
+        return self.action != _BLOCK
     
     def __repr__(self) -> str:
         # Include new fields only if they have values (to keep output concise)
@@ -120,21 +129,29 @@ class Decision:
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Decision):
             return NotImplemented
+        # Single tuple comparison over all fields, including the rich ones
         return (
-            self.action == other.action
-            and self.reasons == other.reasons
-            and self.sanitized_content == other.sanitized_content
-            # Include new fields in equality check
-            and self.severity == other.severity
-            and self.classifications == other.classifications
-            and self.rules == other.rules
-            and self.explanation == other.explanation
-            and self.event_id == other.event_id
+            self.action,
+            self.reasons,
+            self.sanitized_content,
+            self.severity,
+            self.classifications,
+            self.rules,
+            self.explanation,
+            self.event_id,
+        ) == (
+            other.action,
+            other.reasons,
+            other.sanitized_content,
+            other.severity,
+            other.classifications,
+            other.rules,
+            other.explanation,
+            other.event_id,
         )
     
-    @classmethod
+    @staticmethod
     def allow(
-        cls,
         reasons: Optional[List[str]] = None,
         raw_response: Any = None,
         severity: Optional[str] = None,
@@ -144,8 +161,8 @@ class Decision:
         event_id: Optional[str] = None,
     ) -> "Decision":
         """Create an allow decision."""
-        return cls(
-            action="allow",
+        return Decision(
+            action=_ALLOW,
             reasons=reasons,
             raw_response=raw_response,
             severity=severity,
@@ -155,9 +172,8 @@ class Decision:
             event_id=event_id,
         )
     
-    @classmethod
+    @staticmethod
     def block(
-        cls,
         reasons: List[str],
         raw_response: Any = None,
         severity: Optional[str] = None,
@@ -167,8 +183,8 @@ class Decision:
         event_id: Optional[str] = None,
     ) -> "Decision":
         """Create a block decision."""
-        return cls(
-            action="block",
+        return Decision(
+            action=_BLOCK,
             reasons=reasons,
             raw_response=raw_response,
             severity=severity,
@@ -178,9 +194,8 @@ class Decision:
             event_id=event_id,
         )
     
-    @classmethod
+    @staticmethod
     def sanitize(
-        cls,
         reasons: List[str],
         sanitized_content: Optional[str] = None,
         raw_response: Any = None,
@@ -191,8 +206,8 @@ class Decision:
         event_id: Optional[str] = None,
     ) -> "Decision":
         """Create a sanitize decision."""
-        return cls(
-            action="sanitize",
+        return Decision(
+            action=_SANITIZE,
             reasons=reasons,
             sanitized_content=sanitized_content,
             raw_response=raw_response,
@@ -203,9 +218,8 @@ class Decision:
             event_id=event_id,
         )
     
-    @classmethod
+    @staticmethod
     def monitor_only(
-        cls,
         reasons: List[str],
         raw_response: Any = None,
         severity: Optional[str] = None,
@@ -215,8 +229,8 @@ class Decision:
         event_id: Optional[str] = None,
     ) -> "Decision":
         """Create a monitor_only decision."""
-        return cls(
-            action="monitor_only",
+        return Decision(
+            action=_MONITOR_ONLY,
             reasons=reasons,
             raw_response=raw_response,
             severity=severity,
@@ -2,7 +2,7 @@
 
 import atexit
 import logging
-from typing import List, Any
+from typing import Any, Dict
 
 # API Mode Inspectors
 from .api_llm import LLMInspector
@@ -27,8 +27,9 @@ logger = logging.getLogger("aidefense.runtime.agentsec.inspectors")
 inspect_llm = LLMInspector
 inspect_mcp = MCPInspector
 
-# Global registry of inspector instances for cleanup on shutdown
-_inspector_registry: List[Any] = []
+# Global registry of inspector instances for cleanup on shutdown, keyed by id()
+# so registering the same instance again is an O(1) no-op
+_inspector_registry: Dict[int, Any] = {}
 
 
 def register_inspector_for_cleanup(inspector: Any) -> None:
@@ -41,8 +42,7 @@ def register_inspector_for_cleanup(inspector: Any) -> None:
     Args:
         inspector: An inspector instance with a close() method
     """
-    if inspector not in _inspector_registry:
-        _inspector_registry.append(inspector)
+    _inspector_registry.setdefault(id(inspector), inspector)
 
 
 def cleanup_all_inspectors() -> None:
@@ -53,14 +53,14 @@ def cleanup_all_inspectors() -> None:
     Can also be called manually for testing or early cleanup.
     """
     global _inspector_registry
-    for inspector in _inspector_registry:
+    for inspector in _inspector_registry.values():
         try:
             if hasattr(inspector, 'close'):
                 inspector.close()
                 logger.debug(f"Closed inspector: {type(inspector).__name__}")
         except Exception as e:
             logger.debug(f"Error closing inspector {type(inspector).__name__}: {e}")
-    _inspector_registry = []
+    _inspector_registry = {}
 
 
 # Register cleanup handler to run on interpreter shutdown
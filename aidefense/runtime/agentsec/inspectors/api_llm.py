@@ -20,7 +20,9 @@ Uses ChatInspectionClient (sync) and AsyncChatInspectionClient (async) from the
 """
 
 import asyncio
+import json
 import logging
+import os
 import threading
 import time
 from typing import Any, Dict, List, Optional
@@ -128,18 +130,26 @@ class _AgentSecAsyncConfig(AsyncConfig):
             self.runtime_base_url = runtime_base_url.rstrip("/")
 
 
+# Role members keyed by wire value. Roles are a small closed set, so every
+# message reuses the shared enum members instead of re-resolving Role(...).
+_ROLE_BY_VALUE: Dict[str, Role] = {r.value: r for r in Role}
+
+
 def _messages_to_runtime(messages: List[Dict[str, Any]]) -> List[Message]:
     """Convert agentsec message dicts to runtime Message list."""
     out = []
-    valid_roles = {r.value for r in Role}
+    append = out.append
     for m in messages:
-        role_str = (m.get("role") or "user").lower() if isinstance(m.get("role"), str) else "user"
-        if role_str not in valid_roles:
-            role_str = "user"
+        role_str = m.get("role")
+        if isinstance(role_str, str):
+            # Exact hit is the common case; only lowercase on a miss.
+            role = _ROLE_BY_VALUE.get(role_str) or _ROLE_BY_VALUE.get(role_str.lower(), Role.USER)
+        else:
+            role = Role.USER
         content = m.get("content") or ""
         if not isinstance(content, str):
             content = str(content)
-        out.append(Message(role=Role(role_str), content=content))
+        append(Message(role=role, content=content))
     return out
 
 
@@ -235,7 +245,6 @@ class LLMInspector:
             pool_max_keepalive: Maximum keepalive connections (default 20)
             fail_open: Whether to allow requests when API is unreachable (default True)
         """
-        import os
         from .. import _state
         
         # Priority: explicit param > state > env var
@@ -374,8 +383,6 @@ class LLMInspector:
         Returns:
             True if the request should be retried
         """
-        import json
-        
         # Never retry on JSON decode errors (response is malformed, not transient)
         if isinstance(error, json.JSONDecodeError):
             logger.warning(f"JSON decode error (not retryable): {error}")
@@ -3,29 +3,63 @@
 Uses MCPInspectionClient from the runtime; no direct HTTP implementation.
 """
 
+import asyncio
+import atexit
+import hashlib
 import itertools
 import json
 import logging
 import os
+import random
 import threading
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
+import aiohttp
 import httpx
 import requests
 
+from .._loop_resources import LoopResources
 from ..decision import Decision
 from ..exceptions import (
     SecurityPolicyError,
     InspectionTimeoutError,
     InspectionNetworkError,
 )
-from aidefense.config import Config
-from aidefense.runtime.mcp_inspect import MCPInspectionClient
+from aidefense.config import Config, AsyncConfig
+from aidefense.runtime.mcp_inspect import MCPInspectionClient, AsyncMCPInspectionClient
 from aidefense.runtime.mcp_models import MCPMessage, MCPInspectResponse
 
 logger = logging.getLogger("aidefense.runtime.agentsec.inspectors.mcp")
 
+DEFAULT_RUNTIME_BASE_URL = "https://us.api.inspect.aidefense.security.cisco.com"
+
+# Process-wide MCPInspectionClient cache so inspectors with the same settings
+# share one connection pool. Values are [client, refcount].
+_ClientKey = Tuple[str, str, Optional[int], int]
+_client_cache: Dict[_ClientKey, list] = {}
+# Re-entrant so inspectors can guard their lazy client init with the same lock
+# that _acquire_shared_client takes, instead of keeping a lock per instance.
+_client_cache_lock = threading.RLock()
+
+# Error classes by transport: the sync client raises requests errors and the async client
+# aiohttp/asyncio ones. httpx errors are still recognised for backward compatibility.
+_TIMEOUT_ERRORS = (httpx.TimeoutException, requests.exceptions.Timeout, asyncio.TimeoutError)
+_NETWORK_ERRORS = (
+    httpx.ConnectError,
+    httpx.NetworkError,
+    requests.exceptions.ConnectionError,
+    aiohttp.ClientError,
+)
+_TRANSIENT_ERRORS = _TIMEOUT_ERRORS + _NETWORK_ERRORS
+
+# Number of JSON-RPC message ids a thread claims at a time in MCPInspector._get_next_id
+_ID_SLAB_SIZE = 1 << 20
+
+# Dedicated RNG for retry jitter, independent of (and unaffected by seeding of) the
+# global random state; jitter needs spread, not cryptographic randomness
+_jitter_rng = random.Random()
+
 
 def _mcp_inspect_response_to_decision(mcp_resp: MCPInspectResponse) -> Decision:
     """Map MCPInspectResponse to agentsec Decision."""
@@ -37,7 +71,8 @@ def _mcp_inspect_response_to_decision(mcp_resp: MCPInspectResponse) -> Decision:
     if not mcp_resp.result:
         return Decision.allow(raw_response=mcp_resp)
     resp = mcp_resp.result
-    reasons = [c.value for c in resp.classifications] if resp.classifications else []
+    cls_values = [c.value for c in resp.classifications] if resp.classifications else None
+    reasons = list(cls_values) if cls_values else []
     if resp.explanation and resp.explanation not in reasons:
         reasons.append(resp.explanation)
     if not reasons and resp.rules:
@@ -47,12 +82,18 @@ def _mcp_inspect_response_to_decision(mcp_resp: MCPInspectResponse) -> Decision:
             if cl and str(cl) not in ("NONE_VIOLATION", "NONE_SEVERITY"):
                 reasons.append(f"{rn}: {cl}")
     severity_str = resp.severity.value if resp.severity else None
-    rules_list = [getattr(r, "__dict__", r) if not isinstance(r, dict) else r for r in (resp.rules or [])]
+    # Rules come back homogeneous (all Rule objects or all dicts), so dispatch once on the first
+    if not resp.rules:
+        rules_list = []
+    elif isinstance(resp.rules[0], dict):
+        rules_list = list(resp.rules)
+    else:
+        rules_list = [r.__dict__ for r in resp.rules]
     kwargs = dict(
         reasons=reasons,
         raw_response=mcp_resp,
         severity=severity_str,
-        classifications=[c.value for c in resp.classifications] if resp.classifications else None,
+        classifications=cls_values,
         rules=rules_list,
         explanation=resp.explanation,
         event_id=resp.event_id,
@@ -64,6 +105,15 @@ def _mcp_inspect_response_to_decision(mcp_resp: MCPInspectResponse) -> Decision:
 
 def _result_to_content_dict(result: Any) -> Dict[str, Any]:
     """Build MCP result_data for inspect_response. Passes content as-is when already in MCP shape."""
+    # Exact-type fast path, ordered by how often tools return each shape
+    result_type = type(result)
+    if result_type is str:
+        return {"content": [{"type": "text", "text": result}]}
+    if result_type is dict:
+        return result if "content" in result else {"content": [result]}
+    if result_type is list:
+        return {"content": result}
+    # Subclasses of the above keep their original handling
     if isinstance(result, dict) and "content" in result:
         return result
     if isinstance(result, list):
@@ -75,13 +125,26 @@ def _result_to_content_dict(result: Any) -> Dict[str, Any]:
     return {"content": [{"type": "text", "text": str(result)}]}
 
 
+def _resource_params(tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    return {"uri": tool_name}
+
+
+def _named_params(tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    # A fresh dict per call: the params end up in the request and must not share state
+    return {"name": tool_name, "arguments": arguments or {}}
+
+
+# Method -> params builder; tools/call, prompts/get and unknown methods use _named_params
+_PARAM_BUILDERS = {
+    "resources/read": _resource_params,
+    "prompts/get": _named_params,
+    "tools/call": _named_params,
+}
+
+
 def _request_params_for_method(method: str, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
     """Build params dict for MCP inspect_response from method and request context."""
-    if method == "resources/read":
-        return {"uri": tool_name}
-    if method == "prompts/get":
-        return {"name": tool_name, "arguments": arguments or {}}
-    return {"name": tool_name, "arguments": arguments or {}}
+    return _PARAM_BUILDERS.get(method, _named_params)(tool_name, arguments)
 
 
 class _AgentSecMCPConfig(Config):
@@ -95,6 +158,7 @@ class _AgentSecMCPConfig(Config):
         runtime_base_url: str = None,
         timeout_sec: float = None,
         logger_instance: logging.Logger = None,
+        pool_maxsize: int = None,
         **kwargs,
     ):
         timeout_int = int(timeout_sec) if timeout_sec is not None else None
@@ -104,11 +168,97 @@ class _AgentSecMCPConfig(Config):
             runtime_base_url=runtime_base_url,
             timeout=timeout_int,
             logger=logger_instance,
+            pool_config={"pool_maxsize": pool_maxsize} if pool_maxsize else None,
         )
         if runtime_base_url:
             self.runtime_base_url = runtime_base_url.rstrip("/")
 
 
+class _AgentSecMCPAsyncConfig(AsyncConfig):
+    """Per-inspector config for AsyncMCPInspectionClient; __new__ bypasses singleton."""
+
+    def __new__(cls, *args, **kwargs):
+        return object.__new__(cls)
+
+    def _initialize(
+        self,
+        runtime_base_url: str = None,
+        timeout_sec: float = None,
+        logger_instance: logging.Logger = None,
+        **kwargs,
+    ):
+        timeout_int = int(timeout_sec) if timeout_sec is not None else None
+        AsyncConfig._initialize(
+            self,
+            region="us-west-2",
+            runtime_base_url=runtime_base_url,
+            timeout=timeout_int,
+            logger=logger_instance,
+        )
+        if runtime_base_url:
+            self.runtime_base_url = runtime_base_url.rstrip("/")
+
+
+def _acquire_shared_client(
+    runtime_base_url: str,
+    api_key: str,
+    timeout_ms: Optional[int],
+    pool_max_connections: int,
+) -> Tuple[_ClientKey, MCPInspectionClient]:
+    """Return a shared MCPInspectionClient for these settings, creating it if needed."""
+    key_digest = hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()
+    key: _ClientKey = (runtime_base_url, key_digest, timeout_ms, pool_max_connections)
+    with _client_cache_lock:
+        entry = _client_cache.get(key)
+        if entry is None:
+            cfg = _AgentSecMCPConfig(
+                runtime_base_url=runtime_base_url,
+                timeout_sec=(timeout_ms / 1000.0) if timeout_ms is not None else None,
+                logger_instance=logger,
+                pool_maxsize=pool_max_connections,
+            )
+            entry = [MCPInspectionClient(api_key=api_key, config=cfg), 0]
+            _client_cache[key] = entry
+        entry[1] += 1
+        return key, entry[0]
+
+
+def _close_client(client: MCPInspectionClient) -> None:
+    session = getattr(getattr(client, "_request_handler", None), "_session", None)
+    if session is not None:
+        try:
+            session.close()
+        except Exception:
+            pass  # Best effort cleanup
+
+
+async def _close_async_mcp_client(client: AsyncMCPInspectionClient) -> None:
+    await client._request_handler.close()
+
+
+def _release_shared_client(key: _ClientKey) -> None:
+    """Drop one reference to a shared client, closing it when unused."""
+    with _client_cache_lock:
+        entry = _client_cache.get(key)
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1] > 0:
+            return
+        del _client_cache[key]
+    _close_client(entry[0])
+
+
+@atexit.register
+def _close_shared_clients() -> None:
+    """Close every cached MCPInspectionClient at interpreter exit."""
+    with _client_cache_lock:
+        entries = list(_client_cache.values())
+        _client_cache.clear()
+    for client, _ in entries:
+        _close_client(client)
+
+
 class MCPInspector:
     """
     Inspector for MCP (Model Context Protocol) operations using Cisco AI Defense.
@@ -200,6 +350,8 @@ class MCPInspector:
         else:
             state_timeout = _state.get_timeout()
             self.timeout_ms = (state_timeout * 1000) if state_timeout is not None else None
+        # Per-request timeout in whole seconds as passed to the inspection client
+        self._timeout_sec = int(self.timeout_ms / 1000) if self.timeout_ms is not None else None
         
         # Retry configuration: explicit param > state > default
         if retry_total is not None:
@@ -225,6 +377,8 @@ class MCPInspector:
         
         # Keep retry_attempts as alias for backward compatibility
         self.retry_attempts = self.retry_total
+        # Default configuration: one attempt, so the inspect methods skip the retry loop
+        self._single_attempt = self.retry_total == 1
         
         # Connection pool configuration: explicit param > state > default
         if pool_max_connections is not None:
@@ -239,56 +393,87 @@ class MCPInspector:
             state_keepalive = _state.get_pool_max_keepalive()
             self.pool_max_keepalive = state_keepalive if state_keepalive is not None else 20
         
-        # Thread-safe counter for JSON-RPC message IDs using itertools.count()
-        self._request_id_counter = itertools.count(1)
+        # JSON-RPC message IDs: each thread claims a slab of _ID_SLAB_SIZE ids from the shared
+        # itertools.count() and hands them out locally, so concurrent callers don't contend
+        self._id_slabs = itertools.count(0, _ID_SLAB_SIZE)
+        self._id_local = threading.local()
         
-        # MCPInspectionClient is created lazily via _get_mcp_client()
+        # MCPInspectionClient is acquired lazily from the shared cache via _get_mcp_client()
         self._mcp_client: Optional[MCPInspectionClient] = None
-        self._mcp_client_lock = threading.Lock()
+        self._mcp_client_key: Optional[_ClientKey] = None
+        
+        # AsyncMCPInspectionClient is created lazily per event loop via _get_async_mcp_client()
+        # and closed when its loop shuts down
+        self._async_mcp_clients: LoopResources[AsyncMCPInspectionClient] = LoopResources(
+            self._create_async_mcp_client, _close_async_mcp_client
+        )
     
     def _get_next_id(self) -> int:
-        """Get the next request ID for JSON-RPC messages (thread-safe)."""
-        return next(self._request_id_counter)
+        """Get the next request ID for JSON-RPC messages (thread-safe, unique per inspector)."""
+        local = self._id_local
+        try:
+            offset = local.offset + 1
+        except AttributeError:
+            offset = _ID_SLAB_SIZE + 1
+        if offset > _ID_SLAB_SIZE:
+            local.base = next(self._id_slabs)
+            offset = 1
+        local.offset = offset
+        return local.base + offset
     
     def _get_mcp_client(self) -> MCPInspectionClient:
-        """Get or create the MCPInspectionClient (thread-safe)."""
+        """Get the shared MCPInspectionClient for this inspector's settings (thread-safe)."""
         if self._mcp_client is not None:
             return self._mcp_client
-        with self._mcp_client_lock:
+        with _client_cache_lock:
             if self._mcp_client is not None:
                 return self._mcp_client
-            runtime_base_url = (self.endpoint or "").rstrip("/")
-            if not runtime_base_url:
-                runtime_base_url = "https://us.api.inspect.aidefense.security.cisco.com"
-            cfg = _AgentSecMCPConfig(
-                runtime_base_url=runtime_base_url,
-                timeout_sec=(self.timeout_ms / 1000.0) if self.timeout_ms is not None else None,
-                logger_instance=logger,
+            runtime_base_url = (self.endpoint or "").rstrip("/") or DEFAULT_RUNTIME_BASE_URL
+            self._mcp_client_key, self._mcp_client = _acquire_shared_client(
+                runtime_base_url,
+                self.api_key,
+                self.timeout_ms,
+                self.pool_max_connections,
             )
-            self._mcp_client = MCPInspectionClient(api_key=self.api_key, config=cfg)
             return self._mcp_client
     
-    def _get_backoff_delay(self, attempt: int) -> float:
-        """Calculate exponential backoff delay for a retry attempt."""
+    async def _get_async_mcp_client(self) -> AsyncMCPInspectionClient:
+        """Get or create AsyncMCPInspectionClient for the current event loop (thread-safe)."""
+        return await self._async_mcp_clients.get()
+    
+    async def _create_async_mcp_client(self) -> AsyncMCPInspectionClient:
+        cfg = _AgentSecMCPAsyncConfig(
+            runtime_base_url=(self.endpoint or "").rstrip("/") or DEFAULT_RUNTIME_BASE_URL,
+            timeout_sec=(self.timeout_ms / 1000.0) if self.timeout_ms is not None else None,
+            logger_instance=logger,
+        )
+        client = AsyncMCPInspectionClient(api_key=self.api_key, config=cfg)
+        await client._request_handler.ensure_session()
+        return client
+    
+    def _get_backoff_delay(self, attempt: int, prev_delay: float = 0.0) -> float:
+        """
+        Calculate a decorrelated-jitter backoff delay for a retry attempt.
+        
+        Each delay is drawn from [retry_backoff, prev_delay * 3] so concurrent
+        clients retrying the same failure spread out instead of waking together.
+        """
         if self.retry_backoff <= 0:
             return 0.0
-        delay = self.retry_backoff * (2 ** attempt)
-        return min(delay, self.MAX_BACKOFF_DELAY)
+        upper = max(self.retry_backoff, prev_delay) * 3
+        return min(_jitter_rng.uniform(self.retry_backoff, upper), self.MAX_BACKOFF_DELAY)
     
     def _should_retry(self, error: Exception) -> bool:
         """Determine if a request should be retried based on the error."""
-        import json
-        
         if isinstance(error, json.JSONDecodeError):
             logger.warning(f"JSON decode error (not retryable): {error}")
             return False
-        if isinstance(error, (httpx.TimeoutException, httpx.ConnectError, httpx.NetworkError)):
-            return True
-        if isinstance(error, (requests.exceptions.Timeout, requests.exceptions.ConnectionError)):
+        if isinstance(error, _TRANSIENT_ERRORS):
             return True
         if isinstance(error, httpx.HTTPStatusError):
             return error.response.status_code in self.retry_status_codes
-        if isinstance(error, requests.exceptions.HTTPError) and getattr(error, "response", None):
+        # A requests Response is falsy for 4xx/5xx, so compare against None explicitly
+        if isinstance(error, requests.exceptions.HTTPError) and getattr(error, "response", None) is not None:
             return getattr(error.response, "status_code", 0) in self.retry_status_codes
         return False
     
@@ -328,13 +513,13 @@ class MCPInspector:
             logger.error(f"mcp_fail_open=False, blocking tool call '{tool_name}' due to error")
             
             # Raise typed exceptions based on error type
-            if isinstance(error, (httpx.TimeoutException, requests.exceptions.Timeout)):
+            if isinstance(error, _TIMEOUT_ERRORS):
                 raise InspectionTimeoutError(
                     f"MCP inspection timed out: {error_msg}",
                     timeout_ms=self.timeout_ms,
                 ) from error
             
-            if isinstance(error, (httpx.ConnectError, httpx.NetworkError, requests.exceptions.ConnectionError)):
+            if isinstance(error, _NETWORK_ERRORS):
                 raise InspectionNetworkError(
                     f"Failed to connect to MCP inspection API: {error_msg}"
                 ) from error
@@ -342,6 +527,135 @@ class MCPInspector:
             decision = Decision.block(reasons=[f"MCP inspection error: {error_type}: {error_msg}"])
             raise SecurityPolicyError(decision, f"MCP inspection failed and fail_open=False: {error_msg}") from error
     
+    def _send_request(self, tool_name: str, arguments: Dict[str, Any], method: str) -> MCPInspectResponse:
+        """Send one MCP request inspection using the convenience method matching the MCP method."""
+        client = self._get_mcp_client()
+        if method == "tools/call":
+            return client.inspect_tool_call(
+                tool_name=tool_name,
+                arguments=arguments,
+                message_id=self._get_next_id(),
+                timeout=self._timeout_sec,
+            )
+        if method == "resources/read":
+            return client.inspect_resource_read(
+                uri=tool_name,
+                message_id=self._get_next_id(),
+                timeout=self._timeout_sec,
+            )
+        # prompts/get or other: build MCPMessage and inspect
+        msg = MCPMessage(
+            jsonrpc="2.0",
+            method=method,
+            params={"name": tool_name, "arguments": arguments or {}},
+            id=self._get_next_id(),
+        )
+        return client.inspect(msg, timeout=self._timeout_sec)
+    
+    async def _asend_request(self, tool_name: str, arguments: Dict[str, Any], method: str) -> MCPInspectResponse:
+        """Async counterpart of _send_request."""
+        client = await self._get_async_mcp_client()
+        if method == "tools/call":
+            return await client.inspect_tool_call(
+                tool_name=tool_name,
+                arguments=arguments,
+                message_id=self._get_next_id(),
+                timeout=self._timeout_sec,
+            )
+        if method == "resources/read":
+            return await client.inspect_resource_read(
+                uri=tool_name,
+                message_id=self._get_next_id(),
+                timeout=self._timeout_sec,
+            )
+        # prompts/get or other: build MCPMessage and inspect
+        msg = MCPMessage(
+            jsonrpc="2.0",
+            method=method,
+            params={"name": tool_name, "arguments": arguments or {}},
+            id=self._get_next_id(),
+        )
+        return await client.inspect(msg, timeout=self._timeout_sec)
+    
+    def _response_message(self, tool_name: str, arguments: Dict[str, Any], result: Any, method: str) -> MCPMessage:
+        """Build the MCPMessage carrying an operation's result for response inspection."""
+        return MCPMessage(
+            jsonrpc="2.0",
+            method=method,
+            params=_request_params_for_method(method, tool_name, arguments),
+            result=_result_to_content_dict(result),
+            id=self._get_next_id(),
+        )
+    
+    def _inspect_with_retry(
+        self,
+        send: Callable[[], MCPInspectResponse],
+        tool_name: str,
+        context: str,
+    ) -> Decision:
+        """
+        Call send() with the configured retries and convert its response to a Decision.
+        
+        With the default single attempt the retry bookkeeping is skipped.
+        Errors that remain go through _handle_error (fail_open handling).
+        """
+        if self._single_attempt:
+            try:
+                return _mcp_inspect_response_to_decision(send())
+            except Exception as e:
+                return self._handle_error(e, tool_name, context=context)
+        
+        last_error: Optional[Exception] = None
+        delay = 0.0
+        
+        for attempt in range(self.retry_total):
+            try:
+                return _mcp_inspect_response_to_decision(send())
+            except Exception as e:
+                last_error = e
+                logger.debug(f"Attempt {attempt + 1}/{self.retry_total} failed: {e}")
+                is_last_attempt = attempt >= self.retry_total - 1
+                if is_last_attempt or not self._should_retry(e):
+                    break
+                delay = self._get_backoff_delay(attempt, delay)
+                if delay > 0:
+                    logger.debug(f"Retrying in {delay:.2f}s...")
+                    time.sleep(delay)
+        
+        return self._handle_error(last_error, tool_name, context=context)  # type: ignore
+    
+    async def _ainspect_with_retry(
+        self,
+        send: Callable[[], Awaitable[MCPInspectResponse]],
+        tool_name: str,
+        context: str,
+    ) -> Decision:
+        """Async counterpart of _inspect_with_retry."""
+        if self._single_attempt:
+            try:
+                return _mcp_inspect_response_to_decision(await send())
+            except Exception as e:
+                return self._handle_error(e, tool_name, context=context)
+        
+        last_error: Optional[Exception] = None
+        delay = 0.0
+        
+        for attempt in range(self.retry_total):
+            try:
+                return _mcp_inspect_response_to_decision(await send())
+            except Exception as e:
+                last_error = e
+                logger.debug(f"Attempt {attempt + 1}/{self.retry_total} failed: {e}")
+                is_last_attempt = attempt >= self.retry_total - 1
+                if is_last_attempt or not self._should_retry(e):
+                    break
+                delay = self._get_backoff_delay(attempt, delay)
+                if delay > 0:
+                    logger.debug(f"Retrying in {delay:.2f}s...")
+                    await asyncio.sleep(delay)
+        
+        return self._handle_error(last_error, tool_name, context=context)  # type: ignore
+    
     def inspect_request(
         self,
         tool_name: str,
@@ -372,48 +686,11 @@ class MCPInspector:
             return Decision.allow()
         
         logger.debug(f"MCP inspection request: {method}={tool_name}")
-        last_error: Optional[Exception] = None
-        timeout_sec = (int(self.timeout_ms / 1000) if self.timeout_ms is not None else None)
-        
-        for attempt in range(self.retry_total):
-            try:
-                client = self._get_mcp_client()
-                if method == "tools/call":
-                    mcp_resp = client.inspect_tool_call(
-                        tool_name=tool_name,
-                        arguments=arguments,
-                        message_id=self._get_next_id(),
-                        timeout=timeout_sec,
-                    )
-                elif method == "resources/read":
-                    mcp_resp = client.inspect_resource_read(
-                        uri=tool_name,
-                        message_id=self._get_next_id(),
-                        timeout=timeout_sec,
-                    )
-                else:
-                    # prompts/get or other: build MCPMessage and inspect
-                    params = {"name": tool_name, "arguments": arguments or {}}
-                    msg = MCPMessage(
-                        jsonrpc="2.0",
-                        method=method,
-                        params=params,
-                        id=self._get_next_id(),
-                    )
-                    mcp_resp = client.inspect(msg, timeout=timeout_sec)
-                return _mcp_inspect_response_to_decision(mcp_resp)
-            except Exception as e:
-                last_error = e
-                logger.debug(f"Attempt {attempt + 1}/{self.retry_total} failed: {e}")
-                is_last_attempt = attempt >= self.retry_total - 1
-                if is_last_attempt or not self._should_retry(e):
-                    break
-                delay = self._get_backoff_delay(attempt)
-                if delay > 0:
-                    logger.debug(f"Retrying in {delay:.2f}s...")
-                    time.sleep(delay)
-        
-        return self._handle_error(last_error, tool_name, context="inspect_request")  # type: ignore
+        return self._inspect_with_retry(
+            lambda: self._send_request(tool_name, arguments, method),
+            tool_name,
+            context="inspect_request",
+        )
     
     def inspect_response(
         self,
@@ -447,34 +724,18 @@ class MCPInspector:
             return Decision.allow()
         
         logger.debug(f"MCP inspection response: {method}={tool_name}")
-        result_data = _result_to_content_dict(result)
-        params = _request_params_for_method(method, tool_name, arguments)
-        last_error: Optional[Exception] = None
-        timeout_sec = (int(self.timeout_ms / 1000) if self.timeout_ms is not None else None)
+        message = self._response_message(tool_name, arguments, result, method)
+        # Tool outputs can be large: validate and encode the body once and resend it on retry
+        body: Optional[bytes] = None
         
-        for attempt in range(self.retry_total):
-            try:
-                client = self._get_mcp_client()
-                mcp_resp = client.inspect_response(
-                    result_data=result_data,
-                    method=method,
-                    params=params,
-                    message_id=self._get_next_id(),
-                    timeout=timeout_sec,
-                )
-                return _mcp_inspect_response_to_decision(mcp_resp)
-            except Exception as e:
-                last_error = e
-                logger.debug(f"Attempt {attempt + 1}/{self.retry_total} failed: {e}")
-                is_last_attempt = attempt >= self.retry_total - 1
-                if is_last_attempt or not self._should_retry(e):
-                    break
-                delay = self._get_backoff_delay(attempt)
-                if delay > 0:
-                    logger.debug(f"Retrying in {delay:.2f}s...")
-                    time.sleep(delay)
+        def send() -> MCPInspectResponse:
+            nonlocal body
+            client = self._get_mcp_client()
+            if body is None:
+                body = client.serialize_message(message)
+            return client.inspect_raw(body, timeout=self._timeout_sec)
         
-        return self._handle_error(last_error, tool_name, context="inspect_response")  # type: ignore
+        return self._inspect_with_retry(send, tool_name, context="inspect_response")
     
     async def ainspect_request(
         self,
@@ -483,17 +744,31 @@ class MCPInspector:
         metadata: Dict[str, Any],
         method: str = "tools/call",
     ) -> Decision:
-        """Inspect an MCP request before execution (async). Delegates to sync inspect_request."""
-        import asyncio
+        """
+        Inspect an MCP request before execution (async).
+        Uses AsyncMCPInspectionClient for native async I/O.
+        
+        Args:
+            tool_name: Name of the tool/prompt/resource being accessed
+            arguments: Arguments passed to the operation
+            metadata: Additional metadata about the request (not sent to API)
+            method: MCP method (tools/call, prompts/get, resources/read)
+            
+        Returns:
+            Decision indicating whether to allow or block the request
+            
+        Raises:
+            SecurityPolicyError: If fail_open=False and API is unreachable
+        """
         if not self.endpoint or not self.api_key:
             logger.debug(f"MCP request intercepted: {method}={tool_name}, allowing by default (no API configured)")
             return Decision.allow()
-        return await asyncio.to_thread(
-            self.inspect_request,
+        
+        logger.debug(f"MCP inspection request: {method}={tool_name}")
+        return await self._ainspect_with_retry(
+            lambda: self._asend_request(tool_name, arguments, method),
             tool_name,
-            arguments,
-            metadata or {},
-            method,
+            context="ainspect_request",
         )
     
     async def ainspect_response(
@@ -504,25 +779,121 @@ class MCPInspector:
         metadata: Dict[str, Any],
         method: str = "tools/call",
     ) -> Decision:
-        """Inspect an MCP response after execution (async). Delegates to sync inspect_response."""
-        import asyncio
+        """
+        Inspect an MCP response after execution (async).
+        Uses AsyncMCPInspectionClient for native async I/O.
+        
+        Args:
+            tool_name: Name of the tool/prompt/resource that was accessed
+            arguments: Arguments that were passed to the operation
+            result: The result returned by the operation
+            metadata: Additional metadata about the request (not sent to API)
+            method: MCP method (tools/call, prompts/get, resources/read)
+            
+        Returns:
+            Decision indicating whether to allow or block the response
+            
+        Raises:
+            SecurityPolicyError: If fail_open=False and API is unreachable
+        """
         if not self.endpoint or not self.api_key:
             logger.debug(f"MCP response intercepted: {method}={tool_name}, allowing by default (no API configured)")
             return Decision.allow()
-        return await asyncio.to_thread(
-            self.inspect_response,
-            tool_name,
-            arguments,
-            result,
-            metadata or {},
-            method,
+        
+        logger.debug(f"MCP inspection response: {method}={tool_name}")
+        message = self._response_message(tool_name, arguments, result, method)
+        # Tool outputs can be large: validate and encode the body once and resend it on retry
+        body: Optional[bytes] = None
+        
+        async def send() -> MCPInspectResponse:
+            nonlocal body
+            client = await self._get_async_mcp_client()
+            if body is None:
+                body = client.serialize_message(message)
+            return await client.inspect_raw(body, timeout=self._timeout_sec)
+        
+        return await self._ainspect_with_retry(send, tool_name, context="ainspect_response")
+    
+    async def ainspect_many(self, calls: List[Dict[str, Any]]) -> List[Decision]:
+        """
+        Inspect several MCP requests concurrently (async).
+        
+        Agent frameworks often fan out multiple tool calls in one turn. Rather than
+        awaiting each inspection in turn, this issues them together over the shared
+        async client session so the turn waits for roughly one round-trip.
+        
+        Args:
+            calls: One dict per request, holding the keyword arguments for
+                   ainspect_request (tool_name, arguments, and optionally metadata and method)
+            
+        Returns:
+            Decisions in the same order as calls
+            
+        Raises:
+            SecurityPolicyError: If fail_open=False and any inspection fails
+        """
+        if len(calls) == 1:
+            return [await self._ainspect_call(calls[0])]
+        return list(await asyncio.gather(*(self._ainspect_call(call) for call in calls)))
+    
+    async def _ainspect_call(self, call: Dict[str, Any]) -> Decision:
+        return await self.ainspect_request(
+            tool_name=call["tool_name"],
+            arguments=call.get("arguments") or {},
+            metadata=call.get("metadata") or {},
+            method=call.get("method", "tools/call"),
         )
     
+    def warmup(self, timeout: float = 2.0) -> bool:
+        """
+        Open a connection to the MCP inspection endpoint ahead of the first inspection.
+        
+        Sends a HEAD request through the inspection client's session so DNS, TCP and TLS
+        setup happen now and the pooled connection is reused by the first real call.
+        Latency-sensitive applications can call this once at startup; failures are ignored.
+        
+        Args:
+            timeout: Maximum time to wait for the warmup request, in seconds
+            
+        Returns:
+            True if the endpoint answered, False if warmup was skipped or failed
+        """
+        if not self.endpoint or not self.api_key:
+            return False
+        try:
+            client = self._get_mcp_client()
+            client._request_handler._session.head(client.endpoint, timeout=timeout)
+            return True
+        except Exception as e:
+            logger.debug(f"MCP inspection warmup failed: {e}")
+            return False
+    
+    async def awarmup(self, timeout: float = 2.0) -> bool:
+        """Async counterpart of warmup(); warms the current event loop's async client session."""
+        if not self.endpoint or not self.api_key:
+            return False
+        try:
+            client = await self._get_async_mcp_client()
+            async with client._request_handler._session.head(
+                client.endpoint, timeout=aiohttp.ClientTimeout(total=timeout)
+            ):
+                pass
+            return True
+        except Exception as e:
+            logger.debug(f"MCP inspection async warmup failed: {e}")
+            return False
+    
     def close(self) -> None:
-        """Release the MCPInspectionClient so it can be garbage collected."""
-        with self._mcp_client_lock:
+        """Release the shared MCPInspectionClient and close the async clients (best effort)."""
+        with _client_cache_lock:
+            key = self._mcp_client_key
             self._mcp_client = None
+            self._mcp_client_key = None
+        if key is not None:
+            _release_shared_client(key)
+        self._async_mcp_clients.close_all()
     
     async def aclose(self) -> None:
-        """Release the MCPInspectionClient (same as close; client is sync)."""
+        """Release the AsyncMCPInspectionClient session and the shared MCPInspectionClient."""
+        await self._async_mcp_clients.aclose()
         self.close()
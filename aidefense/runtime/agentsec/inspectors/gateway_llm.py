@@ -25,6 +25,8 @@ In Gateway mode:
 - Request body format is standard OpenAI-compatible format
 """
 
+import asyncio
+import json
 import logging
 import time
 from typing import Any, Dict, List, Optional
@@ -153,8 +155,6 @@ class GatewayClient:
         Returns:
             True if the error should trigger a retry, False otherwise
         """
-        import json
-        
         # Never retry on JSON decode errors (response is malformed, not transient)
         if isinstance(error, json.JSONDecodeError):
             logger.warning(f"JSON decode error (not retryable): {error}")
@@ -287,8 +287,6 @@ class GatewayClient:
         
         last_error: Optional[Exception] = None
         
-        import asyncio
-        
         # Create fresh async client per request to avoid event loop issues
         timeout = httpx.Timeout(self.timeout_ms / 1000.0)
         async with httpx.AsyncClient(timeout=timeout, http2=False) as client:
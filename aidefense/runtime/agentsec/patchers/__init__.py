@@ -21,7 +21,7 @@ def mark_patched(name: str) -> None:
     """Mark a client/function as patched (thread-safe)."""
     with _registry_lock:
         _patch_registry[name] = True
-    logger.debug(f"Marked {name} as patched")
+    logger.debug("Marked %s as patched", name)
 
 
 def get_patched_clients() -> List[str]:
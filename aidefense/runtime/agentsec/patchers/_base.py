@@ -38,10 +38,10 @@ def safe_import(module_name: str) -> Optional[Any]:
     try:
         import importlib
         module = importlib.import_module(module_name)
-        logger.debug(f"Successfully imported {module_name}")
+        logger.debug("Successfully imported %s", module_name)
         return module
     except ImportError:
-        logger.debug(f"Module {module_name} not installed, skipping patch")
+        logger.debug("Module %s not installed, skipping patch", module_name)
         return None
 
 
@@ -63,7 +63,7 @@ def apply_patch(
     """
     try:
         wrapt.wrap_function_wrapper(module, attr, wrapper)
-        logger.debug(f"Applied patch to {module.__name__}.{attr}")
+        logger.debug("Applied patch to %s.%s", module.__name__, attr)
         return True
     except Exception as e:
         logger.warning(f"Failed to patch {module.__name__}.{attr}: {e}")
@@ -26,6 +26,10 @@ from typing import Any, Dict, List, Optional, Iterator
 
 logger = logging.getLogger("aidefense.runtime.agentsec.patchers.google_common")
 
+# Google role names that differ from the normalized ones; others pass through unchanged
+_ROLE_MAP = {"model": "assistant"}
+_map_role = _ROLE_MAP.get
+
 
 def normalize_google_messages(contents: Any) -> List[Dict[str, Any]]:
     """
@@ -55,63 +59,67 @@ def normalize_google_messages(contents: Any) -> List[Dict[str, Any]]:
     if isinstance(contents, str):
         return [{"role": "user", "content": contents}]
     
-    # Not a list - try to handle as single content
+    # Not a list - handle as a single content item (e.g. a Content object)
     if not isinstance(contents, (list, tuple)):
-        # Could be a Content object
-        return _normalize_single_content(contents)
+        contents = (contents,)
     
+    # Single pass over the history: role mapping and part text extraction are
+    # inlined so each turn costs one loop iteration rather than nested helper calls.
+    # Dicts are checked first since [{role, parts}, ...] is the shape user code
+    # almost always passes, so the common case exits the type checks immediately.
     messages = []
+    append = messages.append
     for item in contents:
-        normalized = _normalize_single_content(item)
-        messages.extend(normalized)
-    
-    return messages
-
-
-def _normalize_single_content(content: Any) -> List[Dict[str, Any]]:
-    """Normalize a single content item."""
-    if content is None:
-        return []
-    
-    # String
-    if isinstance(content, str):
-        return [{"role": "user", "content": content}]
-    
-    # Dict with role and parts
-    if isinstance(content, dict):
-        role = content.get("role", "user")
-        # Map "model" to "assistant"
-        if role == "model":
-            role = "assistant"
-        
-        parts = content.get("parts", [])
-        text = _extract_text_from_parts(parts)
+        # Dict with role and parts
+        if isinstance(item, dict):
+            role = item.get("role", "user")
+            parts = item.get("parts", [])
+        elif item is None:
+            continue
+        elif isinstance(item, str):
+            append({"role": "user", "content": item})
+            continue
+        # Content object from SDK (has role and parts attributes)
+        elif hasattr(item, "role") and hasattr(item, "parts"):
+            role = item.role
+            parts = item.parts
+        else:
+            # Unknown format - try str()
+            try:
+                text = str(item)
+            except Exception as e:
+                logger.debug("Error converting content to string: %s", e)
+                continue
+            if text:
+                append({"role": "user", "content": text})
+            continue
         
-        if text:
-            return [{"role": role, "content": text}]
-        return []
-    
-    # Content object from SDK (has role and parts attributes)
-    if hasattr(content, "role") and hasattr(content, "parts"):
-        role = content.role
-        if role == "model":
-            role = "assistant"
+        # Map "model" to "assistant"
+        role = _map_role(role, role)
         
-        text = _extract_text_from_parts(content.parts)
+        if isinstance(parts, (list, tuple)):
+            texts = []
+            for part in parts:
+                if isinstance(part, dict):
+                    # {"text": "..."}
+                    part_text = part.get("text")
+                    if part_text is not None:
+                        texts.append(part_text)
+                elif isinstance(part, str):
+                    texts.append(part)
+                else:
+                    # Part object with text attribute - ensure it's not None
+                    part_text = getattr(part, "text", None)
+                    if part_text is not None:
+                        texts.append(part_text)
+            text = " ".join(texts)
+        else:
+            text = _extract_text_from_parts(parts)
         
         if text:
-            return [{"role": role, "content": text}]
-        return []
-    
-    # Unknown format - try str()
-    try:
-        text = str(content)
-        if text:
-            return [{"role": "user", "content": text}]
-    except Exception as e:
-        logger.debug(f"Error converting content to string: {e}")
+            append({"role": role, "content": text})
     
-    return []
+    return messages
 
 
 def _extract_text_from_parts(parts: Any) -> str:
@@ -187,7 +195,7 @@ def extract_google_response(response: Any) -> str:
             return response.text
         
     except Exception as e:
-        logger.debug(f"Error extracting Google response: {e}")
+        logger.debug("Error extracting Google response: %s", e)
     
     return ""
 
@@ -235,6 +243,6 @@ def extract_streaming_chunk_text(chunk: Any) -> str:
                 return _extract_text_from_parts(parts)
                 
     except Exception as e:
-        logger.debug(f"Error extracting streaming chunk: {e}")
+        logger.debug("Error extracting streaming chunk: %s", e)
     
     return ""
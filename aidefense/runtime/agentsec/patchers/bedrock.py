@@ -33,10 +33,11 @@ import logging
 import threading
 from typing import Any, Dict, List, Optional
 
+import httpx
 import wrapt
 
 from .. import _state
-from .._context import get_inspection_context, set_inspection_context
+from .._context import get_inspection_metadata, is_inspection_done, is_llm_skip_active, set_inspection_context
 from ..decision import Decision
 from ..exceptions import SecurityPolicyError
 from ..inspectors.api_llm import LLMInspector
@@ -145,19 +146,21 @@ _inspector_lock = threading.Lock()
 def _get_inspector() -> LLMInspector:
     """Get or create the LLMInspector instance (thread-safe)."""
     global _inspector
-    if _inspector is None:
-        with _inspector_lock:
-            # Double-check pattern for thread safety
-            if _inspector is None:
-                if not _state.is_initialized():
-                    logger.warning("agentsec.protect() not called, using default config")
-                _inspector = LLMInspector(
-                    fail_open=_state.get_api_mode_fail_open_llm(),
-                    default_rules=_state.get_llm_rules(),
-                )
-                # Register for cleanup on shutdown
-                from ..inspectors import register_inspector_for_cleanup
-                register_inspector_for_cleanup(_inspector)
+    inspector = _inspector
+    if inspector is not None:
+        return inspector
+    with _inspector_lock:
+        # Double-check pattern for thread safety
+        if _inspector is None:
+            if not _state.is_initialized():
+                logger.warning("agentsec.protect() not called, using default config")
+            _inspector = LLMInspector(
+                fail_open=_state.get_api_mode_fail_open_llm(),
+                default_rules=_state.get_llm_rules(),
+            )
+            # Register for cleanup on shutdown
+            from ..inspectors import register_inspector_for_cleanup
+            register_inspector_for_cleanup(_inspector)
     return _inspector
 
 
@@ -168,7 +171,6 @@ def _is_gateway_mode() -> bool:
 
 def _should_use_gateway() -> bool:
     """Check if we should use gateway mode for Bedrock (gateway mode enabled, configured, and not skipped)."""
-    from .._context import is_llm_skip_active
     if is_llm_skip_active():
         return False
     if not _is_gateway_mode():
@@ -199,7 +201,7 @@ def _is_agentcore_client(instance) -> bool:
             service_name = getattr(service_model, 'service_name', '')
             return service_name == 'bedrock-agentcore'
     except Exception as e:
-        logger.debug(f"Error detecting AgentCore client: {e}")
+        logger.debug("Error detecting AgentCore client: %s", e)
     return False
 
 
@@ -357,7 +359,6 @@ def _handle_agentcore_gateway_call(operation_name: str, api_params: Dict, instan
     Returns:
         AgentCore-format response dict
     """
-    import httpx
     
     # Use Bedrock gateway URL for AgentCore operations
     gateway_url = _state.get_provider_gateway_url("bedrock")
@@ -377,8 +378,8 @@ def _handle_agentcore_gateway_call(operation_name: str, api_params: Dict, instan
     if isinstance(payload, bytes):
         payload = payload.decode('utf-8')
     
-    logger.debug(f"[GATEWAY] Sending AgentCore request to gateway with AWS Sig V4")
-    logger.debug(f"[GATEWAY] Operation: {operation_name}, AgentRuntime: {agent_runtime_arn}")
+    logger.debug("[GATEWAY] Sending AgentCore request to gateway with AWS Sig V4")
+    logger.debug("[GATEWAY] Operation: %s, AgentRuntime: %s", operation_name, agent_runtime_arn)
     
     try:
         # Import boto3 for AWS Sig V4 signing
@@ -437,7 +438,7 @@ def _handle_agentcore_gateway_call(operation_name: str, api_params: Dict, instan
             response.raise_for_status()
             response_data = response.json()
         
-        logger.debug(f"[GATEWAY] Received AgentCore response from gateway")
+        logger.debug("[GATEWAY] Received AgentCore response from gateway")
         set_inspection_context(decision=Decision.allow(reasons=["Gateway handled inspection"]), done=True)
         
         return response_data
@@ -490,26 +491,31 @@ def _handle_agentcore_api_mode(operation_name: str, api_params: Dict, wrapped, a
     # Parse messages from payload
     messages = _parse_agentcore_payload(payload)
     
-    metadata = get_inspection_context().metadata
-    metadata["agent_runtime_arn"] = agent_runtime_arn
-    metadata["provider"] = "bedrock"  # AgentCore uses Bedrock as the underlying provider
-    
-    mode = _state.get_llm_mode()
-    integration_mode = _state.get_llm_integration_mode()
-    logger.debug(f"")
-    logger.debug(f"╔══════════════════════════════════════════════════════════════")
-    logger.debug(f"║ [PATCHED] LLM CALL: AgentCore")
-    logger.debug(f"║ Operation: AgentCore.{operation_name} | LLM Mode: {mode} | Integration: {integration_mode}")
-    logger.debug(f"║ AgentRuntime: {agent_runtime_arn}")
-    logger.debug(f"╚══════════════════════════════════════════════════════════════")
+    # Built per call so the shared context metadata dict is never mutated
+    metadata = {
+        **get_inspection_metadata(),
+        "agent_runtime_arn": agent_runtime_arn,
+        "provider": "bedrock",  # AgentCore uses Bedrock as the underlying provider
+    }
+    
+    # Only build the call banner when debug logging is on (this runs on every patched call)
+    if logger.isEnabledFor(logging.DEBUG):
+        mode = _state.get_llm_mode()
+        integration_mode = _state.get_llm_integration_mode()
+        logger.debug(f"")
+        logger.debug(f"╔══════════════════════════════════════════════════════════════")
+        logger.debug(f"║ [PATCHED] LLM CALL: AgentCore")
+        logger.debug(f"║ Operation: AgentCore.{operation_name} | LLM Mode: {mode} | Integration: {integration_mode}")
+        logger.debug(f"║ AgentRuntime: {agent_runtime_arn}")
+        logger.debug(f"╚══════════════════════════════════════════════════════════════")
     
     # Pre-call inspection
     if messages:
         try:
-            logger.debug(f"[PATCHED CALL] AgentCore.{operation_name} - Request inspection ({len(messages)} messages)")
+            logger.debug("[PATCHED CALL] AgentCore.%s - Request inspection (%s messages)", operation_name, len(messages))
             inspector = _get_inspector()
             decision = inspector.inspect_conversation(messages, metadata)
-            logger.debug(f"[PATCHED CALL] AgentCore.{operation_name} - Request decision: {decision.action}")
+            logger.debug("[PATCHED CALL] AgentCore.%s - Request decision: %s", operation_name, decision.action)
             set_inspection_context(decision=decision)
             _enforce_decision(decision)
         except SecurityPolicyError:
@@ -520,7 +526,7 @@ def _handle_agentcore_api_mode(operation_name: str, api_params: Dict, wrapped, a
                 set_inspection_context(decision=decision)
     
     # Call original
-    logger.debug(f"[PATCHED CALL] AgentCore.{operation_name} - calling original method")
+    logger.debug("[PATCHED CALL] AgentCore.%s - calling original method", operation_name)
     response = wrapped(*args, **kwargs)
     
     # Post-call inspection
@@ -544,13 +550,13 @@ def _handle_agentcore_api_mode(operation_name: str, api_params: Dict, wrapped, a
         assistant_content = _parse_agentcore_response(response_bytes)
         
         if assistant_content and messages:
-            logger.debug(f"[PATCHED CALL] AgentCore.{operation_name} - Response inspection (response: {len(assistant_content)} chars)")
+            logger.debug("[PATCHED CALL] AgentCore.%s - Response inspection (response: %s chars)", operation_name, len(assistant_content))
             messages_with_response = messages + [
                 {"role": "assistant", "content": assistant_content}
             ]
             inspector = _get_inspector()
             decision = inspector.inspect_conversation(messages_with_response, metadata)
-            logger.debug(f"[PATCHED CALL] AgentCore.{operation_name} - Response decision: {decision.action}")
+            logger.debug("[PATCHED CALL] AgentCore.%s - Response decision: %s", operation_name, decision.action)
             set_inspection_context(decision=decision, done=True)
             _enforce_decision(decision)
     except SecurityPolicyError:
@@ -558,26 +564,23 @@ def _handle_agentcore_api_mode(operation_name: str, api_params: Dict, wrapped, a
     except Exception as e:
         logger.warning(f"[AgentCore.{operation_name} post-call] Inspection error: {e}")
     
-    logger.debug(f"[PATCHED CALL] AgentCore.{operation_name} - complete")
+    logger.debug("[PATCHED CALL] AgentCore.%s - complete", operation_name)
     return response
 
 
 def _should_inspect() -> bool:
     """Check if we should inspect (not already done, mode is not off, and not skipped)."""
-    from .._context import is_llm_skip_active
     if is_llm_skip_active():
         return False
     mode = _state.get_llm_mode()
     if mode == "off":
         return False
-    ctx = get_inspection_context()
-    return not ctx.done
+    return not is_inspection_done()
 
 
 def _enforce_decision(decision: Decision) -> None:
     """Enforce a decision if in enforce mode."""
-    mode = _state.get_llm_mode()
-    if mode == "enforce" and decision.action == "block":
+    if decision.action == "block" and _state.get_llm_mode() == "enforce":
         raise SecurityPolicyError(decision)
 
 
@@ -797,7 +800,6 @@ def _handle_bedrock_gateway_call(operation_name: str, api_params: Dict) -> Dict:
     Returns:
         Bedrock-format response dict (native from gateway)
     """
-    import httpx
     
     gateway_url = _state.get_provider_gateway_url("bedrock")
     gateway_api_key = _state.get_provider_gateway_api_key("bedrock")
@@ -812,8 +814,8 @@ def _handle_bedrock_gateway_call(operation_name: str, api_params: Dict) -> Dict:
     model_id = api_params.get("modelId", "")
     
     # Send native Bedrock request to gateway
-    logger.debug(f"[GATEWAY] Sending native Bedrock request to gateway")
-    logger.debug(f"[GATEWAY] Operation: {operation_name}, Model: {model_id}")
+    logger.debug("[GATEWAY] Sending native Bedrock request to gateway")
+    logger.debug("[GATEWAY] Operation: %s, Model: %s", operation_name, model_id)
     
     try:
         # Build request body based on operation type
@@ -850,7 +852,7 @@ def _handle_bedrock_gateway_call(operation_name: str, api_params: Dict) -> Dict:
             response.raise_for_status()
             response_data = response.json()
         
-        logger.debug(f"[GATEWAY] Received native Bedrock response from gateway")
+        logger.debug("[GATEWAY] Received native Bedrock response from gateway")
         set_inspection_context(decision=Decision.allow(reasons=["Gateway handled inspection"]), done=True)
         
         return response_data
@@ -1060,12 +1062,12 @@ def _handle_agentcore_call(wrapped, instance, args, kwargs, operation_name: str,
         AgentCore response
     """
     if not _should_inspect():
-        logger.debug(f"[PATCHED CALL] AgentCore.{operation_name} - inspection skipped (mode=off or already done)")
+        logger.debug("[PATCHED CALL] AgentCore.%s - inspection skipped (mode=off or already done)", operation_name)
         return wrapped(*args, **kwargs)
     
     # Gateway mode: route through AI Defense Gateway (uses Bedrock gateway config)
     if _should_use_gateway():
-        logger.debug(f"[PATCHED CALL] AgentCore.{operation_name} - Gateway mode - routing to AI Defense Gateway")
+        logger.debug("[PATCHED CALL] AgentCore.%s - Gateway mode - routing to AI Defense Gateway", operation_name)
         return _handle_agentcore_gateway_call(operation_name, api_params, instance)
     
     # API mode: use LLMInspector for inspection
@@ -1096,7 +1098,7 @@ def _wrap_make_api_call(wrapped, instance, args, kwargs):
         return wrapped(*args, **kwargs)
     
     if not _should_inspect():
-        logger.debug(f"[PATCHED CALL] Bedrock.{operation_name} - inspection skipped (mode=off or already done)")
+        logger.debug("[PATCHED CALL] Bedrock.%s - inspection skipped (mode=off or already done)", operation_name)
         return wrapped(*args, **kwargs)
     
     # Extract messages based on operation type
@@ -1114,20 +1116,21 @@ def _wrap_make_api_call(wrapped, instance, args, kwargs):
         
         messages = _parse_bedrock_messages(body, model_id)
     
-    metadata = get_inspection_context().metadata
-    metadata["model_id"] = model_id
+    metadata = {**get_inspection_metadata(), "model_id": model_id}
     
-    mode = _state.get_llm_mode()
-    integration_mode = _state.get_llm_integration_mode()
-    logger.debug(f"")
-    logger.debug(f"╔══════════════════════════════════════════════════════════════")
-    logger.debug(f"║ [PATCHED] LLM CALL: {model_id}")
-    logger.debug(f"║ Operation: Bedrock.{operation_name} | LLM Mode: {mode} | Integration: {integration_mode}")
-    logger.debug(f"╚══════════════════════════════════════════════════════════════")
+    # Only build the call banner when debug logging is on (this runs on every patched call)
+    if logger.isEnabledFor(logging.DEBUG):
+        mode = _state.get_llm_mode()
+        integration_mode = _state.get_llm_integration_mode()
+        logger.debug(f"")
+        logger.debug(f"╔══════════════════════════════════════════════════════════════")
+        logger.debug(f"║ [PATCHED] LLM CALL: {model_id}")
+        logger.debug(f"║ Operation: Bedrock.{operation_name} | LLM Mode: {mode} | Integration: {integration_mode}")
+        logger.debug(f"╚══════════════════════════════════════════════════════════════")
     
     # Gateway mode: route through AI Defense Gateway with format conversion
     if _should_use_gateway():
-        logger.debug(f"[PATCHED CALL] Bedrock.{operation_name} - Gateway mode - routing to AI Defense Gateway")
+        logger.debug("[PATCHED CALL] Bedrock.%s - Gateway mode - routing to AI Defense Gateway", operation_name)
         if operation_name == "Converse":
             return _handle_bedrock_gateway_call(operation_name, api_params)
         elif operation_name == "ConverseStream":
@@ -1147,10 +1150,10 @@ def _wrap_make_api_call(wrapped, instance, args, kwargs):
     # Pre-call inspection with error handling
     if messages:
         try:
-            logger.debug(f"[PATCHED CALL] Bedrock.{operation_name} - Request inspection ({len(messages)} messages)")
+            logger.debug("[PATCHED CALL] Bedrock.%s - Request inspection (%s messages)", operation_name, len(messages))
             inspector = _get_inspector()
             decision = inspector.inspect_conversation(messages, metadata)
-            logger.debug(f"[PATCHED CALL] Bedrock.{operation_name} - Request decision: {decision.action}")
+            logger.debug("[PATCHED CALL] Bedrock.%s - Request decision: %s", operation_name, decision.action)
             set_inspection_context(decision=decision)
             _enforce_decision(decision)
         except SecurityPolicyError:
@@ -1161,7 +1164,7 @@ def _wrap_make_api_call(wrapped, instance, args, kwargs):
                 set_inspection_context(decision=decision)
     
     # Call original
-    logger.debug(f"[PATCHED CALL] Bedrock.{operation_name} - calling original method")
+    logger.debug("[PATCHED CALL] Bedrock.%s - calling original method", operation_name)
     response = wrapped(*args, **kwargs)
     
     # Post-call inspection for non-streaming with error handling
@@ -1192,13 +1195,13 @@ def _wrap_make_api_call(wrapped, instance, args, kwargs):
                     assistant_content = _parse_bedrock_response(response_content, model_id)
             
             if assistant_content and messages:
-                logger.debug(f"[PATCHED CALL] Bedrock.{operation_name} - Response inspection (response: {len(assistant_content)} chars)")
+                logger.debug("[PATCHED CALL] Bedrock.%s - Response inspection (response: %s chars)", operation_name, len(assistant_content))
                 messages_with_response = messages + [
                     {"role": "assistant", "content": assistant_content}
                 ]
                 inspector = _get_inspector()
                 decision = inspector.inspect_conversation(messages_with_response, metadata)
-                logger.debug(f"[PATCHED CALL] Bedrock.{operation_name} - Response decision: {decision.action}")
+                logger.debug("[PATCHED CALL] Bedrock.%s - Response decision: %s", operation_name, decision.action)
                 set_inspection_context(decision=decision, done=True)
                 _enforce_decision(decision)
         except SecurityPolicyError:
@@ -1206,9 +1209,9 @@ def _wrap_make_api_call(wrapped, instance, args, kwargs):
         except Exception as e:
             logger.warning(f"[Bedrock.{operation_name} post-call] Inspection error: {e}")
     else:
-        logger.debug(f"[PATCHED CALL] Bedrock.{operation_name} - streaming response, Response inspection deferred")
+        logger.debug("[PATCHED CALL] Bedrock.%s - streaming response, Response inspection deferred", operation_name)
     
-    logger.debug(f"[PATCHED CALL] Bedrock.{operation_name} - complete")
+    logger.debug("[PATCHED CALL] Bedrock.%s - complete", operation_name)
     return response
 
 
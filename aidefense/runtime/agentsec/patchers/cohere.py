@@ -26,10 +26,11 @@ import threading
 from types import SimpleNamespace
 from typing import Any, Dict, Iterator, List, Optional
 
+import httpx
 import wrapt
 
 from .. import _state
-from .._context import get_inspection_context, set_inspection_context
+from .._context import get_inspection_metadata, is_inspection_done, is_llm_skip_active, set_inspection_context
 from ..decision import Decision
 from ..exceptions import SecurityPolicyError
 from ..inspectors.api_llm import LLMInspector
@@ -43,20 +44,25 @@ _inspector_lock = threading.Lock()
 
 MAX_STREAMING_BUFFER_SIZE = 1_000_000
 
+# Optional call kwargs forwarded as-is to the gateway when set
+_GATEWAY_PASSTHROUGH_PARAMS = ("max_tokens", "temperature", "stop_sequences", "seed", "frequency_penalty", "presence_penalty")
+
 
 def _get_inspector() -> LLMInspector:
     global _inspector
-    if _inspector is None:
-        with _inspector_lock:
-            if _inspector is None:
-                if not _state.is_initialized():
-                    logger.warning("agentsec.protect() not called, using default config")
-                _inspector = LLMInspector(
-                    fail_open=_state.get_api_mode_fail_open_llm(),
-                    default_rules=_state.get_llm_rules(),
-                )
-                from ..inspectors import register_inspector_for_cleanup
-                register_inspector_for_cleanup(_inspector)
+    inspector = _inspector
+    if inspector is not None:
+        return inspector
+    with _inspector_lock:
+        if _inspector is None:
+            if not _state.is_initialized():
+                logger.warning("agentsec.protect() not called, using default config")
+            _inspector = LLMInspector(
+                fail_open=_state.get_api_mode_fail_open_llm(),
+                default_rules=_state.get_llm_rules(),
+            )
+            from ..inspectors import register_inspector_for_cleanup
+            register_inspector_for_cleanup(_inspector)
     return _inspector
 
 
@@ -65,6 +71,7 @@ def _normalize_messages(messages: Any) -> List[Dict[str, Any]]:
     if not messages or not isinstance(messages, (list, tuple)):
         return []
     result = []
+    add = result.append
     for m in messages:
         try:
             if isinstance(m, dict):
@@ -77,9 +84,9 @@ def _normalize_messages(messages: Any) -> List[Dict[str, Any]]:
                 continue
             text = _content_to_string(content)
             if text:
-                result.append({"role": role, "content": text})
+                add({"role": role, "content": text})
         except Exception as e:
-            logger.debug(f"Skip message during normalize: {e}")
+            logger.debug("Skip message during normalize: %s", e)
     return result
 
 
@@ -131,21 +138,20 @@ def _extract_assistant_content(response: Any) -> str:
             return "\n".join(parts)
         return ""
     except Exception as e:
-        logger.debug(f"Error extracting Cohere assistant content: {e}")
+        logger.debug("Error extracting Cohere assistant content: %s", e)
     return ""
 
 
 def _should_inspect() -> bool:
-    from .._context import is_llm_skip_active
-    if is_llm_skip_active():
-        return False
-    if _state.get_llm_mode() == "off":
-        return False
-    return not get_inspection_context().done
+    return (
+        _state.is_llm_inspection_enabled()
+        and not is_llm_skip_active()
+        and not is_inspection_done()
+    )
 
 
 def _enforce_decision(decision: Decision) -> None:
-    if _state.get_llm_mode() == "enforce" and decision.action == "block":
+    if decision.action == "block" and _state.get_llm_mode() == "enforce":
         raise SecurityPolicyError(decision)
 
 
@@ -169,7 +175,6 @@ def _is_gateway_mode() -> bool:
 
 def _should_use_gateway() -> bool:
     """Check if we should use gateway mode for Cohere (gateway enabled, configured, and not skipped)."""
-    from .._context import is_llm_skip_active
     if is_llm_skip_active():
         return False
     if not _is_gateway_mode():
@@ -220,11 +225,9 @@ def _dict_to_cohere_response(data: Dict[str, Any]) -> Any:
 
 def _handle_gateway_call_sync(
     kwargs: Dict[str, Any],
-    normalized: List[Dict[str, Any]],
     metadata: Dict[str, Any],
 ) -> Any:
     """Route Cohere chat request through AI Defense Gateway (sync). Gateway returns full response; streaming not used."""
-    import httpx
     gateway_url = _state.get_provider_gateway_url("cohere")
     gateway_api_key = _state.get_provider_gateway_api_key("cohere")
     if not gateway_url or not gateway_api_key:
@@ -239,9 +242,9 @@ def _handle_gateway_call_sync(
         "model": kwargs.get("model"),
         "messages": _serialize_messages_for_gateway(messages),
     }
-    for key in ["max_tokens", "temperature", "stop_sequences", "seed", "frequency_penalty", "presence_penalty"]:
-        if key in kwargs and kwargs[key] is not None:
-            request_body[key] = kwargs[key]
+    request_body.update(
+        {key: kwargs[key] for key in _GATEWAY_PASSTHROUGH_PARAMS if kwargs.get(key) is not None}
+    )
     full_url = gateway_url.rstrip("/")
     if "/chat" not in full_url and "/v2" not in full_url:
         full_url = f"{full_url}/v2/chat"
@@ -280,11 +283,9 @@ def _handle_gateway_call_sync(
 
 async def _handle_gateway_call_async(
     kwargs: Dict[str, Any],
-    normalized: List[Dict[str, Any]],
     metadata: Dict[str, Any],
 ) -> Any:
     """Route Cohere chat request through AI Defense Gateway (async)."""
-    import httpx
     gateway_url = _state.get_provider_gateway_url("cohere")
     gateway_api_key = _state.get_provider_gateway_api_key("cohere")
     if not gateway_url or not gateway_api_key:
@@ -298,9 +299,9 @@ async def _handle_gateway_call_async(
         "model": kwargs.get("model"),
         "messages": _serialize_messages_for_gateway(messages),
     }
-    for key in ["max_tokens", "temperature", "stop_sequences", "seed", "frequency_penalty", "presence_penalty"]:
-        if key in kwargs and kwargs[key] is not None:
-            request_body[key] = kwargs[key]
+    request_body.update(
+        {key: kwargs[key] for key in _GATEWAY_PASSTHROUGH_PARAMS if kwargs.get(key) is not None}
+    )
     full_url = gateway_url.rstrip("/")
     if "/chat" not in full_url and "/v2" not in full_url:
         full_url = f"{full_url}/v2/chat"
@@ -344,7 +345,8 @@ class _CohereStreamingInspectionWrapper:
         self._stream = stream
         self._messages = messages
         self._metadata = metadata
-        self._buffer = ""
+        self._buffer_parts: List[str] = []
+        self._buffer_len = 0
         self._inspector = _get_inspector()
         self._final_inspection_done = False
 
@@ -370,19 +372,21 @@ class _CohereStreamingInspectionWrapper:
                     text = getattr(delta, "text", None) or getattr(delta, "delta", None)
                     if isinstance(delta, dict):
                         text = text or delta.get("text") or delta.get("delta")
-                    if text and len(self._buffer) < MAX_STREAMING_BUFFER_SIZE:
-                        self._buffer += text[: MAX_STREAMING_BUFFER_SIZE - len(self._buffer)]
+                    if text and self._buffer_len < MAX_STREAMING_BUFFER_SIZE:
+                        piece = text[: MAX_STREAMING_BUFFER_SIZE - self._buffer_len]
+                        self._buffer_parts.append(piece)
+                        self._buffer_len += len(piece)
         except Exception as e:
-            logger.debug(f"Cohere stream chunk handling: {e}")
+            logger.debug("Cohere stream chunk handling: %s", e)
         return chunk
 
     def _perform_final_inspection(self) -> None:
         if self._final_inspection_done:
             return
         self._final_inspection_done = True
-        if not self._buffer or not _should_inspect():
+        if not self._buffer_parts or not _should_inspect():
             return
-        buf = self._buffer[:MAX_STREAMING_BUFFER_SIZE]
+        buf = "".join(self._buffer_parts)
         messages_with_response = self._messages + [{"role": "assistant", "content": buf}]
         try:
             decision = self._inspector.inspect_conversation(messages_with_response, self._metadata)
@@ -401,7 +405,8 @@ class _CohereAsyncStreamingInspectionWrapper:
         self._stream = stream
         self._messages = messages
         self._metadata = metadata
-        self._buffer = ""
+        self._buffer_parts: List[str] = []
+        self._buffer_len = 0
         self._inspector = _get_inspector()
         self._final_inspection_done = False
 
@@ -426,19 +431,21 @@ class _CohereAsyncStreamingInspectionWrapper:
                     text = getattr(delta, "text", None) or getattr(delta, "delta", None)
                     if isinstance(delta, dict):
                         text = text or delta.get("text") or delta.get("delta")
-                    if text and len(self._buffer) < MAX_STREAMING_BUFFER_SIZE:
-                        self._buffer += text[: MAX_STREAMING_BUFFER_SIZE - len(self._buffer)]
+                    if text and self._buffer_len < MAX_STREAMING_BUFFER_SIZE:
+                        piece = text[: MAX_STREAMING_BUFFER_SIZE - self._buffer_len]
+                        self._buffer_parts.append(piece)
+                        self._buffer_len += len(piece)
         except Exception as e:
-            logger.debug(f"Cohere async stream chunk handling: {e}")
+            logger.debug("Cohere async stream chunk handling: %s", e)
         return chunk
 
     async def _perform_final_inspection(self) -> None:
         if self._final_inspection_done:
             return
         self._final_inspection_done = True
-        if not self._buffer or not _should_inspect():
+        if not self._buffer_parts or not _should_inspect():
             return
-        buf = self._buffer[:MAX_STREAMING_BUFFER_SIZE]
+        buf = "".join(self._buffer_parts)
         messages_with_response = self._messages + [{"role": "assistant", "content": buf}]
         try:
             decision = await self._inspector.ainspect_conversation(messages_with_response, self._metadata)
@@ -494,14 +501,15 @@ def _wrap_chat(wrapped, instance, args, kwargs):
         return wrapped(*args, **kwargs)
     model = kwargs.get("model", "unknown")
     messages = kwargs.get("messages", [])
-    normalized = _normalize_messages(messages)
-    metadata = get_inspection_context().metadata
+    metadata = get_inspection_metadata()
 
     if _should_use_gateway():
-        logger.debug(f"[PATCHED] Cohere V2Client.chat gateway mode - routing to AI Defense Gateway")
-        return _handle_gateway_call_sync(kwargs, normalized, metadata)
+        logger.debug("[PATCHED] Cohere V2Client.chat gateway mode - routing to AI Defense Gateway")
+        return _handle_gateway_call_sync(kwargs, metadata)
 
-    logger.debug(f"[PATCHED] Cohere V2Client.chat model={model} messages={len(normalized)}")
+    normalized = _normalize_messages(messages)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"[PATCHED] Cohere V2Client.chat model={model} messages={len(normalized)}")
     try:
         inspector = _get_inspector()
         decision = inspector.inspect_conversation(normalized, metadata)
@@ -537,15 +545,16 @@ def _wrap_chat_stream(wrapped, instance, args, kwargs):
         return wrapped(*args, **kwargs)
     model = kwargs.get("model", "unknown")
     messages = kwargs.get("messages", [])
-    normalized = _normalize_messages(messages)
-    metadata = get_inspection_context().metadata
+    metadata = get_inspection_metadata()
 
     if _should_use_gateway():
-        logger.debug(f"[PATCHED] Cohere V2Client.chat_stream gateway mode - full response as single chunk")
-        response = _handle_gateway_call_sync(kwargs, normalized, metadata)
+        logger.debug("[PATCHED] Cohere V2Client.chat_stream gateway mode - full response as single chunk")
+        response = _handle_gateway_call_sync(kwargs, metadata)
         return _CohereFakeStreamWrapper(response)
 
-    logger.debug(f"[PATCHED] Cohere V2Client.chat_stream model={model} messages={len(normalized)}")
+    normalized = _normalize_messages(messages)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"[PATCHED] Cohere V2Client.chat_stream model={model} messages={len(normalized)}")
     try:
         inspector = _get_inspector()
         decision = inspector.inspect_conversation(normalized, metadata)
@@ -568,14 +577,15 @@ async def _wrap_chat_async(wrapped, instance, args, kwargs):
         return await wrapped(*args, **kwargs)
     model = kwargs.get("model", "unknown")
     messages = kwargs.get("messages", [])
-    normalized = _normalize_messages(messages)
-    metadata = get_inspection_context().metadata
+    metadata = get_inspection_metadata()
 
     if _should_use_gateway():
-        logger.debug(f"[PATCHED] Cohere AsyncV2Client.chat gateway mode - routing to AI Defense Gateway")
-        return await _handle_gateway_call_async(kwargs, normalized, metadata)
+        logger.debug("[PATCHED] Cohere AsyncV2Client.chat gateway mode - routing to AI Defense Gateway")
+        return await _handle_gateway_call_async(kwargs, metadata)
 
-    logger.debug(f"[PATCHED] Cohere AsyncV2Client.chat model={model} messages={len(normalized)}")
+    normalized = _normalize_messages(messages)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"[PATCHED] Cohere AsyncV2Client.chat model={model} messages={len(normalized)}")
     try:
         inspector = _get_inspector()
         decision = await inspector.ainspect_conversation(normalized, metadata)
@@ -611,15 +621,16 @@ async def _wrap_chat_stream_async(wrapped, instance, args, kwargs):
         return await wrapped(*args, **kwargs)
     model = kwargs.get("model", "unknown")
     messages = kwargs.get("messages", [])
-    normalized = _normalize_messages(messages)
-    metadata = get_inspection_context().metadata
+    metadata = get_inspection_metadata()
 
     if _should_use_gateway():
-        logger.debug(f"[PATCHED] Cohere AsyncV2Client.chat_stream gateway mode - full response as single chunk")
-        response = await _handle_gateway_call_async(kwargs, normalized, metadata)
+        logger.debug("[PATCHED] Cohere AsyncV2Client.chat_stream gateway mode - full response as single chunk")
+        response = await _handle_gateway_call_async(kwargs, metadata)
         return _CohereAsyncFakeStreamWrapper(response)
 
-    logger.debug(f"[PATCHED] Cohere AsyncV2Client.chat_stream model={model} messages={len(normalized)}")
+    normalized = _normalize_messages(messages)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"[PATCHED] Cohere AsyncV2Client.chat_stream model={model} messages={len(normalized)}")
     try:
         inspector = _get_inspector()
         decision = await inspector.ainspect_conversation(normalized, metadata)
@@ -636,6 +647,15 @@ async def _wrap_chat_stream_async(wrapped, instance, args, kwargs):
     return _CohereAsyncStreamingInspectionWrapper(stream, normalized, metadata)
 
 
+# Methods wrapped by patch_cohere(), as (module, attribute path, wrapper) triples
+_COHERE_TARGETS = (
+    ("cohere.v2.client", "V2Client.chat", _wrap_chat),
+    ("cohere.v2.client", "V2Client.chat_stream", _wrap_chat_stream),
+    ("cohere.v2.client", "AsyncV2Client.chat", _wrap_chat_async),
+    ("cohere.v2.client", "AsyncV2Client.chat_stream", _wrap_chat_stream_async),
+)
+
+
 def patch_cohere() -> bool:
     """Patch Cohere v2 client for automatic inspection. Returns True if patching succeeded."""
     if is_patched("cohere"):
@@ -644,12 +664,13 @@ def patch_cohere() -> bool:
     if safe_import("cohere") is None:
         return False
     try:
-        wrapt.wrap_function_wrapper("cohere.v2.client", "V2Client.chat", _wrap_chat)
-        wrapt.wrap_function_wrapper("cohere.v2.client", "V2Client.chat_stream", _wrap_chat_stream)
-        wrapt.wrap_function_wrapper("cohere.v2.client", "AsyncV2Client.chat", _wrap_chat_async)
-        wrapt.wrap_function_wrapper("cohere.v2.client", "AsyncV2Client.chat_stream", _wrap_chat_stream_async)
+        for module_path, name, wrapper in _COHERE_TARGETS:
+            wrapt.wrap_function_wrapper(module_path, name, wrapper)
         mark_patched("cohere")
         logger.info("Cohere client patched successfully")
+        if not _is_gateway_mode():
+            # Build the inspector now so the first LLM call doesn't pay for it
+            _get_inspector()
         return True
     except Exception as e:
         logger.warning(f"Failed to patch Cohere: {e}")
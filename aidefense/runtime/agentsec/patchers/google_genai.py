@@ -19,12 +19,13 @@ to the provider-specific AI Defense Gateway in native format.
 
 import logging
 import threading
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import httpx
 import wrapt
 
 from .. import _state
-from .._context import get_inspection_context, set_inspection_context
+from .._context import get_inspection_metadata, is_inspection_done, is_llm_skip_active, set_inspection_context
 from ..decision import Decision
 from ..exceptions import SecurityPolicyError
 from ..inspectors.api_llm import LLMInspector
@@ -45,19 +46,21 @@ _inspector_lock = threading.Lock()
 def _get_inspector() -> LLMInspector:
     """Get or create the LLMInspector instance (thread-safe)."""
     global _inspector
-    if _inspector is None:
-        with _inspector_lock:
-            # Double-check pattern for thread safety
-            if _inspector is None:
-                if not _state.is_initialized():
-                    logger.warning("agentsec.protect() not called, using default config")
-                _inspector = LLMInspector(
-                    fail_open=_state.get_api_mode_fail_open_llm(),
-                    default_rules=_state.get_llm_rules(),
-                )
-                # Register for cleanup on shutdown
-                from ..inspectors import register_inspector_for_cleanup
-                register_inspector_for_cleanup(_inspector)
+    inspector = _inspector
+    if inspector is not None:
+        return inspector
+    with _inspector_lock:
+        # Double-check pattern for thread safety
+        if _inspector is None:
+            if not _state.is_initialized():
+                logger.warning("agentsec.protect() not called, using default config")
+            _inspector = LLMInspector(
+                fail_open=_state.get_api_mode_fail_open_llm(),
+                default_rules=_state.get_llm_rules(),
+            )
+            # Register for cleanup on shutdown
+            from ..inspectors import register_inspector_for_cleanup
+            register_inspector_for_cleanup(_inspector)
     return _inspector
 
 
@@ -68,7 +71,6 @@ def _is_gateway_mode() -> bool:
 
 def _should_use_gateway() -> bool:
     """Check if we should use gateway mode (gateway mode enabled, configured, and not skipped)."""
-    from .._context import is_llm_skip_active
     if is_llm_skip_active():
         return False
     if not _is_gateway_mode():
@@ -84,23 +86,31 @@ def _should_use_gateway() -> bool:
 
 def _should_inspect() -> bool:
     """Check if we should inspect (not already done, mode is not off, and not skipped)."""
-    from .._context import is_llm_skip_active
-    if is_llm_skip_active():
-        return False
-    mode = _state.get_llm_mode()
-    if mode == "off":
-        return False
-    ctx = get_inspection_context()
-    return not ctx.done
+    return (
+        _state.is_llm_inspection_enabled()
+        and not is_llm_skip_active()
+        and not is_inspection_done()
+    )
 
 
 def _enforce_decision(decision: Decision) -> None:
     """Enforce a decision if in enforce mode."""
-    mode = _state.get_llm_mode()
-    if mode == "enforce" and decision.action == "block":
+    if decision.action == "block" and _state.get_llm_mode() == "enforce":
         raise SecurityPolicyError(decision)
 
 
+def _extract_model_and_contents(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Tuple[Any, Any]:
+    """Get (model, contents) from generate_content() call arguments, keyword or positional."""
+    nargs = len(args)
+    model = kwargs.get("model")
+    if model is None and nargs:
+        model = args[0]
+    contents = kwargs.get("contents")
+    if contents is None and nargs > 1:
+        contents = args[1]
+    return model, contents
+
+
 def _extract_model_name(model: Any) -> str:
     """Extract model name from model parameter."""
     if model is None:
@@ -158,7 +168,7 @@ def _extract_genai_response(response: Any) -> str:
         return result if result is not None else ""
         
     except Exception as e:
-        logger.debug(f"Error extracting google-genai response: {e}")
+        logger.debug("Error extracting google-genai response: %s", e)
     
     return ""
 
@@ -182,7 +192,6 @@ def _handle_google_genai_gateway_call(
     Returns:
         Native response wrapped for attribute access
     """
-    import httpx
     
     # Try google_genai gateway first, fall back to vertexai
     gateway_url = _state.get_provider_gateway_url("google_genai")
@@ -239,8 +248,8 @@ def _handle_google_genai_gateway_call(
         if config_dict:
             request_body["generationConfig"] = config_dict
     
-    logger.debug(f"[GATEWAY] Sending native google-genai request to gateway")
-    logger.debug(f"[GATEWAY] Model: {model_name}")
+    logger.debug("[GATEWAY] Sending native google-genai request to gateway")
+    logger.debug("[GATEWAY] Model: %s", model_name)
     
     try:
         with httpx.Client(timeout=60.0) as client:
@@ -255,7 +264,7 @@ def _handle_google_genai_gateway_call(
             response.raise_for_status()
             response_data = response.json()
         
-        logger.debug(f"[GATEWAY] Received native google-genai response from gateway")
+        logger.debug("[GATEWAY] Received native google-genai response from gateway")
         set_inspection_context(decision=Decision.allow(reasons=["Gateway handled inspection"]), done=True)
         
         # Wrap response for attribute access
@@ -286,24 +295,20 @@ def _handle_google_genai_gateway_call(
 class _GoogleGenAIResponseWrapper:
     """Wrapper to provide attribute access to native google-genai response dict."""
     
+    __slots__ = ("_data", "candidates")
+    
     def __init__(self, response_data: Dict):
         if not isinstance(response_data, dict):
             logger.warning(f"Invalid gateway response type: {type(response_data)}, expected dict")
             raise ValueError(f"Invalid gateway response: expected dict, got {type(response_data)}")
         self._data = response_data
-        self._candidates = None
-    
-    @property
-    def candidates(self):
-        if self._candidates is None:
-            try:
-                self._candidates = [
-                    _CandidateWrapper(c) for c in self._data.get("candidates", [])
-                ]
-            except (TypeError, KeyError, AttributeError) as e:
-                logger.warning(f"Error parsing candidates from gateway response: {e}")
-                self._candidates = []
-        return self._candidates
+        try:
+            self.candidates = [
+                _CandidateWrapper(c) for c in response_data.get("candidates", ())
+            ]
+        except (TypeError, KeyError, AttributeError) as e:
+            logger.warning(f"Error parsing candidates from gateway response: {e}")
+            self.candidates = []
     
     @property
     def text(self):
@@ -320,48 +325,33 @@ class _GoogleGenAIResponseWrapper:
 class _CandidateWrapper:
     """Wrapper for candidate in response."""
     
+    __slots__ = ("_data", "content", "finish_reason")
+    
     def __init__(self, candidate_data: Dict):
         self._data = candidate_data
-        self._content = None
-    
-    @property
-    def content(self):
-        if self._content is None:
-            self._content = _ContentWrapper(self._data.get("content", {}))
-        return self._content
-    
-    @property
-    def finish_reason(self):
-        return self._data.get("finishReason")
+        self.content = _ContentWrapper(candidate_data.get("content", {}))
+        self.finish_reason = candidate_data.get("finishReason")
 
 
 class _ContentWrapper:
     """Wrapper for content in response."""
     
+    __slots__ = ("_data", "role", "parts")
+    
     def __init__(self, content_data: Dict):
         self._data = content_data
-        self._parts = None
-    
-    @property
-    def role(self):
-        return self._data.get("role", "model")
-    
-    @property
-    def parts(self):
-        if self._parts is None:
-            self._parts = [_PartWrapper(p) for p in self._data.get("parts", [])]
-        return self._parts
+        self.role = content_data.get("role", "model")
+        self.parts = [_PartWrapper(p) for p in content_data.get("parts", ())]
 
 
 class _PartWrapper:
     """Wrapper for part in response."""
     
+    __slots__ = ("_data", "text")
+    
     def __init__(self, part_data: Dict):
         self._data = part_data
-    
-    @property
-    def text(self):
-        return self._data.get("text", "")
+        self.text = part_data.get("text", "")
 
 
 class GoogleGenAIStreamingWrapper:
@@ -476,74 +466,66 @@ def _wrap_generate_content(wrapped, instance, args, kwargs):
             config=GenerateContentConfig(...)
         )
     """
-    # Extract model name from kwargs or args
-    model = kwargs.get("model")
-    if model is None and args:
-        model = args[0]
-    model_name = _extract_model_name(model)
-    
     if not _should_inspect():
-        logger.debug(f"[PATCHED CALL] google-genai.generate_content - inspection skipped (mode=off or already done)")
+        logger.debug("[PATCHED CALL] google-genai.generate_content - inspection skipped (mode=off or already done)")
         return wrapped(*args, **kwargs)
     
-    # Extract contents from kwargs
-    contents = kwargs.get("contents")
-    if contents is None and len(args) > 1:
-        contents = args[1]
+    model, contents = _extract_model_and_contents(args, kwargs)
+    model_name = _extract_model_name(model)
     
     config = kwargs.get("config")
     
-    # Normalize messages
-    normalized = _normalize_genai_contents(contents)
-    metadata = get_inspection_context().metadata
-    metadata["provider"] = "google_genai"
-    metadata["model"] = model_name
-    
-    mode = _state.get_llm_mode()
-    integration_mode = _state.get_llm_integration_mode()
-    logger.debug(f"")
-    logger.debug(f"╔══════════════════════════════════════════════════════════════")
-    logger.debug(f"║ [PATCHED] LLM CALL: {model_name}")
-    logger.debug(f"║ Operation: google-genai.generate_content | LLM Mode: {mode} | Integration: {integration_mode}")
-    logger.debug(f"╚══════════════════════════════════════════════════════════════")
+    # Only build the call banner when debug logging is on (this runs on every patched call)
+    if logger.isEnabledFor(logging.DEBUG):
+        mode = _state.get_llm_mode()
+        integration_mode = _state.get_llm_integration_mode()
+        logger.debug(f"")
+        logger.debug(f"╔══════════════════════════════════════════════════════════════")
+        logger.debug(f"║ [PATCHED] LLM CALL: {model_name}")
+        logger.debug(f"║ Operation: google-genai.generate_content | LLM Mode: {mode} | Integration: {integration_mode}")
+        logger.debug(f"╚══════════════════════════════════════════════════════════════")
     
     # Gateway mode: route through AI Defense Gateway
     if _should_use_gateway():
-        logger.debug(f"[PATCHED CALL] google-genai.generate_content - Gateway mode - routing to AI Defense Gateway")
+        logger.debug("[PATCHED CALL] google-genai.generate_content - Gateway mode - routing to AI Defense Gateway")
         return _handle_google_genai_gateway_call(
             model_name=model_name,
             contents=contents,
             config=config,
         )
     
+    # Normalize messages; metadata is built per call (never written into the shared context dict)
+    normalized = _normalize_genai_contents(contents)
+    metadata = {**get_inspection_metadata(), "provider": "google_genai", "model": model_name}
+    
     # API mode (default): use LLMInspector for inspection
     # Pre-call inspection
     if normalized:
-        logger.debug(f"[PATCHED CALL] google-genai.generate_content - Request inspection ({len(normalized)} messages)")
+        logger.debug("[PATCHED CALL] google-genai.generate_content - Request inspection (%s messages)", len(normalized))
         inspector = _get_inspector()
         decision = inspector.inspect_conversation(normalized, metadata)
-        logger.debug(f"[PATCHED CALL] google-genai.generate_content - Request decision: {decision.action}")
+        logger.debug("[PATCHED CALL] google-genai.generate_content - Request decision: %s", decision.action)
         set_inspection_context(decision=decision)
         _enforce_decision(decision)
     
     # Call the original
-    logger.debug(f"[PATCHED CALL] google-genai.generate_content - calling original method")
+    logger.debug("[PATCHED CALL] google-genai.generate_content - calling original method")
     response = wrapped(*args, **kwargs)
     
     # Post-call inspection for non-streaming
     assistant_content = _extract_genai_response(response)
     if assistant_content and normalized:
-        logger.debug(f"[PATCHED CALL] google-genai.generate_content - Response inspection (response: {len(assistant_content)} chars)")
+        logger.debug("[PATCHED CALL] google-genai.generate_content - Response inspection (response: %s chars)", len(assistant_content))
         messages_with_response = normalized + [
             {"role": "assistant", "content": assistant_content}
         ]
         inspector = _get_inspector()
         decision = inspector.inspect_conversation(messages_with_response, metadata)
-        logger.debug(f"[PATCHED CALL] google-genai.generate_content - Response decision: {decision.action}")
+        logger.debug("[PATCHED CALL] google-genai.generate_content - Response decision: %s", decision.action)
         set_inspection_context(decision=decision, done=True)
         _enforce_decision(decision)
     
-    logger.debug(f"[PATCHED CALL] google-genai.generate_content - complete")
+    logger.debug("[PATCHED CALL] google-genai.generate_content - complete")
     return response
 
 
@@ -551,40 +533,28 @@ async def _wrap_generate_content_async(wrapped, instance, args, kwargs):
     """
     Async wrapper for Models.generate_content() when called with async client.
     """
-    # Extract model name
-    model = kwargs.get("model")
-    if model is None and args:
-        model = args[0]
-    model_name = _extract_model_name(model)
-    
     if not _should_inspect():
-        logger.debug(f"[PATCHED CALL] google-genai.async.generate_content - inspection skipped")
+        logger.debug("[PATCHED CALL] google-genai.async.generate_content - inspection skipped")
         return await wrapped(*args, **kwargs)
     
-    # Extract contents
-    contents = kwargs.get("contents")
-    if contents is None and len(args) > 1:
-        contents = args[1]
+    model, contents = _extract_model_and_contents(args, kwargs)
+    model_name = _extract_model_name(model)
     
     config = kwargs.get("config")
     
-    # Normalize messages
-    normalized = _normalize_genai_contents(contents)
-    metadata = get_inspection_context().metadata
-    metadata["provider"] = "google_genai"
-    metadata["model"] = model_name
-    
-    mode = _state.get_llm_mode()
-    integration_mode = _state.get_llm_integration_mode()
-    logger.debug(f"")
-    logger.debug(f"╔══════════════════════════════════════════════════════════════")
-    logger.debug(f"║ [PATCHED] LLM CALL (async): {model_name}")
-    logger.debug(f"║ Operation: google-genai.async.generate_content | LLM Mode: {mode} | Integration: {integration_mode}")
-    logger.debug(f"╚══════════════════════════════════════════════════════════════")
+    # Only build the call banner when debug logging is on (this runs on every patched call)
+    if logger.isEnabledFor(logging.DEBUG):
+        mode = _state.get_llm_mode()
+        integration_mode = _state.get_llm_integration_mode()
+        logger.debug(f"")
+        logger.debug(f"╔══════════════════════════════════════════════════════════════")
+        logger.debug(f"║ [PATCHED] LLM CALL (async): {model_name}")
+        logger.debug(f"║ Operation: google-genai.async.generate_content | LLM Mode: {mode} | Integration: {integration_mode}")
+        logger.debug(f"╚══════════════════════════════════════════════════════════════")
     
     # Gateway mode
     if _should_use_gateway():
-        logger.debug(f"[PATCHED CALL] google-genai.async - Gateway mode - routing to AI Defense Gateway")
+        logger.debug("[PATCHED CALL] google-genai.async - Gateway mode - routing to AI Defense Gateway")
         # For now, use sync gateway call (could be made async)
         return _handle_google_genai_gateway_call(
             model_name=model_name,
@@ -592,32 +562,36 @@ async def _wrap_generate_content_async(wrapped, instance, args, kwargs):
             config=config,
         )
     
+    # Normalize messages; metadata is built per call (never written into the shared context dict)
+    normalized = _normalize_genai_contents(contents)
+    metadata = {**get_inspection_metadata(), "provider": "google_genai", "model": model_name}
+    
     # API mode: Pre-call inspection
     if normalized:
-        logger.debug(f"[PATCHED CALL] google-genai.async - Request inspection ({len(normalized)} messages)")
+        logger.debug("[PATCHED CALL] google-genai.async - Request inspection (%s messages)", len(normalized))
         inspector = _get_inspector()
         decision = await inspector.ainspect_conversation(normalized, metadata)
-        logger.debug(f"[PATCHED CALL] google-genai.async - Request decision: {decision.action}")
+        logger.debug("[PATCHED CALL] google-genai.async - Request decision: %s", decision.action)
         set_inspection_context(decision=decision)
         _enforce_decision(decision)
     
     # Call the original
-    logger.debug(f"[PATCHED CALL] google-genai.async - calling original method")
+    logger.debug("[PATCHED CALL] google-genai.async - calling original method")
     response = await wrapped(*args, **kwargs)
     
     # Post-call inspection
     assistant_content = _extract_genai_response(response)
     if assistant_content and normalized:
-        logger.debug(f"[PATCHED CALL] google-genai.async - Response inspection")
+        logger.debug("[PATCHED CALL] google-genai.async - Response inspection")
         messages_with_response = normalized + [
             {"role": "assistant", "content": assistant_content}
         ]
         decision = await inspector.ainspect_conversation(messages_with_response, metadata)
-        logger.debug(f"[PATCHED CALL] google-genai.async - Response decision: {decision.action}")
+        logger.debug("[PATCHED CALL] google-genai.async - Response decision: %s", decision.action)
         set_inspection_context(decision=decision, done=True)
         _enforce_decision(decision)
     
-    logger.debug(f"[PATCHED CALL] google-genai.async - complete")
+    logger.debug("[PATCHED CALL] google-genai.async - complete")
     return response
 
 
@@ -668,7 +642,7 @@ def patch_google_genai() -> bool:
             )
             logger.debug("Patched google.genai.models.AsyncModels.generate_content")
         except Exception as e:
-            logger.debug(f"AsyncModels.generate_content not found or failed to patch: {e}")
+            logger.debug("AsyncModels.generate_content not found or failed to patch: %s", e)
         
         mark_patched("google_genai")
         logger.info("google-genai patched successfully")
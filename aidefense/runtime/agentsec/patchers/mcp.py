@@ -22,7 +22,7 @@ from typing import Any, Dict, Optional, Union
 import wrapt
 
 from .. import _state
-from .._context import get_inspection_context, set_inspection_context
+from .._context import get_inspection_metadata, is_mcp_skip_active, set_inspection_context
 from ..decision import Decision
 from ..exceptions import SecurityPolicyError
 from ..inspectors.api_mcp import MCPInspector
@@ -94,7 +94,6 @@ def _get_gateway_mode_setting() -> str:
 
 def _should_use_gateway() -> bool:
     """Check if we should use gateway mode for MCP (not skipped)."""
-    from .._context import is_mcp_skip_active
     if is_mcp_skip_active():
         return False
     if not _is_gateway_mode():
@@ -107,19 +106,12 @@ def _should_use_gateway() -> bool:
 
 def _should_inspect() -> bool:
     """Check if we should inspect (applies to API mode, and not skipped)."""
-    from .._context import is_mcp_skip_active
-    if is_mcp_skip_active():
-        return False
-    mode = _state.get_mcp_mode()
-    if mode == "off":
-        return False
-    return True
+    return _state.is_mcp_inspection_enabled() and not is_mcp_skip_active()
 
 
 def _enforce_decision(decision: Decision) -> None:
     """Enforce a decision if in enforce mode."""
-    mode = _state.get_mcp_mode()
-    if mode == "enforce" and decision.action == "block":
+    if decision.action == "block" and _state.get_mcp_mode() == "enforce":
         raise SecurityPolicyError(decision)
 
 
@@ -143,8 +135,8 @@ def _wrap_streamablehttp_client(wrapped, instance, args, kwargs):
             
             if not _gateway_mode_logged:
                 logger.info(f"[MCP GATEWAY] Redirecting MCP connections to gateway")
-                logger.debug(f"[MCP GATEWAY] Original URL: {original_url}")
-                logger.debug(f"[MCP GATEWAY] Gateway URL: {redirect_url}")
+                logger.debug("[MCP GATEWAY] Original URL: %s", original_url)
+                logger.debug("[MCP GATEWAY] Gateway URL: %s", redirect_url)
                 _gateway_mode_logged = True
             
             # Replace URL with gateway URL
@@ -181,34 +173,34 @@ async def _wrap_call_tool(wrapped, instance, args, kwargs):
     
     # Log the call
     if use_gateway:
-        logger.debug(f"")
-        logger.debug(f"╔══════════════════════════════════════════════════════════════")
-        logger.debug(f"║ [PATCHED] MCP TOOL CALL: {tool_name}")
-        logger.debug(f"║ Arguments: {arguments}")
-        logger.debug(f"║ Integration: gateway (gateway handles inspection)")
-        logger.debug(f"╚══════════════════════════════════════════════════════════════")
+        logger.debug("")
+        logger.debug("╔══════════════════════════════════════════════════════════════")
+        logger.debug("║ [PATCHED] MCP TOOL CALL: %s", tool_name)
+        logger.debug("║ Arguments: %s", arguments)
+        logger.debug("║ Integration: gateway (gateway handles inspection)")
+        logger.debug("╚══════════════════════════════════════════════════════════════")
     else:
         mode = _state.get_mcp_mode()
-        logger.debug(f"")
-        logger.debug(f"╔══════════════════════════════════════════════════════════════")
-        logger.debug(f"║ [PATCHED] MCP TOOL CALL: {tool_name}")
-        logger.debug(f"║ Arguments: {arguments}")
-        logger.debug(f"║ MCP Mode: {mode} | Integration: {integration_mode}")
-        logger.debug(f"╚══════════════════════════════════════════════════════════════")
+        logger.debug("")
+        logger.debug("╔══════════════════════════════════════════════════════════════")
+        logger.debug("║ [PATCHED] MCP TOOL CALL: %s", tool_name)
+        logger.debug("║ Arguments: %s", arguments)
+        logger.debug("║ MCP Mode: %s | Integration: %s", mode, integration_mode)
+        logger.debug("╚══════════════════════════════════════════════════════════════")
     
     # Check if inspection is enabled (API mode only)
     if not use_gateway and not _should_inspect():
-        logger.debug(f"[PATCHED CALL] MCP.call_tool({tool_name}) - inspection skipped (mode=off)")
+        logger.debug("[PATCHED CALL] MCP.call_tool(%s) - inspection skipped (mode=off)", tool_name)
         return await wrapped(*args, **kwargs)
     
-    metadata = get_inspection_context().metadata
+    metadata = get_inspection_metadata()
     inspector = _get_inspector()
     
     # Pre-call inspection
     try:
-        logger.debug(f"[PATCHED CALL] MCP.call_tool({tool_name}) - Request inspection")
+        logger.debug("[PATCHED CALL] MCP.call_tool(%s) - Request inspection", tool_name)
         decision = await inspector.ainspect_request(tool_name, arguments, metadata)
-        logger.debug(f"[PATCHED CALL] MCP.call_tool({tool_name}) - Request decision: {decision.action}")
+        logger.debug("[PATCHED CALL] MCP.call_tool(%s) - Request decision: %s", tool_name, decision.action)
         set_inspection_context(decision=decision)
         _enforce_decision(decision)
     except SecurityPolicyError:
@@ -223,14 +215,14 @@ async def _wrap_call_tool(wrapped, instance, args, kwargs):
         logger.warning(f"fail_open=True, proceeding despite inspection error")
     
     # Call original
-    logger.debug(f"[PATCHED CALL] MCP.call_tool({tool_name}) - calling original method")
+    logger.debug("[PATCHED CALL] MCP.call_tool(%s) - calling original method", tool_name)
     result = await wrapped(*args, **kwargs)
     
     # Post-call inspection
     try:
-        logger.debug(f"[PATCHED CALL] MCP.call_tool({tool_name}) - Response inspection")
+        logger.debug("[PATCHED CALL] MCP.call_tool(%s) - Response inspection", tool_name)
         decision = await inspector.ainspect_response(tool_name, arguments, result, metadata)
-        logger.debug(f"[PATCHED CALL] MCP.call_tool({tool_name}) - Response decision: {decision.action}")
+        logger.debug("[PATCHED CALL] MCP.call_tool(%s) - Response decision: %s", tool_name, decision.action)
         set_inspection_context(decision=decision, done=True)
         _enforce_decision(decision)
     except SecurityPolicyError:
@@ -238,7 +230,7 @@ async def _wrap_call_tool(wrapped, instance, args, kwargs):
     except Exception as e:
         logger.warning(f"[PATCHED CALL] MCP.call_tool({tool_name}) - Response inspection error: {e}")
     
-    logger.debug(f"[PATCHED CALL] MCP.call_tool({tool_name}) - complete")
+    logger.debug("[PATCHED CALL] MCP.call_tool(%s) - complete", tool_name)
     return result
 
 
@@ -258,34 +250,34 @@ async def _wrap_get_prompt(wrapped, instance, args, kwargs):
     
     # Log the call
     if use_gateway:
-        logger.debug(f"")
-        logger.debug(f"╔══════════════════════════════════════════════════════════════")
-        logger.debug(f"║ [PATCHED] MCP GET PROMPT: {prompt_name}")
-        logger.debug(f"║ Arguments: {arguments}")
-        logger.debug(f"║ Integration: gateway (gateway handles inspection)")
-        logger.debug(f"╚══════════════════════════════════════════════════════════════")
+        logger.debug("")
+        logger.debug("╔══════════════════════════════════════════════════════════════")
+        logger.debug("║ [PATCHED] MCP GET PROMPT: %s", prompt_name)
+        logger.debug("║ Arguments: %s", arguments)
+        logger.debug("║ Integration: gateway (gateway handles inspection)")
+        logger.debug("╚══════════════════════════════════════════════════════════════")
     else:
         mode = _state.get_mcp_mode()
-        logger.debug(f"")
-        logger.debug(f"╔══════════════════════════════════════════════════════════════")
-        logger.debug(f"║ [PATCHED] MCP GET PROMPT: {prompt_name}")
-        logger.debug(f"║ Arguments: {arguments}")
-        logger.debug(f"║ MCP Mode: {mode} | Integration: {integration_mode}")
-        logger.debug(f"╚══════════════════════════════════════════════════════════════")
+        logger.debug("")
+        logger.debug("╔══════════════════════════════════════════════════════════════")
+        logger.debug("║ [PATCHED] MCP GET PROMPT: %s", prompt_name)
+        logger.debug("║ Arguments: %s", arguments)
+        logger.debug("║ MCP Mode: %s | Integration: %s", mode, integration_mode)
+        logger.debug("╚══════════════════════════════════════════════════════════════")
     
     # Check if inspection is enabled (API mode only)
     if not use_gateway and not _should_inspect():
-        logger.debug(f"[PATCHED CALL] MCP.get_prompt({prompt_name}) - inspection skipped (mode=off)")
+        logger.debug("[PATCHED CALL] MCP.get_prompt(%s) - inspection skipped (mode=off)", prompt_name)
         return await wrapped(*args, **kwargs)
     
-    metadata = get_inspection_context().metadata
+    metadata = get_inspection_metadata()
     inspector = _get_inspector()
     
     # Pre-call inspection
     try:
-        logger.debug(f"[PATCHED CALL] MCP.get_prompt({prompt_name}) - Request inspection")
+        logger.debug("[PATCHED CALL] MCP.get_prompt(%s) - Request inspection", prompt_name)
         decision = await inspector.ainspect_request(prompt_name, arguments or {}, metadata, method="prompts/get")
-        logger.debug(f"[PATCHED CALL] MCP.get_prompt({prompt_name}) - Request decision: {decision.action}")
+        logger.debug("[PATCHED CALL] MCP.get_prompt(%s) - Request decision: %s", prompt_name, decision.action)
         set_inspection_context(decision=decision)
         _enforce_decision(decision)
     except SecurityPolicyError:
@@ -300,14 +292,14 @@ async def _wrap_get_prompt(wrapped, instance, args, kwargs):
         logger.warning(f"fail_open=True, proceeding despite inspection error")
     
     # Call original
-    logger.debug(f"[PATCHED CALL] MCP.get_prompt({prompt_name}) - calling original method")
+    logger.debug("[PATCHED CALL] MCP.get_prompt(%s) - calling original method", prompt_name)
     result = await wrapped(*args, **kwargs)
     
     # Post-call inspection
     try:
-        logger.debug(f"[PATCHED CALL] MCP.get_prompt({prompt_name}) - Response inspection")
+        logger.debug("[PATCHED CALL] MCP.get_prompt(%s) - Response inspection", prompt_name)
         decision = await inspector.ainspect_response(prompt_name, arguments or {}, result, metadata, method="prompts/get")
-        logger.debug(f"[PATCHED CALL] MCP.get_prompt({prompt_name}) - Response decision: {decision.action}")
+        logger.debug("[PATCHED CALL] MCP.get_prompt(%s) - Response decision: %s", prompt_name, decision.action)
         set_inspection_context(decision=decision, done=True)
         _enforce_decision(decision)
     except SecurityPolicyError:
@@ -315,7 +307,7 @@ async def _wrap_get_prompt(wrapped, instance, args, kwargs):
     except Exception as e:
         logger.warning(f"[PATCHED CALL] MCP.get_prompt({prompt_name}) - Response inspection error: {e}")
     
-    logger.debug(f"[PATCHED CALL] MCP.get_prompt({prompt_name}) - complete")
+    logger.debug("[PATCHED CALL] MCP.get_prompt(%s) - complete", prompt_name)
     return result
 
 
@@ -334,32 +326,32 @@ async def _wrap_read_resource(wrapped, instance, args, kwargs):
     
     # Log the call
     if use_gateway:
-        logger.debug(f"")
-        logger.debug(f"╔══════════════════════════════════════════════════════════════")
-        logger.debug(f"║ [PATCHED] MCP READ RESOURCE: {resource_uri}")
-        logger.debug(f"║ Integration: gateway (gateway handles inspection)")
-        logger.debug(f"╚══════════════════════════════════════════════════════════════")
+        logger.debug("")
+        logger.debug("╔══════════════════════════════════════════════════════════════")
+        logger.debug("║ [PATCHED] MCP READ RESOURCE: %s", resource_uri)
+        logger.debug("║ Integration: gateway (gateway handles inspection)")
+        logger.debug("╚══════════════════════════════════════════════════════════════")
     else:
         mode = _state.get_mcp_mode()
-        logger.debug(f"")
-        logger.debug(f"╔══════════════════════════════════════════════════════════════")
-        logger.debug(f"║ [PATCHED] MCP READ RESOURCE: {resource_uri}")
-        logger.debug(f"║ MCP Mode: {mode} | Integration: {integration_mode}")
-        logger.debug(f"╚══════════════════════════════════════════════════════════════")
+        logger.debug("")
+        logger.debug("╔══════════════════════════════════════════════════════════════")
+        logger.debug("║ [PATCHED] MCP READ RESOURCE: %s", resource_uri)
+        logger.debug("║ MCP Mode: %s | Integration: %s", mode, integration_mode)
+        logger.debug("╚══════════════════════════════════════════════════════════════")
     
     # Check if inspection is enabled (API mode only)
     if not use_gateway and not _should_inspect():
-        logger.debug(f"[PATCHED CALL] MCP.read_resource({resource_uri}) - inspection skipped (mode=off)")
+        logger.debug("[PATCHED CALL] MCP.read_resource(%s) - inspection skipped (mode=off)", resource_uri)
         return await wrapped(*args, **kwargs)
     
-    metadata = get_inspection_context().metadata
+    metadata = get_inspection_metadata()
     inspector = _get_inspector()
     
     # Pre-call inspection
     try:
-        logger.debug(f"[PATCHED CALL] MCP.read_resource({resource_uri}) - Request inspection")
+        logger.debug("[PATCHED CALL] MCP.read_resource(%s) - Request inspection", resource_uri)
         decision = await inspector.ainspect_request(resource_uri, {}, metadata, method="resources/read")
-        logger.debug(f"[PATCHED CALL] MCP.read_resource({resource_uri}) - Request decision: {decision.action}")
+        logger.debug("[PATCHED CALL] MCP.read_resource(%s) - Request decision: %s", resource_uri, decision.action)
         set_inspection_context(decision=decision)
         _enforce_decision(decision)
     except SecurityPolicyError:
@@ -374,14 +366,14 @@ async def _wrap_read_resource(wrapped, instance, args, kwargs):
         logger.warning(f"fail_open=True, proceeding despite inspection error")
     
     # Call original
-    logger.debug(f"[PATCHED CALL] MCP.read_resource({resource_uri}) - calling original method")
+    logger.debug("[PATCHED CALL] MCP.read_resource(%s) - calling original method", resource_uri)
     result = await wrapped(*args, **kwargs)
     
     # Post-call inspection
     try:
-        logger.debug(f"[PATCHED CALL] MCP.read_resource({resource_uri}) - Response inspection")
+        logger.debug("[PATCHED CALL] MCP.read_resource(%s) - Response inspection", resource_uri)
         decision = await inspector.ainspect_response(resource_uri, {}, result, metadata, method="resources/read")
-        logger.debug(f"[PATCHED CALL] MCP.read_resource({resource_uri}) - Response decision: {decision.action}")
+        logger.debug("[PATCHED CALL] MCP.read_resource(%s) - Response decision: %s", resource_uri, decision.action)
         set_inspection_context(decision=decision, done=True)
         _enforce_decision(decision)
     except SecurityPolicyError:
@@ -389,7 +381,7 @@ async def _wrap_read_resource(wrapped, instance, args, kwargs):
     except Exception as e:
         logger.warning(f"[PATCHED CALL] MCP.read_resource({resource_uri}) - Response inspection error: {e}")
     
-    logger.debug(f"[PATCHED CALL] MCP.read_resource({resource_uri}) - complete")
+    logger.debug("[PATCHED CALL] MCP.read_resource(%s) - complete", resource_uri)
     return result
 
 
@@ -458,7 +450,7 @@ def patch_mcp() -> bool:
             logger.debug("MCP streamablehttp_client patched for gateway mode")
         except Exception as e:
             # This is less critical - only needed for gateway mode URL redirection
-            logger.debug(f"Could not patch streamablehttp_client (gateway mode): {e}")
+            logger.debug("Could not patch streamablehttp_client (gateway mode): %s", e)
         
         mark_patched("mcp")
         # Build list of patched methods for logging
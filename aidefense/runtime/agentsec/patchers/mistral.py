@@ -28,10 +28,11 @@ import threading
 from types import SimpleNamespace
 from typing import Any, Dict, Iterator, List, Optional
 
+import httpx
 import wrapt
 
 from .. import _state
-from .._context import get_inspection_context, set_inspection_context
+from .._context import get_inspection_metadata, is_inspection_done, is_llm_skip_active, set_inspection_context
 from ..decision import Decision
 from ..exceptions import SecurityPolicyError
 from ..inspectors.api_llm import LLMInspector
@@ -45,20 +46,25 @@ _inspector_lock = threading.Lock()
 
 MAX_STREAMING_BUFFER_SIZE = 1_000_000
 
+# Optional call kwargs forwarded as-is to the gateway when set
+_GATEWAY_PASSTHROUGH_PARAMS = ("temperature", "max_tokens", "stream", "stop", "top_p", "presence_penalty", "frequency_penalty")
+
 
 def _get_inspector() -> LLMInspector:
     global _inspector
-    if _inspector is None:
-        with _inspector_lock:
-            if _inspector is None:
-                if not _state.is_initialized():
-                    logger.warning("agentsec.protect() not called, using default config")
-                _inspector = LLMInspector(
-                    fail_open=_state.get_api_mode_fail_open_llm(),
-                    default_rules=_state.get_llm_rules(),
-                )
-                from ..inspectors import register_inspector_for_cleanup
-                register_inspector_for_cleanup(_inspector)
+    inspector = _inspector
+    if inspector is not None:
+        return inspector
+    with _inspector_lock:
+        if _inspector is None:
+            if not _state.is_initialized():
+                logger.warning("agentsec.protect() not called, using default config")
+            _inspector = LLMInspector(
+                fail_open=_state.get_api_mode_fail_open_llm(),
+                default_rules=_state.get_llm_rules(),
+            )
+            from ..inspectors import register_inspector_for_cleanup
+            register_inspector_for_cleanup(_inspector)
     return _inspector
 
 
@@ -67,58 +73,63 @@ def _normalize_messages(messages: Any) -> List[Dict[str, Any]]:
     if not messages or not isinstance(messages, (list, tuple)):
         return []
     result = []
+    add = result.append
     for m in messages:
         try:
             if isinstance(m, dict):
                 role = m.get("role", "user")
+                if role in ("tool", "function"):
+                    continue
                 content = m.get("content") or ""
             else:
                 role = getattr(m, "role", "user")
+                if role in ("tool", "function"):
+                    continue
                 content = getattr(m, "content", None) or ""
             if isinstance(content, list):
                 text_parts = []
+                append = text_parts.append
                 for block in content:
                     if isinstance(block, dict):
-                        text_parts.append(block.get("text", block.get("content", "")))
+                        text = block.get("text", block.get("content", ""))
                     elif isinstance(block, str):
-                        text_parts.append(block)
-                    elif hasattr(block, "text"):
-                        text_parts.append(getattr(block, "text", "") or "")
-                content = "\n".join(p for p in text_parts if p)
-            if role in ("tool", "function"):
-                continue
+                        text = block
+                    else:
+                        text = getattr(block, "text", None)
+                    if text:
+                        append(text)
+                content = "\n".join(text_parts)
             if content:
-                result.append({"role": role, "content": content})
+                add({"role": role, "content": content})
         except Exception as e:
-            logger.debug(f"Skip message during normalize: {e}")
+            logger.debug("Skip message during normalize: %s", e)
     return result
 
 
 def _extract_assistant_content(response: Any) -> str:
     """Extract assistant text from Mistral ChatCompletionResponse (OpenAI-compatible)."""
     try:
-        if hasattr(response, "choices") and response.choices:
-            choice = response.choices[0]
-            if hasattr(choice, "message"):
-                return (getattr(choice.message, "content", None) or "") or ""
-            if hasattr(choice, "text"):
-                return (getattr(choice, "text", None) or "") or ""
-    except Exception as e:
-        logger.debug(f"Error extracting Mistral assistant content: {e}")
-    return ""
+        choice = response.choices[0]
+    except (AttributeError, IndexError, KeyError, TypeError):
+        return ""
+    try:
+        message = choice.message
+    except AttributeError:
+        # Text-completion choice (no message)
+        return getattr(choice, "text", None) or ""
+    return getattr(message, "content", None) or ""
 
 
 def _should_inspect() -> bool:
-    from .._context import is_llm_skip_active
-    if is_llm_skip_active():
-        return False
-    if _state.get_llm_mode() == "off":
-        return False
-    return not get_inspection_context().done
+    return (
+        _state.is_llm_inspection_enabled()
+        and not is_llm_skip_active()
+        and not is_inspection_done()
+    )
 
 
 def _enforce_decision(decision: Decision) -> None:
-    if _state.get_llm_mode() == "enforce" and decision.action == "block":
+    if decision.action == "block" and _state.get_llm_mode() == "enforce":
         raise SecurityPolicyError(decision)
 
 
@@ -140,7 +151,6 @@ def _is_gateway_mode() -> bool:
 
 
 def _should_use_gateway() -> bool:
-    from .._context import is_llm_skip_active
     if is_llm_skip_active():
         return False
     if not _is_gateway_mode():
@@ -152,8 +162,8 @@ def _should_use_gateway() -> bool:
 
 def _serialize_messages_for_gateway(messages: Any) -> List[Dict[str, Any]]:
     """Convert messages to JSON-serializable list for gateway request."""
-    normalized = _normalize_messages(messages)
-    return [{"role": m["role"], "content": m["content"]} for m in normalized]
+    # _normalize_messages already builds fresh {role, content} dicts; no second copy needed.
+    return _normalize_messages(messages)
 
 
 def _dict_to_mistral_response(data: Dict[str, Any]) -> Any:
@@ -175,12 +185,10 @@ def _dict_to_mistral_response(data: Dict[str, Any]) -> Any:
 
 def _handle_gateway_call_sync(
     kwargs: Dict[str, Any],
-    normalized: List[Dict[str, Any]],
     metadata: Dict[str, Any],
     stream: bool,
 ) -> Any:
     """Route Mistral chat request through AI Defense Gateway (sync)."""
-    import httpx
     gateway_url = _state.get_provider_gateway_url("mistral")
     gateway_api_key = _state.get_provider_gateway_api_key("mistral")
     if not gateway_url or not gateway_api_key:
@@ -194,9 +202,9 @@ def _handle_gateway_call_sync(
         "model": kwargs.get("model"),
         "messages": _serialize_messages_for_gateway(kwargs.get("messages", [])),
     }
-    for key in ["temperature", "max_tokens", "stream", "stop", "top_p", "presence_penalty", "frequency_penalty"]:
-        if key in kwargs and kwargs[key] is not None:
-            request_body[key] = kwargs[key]
+    request_body.update(
+        {key: kwargs[key] for key in _GATEWAY_PASSTHROUGH_PARAMS if kwargs.get(key) is not None}
+    )
     full_url = gateway_url.rstrip("/")
     if "/chat/completions" not in full_url:
         full_url = f"{full_url}/v1/chat/completions"
@@ -235,12 +243,10 @@ def _handle_gateway_call_sync(
 
 async def _handle_gateway_call_async(
     kwargs: Dict[str, Any],
-    normalized: List[Dict[str, Any]],
     metadata: Dict[str, Any],
     stream: bool,
 ) -> Any:
     """Route Mistral chat request through AI Defense Gateway (async)."""
-    import httpx
     gateway_url = _state.get_provider_gateway_url("mistral")
     gateway_api_key = _state.get_provider_gateway_api_key("mistral")
     if not gateway_url or not gateway_api_key:
@@ -253,9 +259,9 @@ async def _handle_gateway_call_async(
         "model": kwargs.get("model"),
         "messages": _serialize_messages_for_gateway(kwargs.get("messages", [])),
     }
-    for key in ["temperature", "max_tokens", "stream", "stop", "top_p", "presence_penalty", "frequency_penalty"]:
-        if key in kwargs and kwargs[key] is not None:
-            request_body[key] = kwargs[key]
+    request_body.update(
+        {key: kwargs[key] for key in _GATEWAY_PASSTHROUGH_PARAMS if kwargs.get(key) is not None}
+    )
     full_url = gateway_url.rstrip("/")
     if "/chat/completions" not in full_url:
         full_url = f"{full_url}/v1/chat/completions"
@@ -299,7 +305,8 @@ class _MistralStreamingInspectionWrapper:
         self._stream = stream
         self._messages = messages
         self._metadata = metadata
-        self._buffer = ""
+        self._buffer_parts: List[str] = []
+        self._buffer_len = 0
         self._inspector = _get_inspector()
         self._final_inspection_done = False
 
@@ -321,19 +328,21 @@ class _MistralStreamingInspectionWrapper:
                 delta = getattr(chunk.data.choices[0], "delta", None)
                 if delta and getattr(delta, "content", None):
                     text = delta.content
-                    if text and len(self._buffer) < MAX_STREAMING_BUFFER_SIZE:
-                        self._buffer += text[: MAX_STREAMING_BUFFER_SIZE - len(self._buffer)]
+                    if text and self._buffer_len < MAX_STREAMING_BUFFER_SIZE:
+                        piece = text[: MAX_STREAMING_BUFFER_SIZE - self._buffer_len]
+                        self._buffer_parts.append(piece)
+                        self._buffer_len += len(piece)
         except Exception as e:
-            logger.debug(f"Mistral stream chunk handling: {e}")
+            logger.debug("Mistral stream chunk handling: %s", e)
         return chunk
 
     def _perform_final_inspection(self) -> None:
         if self._final_inspection_done:
             return
         self._final_inspection_done = True
-        if not self._buffer or not _should_inspect():
+        if not self._buffer_parts or not _should_inspect():
             return
-        buf = self._buffer[:MAX_STREAMING_BUFFER_SIZE]
+        buf = "".join(self._buffer_parts)
         messages_with_response = self._messages + [{"role": "assistant", "content": buf}]
         try:
             decision = self._inspector.inspect_conversation(messages_with_response, self._metadata)
@@ -352,7 +361,8 @@ class _MistralAsyncStreamingInspectionWrapper:
         self._stream = stream
         self._messages = messages
         self._metadata = metadata
-        self._buffer = ""
+        self._buffer_parts: List[str] = []
+        self._buffer_len = 0
         self._inspector = _get_inspector()
         self._final_inspection_done = False
 
@@ -374,19 +384,21 @@ class _MistralAsyncStreamingInspectionWrapper:
                 delta = getattr(chunk.data.choices[0], "delta", None)
                 if delta and getattr(delta, "content", None):
                     text = delta.content
-                    if text and len(self._buffer) < MAX_STREAMING_BUFFER_SIZE:
-                        self._buffer += text[: MAX_STREAMING_BUFFER_SIZE - len(self._buffer)]
+                    if text and self._buffer_len < MAX_STREAMING_BUFFER_SIZE:
+                        piece = text[: MAX_STREAMING_BUFFER_SIZE - self._buffer_len]
+                        self._buffer_parts.append(piece)
+                        self._buffer_len += len(piece)
         except Exception as e:
-            logger.debug(f"Mistral async stream chunk handling: {e}")
+            logger.debug("Mistral async stream chunk handling: %s", e)
         return chunk
 
     async def _perform_final_inspection(self) -> None:
         if self._final_inspection_done:
             return
         self._final_inspection_done = True
-        if not self._buffer or not _should_inspect():
+        if not self._buffer_parts or not _should_inspect():
             return
-        buf = self._buffer[:MAX_STREAMING_BUFFER_SIZE]
+        buf = "".join(self._buffer_parts)
         messages_with_response = self._messages + [{"role": "assistant", "content": buf}]
         try:
             decision = await self._inspector.ainspect_conversation(messages_with_response, self._metadata)
@@ -442,15 +454,16 @@ def _wrap_complete(wrapped, instance, args, kwargs):
         return wrapped(*args, **kwargs)
     model = kwargs.get("model", "unknown")
     messages = kwargs.get("messages", [])
-    normalized = _normalize_messages(messages)
-    metadata = get_inspection_context().metadata
+    metadata = get_inspection_metadata()
     stream = kwargs.get("stream", False)
 
     if _should_use_gateway():
         logger.debug("[PATCHED] Mistral Chat.complete gateway mode - routing to AI Defense Gateway")
-        return _handle_gateway_call_sync(kwargs, normalized, metadata, stream)
+        return _handle_gateway_call_sync(kwargs, metadata, stream)
 
-    logger.debug(f"[PATCHED] Mistral Chat.complete model={model} messages={len(normalized)}")
+    normalized = _normalize_messages(messages)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"[PATCHED] Mistral Chat.complete model={model} messages={len(normalized)}")
     try:
         inspector = _get_inspector()
         decision = inspector.inspect_conversation(normalized, metadata)
@@ -489,14 +502,15 @@ def _wrap_stream(wrapped, instance, args, kwargs):
         return wrapped(*args, **kwargs)
     model = kwargs.get("model", "unknown")
     messages = kwargs.get("messages", [])
-    normalized = _normalize_messages(messages)
-    metadata = get_inspection_context().metadata
+    metadata = get_inspection_metadata()
 
     if _should_use_gateway():
         logger.debug("[PATCHED] Mistral Chat.stream gateway mode - full response as single chunk")
-        return _handle_gateway_call_sync({**kwargs, "stream": True}, normalized, metadata, stream=True)
+        return _handle_gateway_call_sync({**kwargs, "stream": True}, metadata, stream=True)
 
-    logger.debug(f"[PATCHED] Mistral Chat.stream model={model} messages={len(normalized)}")
+    normalized = _normalize_messages(messages)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"[PATCHED] Mistral Chat.stream model={model} messages={len(normalized)}")
     try:
         inspector = _get_inspector()
         decision = inspector.inspect_conversation(normalized, metadata)
@@ -519,15 +533,16 @@ async def _wrap_complete_async(wrapped, instance, args, kwargs):
         return await wrapped(*args, **kwargs)
     model = kwargs.get("model", "unknown")
     messages = kwargs.get("messages", [])
-    normalized = _normalize_messages(messages)
-    metadata = get_inspection_context().metadata
+    metadata = get_inspection_metadata()
     stream = kwargs.get("stream", False)
 
     if _should_use_gateway():
         logger.debug("[PATCHED] Mistral Chat.complete_async gateway mode - routing to AI Defense Gateway")
-        return await _handle_gateway_call_async(kwargs, normalized, metadata, stream)
+        return await _handle_gateway_call_async(kwargs, metadata, stream)
 
-    logger.debug(f"[PATCHED] Mistral Chat.complete_async model={model} messages={len(normalized)}")
+    normalized = _normalize_messages(messages)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"[PATCHED] Mistral Chat.complete_async model={model} messages={len(normalized)}")
     try:
         inspector = _get_inspector()
         decision = await inspector.ainspect_conversation(normalized, metadata)
@@ -566,14 +581,15 @@ async def _wrap_stream_async(wrapped, instance, args, kwargs):
         return await wrapped(*args, **kwargs)
     model = kwargs.get("model", "unknown")
     messages = kwargs.get("messages", [])
-    normalized = _normalize_messages(messages)
-    metadata = get_inspection_context().metadata
+    metadata = get_inspection_metadata()
 
     if _should_use_gateway():
         logger.debug("[PATCHED] Mistral Chat.stream_async gateway mode - full response as single chunk")
-        return await _handle_gateway_call_async({**kwargs, "stream": True}, normalized, metadata, stream=True)
+        return await _handle_gateway_call_async({**kwargs, "stream": True}, metadata, stream=True)
 
-    logger.debug(f"[PATCHED] Mistral Chat.stream_async model={model} messages={len(normalized)}")
+    normalized = _normalize_messages(messages)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"[PATCHED] Mistral Chat.stream_async model={model} messages={len(normalized)}")
     try:
         inspector = _get_inspector()
         decision = await inspector.ainspect_conversation(normalized, metadata)
@@ -590,6 +606,21 @@ async def _wrap_stream_async(wrapped, instance, args, kwargs):
     return _MistralAsyncStreamingInspectionWrapper(stream, normalized, metadata)
 
 
+# Chat methods wrapped by patch_mistral(), as (attribute path, wrapper) pairs
+_MISTRAL_CHAT_TARGETS = (
+    ("Chat.complete", _wrap_complete),
+    ("Chat.stream", _wrap_stream),
+    ("Chat.complete_async", _wrap_complete_async),
+    ("Chat.stream_async", _wrap_stream_async),
+)
+
+
+def _wrap_chat_targets(module_path: str) -> None:
+    """Wrap every Mistral chat target in the given module."""
+    for name, wrapper in _MISTRAL_CHAT_TARGETS:
+        wrapt.wrap_function_wrapper(module_path, name, wrapper)
+
+
 def patch_mistral() -> bool:
     """Patch Mistral AI client for automatic inspection. Returns True if patching succeeded."""
     if is_patched("mistral"):
@@ -599,20 +630,15 @@ def patch_mistral() -> bool:
         return False
     # Mistral SDK: Chat lives in mistralai.client.chat (repo layout) or mistralai.chat (some installs)
     try:
-        module_path = "mistralai.client.chat"
         try:
-            wrapt.wrap_function_wrapper(module_path, "Chat.complete", _wrap_complete)
-            wrapt.wrap_function_wrapper(module_path, "Chat.stream", _wrap_stream)
-            wrapt.wrap_function_wrapper(module_path, "Chat.complete_async", _wrap_complete_async)
-            wrapt.wrap_function_wrapper(module_path, "Chat.stream_async", _wrap_stream_async)
+            _wrap_chat_targets("mistralai.client.chat")
         except (ImportError, AttributeError):
-            module_path = "mistralai.chat"
-            wrapt.wrap_function_wrapper(module_path, "Chat.complete", _wrap_complete)
-            wrapt.wrap_function_wrapper(module_path, "Chat.stream", _wrap_stream)
-            wrapt.wrap_function_wrapper(module_path, "Chat.complete_async", _wrap_complete_async)
-            wrapt.wrap_function_wrapper(module_path, "Chat.stream_async", _wrap_stream_async)
+            _wrap_chat_targets("mistralai.chat")
         mark_patched("mistral")
         logger.info("Mistral client patched successfully")
+        if not _is_gateway_mode():
+            # Build the inspector now so the first LLM call doesn't pay for it
+            _get_inspector()
         return True
     except Exception as e:
         logger.warning(f"Failed to patch Mistral: {e}")
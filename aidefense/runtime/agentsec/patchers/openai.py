@@ -18,14 +18,22 @@ Note: This satisfies roadmap item 23 (Azure OpenAI Autopatch) as the
 patch covers AzureOpenAI without requiring separate handling.
 """
 
+import asyncio
+import atexit
+import functools
+import inspect
 import logging
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import SimpleNamespace
 from typing import Any, Dict, Iterator, List, Optional
 
+import httpx
 import wrapt
 
 from .. import _state
-from .._context import clear_inspection_context, get_inspection_context, set_inspection_context
+from .._context import clear_inspection_context, get_inspection_metadata, is_inspection_done, is_llm_skip_active, set_inspection_context
+from .._loop_resources import LoopResources
 from ..decision import Decision
 from ..exceptions import SecurityPolicyError
 from ..inspectors.api_llm import LLMInspector
@@ -43,35 +51,191 @@ _inspector_lock = threading.Lock()
 _gateway_client: Optional[GatewayClient] = None
 _gateway_lock = threading.Lock()
 
+# Shared HTTP clients for gateway calls, created on first use so repeated
+# requests to the same gateway reuse pooled connections (no per-call TLS handshake).
+# The async client is bound to the event loop it was created on.
+_http_client = None
+_http_client_key = None
+_http_lock = threading.Lock()
+_GATEWAY_HTTP_TIMEOUT = 60.0
+
+# Worker pool for speculative request inspection on the sync path, created on first use
+_speculative_executor: Optional[ThreadPoolExecutor] = None
+_speculative_lock = threading.Lock()
+
 # Maximum buffer size for streaming inspection (1MB)
 # Prevents memory issues with very long streaming responses
 MAX_STREAMING_BUFFER_SIZE = 1_000_000
 
+# Mid-stream inspection runs once this much new content has been buffered
+# since the previous inspection (the final inspection always runs)
+STREAMING_INSPECT_THRESHOLD = 4096
+
+# Azure client classes (sync and async), matched by class name with one set lookup
+_AZURE_CLIENT_TYPES = frozenset({"AzureOpenAI", "AsyncAzureOpenAI"})
+
+# Optional call kwargs forwarded as-is to the gateway when present
+_GATEWAY_PASSTHROUGH_PARAMS = (
+    "temperature", "max_tokens", "top_p", "n", "stop", "presence_penalty",
+    "frequency_penalty", "logit_bias", "user", "tools", "tool_choice",
+    "response_format", "seed",
+)
+
 
 def _get_inspector() -> LLMInspector:
     """Get or create the LLMInspector instance (thread-safe)."""
     global _inspector
-    if _inspector is None:
-        with _inspector_lock:
-            # Double-check pattern for thread safety
-            if _inspector is None:
-                if not _state.is_initialized():
-                    logger.warning("agentsec.protect() not called, using default config")
-                _inspector = LLMInspector(
-                    fail_open=_state.get_api_mode_fail_open_llm(),
-                    default_rules=_state.get_llm_rules(),
-                )
-                # Register for cleanup on shutdown
-                from ..inspectors import register_inspector_for_cleanup
-                register_inspector_for_cleanup(_inspector)
+    inspector = _inspector
+    if inspector is not None:
+        return inspector
+    with _inspector_lock:
+        # Double-check pattern for thread safety
+        if _inspector is None:
+            if not _state.is_initialized():
+                logger.warning("agentsec.protect() not called, using default config")
+            _inspector = LLMInspector(
+                fail_open=_state.get_api_mode_fail_open_llm(),
+                default_rules=_state.get_llm_rules(),
+            )
+            # Register for cleanup on shutdown
+            from ..inspectors import register_inspector_for_cleanup
+            register_inspector_for_cleanup(_inspector)
     return _inspector
 
 
+def _gateway_http_limits_key():
+    """Pool settings the gateway HTTP clients are built with (max connections, max keepalive)."""
+    return (
+        _state.get_pool_max_connections() or 100,
+        _state.get_pool_max_keepalive() or 20,
+    )
+
+
+def _gateway_http_limits(key=None):
+    """Connection pool limits for the shared gateway HTTP clients."""
+    max_connections, max_keepalive = key or _gateway_http_limits_key()
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive,
+    )
+
+
+def _get_http_client():
+    """
+    Get or create the shared httpx.Client for gateway calls (thread-safe).
+
+    The client is rebuilt (and the old one closed) when the pool settings change.
+    """
+    global _http_client, _http_client_key
+    key = _gateway_http_limits_key()
+    client = _http_client
+    if client is not None and _http_client_key == key:
+        return client
+    stale = None
+    with _http_lock:
+        # Double-check pattern for thread safety
+        if _http_client is None or _http_client_key != key:
+            stale = _http_client
+            _http_client = httpx.Client(
+                timeout=_GATEWAY_HTTP_TIMEOUT,
+                limits=_gateway_http_limits(key),
+                http2=False,
+            )
+            _http_client_key = key
+        client = _http_client
+    if stale is not None:
+        try:
+            stale.close()
+        except Exception as e:
+            logger.debug("Error closing gateway HTTP client: %s", e)
+    return client
+
+
+async def _create_async_http_client():
+    return httpx.AsyncClient(
+        timeout=_GATEWAY_HTTP_TIMEOUT,
+        limits=_gateway_http_limits(),
+        http2=False,
+    )
+
+
+async def _close_async_http_client(client) -> None:
+    await client.aclose()
+
+
+# One httpx.AsyncClient per event loop, closed when its loop shuts down
+_http_async_clients = LoopResources(_create_async_http_client, _close_async_http_client)
+
+
+async def _get_async_http_client():
+    """
+    Get or create the httpx.AsyncClient for the running event loop.
+
+    Each loop keeps its own client; it is replaced (and the old one closed)
+    when the pool settings change.
+    """
+    return await _http_async_clients.get(_gateway_http_limits_key())
+
+
+@atexit.register
+def _close_http_client() -> None:
+    """Close the shared gateway HTTP clients at interpreter exit."""
+    global _http_client, _http_client_key
+    with _http_lock:
+        client, _http_client = _http_client, None
+        _http_client_key = None
+    if client is not None:
+        try:
+            client.close()
+        except Exception as e:
+            logger.debug("Error closing gateway HTTP client: %s", e)
+    _http_async_clients.close_all()
+
+
+async def _close_response(response: Any) -> None:
+    """Close a (sync or async) streaming response, ignoring errors."""
+    close = getattr(response, "close", None)
+    if not callable(close):
+        return
+    try:
+        result = close()
+        if inspect.isawaitable(result):
+            await result
+    except Exception as e:
+        logger.debug("Error closing streaming response: %s", e)
+
+
+def _get_speculative_executor() -> ThreadPoolExecutor:
+    """Get or create the worker pool for speculative sync request inspection (thread-safe)."""
+    global _speculative_executor
+    if _speculative_executor is None:
+        with _speculative_lock:
+            if _speculative_executor is None:
+                _speculative_executor = ThreadPoolExecutor(thread_name_prefix="agentsec-inspect")
+    return _speculative_executor
+
+
+@atexit.register
+def _shutdown_speculative_executor() -> None:
+    """Shut down the speculative inspection worker pool at interpreter exit."""
+    global _speculative_executor
+    with _speculative_lock:
+        executor, _speculative_executor = _speculative_executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 def _is_gateway_mode() -> bool:
     """Check if LLM integration mode is 'gateway'."""
     return _state.get_llm_integration_mode() == "gateway"
 
 
+@functools.lru_cache(maxsize=256)
+def _is_azure_base_url(base_url: str) -> bool:
+    """Check if a client base_url points at Azure (cached, as clients reuse the same URL)."""
+    return "azure" in base_url.lower()
+
+
 def _detect_provider(instance) -> str:
     """
     Detect whether the client is OpenAI or AzureOpenAI.
@@ -85,15 +249,13 @@ def _detect_provider(instance) -> str:
     try:
         client = getattr(instance, '_client', None)
         if client is not None:
-            client_type = type(client).__name__
-            if client_type == 'AzureOpenAI':
+            if type(client).__name__ in _AZURE_CLIENT_TYPES:
                 return "azure_openai"
             # Also check base_url for Azure
-            base_url = str(getattr(client, 'base_url', ''))
-            if 'azure' in base_url.lower():
+            if _is_azure_base_url(str(getattr(client, 'base_url', ''))):
                 return "azure_openai"
     except Exception as e:
-        logger.debug(f"Error detecting OpenAI provider, defaulting to 'openai': {e}")
+        logger.debug("Error detecting OpenAI provider, defaulting to 'openai': %s", e)
     return "openai"
 
 
@@ -132,7 +294,7 @@ def _get_azure_api_version(instance) -> Optional[str]:
                     if api_version:
                         return str(api_version)
     except Exception as e:
-        logger.debug(f"Error extracting Azure API version: {e}")
+        logger.debug("Error extracting Azure API version: %s", e)
     return None
 
 
@@ -152,8 +314,6 @@ def _get_azure_deployment_name(instance, kwargs: Dict[str, Any]) -> Optional[str
     Returns:
         Deployment name string or None if not available
     """
-    import re
-    
     # First try kwargs["model"] - this is the standard way
     model = kwargs.get("model")
     if model:
@@ -174,11 +334,12 @@ def _get_azure_deployment_name(instance, kwargs: Dict[str, Any]) -> Optional[str
             
             # Extract from base_url: .../deployments/{name}/...
             base_url = str(getattr(client, 'base_url', ''))
-            match = re.search(r'/deployments/([^/]+)', base_url)
-            if match:
-                return match.group(1)
+            _, found, rest = base_url.partition("/deployments/")
+            deployment = rest.partition("/")[0] if found else ""
+            if deployment:
+                return deployment
     except Exception as e:
-        logger.debug(f"Error extracting Azure deployment name: {e}")
+        logger.debug("Error extracting Azure deployment name: %s", e)
     
     return None
 
@@ -190,15 +351,21 @@ def _should_use_gateway(provider: str = "openai") -> bool:
     Args:
         provider: Provider name - "openai" or "azure_openai"
     """
-    from .._context import is_llm_skip_active
     if is_llm_skip_active():
         return False
     if not _is_gateway_mode():
         return False
     # Check if gateway is properly configured for this provider
-    gateway_url = _state.get_provider_gateway_url(provider)
-    gateway_api_key = _state.get_provider_gateway_api_key(provider)
-    return bool(gateway_url and gateway_api_key)
+    gateway = _state.get_provider_gateway_config(provider)
+    return bool(gateway.url and gateway.api_key)
+
+
+def _tool_call_name(tool_call: Any) -> str:
+    """Get the function name from a tool call dict or SDK tool call object."""
+    if isinstance(tool_call, dict):
+        function = tool_call.get("function") or {}
+        return function.get("name") or "unknown"
+    return getattr(getattr(tool_call, "function", None), "name", None) or "unknown"
 
 
 def _normalize_messages(messages: Any) -> List[Dict[str, Any]]:
@@ -219,38 +386,55 @@ def _normalize_messages(messages: Any) -> List[Dict[str, Any]]:
     if not isinstance(messages, list):
         return []
     
+    # Fast path: plain dicts with string (or empty) content and no tool calls.
+    # Falls through to the general loop at the first message that needs more work.
     result = []
+    append = result.append
     for m in messages:
+        if type(m) is not dict or m.get("tool_calls"):
+            break
+        content = m.get("content")
+        if content is None:
+            continue
+        if type(content) is not str:
+            break
         role = m.get("role", "user")
+        if content and role not in ("tool", "function"):
+            append({"role": role, "content": content})
+    else:
+        return result
+    
+    result = []
+    for m in messages:
+        role = m.get("role", "user")
+        
+        # Skip tool/function response messages - AI Defense doesn't support these roles
+        if role in ("tool", "function"):
+            continue
+        
         content = m.get("content") or ""
         
         # Handle content that's a list of content blocks (OpenAI/Strands format)
         # Convert to string for AI Defense API compatibility
         if isinstance(content, list):
             text_parts = []
+            append = text_parts.append
             for block in content:
                 if isinstance(block, dict):
-                    # Handle {"type": "text", "text": "..."} format
-                    if block.get("type") == "text" and "text" in block:
-                        text_parts.append(block["text"])
-                    # Handle {"text": "..."} format
-                    elif "text" in block:
-                        text_parts.append(block["text"])
+                    # Handles both {"type": "text", "text": "..."} and {"text": "..."}
+                    if "text" in block:
+                        append(block["text"])
                 elif isinstance(block, str):
-                    text_parts.append(block)
+                    append(block)
             content = "\n".join(text_parts)
         
-        # Skip tool/function response messages - AI Defense doesn't support these roles
-        if role in ("tool", "function"):
-            continue
-        
         # Handle assistant messages that triggered tool calls
-        if role == "assistant" and m.get("tool_calls"):
-            # Include info about what tool was called
-            tool_names = [tc.get("function", {}).get("name", "unknown") 
-                         for tc in m.get("tool_calls", [])]
-            tool_info = f"[Called tools: {', '.join(tool_names)}]"
-            content = f"{content} {tool_info}" if content else tool_info
+        if role == "assistant":
+            tool_calls = m.get("tool_calls")
+            if tool_calls:
+                # Include info about what tool was called
+                tool_info = f"[Called tools: {', '.join(map(_tool_call_name, tool_calls))}]"
+                content = f"{content} {tool_info}" if content else tool_info
         
         # Only include messages with actual content
         if content:
@@ -262,33 +446,30 @@ def _normalize_messages(messages: Any) -> List[Dict[str, Any]]:
 def _extract_assistant_content(response: Any) -> str:
     """Extract assistant content from OpenAI response."""
     try:
-        if hasattr(response, "choices") and response.choices:
-            choice = response.choices[0]
-            if hasattr(choice, "message"):
-                return choice.message.content or ""
-            elif hasattr(choice, "text"):
-                return choice.text or ""
-    except Exception as e:
-        logger.debug(f"Error extracting assistant content: {e}")
-    return ""
+        choice = response.choices[0]
+    except (AttributeError, IndexError, KeyError, TypeError):
+        return ""
+    try:
+        message = choice.message
+    except AttributeError:
+        # Text-completion choice (no message)
+        return getattr(choice, "text", None) or ""
+    return getattr(message, "content", None) or ""
 
 
 def _should_inspect() -> bool:
     """Check if we should inspect (not already done, mode is not off, and not skipped)."""
-    from .._context import is_llm_skip_active
-    if is_llm_skip_active():
-        return False
-    mode = _state.get_llm_mode()
-    if mode == "off":
-        return False
-    ctx = get_inspection_context()
-    return not ctx.done
+    return (
+        _state.is_llm_inspection_enabled()
+        and not is_llm_skip_active()
+        and not is_inspection_done()
+    )
 
 
 def _enforce_decision(decision: Decision) -> None:
     """Enforce a decision if in enforce mode."""
-    mode = _state.get_llm_mode()
-    if mode == "enforce" and decision.action == "block":
+    # Allows are the common case, so the mode is only read for a block
+    if decision.action == "block" and _state.get_llm_mode() == "enforce":
         raise SecurityPolicyError(decision)
 
 
@@ -299,10 +480,11 @@ class StreamingInspectionWrapper:
         self._stream = stream
         self._messages = messages
         self._metadata = metadata
-        self._buffer = ""
+        self._buffer_parts: List[str] = []
+        self._buffer_len = 0
         self._inspector = _get_inspector()
-        self._chunk_count = 0
-        self._inspect_interval = 10  # Inspect every N chunks
+        self._inspect_threshold = STREAMING_INSPECT_THRESHOLD
+        self._last_inspected_len = 0
         self._final_inspection_done = False
     
     def __iter__(self):
@@ -327,13 +509,14 @@ class StreamingInspectionWrapper:
                 delta = chunk.choices[0].delta
                 if hasattr(delta, "content") and delta.content:
                     # Limit buffer size during accumulation to prevent memory issues
-                    if len(self._buffer) < MAX_STREAMING_BUFFER_SIZE:
-                        remaining_capacity = MAX_STREAMING_BUFFER_SIZE - len(self._buffer)
-                        self._buffer += delta.content[:remaining_capacity]
-                    self._chunk_count += 1
+                    if self._buffer_len < MAX_STREAMING_BUFFER_SIZE:
+                        piece = delta.content[:MAX_STREAMING_BUFFER_SIZE - self._buffer_len]
+                        self._buffer_parts.append(piece)
+                        self._buffer_len += len(piece)
                     
-                    # Incremental inspection
-                    if self._chunk_count % self._inspect_interval == 0:
+                    # Incremental inspection once enough new content has arrived
+                    if self._buffer_len - self._last_inspected_len >= self._inspect_threshold:
+                        self._last_inspected_len = self._buffer_len
                         self._inspect_buffer()
         except Exception as e:
             logger.warning(f"Error processing streaming chunk: {e}")
@@ -346,16 +529,18 @@ class StreamingInspectionWrapper:
             return
         self._final_inspection_done = True
         
-        if self._buffer:
+        if self._buffer_parts:
             self._inspect_buffer()
     
     def _inspect_buffer(self) -> None:
         """Inspect the buffered content."""
-        if not self._buffer or not _should_inspect():
+        if not self._buffer_parts or not _should_inspect():
             return
         
         # Truncate buffer if it exceeds maximum size to prevent memory issues
-        buffer_to_inspect = self._buffer
+        buffer_to_inspect = "".join(self._buffer_parts)
+        # Keep the joined text as the single part so later inspections don't re-join every chunk
+        self._buffer_parts = [buffer_to_inspect]
         if len(buffer_to_inspect) > MAX_STREAMING_BUFFER_SIZE:
             logger.warning(
                 f"Streaming buffer exceeded {MAX_STREAMING_BUFFER_SIZE} bytes "
@@ -387,10 +572,11 @@ class AsyncStreamingInspectionWrapper:
         self._stream = stream
         self._messages = messages
         self._metadata = metadata
-        self._buffer = ""
+        self._buffer_parts: List[str] = []
+        self._buffer_len = 0
         self._inspector = _get_inspector()
-        self._chunk_count = 0
-        self._inspect_interval = 10
+        self._inspect_threshold = STREAMING_INSPECT_THRESHOLD
+        self._last_inspected_len = 0
         self._final_inspection_done = False
     
     def __aiter__(self):
@@ -414,12 +600,13 @@ class AsyncStreamingInspectionWrapper:
                 delta = chunk.choices[0].delta
                 if hasattr(delta, "content") and delta.content:
                     # Limit buffer size during accumulation to prevent memory issues
-                    if len(self._buffer) < MAX_STREAMING_BUFFER_SIZE:
-                        remaining_capacity = MAX_STREAMING_BUFFER_SIZE - len(self._buffer)
-                        self._buffer += delta.content[:remaining_capacity]
-                    self._chunk_count += 1
+                    if self._buffer_len < MAX_STREAMING_BUFFER_SIZE:
+                        piece = delta.content[:MAX_STREAMING_BUFFER_SIZE - self._buffer_len]
+                        self._buffer_parts.append(piece)
+                        self._buffer_len += len(piece)
                     
-                    if self._chunk_count % self._inspect_interval == 0:
+                    if self._buffer_len - self._last_inspected_len >= self._inspect_threshold:
+                        self._last_inspected_len = self._buffer_len
                         await self._inspect_buffer()
         except Exception as e:
             logger.warning(f"Error processing async streaming chunk: {e}")
@@ -432,16 +619,18 @@ class AsyncStreamingInspectionWrapper:
             return
         self._final_inspection_done = True
         
-        if self._buffer:
+        if self._buffer_parts:
             await self._inspect_buffer()
     
     async def _inspect_buffer(self) -> None:
         """Inspect the buffered content asynchronously."""
-        if not self._buffer or not _should_inspect():
+        if not self._buffer_parts or not _should_inspect():
             return
         
         # Truncate buffer if it exceeds maximum size to prevent memory issues
-        buffer_to_inspect = self._buffer
+        buffer_to_inspect = "".join(self._buffer_parts)
+        # Keep the joined text as the single part so later inspections don't re-join every chunk
+        self._buffer_parts = [buffer_to_inspect]
         if len(buffer_to_inspect) > MAX_STREAMING_BUFFER_SIZE:
             logger.warning(
                 f"Streaming buffer exceeded {MAX_STREAMING_BUFFER_SIZE} bytes "
@@ -491,6 +680,47 @@ def _handle_patcher_error(error: Exception, operation: str) -> Optional[Decision
         raise SecurityPolicyError(decision, f"Inspection failed and fail_open=False: {error}")
 
 
+def _run_request_inspection(normalized: List[Dict[str, Any]], metadata: Dict[str, Any]) -> Decision:
+    """Run the request inspection API call (used directly or on the speculative worker pool)."""
+    return _get_inspector().inspect_conversation(normalized, metadata)
+
+
+def _inspect_request(
+    normalized: List[Dict[str, Any]],
+    metadata: Dict[str, Any],
+    pending: Optional["Future[Decision]"] = None,
+) -> None:
+    """Pre-call inspection for the sync wrapper, with error handling.
+    
+    When pending is given, the decision is taken from a speculative inspection
+    already submitted to the worker pool instead of a new API call. Raises
+    SecurityPolicyError when the request is blocked in enforce mode, or when
+    inspection fails and fail_open=False. An empty request has nothing to
+    inspect and is skipped; the response is still inspected after the call.
+    """
+    if not normalized:
+        return
+    try:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[PATCHED CALL] OpenAI.chat.completions.create - Request inspection ({len(normalized)} messages)")
+        if pending is not None:
+            decision = pending.result()
+        else:
+            decision = _run_request_inspection(normalized, metadata)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[PATCHED CALL] OpenAI.chat.completions.create - Request decision: {decision.action}")
+        set_inspection_context(decision=decision)
+        _enforce_decision(decision)
+    except SecurityPolicyError:
+        # Re-raise SecurityPolicyError (expected in enforce mode or from fail_open=False)
+        raise
+    except Exception as e:
+        # Unexpected error during inspection - handle based on fail_open
+        decision = _handle_patcher_error(e, "OpenAI.chat.completions.create pre-call")
+        if decision:
+            set_inspection_context(decision=decision)
+
+
 def _wrap_chat_completions_create(wrapped, instance, args, kwargs):
     """Wrapper for chat.completions.create.
     
@@ -504,75 +734,85 @@ def _wrap_chat_completions_create(wrapped, instance, args, kwargs):
     model = kwargs.get("model", "unknown")
     
     if not _should_inspect():
-        logger.debug(f"[PATCHED CALL] OpenAI.chat.completions.create - inspection skipped (mode=off or already done)")
+        logger.debug("[PATCHED CALL] OpenAI.chat.completions.create - inspection skipped (mode=off or already done)")
         return wrapped(*args, **kwargs)
     
     # Detect provider (OpenAI vs Azure OpenAI)
     provider = _detect_provider(instance)
     
-    # Extract Azure-specific info if using Azure OpenAI
-    azure_api_version = None
-    azure_deployment_name = None
-    if provider == "azure_openai":
-        azure_api_version = _get_azure_api_version(instance)
-        azure_deployment_name = _get_azure_deployment_name(instance, kwargs)
-    
     messages = kwargs.get("messages", [])
-    normalized = _normalize_messages(messages)
-    metadata = get_inspection_context().metadata
+    metadata = get_inspection_metadata()
     stream = kwargs.get("stream", False)
     
-    mode = _state.get_llm_mode()
-    integration_mode = _state.get_llm_integration_mode()
-    logger.debug(f"")
-    logger.debug(f"╔══════════════════════════════════════════════════════════════")
-    logger.debug(f"║ [PATCHED] LLM CALL: {model}")
-    logger.debug(f"║ Operation: OpenAI.chat.completions.create | LLM Mode: {mode} | Integration: {integration_mode} | Provider: {provider}")
-    logger.debug(f"╚══════════════════════════════════════════════════════════════")
+    # Only build the call banner when debug logging is on (this runs on every patched call)
+    if logger.isEnabledFor(logging.DEBUG):
+        mode = _state.get_llm_mode()
+        integration_mode = _state.get_llm_integration_mode()
+        logger.debug(f"")
+        logger.debug(f"╔══════════════════════════════════════════════════════════════")
+        logger.debug(f"║ [PATCHED] LLM CALL: {model}")
+        logger.debug(f"║ Operation: OpenAI.chat.completions.create | LLM Mode: {mode} | Integration: {integration_mode} | Provider: {provider}")
+        logger.debug(f"╚══════════════════════════════════════════════════════════════")
     
     # Gateway mode: route through AI Defense Gateway
     if _should_use_gateway(provider):
-        logger.debug(f"[PATCHED CALL] Gateway mode ({provider}) - routing to AI Defense Gateway")
-        return _handle_gateway_call_sync(kwargs, stream, normalized, metadata, provider, azure_api_version, azure_deployment_name)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[PATCHED CALL] Gateway mode ({provider}) - routing to AI Defense Gateway")
+        # Azure routing info is only needed to build the gateway URL
+        azure_api_version = None
+        azure_deployment_name = None
+        if provider == "azure_openai":
+            azure_api_version = _get_azure_api_version(instance)
+            azure_deployment_name = _get_azure_deployment_name(instance, kwargs)
+        return _handle_gateway_call_sync(kwargs, stream, metadata, provider, azure_api_version, azure_deployment_name)
     
     # API mode (default): use LLMInspector for inspection
-    # Pre-call inspection with error handling
-    try:
-        logger.debug(f"[PATCHED CALL] OpenAI.chat.completions.create - Request inspection ({len(normalized)} messages)")
-        inspector = _get_inspector()
-        decision = inspector.inspect_conversation(normalized, metadata)
-        logger.debug(f"[PATCHED CALL] OpenAI.chat.completions.create - Request decision: {decision.action}")
-        set_inspection_context(decision=decision)
-        _enforce_decision(decision)
-    except SecurityPolicyError:
-        # Re-raise SecurityPolicyError (expected in enforce mode or from fail_open=False)
-        raise
-    except Exception as e:
-        # Unexpected error during inspection - handle based on fail_open
-        decision = _handle_patcher_error(e, "OpenAI.chat.completions.create pre-call")
-        if decision:
-            set_inspection_context(decision=decision)
+    normalized = _normalize_messages(messages)
     
-    # Call the original
-    logger.debug(f"[PATCHED CALL] OpenAI.chat.completions.create - calling original method")
-    response = wrapped(*args, **kwargs)
+    # A sync call cannot be cancelled, so in enforce mode the request is always
+    # inspected first rather than sending (and paying for) a prompt that gets blocked
+    if normalized and _state.get_api_mode_speculative_llm() and _state.get_llm_mode() != "enforce":
+        # Inspect the request on a worker thread while the original call runs; a
+        # fail-closed error is raised once the call returns
+        pending = _get_speculative_executor().submit(_run_request_inspection, normalized, metadata)
+        logger.debug("[PATCHED CALL] OpenAI.chat.completions.create - calling original method (speculative)")
+        response = wrapped(*args, **kwargs)
+        try:
+            _inspect_request(normalized, metadata, pending)
+        except SecurityPolicyError:
+            # Release a stream the caller will never see
+            if stream and callable(getattr(response, "close", None)):
+                response.close()
+            raise
+    else:
+        _inspect_request(normalized, metadata)
+        
+        # Call the original
+        logger.debug("[PATCHED CALL] OpenAI.chat.completions.create - calling original method")
+        response = wrapped(*args, **kwargs)
+    
+    # A nested patcher or gateway already completed inspection for this call
+    if is_inspection_done():
+        return response
     
     # Handle streaming vs non-streaming
     if stream:
-        logger.debug(f"[PATCHED CALL] OpenAI.chat.completions.create - streaming response, wrapping for inspection")
+        logger.debug("[PATCHED CALL] OpenAI.chat.completions.create - streaming response, wrapping for inspection")
         return StreamingInspectionWrapper(response, normalized, metadata)
     
     # Post-call inspection for non-streaming with error handling
     try:
         assistant_content = _extract_assistant_content(response)
         if assistant_content:
-            logger.debug(f"[PATCHED CALL] OpenAI.chat.completions.create - Response inspection (response: {len(assistant_content)} chars)")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"[PATCHED CALL] OpenAI.chat.completions.create - Response inspection (response: {len(assistant_content)} chars)")
             messages_with_response = normalized + [
                 {"role": "assistant", "content": assistant_content}
             ]
             inspector = _get_inspector()
             decision = inspector.inspect_conversation(messages_with_response, metadata)
-            logger.debug(f"[PATCHED CALL] OpenAI.chat.completions.create - Response decision: {decision.action}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"[PATCHED CALL] OpenAI.chat.completions.create - Response decision: {decision.action}")
             set_inspection_context(decision=decision, done=True)
             _enforce_decision(decision)
     except SecurityPolicyError:
@@ -581,11 +821,40 @@ def _wrap_chat_completions_create(wrapped, instance, args, kwargs):
         # Log post-call errors but don't block - we've already made the call
         logger.warning(f"[OpenAI.chat.completions.create post-call] Inspection error: {e}")
     
-    logger.debug(f"[PATCHED CALL] OpenAI.chat.completions.create - complete")
+    logger.debug("[PATCHED CALL] OpenAI.chat.completions.create - complete")
     return response
 
 
-def _handle_gateway_call_sync(kwargs: Dict[str, Any], stream: bool, normalized: List[Dict], metadata: Dict, provider: str = "openai", azure_api_version: Optional[str] = None, azure_deployment_name: Optional[str] = None) -> Any:
+@functools.lru_cache(maxsize=64)
+def _gateway_chat_completions_url(
+    gateway_url: str,
+    provider: str,
+    deployment_name: Optional[str],
+    api_version: Optional[str],
+) -> str:
+    """
+    Build the chat completions URL for a provider gateway.
+    
+    The result only depends on the arguments, so it is cached and reused for
+    every request that targets the same gateway and deployment.
+    """
+    full_url = gateway_url.rstrip('/')
+    if 'chat/completions' in full_url:
+        return full_url
+    
+    if provider == "azure_openai":
+        # Azure OpenAI gateway URL format:
+        # {gateway_base}/openai/deployments/{deployment_name}/chat/completions[?api-version={api_version}]
+        full_url = f"{full_url}/openai/deployments/{deployment_name}/chat/completions"
+        if api_version:
+            full_url = f"{full_url}?api-version={api_version}"
+        return full_url
+    
+    # OpenAI gateway URL format: {gateway_base}/v1/chat/completions
+    return full_url + '/v1/chat/completions'
+
+
+def _handle_gateway_call_sync(kwargs: Dict[str, Any], stream: bool, metadata: Dict, provider: str = "openai", azure_api_version: Optional[str] = None, azure_deployment_name: Optional[str] = None) -> Any:
     """
     Handle synchronous gateway call.
     
@@ -595,7 +864,6 @@ def _handle_gateway_call_sync(kwargs: Dict[str, Any], stream: bool, normalized:
     Args:
         kwargs: Original call kwargs (model, messages, etc.)
         stream: Whether streaming is requested
-        normalized: Normalized messages for context
         metadata: Inspection metadata
         provider: Provider name - "openai" or "azure_openai"
         azure_api_version: Azure OpenAI API version (only for azure_openai provider)
@@ -604,10 +872,10 @@ def _handle_gateway_call_sync(kwargs: Dict[str, Any], stream: bool, normalized:
     Returns:
         Response from gateway (same format as OpenAI response)
     """
-    import httpx
     
-    gateway_url = _state.get_provider_gateway_url(provider)
-    gateway_api_key = _state.get_provider_gateway_api_key(provider)
+    gateway = _state.get_provider_gateway_config(provider)
+    gateway_url = gateway.url
+    gateway_api_key = gateway.api_key
     
     if not gateway_url or not gateway_api_key:
         logger.warning(f"Gateway mode enabled but {provider} gateway not configured")
@@ -624,49 +892,38 @@ def _handle_gateway_call_sync(kwargs: Dict[str, Any], stream: bool, normalized:
     }
     
     # Copy optional parameters
-    for param in ["temperature", "max_tokens", "top_p", "n", "stop", "presence_penalty", 
-                  "frequency_penalty", "logit_bias", "user", "tools", "tool_choice",
-                  "response_format", "seed"]:
-        if param in kwargs:
-            request_body[param] = kwargs[param]
+    request_body.update({param: kwargs[param] for param in _GATEWAY_PASSTHROUGH_PARAMS if param in kwargs})
     
     # Note: Gateway mode does NOT support streaming yet - always use non-streaming
     # The gateway returns JSON response, not SSE stream
     if stream:
-        logger.debug(f"[GATEWAY] Streaming requested but gateway returns JSON - will convert response")
+        logger.debug("[GATEWAY] Streaming requested but gateway returns JSON - will convert response")
     
     try:
         # Construct full URL based on provider
-        full_url = gateway_url.rstrip('/')
-        
-        if provider == "azure_openai":
-            # Azure OpenAI gateway URL format:
-            # {gateway_base}/openai/deployments/{deployment_name}/chat/completions[?api-version={api_version}]
+        full_url = _gateway_chat_completions_url(
+            gateway_url,
+            provider,
             # Use azure_deployment_name (extracted from client) or fall back to kwargs["model"]
-            deployment_name = azure_deployment_name or kwargs.get("model", "")
-            if 'chat/completions' not in full_url:
-                full_url = f"{full_url}/openai/deployments/{deployment_name}/chat/completions"
-                if azure_api_version:
-                    full_url = f"{full_url}?api-version={azure_api_version}"
-        else:
-            # OpenAI gateway URL format: {gateway_base}/v1/chat/completions
-            if 'chat/completions' not in full_url:
-                full_url = full_url + '/v1/chat/completions'
+            (azure_deployment_name or kwargs.get("model", "")) if provider == "azure_openai" else None,
+            azure_api_version,
+        )
         
-        logger.debug(f"[GATEWAY] Sending request to {provider} gateway: {full_url}")
-        with httpx.Client(timeout=60.0) as client:
-            response = client.post(
-                full_url,
-                json=request_body,
-                headers={
-                    "Authorization": f"Bearer {gateway_api_key}",
-                    "Content-Type": "application/json",
-                },
-            )
-            response.raise_for_status()
-            response_data = response.json()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[GATEWAY] Sending request to {provider} gateway: {full_url}")
+        response = _get_http_client().post(
+            full_url,
+            json=request_body,
+            headers={
+                "Authorization": f"Bearer {gateway_api_key}",
+                "Content-Type": "application/json",
+            },
+        )
+        response.raise_for_status()
+        response_data = response.json()
         
-        logger.debug(f"[GATEWAY] Received response from {provider} gateway")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[GATEWAY] Received response from {provider} gateway")
         set_inspection_context(decision=Decision.allow(reasons=["Gateway handled inspection"]), done=True)
         
         # Convert dict response to OpenAI-like object
@@ -728,6 +985,96 @@ class _FakeStreamWrapper:
         return chunk
 
 
+class _GatewayToolCall:
+    """Tool call on a gateway response message."""
+    
+    def __init__(self, tool_call_data):
+        self.id = tool_call_data.get("id")
+        self.index = tool_call_data.get("index", 0)
+        self.type = tool_call_data.get("type", "function")
+        function_data = tool_call_data.get("function", {})
+        self.function = SimpleNamespace(
+            name=function_data.get("name"),
+            arguments=function_data.get("arguments"),
+        )
+
+
+class _GatewayMessage:
+    """Assistant message on a gateway response choice."""
+    
+    def __init__(self, message_data):
+        self._data = message_data  # Store original data for dict conversion
+        self.role = message_data.get("role", "assistant")
+        self.content = message_data.get("content")
+        self.function_call = message_data.get("function_call")
+        self.refusal = message_data.get("refusal")
+        # Convert tool_calls dicts to objects
+        raw_tool_calls = message_data.get("tool_calls")
+        if raw_tool_calls:
+            self.tool_calls = [_GatewayToolCall(tc) for tc in raw_tool_calls]
+        else:
+            self.tool_calls = None
+    
+    # Support dict(message) for AutoGen compatibility
+    def keys(self):
+        return self._data.keys()
+    
+    def __getitem__(self, key):
+        return self._data[key]
+    
+    def __iter__(self):
+        return iter(self._data)
+    
+    def get(self, key, default=None):
+        return self._data.get(key, default)
+
+
+class _GatewayChoice:
+    """Choice on a gateway chat completion response."""
+    
+    def __init__(self, choice_data):
+        self.index = choice_data.get("index", 0)
+        self.finish_reason = choice_data.get("finish_reason")
+        message_data = choice_data.get("message", {})
+        self.message = _GatewayMessage(message_data)
+
+
+class _GatewayUsage:
+    """Token usage on a gateway chat completion response."""
+    
+    def __init__(self, usage_data):
+        self.prompt_tokens = usage_data.get("prompt_tokens", 0)
+        self.completion_tokens = usage_data.get("completion_tokens", 0)
+        self.total_tokens = usage_data.get("total_tokens", 0)
+
+
+class _GatewayChatCompletion:
+    """OpenAI ChatCompletion look-alike built from a gateway response dict."""
+    
+    def __init__(self, response_data):
+        self._data = response_data  # Store original data
+        self.id = response_data.get("id")
+        self.object = response_data.get("object", "chat.completion")
+        self.created = response_data.get("created")
+        self.model = response_data.get("model")
+        self.choices = [_GatewayChoice(c) for c in response_data.get("choices", [])]
+        usage_data = response_data.get("usage", {})
+        self.usage = _GatewayUsage(usage_data) if usage_data else None
+        self.system_fingerprint = response_data.get("system_fingerprint")
+    
+    def parse(self):
+        """Return self for LangChain compatibility.
+        
+        LangChain calls response.parse() expecting the parsed response.
+        For our use case, the response is already parsed, so we return self.
+        """
+        return self
+    
+    def model_dump(self):
+        """Return the response data as a dictionary."""
+        return self._data
+
+
 def _dict_to_openai_response(data: Dict[str, Any]) -> Any:
     """
     Convert dictionary response to OpenAI-like response object.
@@ -735,88 +1082,39 @@ def _dict_to_openai_response(data: Dict[str, Any]) -> Any:
     Creates a simple object that mimics OpenAI's ChatCompletion response structure
     so that calling code can access response.choices[0].message.content etc.
     """
-    class ToolCall:
-        def __init__(self, tool_call_data):
-            self.id = tool_call_data.get("id")
-            self.index = tool_call_data.get("index", 0)
-            self.type = tool_call_data.get("type", "function")
-            function_data = tool_call_data.get("function", {})
-            self.function = type("Function", (), {
-                "name": function_data.get("name"),
-                "arguments": function_data.get("arguments"),
-            })()
-    
-    class Message:
-        def __init__(self, message_data):
-            self._data = message_data  # Store original data for dict conversion
-            self.role = message_data.get("role", "assistant")
-            self.content = message_data.get("content")
-            self.function_call = message_data.get("function_call")
-            self.refusal = message_data.get("refusal")
-            # Convert tool_calls dicts to objects
-            raw_tool_calls = message_data.get("tool_calls")
-            if raw_tool_calls:
-                self.tool_calls = [ToolCall(tc) for tc in raw_tool_calls]
-            else:
-                self.tool_calls = None
-        
-        # Support dict(message) for AutoGen compatibility
-        def keys(self):
-            return self._data.keys()
-        
-        def __getitem__(self, key):
-            return self._data[key]
-        
-        def __iter__(self):
-            return iter(self._data)
-        
-        def get(self, key, default=None):
-            return self._data.get(key, default)
-    
-    class Choice:
-        def __init__(self, choice_data):
-            self.index = choice_data.get("index", 0)
-            self.finish_reason = choice_data.get("finish_reason")
-            message_data = choice_data.get("message", {})
-            self.message = Message(message_data)
-    
-    class Usage:
-        def __init__(self, usage_data):
-            self.prompt_tokens = usage_data.get("prompt_tokens", 0)
-            self.completion_tokens = usage_data.get("completion_tokens", 0)
-            self.total_tokens = usage_data.get("total_tokens", 0)
-    
-    class ChatCompletion:
-        def __init__(self, response_data):
-            self._data = response_data  # Store original data
-            self.id = response_data.get("id")
-            self.object = response_data.get("object", "chat.completion")
-            self.created = response_data.get("created")
-            self.model = response_data.get("model")
-            self.choices = [Choice(c) for c in response_data.get("choices", [])]
-            usage_data = response_data.get("usage", {})
-            self.usage = Usage(usage_data) if usage_data else None
-            self.system_fingerprint = response_data.get("system_fingerprint")
-        
-        def parse(self):
-            """Return self for LangChain compatibility.
-            
-            LangChain calls response.parse() expecting the parsed response.
-            For our use case, the response is already parsed, so we return self.
-            """
-            return self
-        
-        def model_dump(self):
-            """Return the response data as a dictionary."""
-            return self._data
-    
     try:
-        return ChatCompletion(data)
+        return _GatewayChatCompletion(data)
     except (KeyError, TypeError, AttributeError) as e:
         logger.warning(f"Invalid gateway response structure: {e}")
         raise ValueError(f"Invalid gateway response: {e}") from e
 
 
+async def _inspect_request_async(normalized: List[Dict[str, Any]], metadata: Dict[str, Any]) -> None:
+    """Pre-call inspection for the async wrapper, with error handling.
+    
+    Raises SecurityPolicyError when the request is blocked in enforce mode,
+    or when inspection fails and fail_open=False. An empty request has nothing
+    to inspect and is skipped; the response is still inspected after the call.
+    """
+    if not normalized:
+        return
+    try:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[PATCHED CALL] OpenAI.async - Request inspection ({len(normalized)} messages)")
+        inspector = _get_inspector()
+        decision = await inspector.ainspect_conversation(normalized, metadata)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[PATCHED CALL] OpenAI.async - Request decision: {decision.action}")
+        set_inspection_context(decision=decision)
+        _enforce_decision(decision)
+    except SecurityPolicyError:
+        raise
+    except Exception as e:
+        decision = _handle_patcher_error(e, "OpenAI.async pre-call")
+        if decision:
+            set_inspection_context(decision=decision)
+
+
 async def _wrap_chat_completions_create_async(wrapped, instance, args, kwargs):
     """Async wrapper for chat.completions.create.
     
@@ -830,73 +1128,86 @@ async def _wrap_chat_completions_create_async(wrapped, instance, args, kwargs):
     model = kwargs.get("model", "unknown")
     
     if not _should_inspect():
-        logger.debug(f"[PATCHED CALL] OpenAI.async.chat.completions.create - inspection skipped")
+        logger.debug("[PATCHED CALL] OpenAI.async.chat.completions.create - inspection skipped")
         return await wrapped(*args, **kwargs)
     
     # Detect provider (OpenAI vs Azure OpenAI)
     provider = _detect_provider(instance)
     
-    # Extract Azure-specific info if using Azure OpenAI
-    azure_api_version = None
-    azure_deployment_name = None
-    if provider == "azure_openai":
-        azure_api_version = _get_azure_api_version(instance)
-        azure_deployment_name = _get_azure_deployment_name(instance, kwargs)
-    
     messages = kwargs.get("messages", [])
-    normalized = _normalize_messages(messages)
-    metadata = get_inspection_context().metadata
+    metadata = get_inspection_metadata()
     stream = kwargs.get("stream", False)
     
-    mode = _state.get_llm_mode()
-    integration_mode = _state.get_llm_integration_mode()
-    logger.debug(f"")
-    logger.debug(f"╔══════════════════════════════════════════════════════════════")
-    logger.debug(f"║ [PATCHED] LLM CALL (async): {model}")
-    logger.debug(f"║ Operation: OpenAI.async.chat.completions.create | LLM Mode: {mode} | Integration: {integration_mode} | Provider: {provider}")
-    logger.debug(f"╚══════════════════════════════════════════════════════════════")
+    # Only build the call banner when debug logging is on (this runs on every patched call)
+    if logger.isEnabledFor(logging.DEBUG):
+        mode = _state.get_llm_mode()
+        integration_mode = _state.get_llm_integration_mode()
+        logger.debug(f"")
+        logger.debug(f"╔══════════════════════════════════════════════════════════════")
+        logger.debug(f"║ [PATCHED] LLM CALL (async): {model}")
+        logger.debug(f"║ Operation: OpenAI.async.chat.completions.create | LLM Mode: {mode} | Integration: {integration_mode} | Provider: {provider}")
+        logger.debug(f"╚══════════════════════════════════════════════════════════════")
     
     # Gateway mode: route through AI Defense Gateway
     if _should_use_gateway(provider):
-        logger.debug(f"[PATCHED CALL] Gateway mode (async, {provider}) - routing to AI Defense Gateway")
-        return await _handle_gateway_call_async(kwargs, stream, normalized, metadata, provider, azure_api_version, azure_deployment_name)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[PATCHED CALL] Gateway mode (async, {provider}) - routing to AI Defense Gateway")
+        # Azure routing info is only needed to build the gateway URL
+        azure_api_version = None
+        azure_deployment_name = None
+        if provider == "azure_openai":
+            azure_api_version = _get_azure_api_version(instance)
+            azure_deployment_name = _get_azure_deployment_name(instance, kwargs)
+        return await _handle_gateway_call_async(kwargs, stream, metadata, provider, azure_api_version, azure_deployment_name)
     
     # API mode (default): use LLMInspector for inspection
-    # Pre-call inspection with error handling
-    try:
-        logger.debug(f"[PATCHED CALL] OpenAI.async - Request inspection ({len(normalized)} messages)")
-        inspector = _get_inspector()
-        decision = await inspector.ainspect_conversation(normalized, metadata)
-        logger.debug(f"[PATCHED CALL] OpenAI.async - Request decision: {decision.action}")
-        set_inspection_context(decision=decision)
-        _enforce_decision(decision)
-    except SecurityPolicyError:
-        raise
-    except Exception as e:
-        decision = _handle_patcher_error(e, "OpenAI.async pre-call")
-        if decision:
-            set_inspection_context(decision=decision)
+    normalized = _normalize_messages(messages)
     
-    # Call the original
-    logger.debug(f"[PATCHED CALL] OpenAI.async - calling original method")
-    response = await wrapped(*args, **kwargs)
+    # Cancelling the call does not un-send (or un-bill) a prompt that is already on
+    # the wire, so in enforce mode the request is always inspected first
+    if normalized and _state.get_api_mode_speculative_llm() and _state.get_llm_mode() != "enforce":
+        # Start the original call now and inspect the request while it is in flight;
+        # the call is cancelled if inspection fails closed
+        logger.debug("[PATCHED CALL] OpenAI.async - calling original method (speculative)")
+        call_task = asyncio.ensure_future(wrapped(*args, **kwargs))
+        try:
+            await _inspect_request_async(normalized, metadata)
+        except BaseException:
+            call_task.cancel()
+            if call_task.done() and not call_task.cancelled():
+                # The inspection error takes precedence; release a stream the caller will never see
+                if call_task.exception() is None and stream:
+                    await _close_response(call_task.result())
+            raise
+        response = await call_task
+    else:
+        await _inspect_request_async(normalized, metadata)
+        
+        # Call the original
+        logger.debug("[PATCHED CALL] OpenAI.async - calling original method")
+        response = await wrapped(*args, **kwargs)
+    
+    # A nested patcher or gateway already completed inspection for this call
+    if is_inspection_done():
+        return response
     
     # Handle streaming
     if stream:
-        logger.debug(f"[PATCHED CALL] OpenAI.async - streaming response, wrapping for inspection")
+        logger.debug("[PATCHED CALL] OpenAI.async - streaming response, wrapping for inspection")
         return AsyncStreamingInspectionWrapper(response, normalized, metadata)
     
     # Post-call inspection with error handling
     try:
         assistant_content = _extract_assistant_content(response)
         if assistant_content:
-            logger.debug(f"[PATCHED CALL] OpenAI.async - Response inspection")
+            logger.debug("[PATCHED CALL] OpenAI.async - Response inspection")
             messages_with_response = normalized + [
                 {"role": "assistant", "content": assistant_content}
             ]
             inspector = _get_inspector()
             decision = await inspector.ainspect_conversation(messages_with_response, metadata)
-            logger.debug(f"[PATCHED CALL] OpenAI.async - Response decision: {decision.action}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"[PATCHED CALL] OpenAI.async - Response decision: {decision.action}")
             set_inspection_context(decision=decision, done=True)
             _enforce_decision(decision)
     except SecurityPolicyError:
@@ -904,11 +1215,11 @@ async def _wrap_chat_completions_create_async(wrapped, instance, args, kwargs):
     except Exception as e:
         logger.warning(f"[OpenAI.async post-call] Inspection error: {e}")
     
-    logger.debug(f"[PATCHED CALL] OpenAI.async - complete")
+    logger.debug("[PATCHED CALL] OpenAI.async - complete")
     return response
 
 
-async def _handle_gateway_call_async(kwargs: Dict[str, Any], stream: bool, normalized: List[Dict], metadata: Dict, provider: str = "openai", azure_api_version: Optional[str] = None, azure_deployment_name: Optional[str] = None) -> Any:
+async def _handle_gateway_call_async(kwargs: Dict[str, Any], stream: bool, metadata: Dict, provider: str = "openai", azure_api_version: Optional[str] = None, azure_deployment_name: Optional[str] = None) -> Any:
     """
     Handle asynchronous gateway call.
     
@@ -918,7 +1229,6 @@ async def _handle_gateway_call_async(kwargs: Dict[str, Any], stream: bool, norma
     Args:
         kwargs: Original call kwargs (model, messages, etc.)
         stream: Whether streaming is requested
-        normalized: Normalized messages for context
         metadata: Inspection metadata
         provider: Provider name - "openai" or "azure_openai"
         azure_api_version: Azure OpenAI API version (only for azure_openai provider)
@@ -927,10 +1237,10 @@ async def _handle_gateway_call_async(kwargs: Dict[str, Any], stream: bool, norma
     Returns:
         Response from gateway (same format as OpenAI response)
     """
-    import httpx
     
-    gateway_url = _state.get_provider_gateway_url(provider)
-    gateway_api_key = _state.get_provider_gateway_api_key(provider)
+    gateway = _state.get_provider_gateway_config(provider)
+    gateway_url = gateway.url
+    gateway_api_key = gateway.api_key
     
     if not gateway_url or not gateway_api_key:
         logger.warning(f"Gateway mode enabled but {provider} gateway not configured")
@@ -946,49 +1256,39 @@ async def _handle_gateway_call_async(kwargs: Dict[str, Any], stream: bool, norma
     }
     
     # Copy optional parameters
-    for param in ["temperature", "max_tokens", "top_p", "n", "stop", "presence_penalty", 
-                  "frequency_penalty", "logit_bias", "user", "tools", "tool_choice",
-                  "response_format", "seed"]:
-        if param in kwargs:
-            request_body[param] = kwargs[param]
+    request_body.update({param: kwargs[param] for param in _GATEWAY_PASSTHROUGH_PARAMS if param in kwargs})
     
     # Note: Gateway mode does NOT support streaming yet - always use non-streaming
     # The gateway returns JSON response, not SSE stream
     if stream:
-        logger.debug(f"[GATEWAY] Streaming requested but gateway returns JSON - will convert response")
+        logger.debug("[GATEWAY] Streaming requested but gateway returns JSON - will convert response")
     
     try:
         # Construct full URL based on provider
-        full_url = gateway_url.rstrip('/')
-        
-        if provider == "azure_openai":
-            # Azure OpenAI gateway URL format:
-            # {gateway_base}/openai/deployments/{deployment_name}/chat/completions[?api-version={api_version}]
+        full_url = _gateway_chat_completions_url(
+            gateway_url,
+            provider,
             # Use azure_deployment_name (extracted from client) or fall back to kwargs["model"]
-            deployment_name = azure_deployment_name or kwargs.get("model", "")
-            if 'chat/completions' not in full_url:
-                full_url = f"{full_url}/openai/deployments/{deployment_name}/chat/completions"
-                if azure_api_version:
-                    full_url = f"{full_url}?api-version={azure_api_version}"
-        else:
-            # OpenAI gateway URL format: {gateway_base}/v1/chat/completions
-            if 'chat/completions' not in full_url:
-                full_url = full_url + '/v1/chat/completions'
+            (azure_deployment_name or kwargs.get("model", "")) if provider == "azure_openai" else None,
+            azure_api_version,
+        )
         
-        logger.debug(f"[GATEWAY] Sending async request to {provider} gateway: {full_url}")
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                full_url,
-                json=request_body,
-                headers={
-                    "Authorization": f"Bearer {gateway_api_key}",
-                    "Content-Type": "application/json",
-                },
-            )
-            response.raise_for_status()
-            response_data = response.json()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[GATEWAY] Sending async request to {provider} gateway: {full_url}")
+        client = await _get_async_http_client()
+        response = await client.post(
+            full_url,
+            json=request_body,
+            headers={
+                "Authorization": f"Bearer {gateway_api_key}",
+                "Content-Type": "application/json",
+            },
+        )
+        response.raise_for_status()
+        response_data = response.json()
         
-        logger.debug(f"[GATEWAY] Received async response from {provider} gateway")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[GATEWAY] Received async response from {provider} gateway")
         set_inspection_context(decision=Decision.allow(reasons=["Gateway handled inspection"]), done=True)
         
         # Convert dict response to OpenAI-like object
@@ -996,7 +1296,7 @@ async def _handle_gateway_call_async(kwargs: Dict[str, Any], stream: bool, norma
         
         # If streaming was requested, wrap the complete response as a fake stream
         if stream:
-            logger.debug(f"[GATEWAY] Wrapping response as fake async stream for compatibility")
+            logger.debug("[GATEWAY] Wrapping response as fake async stream for compatibility")
             return _AsyncFakeStreamWrapper(response_obj)
         
         return response_obj
@@ -1052,8 +1352,6 @@ class _AsyncFakeStreamWrapper:
 
 def _create_stream_chunk_from_response(response):
     """Convert a complete ChatCompletion response to a streaming chunk format."""
-    from types import SimpleNamespace
-    
     # Extract content from the response
     content = ""
     tool_calls = None
@@ -1111,7 +1409,7 @@ def _wrap_responses_create(wrapped, instance, args, kwargs):
     elif isinstance(input_data, list):
         messages = _normalize_messages(input_data)
     
-    metadata = get_inspection_context().metadata
+    metadata = get_inspection_metadata()
     
     # Pre-call inspection with error handling
     try:
@@ -1129,6 +1427,10 @@ def _wrap_responses_create(wrapped, instance, args, kwargs):
     # Call original
     response = wrapped(*args, **kwargs)
     
+    # A nested patcher or gateway already completed inspection for this call
+    if is_inspection_done():
+        return response
+    
     # Post-call inspection with error handling
     try:
         if hasattr(response, "output_text"):
@@ -1163,7 +1465,7 @@ async def _wrap_responses_create_async(wrapped, instance, args, kwargs):
     elif isinstance(input_data, list):
         messages = _normalize_messages(input_data)
     
-    metadata = get_inspection_context().metadata
+    metadata = get_inspection_metadata()
     
     # Pre-call inspection with error handling
     try:
@@ -1181,6 +1483,10 @@ async def _wrap_responses_create_async(wrapped, instance, args, kwargs):
     # Call original
     response = await wrapped(*args, **kwargs)
     
+    # A nested patcher or gateway already completed inspection for this call
+    if is_inspection_done():
+        return response
+    
     # Post-call inspection with error handling
     try:
         if hasattr(response, "output_text"):
@@ -1246,6 +1552,9 @@ def patch_openai() -> bool:
         
         mark_patched("openai")
         logger.info("OpenAI client patched successfully")
+        if not _is_gateway_mode():
+            # Build the inspector now so the first LLM call doesn't pay for it
+            _get_inspector()
         return True
     except Exception as e:
         logger.warning(f"Failed to patch OpenAI: {e}")
@@ -13,10 +13,11 @@ import logging
 import threading
 from typing import Any, Dict, Iterator, List, Optional
 
+import httpx
 import wrapt
 
 from .. import _state
-from .._context import get_inspection_context, set_inspection_context
+from .._context import get_inspection_metadata, is_inspection_done, is_llm_skip_active, set_inspection_context
 from ..decision import Decision
 from ..exceptions import SecurityPolicyError
 from ..inspectors.api_llm import LLMInspector
@@ -25,6 +26,7 @@ from ._base import safe_import
 from ._google_common import (
     normalize_google_messages,
     extract_google_response,
+    extract_streaming_chunk_text,
 )
 
 logger = logging.getLogger("aidefense.runtime.agentsec.patchers.vertexai")
@@ -41,19 +43,21 @@ MAX_STREAMING_BUFFER_SIZE = 1_000_000
 def _get_inspector() -> LLMInspector:
     """Get or create the LLMInspector instance (thread-safe)."""
     global _inspector
-    if _inspector is None:
-        with _inspector_lock:
-            # Double-check pattern for thread safety
-            if _inspector is None:
-                if not _state.is_initialized():
-                    logger.warning("agentsec.protect() not called, using default config")
-                _inspector = LLMInspector(
-                    fail_open=_state.get_api_mode_fail_open_llm(),
-                    default_rules=_state.get_llm_rules(),
-                )
-                # Register for cleanup on shutdown
-                from ..inspectors import register_inspector_for_cleanup
-                register_inspector_for_cleanup(_inspector)
+    inspector = _inspector
+    if inspector is not None:
+        return inspector
+    with _inspector_lock:
+        # Double-check pattern for thread safety
+        if _inspector is None:
+            if not _state.is_initialized():
+                logger.warning("agentsec.protect() not called, using default config")
+            _inspector = LLMInspector(
+                fail_open=_state.get_api_mode_fail_open_llm(),
+                default_rules=_state.get_llm_rules(),
+            )
+            # Register for cleanup on shutdown
+            from ..inspectors import register_inspector_for_cleanup
+            register_inspector_for_cleanup(_inspector)
     return _inspector
 
 
@@ -64,7 +68,6 @@ def _is_gateway_mode() -> bool:
 
 def _should_use_gateway() -> bool:
     """Check if we should use gateway mode (gateway mode enabled, configured, and not skipped)."""
-    from .._context import is_llm_skip_active
     if is_llm_skip_active():
         return False
     if not _is_gateway_mode():
@@ -76,20 +79,16 @@ def _should_use_gateway() -> bool:
 
 def _should_inspect() -> bool:
     """Check if we should inspect (not already done, mode is not off, and not skipped)."""
-    from .._context import is_llm_skip_active
-    if is_llm_skip_active():
-        return False
-    mode = _state.get_llm_mode()
-    if mode == "off":
-        return False
-    ctx = get_inspection_context()
-    return not ctx.done
+    return (
+        _state.is_llm_inspection_enabled()
+        and not is_llm_skip_active()
+        and not is_inspection_done()
+    )
 
 
 def _enforce_decision(decision: Decision) -> None:
     """Enforce a decision if in enforce mode."""
-    mode = _state.get_llm_mode()
-    if mode == "enforce" and decision.action == "block":
+    if decision.action == "block" and _state.get_llm_mode() == "enforce":
         raise SecurityPolicyError(decision)
 
 
@@ -118,7 +117,6 @@ def _handle_vertexai_gateway_call(
     Returns:
         Native Vertex AI response wrapped for attribute access
     """
-    import httpx
     
     gateway_url = _state.get_provider_gateway_url("vertexai")
     gateway_api_key = _state.get_provider_gateway_api_key("vertexai")
@@ -175,8 +173,8 @@ def _handle_vertexai_gateway_call(
             parts = [{"text": p.text} for p in system_instruction.parts if hasattr(p, "text")]
             request_body["systemInstruction"] = {"parts": parts}
     
-    logger.debug(f"[GATEWAY] Sending native Vertex AI request to gateway")
-    logger.debug(f"[GATEWAY] Model: {model_name}")
+    logger.debug("[GATEWAY] Sending native Vertex AI request to gateway")
+    logger.debug("[GATEWAY] Model: %s", model_name)
     
     try:
         with httpx.Client(timeout=60.0) as client:
@@ -191,7 +189,7 @@ def _handle_vertexai_gateway_call(
             response.raise_for_status()
             response_data = response.json()
         
-        logger.debug(f"[GATEWAY] Received native Vertex AI response from gateway")
+        logger.debug("[GATEWAY] Received native Vertex AI response from gateway")
         set_inspection_context(decision=Decision.allow(reasons=["Gateway handled inspection"]), done=True)
         
         # Wrap response for attribute access
@@ -222,24 +220,20 @@ def _handle_vertexai_gateway_call(
 class _VertexAIResponseWrapper:
     """Wrapper to provide attribute access to native Vertex AI response dict."""
     
+    __slots__ = ("_data", "candidates")
+    
     def __init__(self, response_data: Dict):
         if not isinstance(response_data, dict):
             logger.warning(f"Invalid gateway response type: {type(response_data)}, expected dict")
             raise ValueError(f"Invalid gateway response: expected dict, got {type(response_data)}")
         self._data = response_data
-        self._candidates = None
-    
-    @property
-    def candidates(self):
-        if self._candidates is None:
-            try:
-                self._candidates = [
-                    _CandidateWrapper(c) for c in self._data.get("candidates", [])
-                ]
-            except (TypeError, KeyError, AttributeError) as e:
-                logger.warning(f"Error parsing candidates from gateway response: {e}")
-                self._candidates = []
-        return self._candidates
+        try:
+            self.candidates = [
+                _CandidateWrapper(c) for c in response_data.get("candidates", ())
+            ]
+        except (TypeError, KeyError, AttributeError) as e:
+            logger.warning(f"Error parsing candidates from gateway response: {e}")
+            self.candidates = []
     
     @property
     def text(self):
@@ -256,48 +250,33 @@ class _VertexAIResponseWrapper:
 class _CandidateWrapper:
     """Wrapper for candidate in Vertex AI response."""
     
+    __slots__ = ("_data", "content", "finish_reason")
+    
     def __init__(self, candidate_data: Dict):
         self._data = candidate_data
-        self._content = None
-    
-    @property
-    def content(self):
-        if self._content is None:
-            self._content = _ContentWrapper(self._data.get("content", {}))
-        return self._content
-    
-    @property
-    def finish_reason(self):
-        return self._data.get("finishReason")
+        self.content = _ContentWrapper(candidate_data.get("content", {}))
+        self.finish_reason = candidate_data.get("finishReason")
 
 
 class _ContentWrapper:
     """Wrapper for content in Vertex AI response."""
     
+    __slots__ = ("_data", "role", "parts")
+    
     def __init__(self, content_data: Dict):
         self._data = content_data
-        self._parts = None
-    
-    @property
-    def role(self):
-        return self._data.get("role", "model")
-    
-    @property
-    def parts(self):
-        if self._parts is None:
-            self._parts = [_PartWrapper(p) for p in self._data.get("parts", [])]
-        return self._parts
+        self.role = content_data.get("role", "model")
+        self.parts = [_PartWrapper(p) for p in content_data.get("parts", ())]
 
 
 class _PartWrapper:
     """Wrapper for part in Vertex AI response."""
     
+    __slots__ = ("_data", "text")
+    
     def __init__(self, part_data: Dict):
         self._data = part_data
-    
-    @property
-    def text(self):
-        return self._data.get("text", "")
+        self.text = part_data.get("text", "")
 
 
 class GoogleStreamingInspectionWrapper:
@@ -313,6 +292,8 @@ class GoogleStreamingInspectionWrapper:
         self._normalized = normalized_messages
         self._metadata = metadata
         self._collected_text = []
+        # Running length of _collected_text, so the buffer cap check is O(1) per chunk
+        self._collected_size = 0
         self._chunks = []
         self._inspection_done = False
     
@@ -325,13 +306,11 @@ class GoogleStreamingInspectionWrapper:
             self._chunks.append(chunk)
             
             # Extract text from chunk, with size limit to prevent memory issues
-            from ._google_common import extract_streaming_chunk_text
             text = extract_streaming_chunk_text(chunk)
-            if text:
-                current_size = sum(len(t) for t in self._collected_text)
-                if current_size < MAX_STREAMING_BUFFER_SIZE:
-                    remaining_capacity = MAX_STREAMING_BUFFER_SIZE - current_size
-                    self._collected_text.append(text[:remaining_capacity])
+            if text and self._collected_size < MAX_STREAMING_BUFFER_SIZE:
+                text = text[:MAX_STREAMING_BUFFER_SIZE - self._collected_size]
+                self._collected_text.append(text)
+                self._collected_size += len(text)
             
             return chunk
         except StopIteration:
@@ -376,6 +355,8 @@ class AsyncGoogleStreamingInspectionWrapper:
         self._normalized = normalized_messages
         self._metadata = metadata
         self._collected_text = []
+        # Running length of _collected_text, so the buffer cap check is O(1) per chunk
+        self._collected_size = 0
         self._chunks = []
         self._inspection_done = False
     
@@ -388,13 +369,11 @@ class AsyncGoogleStreamingInspectionWrapper:
             self._chunks.append(chunk)
             
             # Extract text from chunk, with size limit to prevent memory issues
-            from ._google_common import extract_streaming_chunk_text
             text = extract_streaming_chunk_text(chunk)
-            if text:
-                current_size = sum(len(t) for t in self._collected_text)
-                if current_size < MAX_STREAMING_BUFFER_SIZE:
-                    remaining_capacity = MAX_STREAMING_BUFFER_SIZE - current_size
-                    self._collected_text.append(text[:remaining_capacity])
+            if text and self._collected_size < MAX_STREAMING_BUFFER_SIZE:
+                text = text[:MAX_STREAMING_BUFFER_SIZE - self._collected_size]
+                self._collected_text.append(text)
+                self._collected_size += len(text)
             
             return chunk
         except StopAsyncIteration:
@@ -435,7 +414,6 @@ async def _handle_vertexai_gateway_call_async(
     system_instruction: Optional[Any] = None,
 ) -> Any:
     """Async version of _handle_vertexai_gateway_call."""
-    import httpx
     
     gateway_url = _state.get_provider_gateway_url("vertexai")
     gateway_api_key = _state.get_provider_gateway_api_key("vertexai")
@@ -492,7 +470,7 @@ async def _handle_vertexai_gateway_call_async(
             parts = [{"text": p.text} for p in system_instruction.parts if hasattr(p, "text")]
             request_body["systemInstruction"] = {"parts": parts}
     
-    logger.debug(f"[GATEWAY] Sending native Vertex AI request to gateway (async)")
+    logger.debug("[GATEWAY] Sending native Vertex AI request to gateway (async)")
     
     try:
         async with httpx.AsyncClient(timeout=60.0) as client:
@@ -507,7 +485,7 @@ async def _handle_vertexai_gateway_call_async(
             response.raise_for_status()
             response_data = response.json()
         
-        logger.debug(f"[GATEWAY] Received native Vertex AI response from gateway")
+        logger.debug("[GATEWAY] Received native Vertex AI response from gateway")
         set_inspection_context(decision=Decision.allow(reasons=["Gateway handled inspection"]), done=True)
         
         return _VertexAIResponseWrapper(response_data)
@@ -548,30 +526,26 @@ def _wrap_generate_content(wrapped, instance, args, kwargs):
         model_name = instance._model_name
     
     if not _should_inspect():
-        logger.debug(f"[PATCHED CALL] VertexAI.generate_content - inspection skipped (mode=off or already done)")
+        logger.debug("[PATCHED CALL] VertexAI.generate_content - inspection skipped (mode=off or already done)")
         return wrapped(*args, **kwargs)
     
     # Extract contents from args/kwargs
     contents = args[0] if args else kwargs.get("contents")
     stream = kwargs.get("stream", False)
     
-    # Normalize messages
-    normalized = normalize_google_messages(contents)
-    metadata = get_inspection_context().metadata
-    metadata["provider"] = "vertexai"
-    metadata["model"] = model_name
-    
-    mode = _state.get_llm_mode()
-    integration_mode = _state.get_llm_integration_mode()
-    logger.debug(f"")
-    logger.debug(f"╔══════════════════════════════════════════════════════════════")
-    logger.debug(f"║ [PATCHED] LLM CALL: {model_name}")
-    logger.debug(f"║ Operation: VertexAI.generate_content | LLM Mode: {mode} | Integration: {integration_mode}")
-    logger.debug(f"╚══════════════════════════════════════════════════════════════")
+    # Only build the call banner when debug logging is on (this runs on every patched call)
+    if logger.isEnabledFor(logging.DEBUG):
+        mode = _state.get_llm_mode()
+        integration_mode = _state.get_llm_integration_mode()
+        logger.debug(f"")
+        logger.debug(f"╔══════════════════════════════════════════════════════════════")
+        logger.debug(f"║ [PATCHED] LLM CALL: {model_name}")
+        logger.debug(f"║ Operation: VertexAI.generate_content | LLM Mode: {mode} | Integration: {integration_mode}")
+        logger.debug(f"╚══════════════════════════════════════════════════════════════")
     
     # Gateway mode: route through AI Defense Gateway with format conversion
     if _should_use_gateway():
-        logger.debug(f"[PATCHED CALL] VertexAI.generate_content - Gateway mode - routing to AI Defense Gateway")
+        logger.debug("[PATCHED CALL] VertexAI.generate_content - Gateway mode - routing to AI Defense Gateway")
         if not stream:  # Non-streaming only for now
             return _handle_vertexai_gateway_call(
                 model_name=model_name,
@@ -584,39 +558,43 @@ def _wrap_generate_content(wrapped, instance, args, kwargs):
         else:
             logger.warning(f"[PATCHED CALL] Gateway mode streaming not yet supported for VertexAI, falling back to API mode")
     
+    # Normalize messages; metadata is built per call (never written into the shared context dict)
+    normalized = normalize_google_messages(contents)
+    metadata = {**get_inspection_metadata(), "provider": "vertexai", "model": model_name}
+    
     # API mode (default): use LLMInspector for inspection
     # Pre-call inspection
     if normalized:
-        logger.debug(f"[PATCHED CALL] VertexAI.generate_content - Request inspection ({len(normalized)} messages)")
+        logger.debug("[PATCHED CALL] VertexAI.generate_content - Request inspection (%s messages)", len(normalized))
         inspector = _get_inspector()
         decision = inspector.inspect_conversation(normalized, metadata)
-        logger.debug(f"[PATCHED CALL] VertexAI.generate_content - Request decision: {decision.action}")
+        logger.debug("[PATCHED CALL] VertexAI.generate_content - Request decision: %s", decision.action)
         set_inspection_context(decision=decision)
         _enforce_decision(decision)
     
     # Call the original
-    logger.debug(f"[PATCHED CALL] VertexAI.generate_content - calling original method")
+    logger.debug("[PATCHED CALL] VertexAI.generate_content - calling original method")
     response = wrapped(*args, **kwargs)
     
     # Handle streaming vs non-streaming
     if stream:
-        logger.debug(f"[PATCHED CALL] VertexAI.generate_content - streaming response, wrapping for inspection")
+        logger.debug("[PATCHED CALL] VertexAI.generate_content - streaming response, wrapping for inspection")
         return GoogleStreamingInspectionWrapper(response, normalized, metadata)
     
     # Post-call inspection for non-streaming
     assistant_content = extract_google_response(response)
     if assistant_content and normalized:
-        logger.debug(f"[PATCHED CALL] VertexAI.generate_content - Response inspection (response: {len(assistant_content)} chars)")
+        logger.debug("[PATCHED CALL] VertexAI.generate_content - Response inspection (response: %s chars)", len(assistant_content))
         messages_with_response = normalized + [
             {"role": "assistant", "content": assistant_content}
         ]
         inspector = _get_inspector()
         decision = inspector.inspect_conversation(messages_with_response, metadata)
-        logger.debug(f"[PATCHED CALL] VertexAI.generate_content - Response decision: {decision.action}")
+        logger.debug("[PATCHED CALL] VertexAI.generate_content - Response decision: %s", decision.action)
         set_inspection_context(decision=decision, done=True)
         _enforce_decision(decision)
     
-    logger.debug(f"[PATCHED CALL] VertexAI.generate_content - complete")
+    logger.debug("[PATCHED CALL] VertexAI.generate_content - complete")
     return response
 
 
@@ -634,30 +612,26 @@ async def _wrap_generate_content_async(wrapped, instance, args, kwargs):
         model_name = instance._model_name
     
     if not _should_inspect():
-        logger.debug(f"[PATCHED CALL] VertexAI.async.generate_content - inspection skipped")
+        logger.debug("[PATCHED CALL] VertexAI.async.generate_content - inspection skipped")
         return await wrapped(*args, **kwargs)
     
     # Extract contents from args/kwargs
     contents = args[0] if args else kwargs.get("contents")
     stream = kwargs.get("stream", False)
     
-    # Normalize messages
-    normalized = normalize_google_messages(contents)
-    metadata = get_inspection_context().metadata
-    metadata["provider"] = "vertexai"
-    metadata["model"] = model_name
-    
-    mode = _state.get_llm_mode()
-    integration_mode = _state.get_llm_integration_mode()
-    logger.debug(f"")
-    logger.debug(f"╔══════════════════════════════════════════════════════════════")
-    logger.debug(f"║ [PATCHED] LLM CALL (async): {model_name}")
-    logger.debug(f"║ Operation: VertexAI.async.generate_content | LLM Mode: {mode} | Integration: {integration_mode}")
-    logger.debug(f"╚══════════════════════════════════════════════════════════════")
+    # Only build the call banner when debug logging is on (this runs on every patched call)
+    if logger.isEnabledFor(logging.DEBUG):
+        mode = _state.get_llm_mode()
+        integration_mode = _state.get_llm_integration_mode()
+        logger.debug(f"")
+        logger.debug(f"╔══════════════════════════════════════════════════════════════")
+        logger.debug(f"║ [PATCHED] LLM CALL (async): {model_name}")
+        logger.debug(f"║ Operation: VertexAI.async.generate_content | LLM Mode: {mode} | Integration: {integration_mode}")
+        logger.debug(f"╚══════════════════════════════════════════════════════════════")
     
     # Gateway mode: route through AI Defense Gateway with format conversion
     if _should_use_gateway():
-        logger.debug(f"[PATCHED CALL] VertexAI.async.generate_content - Gateway mode - routing to AI Defense Gateway")
+        logger.debug("[PATCHED CALL] VertexAI.async.generate_content - Gateway mode - routing to AI Defense Gateway")
         if not stream:  # Non-streaming only for now
             return await _handle_vertexai_gateway_call_async(
                 model_name=model_name,
@@ -670,38 +644,42 @@ async def _wrap_generate_content_async(wrapped, instance, args, kwargs):
         else:
             logger.warning(f"[PATCHED CALL] Gateway mode streaming not yet supported for VertexAI, falling back to API mode")
     
+    # Normalize messages; metadata is built per call (never written into the shared context dict)
+    normalized = normalize_google_messages(contents)
+    metadata = {**get_inspection_metadata(), "provider": "vertexai", "model": model_name}
+    
     # API mode (default): use LLMInspector for inspection
     # Pre-call inspection
     if normalized:
-        logger.debug(f"[PATCHED CALL] VertexAI.async - Request inspection ({len(normalized)} messages)")
+        logger.debug("[PATCHED CALL] VertexAI.async - Request inspection (%s messages)", len(normalized))
         inspector = _get_inspector()
         decision = await inspector.ainspect_conversation(normalized, metadata)
-        logger.debug(f"[PATCHED CALL] VertexAI.async - Request decision: {decision.action}")
+        logger.debug("[PATCHED CALL] VertexAI.async - Request decision: %s", decision.action)
         set_inspection_context(decision=decision)
         _enforce_decision(decision)
     
     # Call the original
-    logger.debug(f"[PATCHED CALL] VertexAI.async - calling original method")
+    logger.debug("[PATCHED CALL] VertexAI.async - calling original method")
     response = await wrapped(*args, **kwargs)
     
     # Handle streaming
     if stream:
-        logger.debug(f"[PATCHED CALL] VertexAI.async - streaming response, wrapping for inspection")
+        logger.debug("[PATCHED CALL] VertexAI.async - streaming response, wrapping for inspection")
         return AsyncGoogleStreamingInspectionWrapper(response, normalized, metadata)
     
     # Post-call inspection
     assistant_content = extract_google_response(response)
     if assistant_content and normalized:
-        logger.debug(f"[PATCHED CALL] VertexAI.async - Response inspection")
+        logger.debug("[PATCHED CALL] VertexAI.async - Response inspection")
         messages_with_response = normalized + [
             {"role": "assistant", "content": assistant_content}
         ]
         decision = await inspector.ainspect_conversation(messages_with_response, metadata)
-        logger.debug(f"[PATCHED CALL] VertexAI.async - Response decision: {decision.action}")
+        logger.debug("[PATCHED CALL] VertexAI.async - Response decision: %s", decision.action)
         set_inspection_context(decision=decision, done=True)
         _enforce_decision(decision)
     
-    logger.debug(f"[PATCHED CALL] VertexAI.async - complete")
+    logger.debug("[PATCHED CALL] VertexAI.async - complete")
     return response
 
 
@@ -17,21 +17,228 @@
 """
 MCP (Model Context Protocol) inspection client for Cisco AI Defense.
 
-This module provides the MCPInspectionClient for inspecting MCP JSON-RPC 2.0
-messages for security, privacy, and safety violations.
+This module provides the MCPInspectionClient and AsyncMCPInspectionClient for
+inspecting MCP JSON-RPC 2.0 messages for security, privacy, and safety violations.
 """
 
 from typing import Dict, Any, Optional, Union
 
-from .utils import convert
-from .inspection_client import InspectionClient
+from .utils import convert, json_dumps_bytes
+from .inspection_client import InspectionClient, AsyncInspectionClient
 from .models import InspectResponse, Action, Classification, Severity, Rule, RuleName
 from .mcp_models import MCPMessage, MCPError, MCPInspectResponse, MCPInspectError
-from ..config import Config
+from ..config import Config, BaseConfig, AsyncConfig
 from ..exceptions import ValidationError
 
 
-class MCPInspectionClient(InspectionClient):
+class BaseMCPInspectionClient:
+    """
+    Shared request building, validation and parsing for the sync and async MCP inspection clients.
+    """
+
+    def __new__(cls, *args, **kwargs):
+        if cls is BaseMCPInspectionClient:
+            raise TypeError("BaseMCPInspectionClient cannot be instantiated directly.")
+
+        return super().__new__(cls)
+
+    def __init__(self, api_key: str, config: BaseConfig):
+        super().__init__(api_key, config)
+        self.endpoint = f"{self.config.runtime_base_url}/api/v1/inspect/mcp"
+
+    def serialize_message(
+        self, message: MCPMessage, request_id: Optional[str] = None
+    ) -> bytes:
+        """
+        Validate an MCP message and serialize it to a JSON request body.
+
+        The returned bytes can be passed to ``inspect_raw`` any number of times, so callers
+        that retry an inspection only pay for validation and encoding once.
+
+        Args:
+            message (MCPMessage): The MCP message to inspect.
+            request_id (str, optional): Unique identifier for the request to enable tracing.
+
+        Returns:
+            bytes: The JSON-encoded JSON-RPC 2.0 request body.
+
+        Raises:
+            ValidationError: If the input message is invalid.
+        """
+        self.config.logger.debug(
+            f"Starting MCP inspection | Message: {message}, Request ID: {request_id}"
+        )
+
+        if not isinstance(message, MCPMessage):
+            raise ValidationError("'message' must be an MCPMessage object.")
+
+        request_dict = self._prepare_request_data(message)
+        self.validate_mcp_message(request_dict)
+
+        # Serialize once up front so the body is not re-encoded while preparing the request
+        return json_dumps_bytes(request_dict)
+
+    def validate_mcp_message(self, request_dict: Dict[str, Any]) -> None:
+        """
+        Validate the MCP message dictionary before sending to the API.
+
+        Validates according to JSON-RPC 2.0 and MCP specification:
+            - 'jsonrpc' must be "2.0"
+            - Must have either 'method' (for requests/notifications) or 'result'/'error' (for responses)
+            - 'id' must be present for requests (has method) and responses (has result/error)
+            - 'params', 'result', 'error', and 'data' must be dicts if present
+
+        Args:
+            request_dict (Dict[str, Any]): The request dictionary to validate.
+
+        Raises:
+            ValidationError: If the message is missing required fields or is malformed.
+        """
+        self.config.logger.debug(
+            f"Validating MCP message dictionary | Request dict: {request_dict}"
+        )
+
+        # jsonrpc must be "2.0"
+        jsonrpc = request_dict.get("jsonrpc")
+        if jsonrpc != "2.0":
+            self.config.logger.error("'jsonrpc' must be '2.0'.")
+            raise ValidationError("'jsonrpc' must be '2.0'.")
+
+        has_method = "method" in request_dict and request_dict.get("method")
+        has_result = "result" in request_dict and request_dict.get("result") is not None
+        has_error = "error" in request_dict and request_dict.get("error") is not None
+        has_id = "id" in request_dict and request_dict.get("id") is not None
+
+        # Must have method (request/notification) or result/error (response)
+        if not has_method and not has_result and not has_error:
+            self.config.logger.error(
+                "MCP message must have 'method' (for requests/notifications) or 'result'/'error' (for responses)."
+            )
+            raise ValidationError(
+                "MCP message must have 'method' (for requests/notifications) or 'result'/'error' (for responses)."
+            )
+
+        # If it's a request (has method), check params is dict if present
+        if has_method:
+            params = request_dict.get("params")
+            if params is not None and not isinstance(params, dict):
+                self.config.logger.error("'params' must be a dict if provided.")
+                raise ValidationError("'params' must be a dict if provided.")
+
+        # If it's a response (has result), check result is dict
+        if has_result:
+            result = request_dict.get("result")
+            if not isinstance(result, dict):
+                self.config.logger.error("'result' must be a dict.")
+                raise ValidationError("'result' must be a dict.")
+
+        # If it's an error response (has error), validate error structure
+        if has_error:
+            error = request_dict.get("error")
+            if not isinstance(error, dict):
+                self.config.logger.error("'error' must be a dict.")
+                raise ValidationError("'error' must be a dict.")
+
+            if "code" not in error or not isinstance(error.get("code"), int):
+                self.config.logger.error("'error.code' must be an integer.")
+                raise ValidationError("'error.code' must be an integer.")
+
+            if "message" not in error or not isinstance(error.get("message"), str):
+                self.config.logger.error("'error.message' must be a string.")
+                raise ValidationError("'error.message' must be a string.")
+
+            if "data" in error and error.get("data") is not None:
+                if not isinstance(error.get("data"), dict):
+                    self.config.logger.error("'error.data' must be a dict if provided.")
+                    raise ValidationError("'error.data' must be a dict if provided.")
+
+    def _prepare_request_data(self, message: MCPMessage) -> Dict[str, Any]:
+        """
+        Convert an MCPMessage dataclass to a dictionary suitable for the API.
+
+        Handles the special case where 'id' can be either a string or integer.
+
+        Args:
+            message (MCPMessage): The MCPMessage dataclass instance.
+
+        Returns:
+            Dict[str, Any]: Dictionary representation of the message for JSON serialization.
+        """
+        self.config.logger.debug("Preparing request data for MCP inspection API.")
+
+        request_dict = {"jsonrpc": message.jsonrpc}
+
+        if message.method is not None:
+            request_dict["method"] = message.method
+
+        if message.params is not None:
+            request_dict["params"] = convert(message.params)
+
+        if message.result is not None:
+            request_dict["result"] = convert(message.result)
+
+        if message.error is not None:
+            request_dict["error"] = convert(message.error)
+
+        if message.id is not None:
+            request_dict["id"] = message.id
+
+        self.config.logger.debug(f"Prepared request dict: {request_dict}")
+        return request_dict
+
+    def _parse_mcp_inspect_response(
+        self, response_data: Dict[str, Any]
+    ) -> MCPInspectResponse:
+        """
+        Parse API response into an MCPInspectResponse object.
+
+        Args:
+            response_data (Dict[str, Any]): The response data returned by the API.
+
+        Returns:
+            MCPInspectResponse: The parsed MCP inspection response object.
+        """
+        self.config.logger.debug(
+            f"_parse_mcp_inspect_response called | response_data: {response_data}"
+        )
+
+        jsonrpc = response_data.get("jsonrpc", "2.0")
+
+        # Extract ID - can be string or int
+        response_id = response_data.get("id")
+
+        # Check if response contains error
+        if "error" in response_data and response_data.get("error"):
+            error_data = response_data["error"]
+            error = MCPInspectError(
+                code=error_data.get("code", -32603),
+                message=error_data.get("message", "Unknown error"),
+                data=error_data.get("data"),
+            )
+            return MCPInspectResponse(
+                jsonrpc=jsonrpc,
+                error=error,
+                id=response_id,
+            )
+
+        # Parse the result (InspectResponse)
+        result_data = response_data.get("result", response_data)
+
+        # If result is directly the inspect response (not wrapped in "result" key)
+        if "result" in response_data and isinstance(response_data["result"], dict):
+            result_data = response_data["result"]
+
+        # Parse the InspectResponse from result_data
+        inspect_result = self._parse_inspect_response(result_data)
+
+        return MCPInspectResponse(
+            jsonrpc=jsonrpc,
+            result=inspect_result,
+            id=response_id,
+        )
+
+
+class MCPInspectionClient(BaseMCPInspectionClient, InspectionClient):
     """
     Client for inspecting MCP (Model Context Protocol) JSON-RPC 2.0 messages with Cisco AI Defense.
 
@@ -89,7 +296,6 @@ class MCPInspectionClient(InspectionClient):
         """
         config = config or Config()
         super().__init__(api_key, config)
-        self.endpoint = f"{self.config.runtime_base_url}/api/v1/inspect/mcp"
 
     def inspect(
         self,
@@ -305,208 +511,281 @@ class MCPInspectionClient(InspectionClient):
         )
         return self._inspect(message, request_id, timeout)
 
-    def _inspect(
+    def inspect_raw(
         self,
-        message: MCPMessage,
+        body: bytes,
         request_id: Optional[str] = None,
         timeout: Optional[int] = None,
     ) -> MCPInspectResponse:
         """
-        Implements the inspection logic for MCP messages.
+        Inspect a pre-serialized MCP JSON-RPC 2.0 request body.
 
-        This method validates the input message, prepares the request, sends it to the API,
-        and parses the inspection response.
+        Use together with ``serialize_message`` to avoid re-encoding large payloads
+        (e.g. tool outputs) when the same inspection is retried.
 
         Args:
-            message (MCPMessage): The MCP message to inspect.
+            body (bytes): JSON request body as returned by ``serialize_message``.
             request_id (str, optional): Unique identifier for the request to enable tracing.
             timeout (int, optional): Request timeout in seconds.
 
         Returns:
             MCPInspectResponse: Inspection results wrapped in JSON-RPC 2.0 format.
-
-        Raises:
-            ValidationError: If the input message is invalid.
         """
-        self.config.logger.debug(
-            f"Starting MCP inspection | Message: {message}, Request ID: {request_id}"
-        )
-
-        if not isinstance(message, MCPMessage):
-            raise ValidationError("'message' must be an MCPMessage object.")
-
-        request_dict = self._prepare_request_data(message)
-        self.validate_mcp_message(request_dict)
-
-        headers = {"Content-Type": "application/json"}
         result = self._request_handler.request(
             method="POST",
             url=self.endpoint,
             auth=self.auth,
-            headers=headers,
-            json_data=request_dict,
+            headers={"Content-Type": "application/json"},
+            data=body,
             request_id=request_id,
             timeout=timeout,
         )
         self.config.logger.debug(f"Raw API response: {result}")
         return self._parse_mcp_inspect_response(result)
 
-    def validate_mcp_message(self, request_dict: Dict[str, Any]) -> None:
+    def _inspect(
+        self,
+        message: MCPMessage,
+        request_id: Optional[str] = None,
+        timeout: Optional[int] = None,
+    ) -> MCPInspectResponse:
         """
-        Validate the MCP message dictionary before sending to the API.
+        Implements the inspection logic for MCP messages.
 
-        Validates according to JSON-RPC 2.0 and MCP specification:
-            - 'jsonrpc' must be "2.0"
-            - Must have either 'method' (for requests/notifications) or 'result'/'error' (for responses)
-            - 'id' must be present for requests (has method) and responses (has result/error)
-            - 'params', 'result', 'error', and 'data' must be dicts if present
+        This method validates the input message, prepares the request, sends it to the API,
+        and parses the inspection response.
 
         Args:
-            request_dict (Dict[str, Any]): The request dictionary to validate.
+            message (MCPMessage): The MCP message to inspect.
+            request_id (str, optional): Unique identifier for the request to enable tracing.
+            timeout (int, optional): Request timeout in seconds.
+
+        Returns:
+            MCPInspectResponse: Inspection results wrapped in JSON-RPC 2.0 format.
 
         Raises:
-            ValidationError: If the message is missing required fields or is malformed.
+            ValidationError: If the input message is invalid.
         """
-        self.config.logger.debug(
-            f"Validating MCP message dictionary | Request dict: {request_dict}"
-        )
+        body = self.serialize_message(message, request_id)
+        return self.inspect_raw(body, request_id, timeout)
 
-        # jsonrpc must be "2.0"
-        jsonrpc = request_dict.get("jsonrpc")
-        if jsonrpc != "2.0":
-            self.config.logger.error("'jsonrpc' must be '2.0'.")
-            raise ValidationError("'jsonrpc' must be '2.0'.")
 
-        has_method = "method" in request_dict and request_dict.get("method")
-        has_result = "result" in request_dict and request_dict.get("result") is not None
-        has_error = "error" in request_dict and request_dict.get("error") is not None
-        has_id = "id" in request_dict and request_dict.get("id") is not None
+class AsyncMCPInspectionClient(BaseMCPInspectionClient, AsyncInspectionClient):
+    """
+    Async client for inspecting MCP (Model Context Protocol) JSON-RPC 2.0 messages with Cisco AI Defense.
 
-        # Must have method (request/notification) or result/error (response)
-        if not has_method and not has_result and not has_error:
-            self.config.logger.error(
-                "MCP message must have 'method' (for requests/notifications) or 'result'/'error' (for responses)."
-            )
-            raise ValidationError(
-                "MCP message must have 'method' (for requests/notifications) or 'result'/'error' (for responses)."
-            )
+    Mirrors MCPInspectionClient, but sends requests through the async request handler so
+    inspections can be awaited directly from an event loop without a worker thread.
 
-        # If it's a request (has method), check params is dict if present
-        if has_method:
-            params = request_dict.get("params")
-            if params is not None and not isinstance(params, dict):
-                self.config.logger.error("'params' must be a dict if provided.")
-                raise ValidationError("'params' must be a dict if provided.")
+    Typical usage:
+        ```python
+        from aidefense.config import AsyncConfig
+        from aidefense.runtime import AsyncMCPInspectionClient
 
-        # If it's a response (has result), check result is dict
-        if has_result:
-            result = request_dict.get("result")
-            if not isinstance(result, dict):
-                self.config.logger.error("'result' must be a dict.")
-                raise ValidationError("'result' must be a dict.")
+        async with AsyncMCPInspectionClient(api_key="...", config=AsyncConfig()) as client:
+            result = await client.inspect_tool_call(
+                tool_name="execute_command",
+                arguments={"command": "ls -la"},
+                message_id=1,
+            )
+            if result.result and result.result.is_safe:
+                print("MCP message is safe to process")
+        ```
 
-        # If it's an error response (has error), validate error structure
-        if has_error:
-            error = request_dict.get("error")
-            if not isinstance(error, dict):
-                self.config.logger.error("'error' must be a dict.")
-                raise ValidationError("'error' must be a dict.")
+    Args:
+        api_key (str): Your Cisco AI Defense API key.
+        config (AsyncConfig, optional): SDK configuration for endpoints, logging, retries, etc.
+            If not provided, a default singleton AsyncConfig is used.
 
-            if "code" not in error or not isinstance(error.get("code"), int):
-                self.config.logger.error("'error.code' must be an integer.")
-                raise ValidationError("'error.code' must be an integer.")
+    Attributes:
+        endpoint (str): The API endpoint for MCP inspection requests.
+    """
 
-            if "message" not in error or not isinstance(error.get("message"), str):
-                self.config.logger.error("'error.message' must be a string.")
-                raise ValidationError("'error.message' must be a string.")
+    def __init__(self, api_key: str, config: AsyncConfig = None):
+        """
+        Initialize an AsyncMCPInspectionClient instance.
 
-            if "data" in error and error.get("data") is not None:
-                if not isinstance(error.get("data"), dict):
-                    self.config.logger.error("'error.data' must be a dict if provided.")
-                    raise ValidationError("'error.data' must be a dict if provided.")
+        Args:
+            api_key (str): Your Cisco AI Defense API key for authentication.
+            config (AsyncConfig, optional): Async SDK configuration for endpoints, logging, retries, etc.
+                If not provided, a default singleton AsyncConfig is used.
 
-    def _prepare_request_data(self, message: MCPMessage) -> Dict[str, Any]:
+        Raises:
+            ValueError: If config is provided but is not an AsyncConfig instance.
         """
-        Convert an MCPMessage dataclass to a dictionary suitable for the API.
+        if config is not None and not isinstance(config, AsyncConfig):
+            raise ValueError("config must be an AsyncConfig object.")
 
-        Handles the special case where 'id' can be either a string or integer.
+        config = config or AsyncConfig()
+        super().__init__(api_key, config)
+
+    async def inspect(
+        self,
+        message: MCPMessage,
+        request_id: Optional[str] = None,
+        timeout: Optional[int] = None,
+    ) -> MCPInspectResponse:
+        """
+        Inspect an MCP JSON-RPC 2.0 message for security, privacy, and safety violations.
 
         Args:
-            message (MCPMessage): The MCPMessage dataclass instance.
+            message (MCPMessage): The MCP message to inspect.
+            request_id (str, optional): Unique identifier for the request to enable tracing.
+            timeout (int, optional): Request timeout in seconds.
 
         Returns:
-            Dict[str, Any]: Dictionary representation of the message for JSON serialization.
+            MCPInspectResponse: Inspection results wrapped in JSON-RPC 2.0 format.
         """
-        self.config.logger.debug("Preparing request data for MCP inspection API.")
-
-        request_dict = {"jsonrpc": message.jsonrpc}
+        self.config.logger.debug(
+            f"Inspecting MCP message: {message} | Request ID: {request_id}"
+        )
+        return await self._inspect(message, request_id, timeout)
 
-        if message.method is not None:
-            request_dict["method"] = message.method
+    async def inspect_tool_call(
+        self,
+        tool_name: str,
+        arguments: Optional[Dict[str, Any]] = None,
+        message_id: Optional[Union[str, int]] = None,
+        request_id: Optional[str] = None,
+        timeout: Optional[int] = None,
+    ) -> MCPInspectResponse:
+        """
+        Convenience method to inspect an MCP tools/call request.
 
-        if message.params is not None:
-            request_dict["params"] = convert(message.params)
+        Args:
+            tool_name (str): The name of the tool being called.
+            arguments (Dict[str, Any], optional): The arguments passed to the tool.
+            message_id (Union[str, int], optional): The JSON-RPC message ID.
+            request_id (str, optional): Unique identifier for the request to enable tracing.
+            timeout (int, optional): Request timeout in seconds.
 
-        if message.result is not None:
-            request_dict["result"] = convert(message.result)
+        Returns:
+            MCPInspectResponse: Inspection results wrapped in JSON-RPC 2.0 format.
+        """
+        self.config.logger.debug(
+            f"Inspecting MCP tool call: {tool_name} | Arguments: {arguments}, Message ID: {message_id}, Request ID: {request_id}"
+        )
+        message = MCPMessage(
+            jsonrpc="2.0",
+            method="tools/call",
+            params={"name": tool_name, "arguments": arguments or {}},
+            id=message_id,
+        )
+        return await self._inspect(message, request_id, timeout)
 
-        if message.error is not None:
-            request_dict["error"] = convert(message.error)
+    async def inspect_resource_read(
+        self,
+        uri: str,
+        message_id: Optional[Union[str, int]] = None,
+        request_id: Optional[str] = None,
+        timeout: Optional[int] = None,
+    ) -> MCPInspectResponse:
+        """
+        Convenience method to inspect an MCP resources/read request.
 
-        if message.id is not None:
-            request_dict["id"] = message.id
+        Args:
+            uri (str): The URI of the resource being accessed.
+            message_id (Union[str, int], optional): The JSON-RPC message ID.
+            request_id (str, optional): Unique identifier for the request to enable tracing.
+            timeout (int, optional): Request timeout in seconds.
 
-        self.config.logger.debug(f"Prepared request dict: {request_dict}")
-        return request_dict
+        Returns:
+            MCPInspectResponse: Inspection results wrapped in JSON-RPC 2.0 format.
+        """
+        self.config.logger.debug(
+            f"Inspecting MCP resource read: {uri} | Message ID: {message_id}, Request ID: {request_id}"
+        )
+        message = MCPMessage(
+            jsonrpc="2.0",
+            method="resources/read",
+            params={"uri": uri},
+            id=message_id,
+        )
+        return await self._inspect(message, request_id, timeout)
 
-    def _parse_mcp_inspect_response(
-        self, response_data: Dict[str, Any]
+    async def inspect_response(
+        self,
+        result_data: Dict[str, Any],
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        message_id: Optional[Union[str, int]] = None,
+        request_id: Optional[str] = None,
+        timeout: Optional[int] = None,
     ) -> MCPInspectResponse:
         """
-        Parse API response into an MCPInspectResponse object.
+        Convenience method to inspect an MCP response message.
 
         Args:
-            response_data (Dict[str, Any]): The response data returned by the API.
+            result_data (Dict[str, Any]): The result data from the MCP response.
+            method (str): The method from the original request (e.g., "tools/call").
+            params (Dict[str, Any], optional): The params from the original request.
+            message_id (Union[str, int], optional): The JSON-RPC message ID.
+            request_id (str, optional): Unique identifier for the request to enable tracing.
+            timeout (int, optional): Request timeout in seconds.
 
         Returns:
-            MCPInspectResponse: The parsed MCP inspection response object.
+            MCPInspectResponse: Inspection results wrapped in JSON-RPC 2.0 format.
         """
         self.config.logger.debug(
-            f"_parse_mcp_inspect_response called | response_data: {response_data}"
+            f"Inspecting MCP response: {result_data} | Method: {method}, Params: {params}, Message ID: {message_id}, Request ID: {request_id}"
         )
+        message = MCPMessage(
+            jsonrpc="2.0",
+            method=method,
+            params=params,
+            result=result_data,
+            id=message_id,
+        )
+        return await self._inspect(message, request_id, timeout)
 
-        jsonrpc = response_data.get("jsonrpc", "2.0")
-
-        # Extract ID - can be string or int
-        response_id = response_data.get("id")
+    async def inspect_raw(
+        self,
+        body: bytes,
+        request_id: Optional[str] = None,
+        timeout: Optional[int] = None,
+    ) -> MCPInspectResponse:
+        """
+        Inspect a pre-serialized MCP JSON-RPC 2.0 request body.
 
-        # Check if response contains error
-        if "error" in response_data and response_data.get("error"):
-            error_data = response_data["error"]
-            error = MCPInspectError(
-                code=error_data.get("code", -32603),
-                message=error_data.get("message", "Unknown error"),
-                data=error_data.get("data"),
-            )
-            return MCPInspectResponse(
-                jsonrpc=jsonrpc,
-                error=error,
-                id=response_id,
-            )
+        Args:
+            body (bytes): JSON request body as returned by ``serialize_message``.
+            request_id (str, optional): Unique identifier for the request to enable tracing.
+            timeout (int, optional): Request timeout in seconds.
 
-        # Parse the result (InspectResponse)
-        result_data = response_data.get("result", response_data)
+        Returns:
+            MCPInspectResponse: Inspection results wrapped in JSON-RPC 2.0 format.
+        """
+        result = await self._request_handler.request(
+            method="POST",
+            url=self.endpoint,
+            auth=self.auth,
+            headers={"Content-Type": "application/json"},
+            data=body,
+            request_id=request_id,
+            timeout=timeout,
+        )
+        self.config.logger.debug(f"Raw API response: {result}")
+        return self._parse_mcp_inspect_response(result)
 
-        # If result is directly the inspect response (not wrapped in "result" key)
-        if "result" in response_data and isinstance(response_data["result"], dict):
-            result_data = response_data["result"]
+    async def _inspect(
+        self,
+        message: MCPMessage,
+        request_id: Optional[str] = None,
+        timeout: Optional[int] = None,
+    ) -> MCPInspectResponse:
+        """
+        Implements the async inspection logic for MCP messages.
 
-        # Parse the InspectResponse from result_data
-        inspect_result = self._parse_inspect_response(result_data)
+        Args:
+            message (MCPMessage): The MCP message to inspect.
+            request_id (str, optional): Unique identifier for the request to enable tracing.
+            timeout (int, optional): Request timeout in seconds.
 
-        return MCPInspectResponse(
-            jsonrpc=jsonrpc,
-            result=inspect_result,
-            id=response_id,
-        )
+        Returns:
+            MCPInspectResponse: Inspection results wrapped in JSON-RPC 2.0 format.
 
+        Raises:
+            ValidationError: If the input message is invalid.
+        """
+        body = self.serialize_message(message, request_id)
+        return await self.inspect_raw(body, request_id, timeout)
@@ -19,12 +19,25 @@ Utility functions for encoding HTTP bodies and serializing objects for the AI De
 """
 
 import base64
+import json
 from typing import Union, Any, Optional, Dict
 from dataclasses import asdict, is_dataclass
 from enum import Enum
 
 from .constants import HTTP_BODY
 
+def json_dumps_bytes(obj: Any) -> bytes:
+    """
+    Serialize an object to compact UTF-8 JSON bytes for a request body.
+
+    Args:
+        obj: A JSON-serializable object.
+
+    Returns:
+        bytes: The encoded JSON document.
+    """
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
 
 def to_base64_bytes(data: Union[str, bytes]) -> str:
     """
@@ -5,9 +5,9 @@ import pytest
 from typing import Generator
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
 def reset_agentsec_state() -> Generator[None, None, None]:
-    """Reset agentsec state for test isolation."""
+    """Reset agentsec state and patch registry around every functional test."""
     from aidefense.runtime.agentsec._state import reset
     from aidefense.runtime.agentsec.patchers import reset_registry
     
@@ -3,18 +3,7 @@
 import pytest
 from unittest.mock import patch, MagicMock
 
-from aidefense.runtime.agentsec import protect, get_patched_clients, _state
-from aidefense.runtime.agentsec.patchers import reset_registry
-
-
-@pytest.fixture(autouse=True)
-def reset_state():
-    """Reset agentsec state before each test."""
-    _state.reset()
-    reset_registry()
-    yield
-    _state.reset()
-    reset_registry()
+from aidefense.runtime.agentsec import protect, get_patched_clients
 
 
 class TestVertexAIIntegration:
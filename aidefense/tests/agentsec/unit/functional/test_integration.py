@@ -7,18 +7,10 @@ import pytest
 
 from aidefense.runtime import agentsec
 from aidefense.runtime.agentsec import Decision, SecurityPolicyError, protect
-from aidefense.runtime.agentsec._state import get_llm_mode, get_mcp_mode, is_initialized, reset
+from aidefense.runtime.agentsec._state import get_llm_mode, get_mcp_mode, is_initialized
 from aidefense.runtime.agentsec.inspectors import LLMInspector, MCPInspector
 
 
-@pytest.fixture(autouse=True)
-def reset_state():
-    """Reset agentsec state before and after each test."""
-    reset()
-    yield
-    reset()
-
-
 class TestFullInitialization:
     """Test full initialization flow."""
 
@@ -4,21 +4,10 @@ import pytest
 from unittest.mock import patch
 
 from aidefense.runtime import agentsec
-from aidefense.runtime.agentsec._state import reset, get_mcp_mode
-from aidefense.runtime.agentsec.patchers import reset_registry
+from aidefense.runtime.agentsec._state import get_mcp_mode
 from aidefense.runtime.agentsec.exceptions import SecurityPolicyError
 
 
-@pytest.fixture(autouse=True)
-def reset_state():
-    """Reset agentsec state before and after each test."""
-    reset()
-    reset_registry()
-    yield
-    reset()
-    reset_registry()
-
-
 class TestMCPOffMode:
     """Tests for MCP off mode behavior."""
 
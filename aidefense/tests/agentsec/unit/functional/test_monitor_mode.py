@@ -5,8 +5,7 @@ import pytest
 from unittest.mock import patch, MagicMock
 
 from aidefense.runtime import agentsec
-from aidefense.runtime.agentsec._state import reset, get_llm_mode
-from aidefense.runtime.agentsec.patchers import reset_registry
+from aidefense.runtime.agentsec._state import get_llm_mode
 
 # API key must be 64 characters (RuntimeAuth validation)
 TEST_API_KEY = "0" * 64
@@ -20,16 +19,6 @@ def _mock_session_request(response_json):
     return patch("requests.Session.request", return_value=mock_response)
 
 
-@pytest.fixture(autouse=True)
-def reset_state():
-    """Reset agentsec state before and after each test."""
-    reset()
-    reset_registry()
-    yield
-    reset()
-    reset_registry()
-
-
 class TestMonitorMode:
     """Tests for monitor mode behavior."""
 
@@ -1,52 +1,50 @@
 """Tests for protect() integration (Task 13.1)."""
 
 import pytest
-from unittest.mock import patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 from aidefense.runtime import agentsec
 from aidefense.runtime.agentsec import protect, get_patched_clients
-from aidefense.runtime.agentsec._state import reset
 
+# Package whose patch_* functions protect() imports when applying patches
+_PATCHERS = "aidefense.runtime.agentsec.patchers"
 
-@pytest.fixture(autouse=True)
-def reset_state():
-    """Reset agentsec state before and after each test."""
-    reset()
-    # Also reset patch registry
-    from aidefense.runtime.agentsec.patchers import reset_registry
-    reset_registry()
-    yield
-    reset()
-    reset_registry()
+
+@pytest.fixture(scope="module")
+def _installed_patcher_mocks():
+    """Install mock patch_* functions once for the whole module."""
+    mocks = SimpleNamespace(openai=MagicMock(), bedrock=MagicMock(), vertexai=MagicMock(), mcp=MagicMock())
+    with pytest.MonkeyPatch.context() as mp:
+        for name, mock_patcher in vars(mocks).items():
+            mp.setattr(f"{_PATCHERS}.patch_{name}", mock_patcher)
+        yield mocks
+
+
+@pytest.fixture
+def patcher_mocks(_installed_patcher_mocks):
+    """Module-wide patcher mocks with call history cleared for each test."""
+    for mock_patcher in vars(_installed_patcher_mocks).values():
+        mock_patcher.reset_mock()
+    return _installed_patcher_mocks
 
 
 class TestProtectIntegration:
     """Test protect() integration with patching."""
 
-    def test_protect_patches_clients_when_enabled(self):
+    def test_protect_patches_clients_when_enabled(self, patcher_mocks):
         """Test protect() patches all clients when patch_clients=True."""
-        # Mock the patch functions to track calls
-        with patch("aidefense.runtime.agentsec.patchers.patch_openai") as mock_openai, \
-             patch("aidefense.runtime.agentsec.patchers.patch_bedrock") as mock_bedrock, \
-             patch("aidefense.runtime.agentsec.patchers.patch_vertexai") as mock_vertexai, \
-             patch("aidefense.runtime.agentsec.patchers.patch_mcp") as mock_mcp:
-            
-            protect(api_mode_llm="enforce", patch_clients=True)
-            
-            mock_openai.assert_called_once()
-            mock_bedrock.assert_called_once()
-            mock_vertexai.assert_called_once()
-            mock_mcp.assert_called_once()
-
-    def test_protect_skips_patching_when_disabled(self):
+        protect(api_mode_llm="enforce", patch_clients=True)
+        
+        for mock_patcher in vars(patcher_mocks).values():
+            mock_patcher.assert_called_once()
+
+    def test_protect_skips_patching_when_disabled(self, patcher_mocks):
         """Test protect() skips patching when patch_clients=False."""
-        with patch("aidefense.runtime.agentsec.patchers.patch_openai") as mock_openai, \
-             patch("aidefense.runtime.agentsec.patchers.patch_bedrock") as mock_bedrock:
-            
-            protect(api_mode_llm="enforce", patch_clients=False)
-            
-            mock_openai.assert_not_called()
-            mock_bedrock.assert_not_called()
+        protect(api_mode_llm="enforce", patch_clients=False)
+        
+        patcher_mocks.openai.assert_not_called()
+        patcher_mocks.bedrock.assert_not_called()
 
     def test_get_patched_clients_after_protect(self):
         """Test get_patched_clients() returns correct list after protect()."""
@@ -66,46 +64,25 @@ class TestProtectIntegration:
 class TestProtectModes:
     """Test protect() with different modes."""
 
-    def test_protect_off_mode_skips_all(self):
-        """Test all modes='off' skips patching."""
+    @pytest.mark.parametrize(
+        "protect_kwargs,llm_expected,mcp_expected,should_patch",
+        [
+            pytest.param({"api_mode_llm": "off", "api_mode_mcp": "off"}, "off", "off", False, id="off-skips-all"),
+            pytest.param({"api_mode_llm": "monitor"}, "monitor", None, True, id="monitor"),
+            pytest.param({"api_mode_llm": "enforce"}, "enforce", None, True, id="enforce"),
+            pytest.param(
+                {"api_mode_llm": "enforce", "api_mode_mcp": "monitor"}, "enforce", "monitor", True, id="fine-grained"
+            ),
+        ],
+    )
+    def test_protect_modes(self, protect_kwargs, llm_expected, mcp_expected, should_patch):
+        """Test protect() stores the requested modes and only patches when a mode is on."""
+        from aidefense.runtime.agentsec._state import get_llm_mode, get_mcp_mode
+
         with patch("aidefense.runtime.agentsec._apply_patches") as mock_patches:
-            
-            protect(api_mode_llm="off", api_mode_mcp="off")
-            
-            mock_patches.assert_not_called()
-
-    def test_protect_monitor_mode_enables_all(self):
-        """Test api_mode_llm='monitor' enables patching."""
-        with patch("aidefense.runtime.agentsec.patchers.patch_openai"), \
-             patch("aidefense.runtime.agentsec.patchers.patch_bedrock"), \
-             patch("aidefense.runtime.agentsec.patchers.patch_vertexai"), \
-             patch("aidefense.runtime.agentsec.patchers.patch_mcp"):
-            
-            protect(api_mode_llm="monitor")
-            
-            from aidefense.runtime.agentsec._state import get_llm_mode
-            assert get_llm_mode() == "monitor"
-
-    def test_protect_enforce_mode_enables_all(self):
-        """Test api_mode_llm='enforce' enables patching."""
-        with patch("aidefense.runtime.agentsec.patchers.patch_openai"), \
-             patch("aidefense.runtime.agentsec.patchers.patch_bedrock"), \
-             patch("aidefense.runtime.agentsec.patchers.patch_vertexai"), \
-             patch("aidefense.runtime.agentsec.patchers.patch_mcp"):
-            
-            protect(api_mode_llm="enforce")
-            
-            from aidefense.runtime.agentsec._state import get_llm_mode
-            assert get_llm_mode() == "enforce"
-
-    def test_protect_fine_grained_modes(self):
-        """Test fine-grained mode control."""
-        with patch("aidefense.runtime.agentsec.patchers.patch_openai"), \
-             patch("aidefense.runtime.agentsec.patchers.patch_bedrock"), \
-             patch("aidefense.runtime.agentsec.patchers.patch_vertexai"):
-            
-            protect(api_mode_llm="enforce", api_mode_mcp="monitor")
-            
-            from aidefense.runtime.agentsec._state import get_llm_mode, get_mcp_mode
-            assert get_llm_mode() == "enforce"
-            assert get_mcp_mode() == "monitor"
+            protect(**protect_kwargs)
+
+        assert mock_patches.called is should_patch
+        assert get_llm_mode() == llm_expected
+        if mcp_expected is not None:
+            assert get_mcp_mode() == mcp_expected
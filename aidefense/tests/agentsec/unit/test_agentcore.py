@@ -425,18 +425,16 @@ class TestAgentCoreApiMode:
 
     @patch("aidefense.runtime.agentsec.patchers.bedrock._state")
     @patch("aidefense.runtime.agentsec.patchers.bedrock._get_inspector")
-    @patch("aidefense.runtime.agentsec.patchers.bedrock.get_inspection_context")
+    @patch("aidefense.runtime.agentsec.patchers.bedrock.get_inspection_metadata")
     @patch("aidefense.runtime.agentsec.patchers.bedrock.set_inspection_context")
-    def test_api_mode_inspects_request(self, mock_set_ctx, mock_get_ctx, mock_get_inspector, mock_state):
+    def test_api_mode_inspects_request(self, mock_set_ctx, mock_get_metadata, mock_get_inspector, mock_state):
         """Test API mode inspects request before calling."""
         from aidefense.runtime.agentsec.patchers.bedrock import _handle_agentcore_api_mode
         
         mock_state.get_llm_mode.return_value = "monitor"
         mock_state.get_llm_integration_mode.return_value = "api"
         
-        mock_ctx = MagicMock()
-        mock_ctx.metadata = {}
-        mock_get_ctx.return_value = mock_ctx
+        mock_get_metadata.return_value = {}
         
         mock_inspector = MagicMock()
         mock_inspector.inspect_conversation.return_value = Decision.allow()
@@ -461,17 +459,15 @@ class TestAgentCoreApiMode:
 
     @patch("aidefense.runtime.agentsec.patchers.bedrock._state")
     @patch("aidefense.runtime.agentsec.patchers.bedrock._get_inspector")
-    @patch("aidefense.runtime.agentsec.patchers.bedrock.get_inspection_context")
-    def test_api_mode_enforces_block_decision(self, mock_get_ctx, mock_get_inspector, mock_state):
+    @patch("aidefense.runtime.agentsec.patchers.bedrock.get_inspection_metadata")
+    def test_api_mode_enforces_block_decision(self, mock_get_metadata, mock_get_inspector, mock_state):
         """Test API mode enforces block decision in enforce mode."""
         from aidefense.runtime.agentsec.patchers.bedrock import _handle_agentcore_api_mode
         
         mock_state.get_llm_mode.return_value = "enforce"
         mock_state.get_llm_integration_mode.return_value = "api"
         
-        mock_ctx = MagicMock()
-        mock_ctx.metadata = {}
-        mock_get_ctx.return_value = mock_ctx
+        mock_get_metadata.return_value = {}
         
         mock_inspector = MagicMock()
         mock_inspector.inspect_conversation.return_value = Decision.block(reasons=["policy_violation"])
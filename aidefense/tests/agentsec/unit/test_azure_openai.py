@@ -1,10 +1,15 @@
 """Tests for Azure OpenAI coverage verification."""
 
+import asyncio
+import threading
+from types import SimpleNamespace
+
 import pytest
 from unittest.mock import MagicMock, patch, AsyncMock
 
 from aidefense.runtime.agentsec.patchers.openai import (
     patch_openai,
+    _extract_assistant_content,
     _wrap_chat_completions_create,
 )
 from aidefense.runtime.agentsec.exceptions import SecurityPolicyError
@@ -12,6 +17,23 @@ from aidefense.runtime.agentsec.decision import Decision
 from aidefense.runtime.agentsec import _state
 from aidefense.runtime.agentsec._context import clear_inspection_context, get_inspection_context
 from aidefense.runtime.agentsec.patchers import reset_registry
+from aidefense.runtime.agentsec.patchers import openai as openai_module
+
+# Fail-open API mode state shared by the Azure OpenAI coverage tests
+_FAIL_OPEN_STATE = {"initialized": True, "llm_rules": None, "api_mode_fail_open_llm": True}
+
+# Read-only response shapes for assistant content extraction
+_RESP_HI = SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="Hi"))])
+_RESP_TEXT_COMPLETION = SimpleNamespace(choices=[SimpleNamespace(text="done")])
+_RESP_EMPTY_CHOICES = SimpleNamespace(choices=[])
+_RESP_NONE_CHOICES = SimpleNamespace(choices=None)
+_RESP_NONE_MESSAGE = SimpleNamespace(choices=[SimpleNamespace(message=None)])
+
+# Read-only streaming chunks; tests wrap them in a fresh iterator
+_STREAM_CHUNKS = (
+    SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content="Hello"))]),
+    SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=" world!"))]),
+)
 
 
 @pytest.fixture(autouse=True)
@@ -21,7 +43,6 @@ def reset_state():
     reset_registry()
     clear_inspection_context()
     # Reset global inspector
-    import aidefense.runtime.agentsec.patchers.openai as openai_module
     openai_module._inspector = None
     yield
     _state.reset()
@@ -33,6 +54,11 @@ def reset_state():
 class TestAzureOpenAICoverage:
     """Verify Azure OpenAI is covered by existing OpenAI patch."""
 
+    @pytest.fixture(autouse=True)
+    def monitor_mode(self, reset_state):
+        """Install fail-open monitor mode after the per-test state reset."""
+        _state.set_state(**_FAIL_OPEN_STATE, api_mode_llm="monitor")
+
     @patch("aidefense.runtime.agentsec.patchers.openai._get_inspector")
     def test_azure_openai_uses_same_completions_resource(self, mock_get_inspector):
         """
@@ -48,10 +74,6 @@ class TestAzureOpenAICoverage:
         mock_inspector.inspect_conversation.return_value = Decision.allow(reasons=[])
         mock_get_inspector.return_value = mock_inspector
         
-        # Setup state
-        _state.set_state(initialized=True, llm_rules=None, api_mode_fail_open_llm=True, api_mode_llm="monitor")
-        clear_inspection_context()
-        
         # Mock wrapped function
         mock_wrapped = MagicMock()
         mock_response = MagicMock()
@@ -93,8 +115,7 @@ class TestAzureOpenAICoverage:
         mock_get_inspector.return_value = mock_inspector
         
         # Setup state in enforce mode
-        _state.set_state(initialized=True, llm_rules=None, api_mode_fail_open_llm=True, api_mode_llm="enforce")
-        clear_inspection_context()
+        _state.set_state(**_FAIL_OPEN_STATE, api_mode_llm="enforce")
         
         # Mock wrapped function
         mock_wrapped = MagicMock()
@@ -122,22 +143,8 @@ class TestAzureOpenAICoverage:
         mock_inspector.inspect_conversation.return_value = Decision.allow(reasons=[])
         mock_get_inspector.return_value = mock_inspector
         
-        # Setup state
-        _state.set_state(initialized=True, llm_rules=None, api_mode_fail_open_llm=True, api_mode_llm="monitor")
-        clear_inspection_context()
-        
         # Mock streaming response
-        chunk1 = MagicMock()
-        chunk1.choices = [MagicMock()]
-        chunk1.choices[0].delta = MagicMock()
-        chunk1.choices[0].delta.content = "Hello"
-        
-        chunk2 = MagicMock()
-        chunk2.choices = [MagicMock()]
-        chunk2.choices[0].delta = MagicMock()
-        chunk2.choices[0].delta.content = " world!"
-        
-        mock_stream = iter([chunk1, chunk2])
+        mock_stream = iter(_STREAM_CHUNKS)
         mock_wrapped = MagicMock(return_value=mock_stream)
         mock_instance = MagicMock()
         
@@ -155,7 +162,7 @@ class TestAzureOpenAICoverage:
         
         # Iterate through stream
         chunks = list(result)
-        assert len(chunks) == 2
+        assert chunks == list(_STREAM_CHUNKS)
 
     @patch("aidefense.runtime.agentsec.patchers.openai._get_inspector")
     def test_azure_openai_monitor_mode_logs_only(self, mock_get_inspector):
@@ -168,10 +175,6 @@ class TestAzureOpenAICoverage:
         )
         mock_get_inspector.return_value = mock_inspector
         
-        # Setup state in MONITOR mode (not enforce)
-        _state.set_state(initialized=True, llm_rules=None, api_mode_fail_open_llm=True, api_mode_llm="monitor")
-        clear_inspection_context()
-        
         # Mock wrapped function
         mock_wrapped = MagicMock()
         mock_response = MagicMock()
@@ -200,3 +203,579 @@ class TestAzureOpenAICoverage:
 
 
 
+
+
+class TestDetectProvider:
+    """Test OpenAI vs Azure OpenAI provider detection."""
+
+    @staticmethod
+    def _instance(client_type, base_url):
+        instance = MagicMock()
+        instance._client = type(client_type, (), {"base_url": base_url})()
+        return instance
+
+    def test_sync_and_async_azure_clients_detected_by_type(self):
+        from aidefense.runtime.agentsec.patchers.openai import _detect_provider
+
+        for client_type in ("AzureOpenAI", "AsyncAzureOpenAI"):
+            instance = self._instance(client_type, "https://proxy.example.com/v1/")
+            assert _detect_provider(instance) == "azure_openai"
+
+    def test_azure_base_url_detected(self):
+        from aidefense.runtime.agentsec.patchers.openai import _detect_provider
+
+        instance = self._instance("OpenAI", "https://res.openai.Azure.com/openai/")
+        assert _detect_provider(instance) == "azure_openai"
+
+    def test_base_url_check_is_cached(self):
+        from aidefense.runtime.agentsec.patchers.openai import _detect_provider, _is_azure_base_url
+
+        _is_azure_base_url.cache_clear()
+        instance = self._instance("OpenAI", "https://api.openai.com/v1/")
+        for _ in range(3):
+            assert _detect_provider(instance) == "openai"
+
+        info = _is_azure_base_url.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
+    def test_openai_client(self):
+        from aidefense.runtime.agentsec.patchers.openai import _detect_provider
+
+        assert _detect_provider(self._instance("OpenAI", "https://api.openai.com/v1/")) == "openai"
+        assert _detect_provider(MagicMock(_client=None)) == "openai"
+
+
+class TestAzureDeploymentName:
+    """Test Azure deployment name extraction."""
+
+    def test_deployment_from_base_url(self):
+        """Test deployment name is parsed from the client's base_url."""
+        from aidefense.runtime.agentsec.patchers.openai import _get_azure_deployment_name
+
+        mock_instance = MagicMock()
+        mock_instance._client = MagicMock(spec=["base_url"])
+        mock_instance._client.base_url = "https://res.openai.azure.com/openai/deployments/gpt-4o/"
+
+        assert _get_azure_deployment_name(mock_instance, {}) == "gpt-4o"
+
+    def test_model_kwarg_takes_precedence(self):
+        """Test kwargs["model"] wins over the base_url."""
+        from aidefense.runtime.agentsec.patchers.openai import _get_azure_deployment_name
+
+        mock_instance = MagicMock()
+        mock_instance._client = MagicMock(spec=["base_url"])
+        mock_instance._client.base_url = "https://res.openai.azure.com/openai/deployments/gpt-4o/"
+
+        assert _get_azure_deployment_name(mock_instance, {"model": "gpt-35"}) == "gpt-35"
+
+    def test_no_deployment_in_base_url(self):
+        """Test None is returned when no deployment can be found."""
+        from aidefense.runtime.agentsec.patchers.openai import _get_azure_deployment_name
+
+        mock_instance = MagicMock()
+        mock_instance._client = MagicMock(spec=["base_url"])
+        mock_instance._client.base_url = "https://api.openai.com/v1/"
+
+        assert _get_azure_deployment_name(mock_instance, {}) is None
+
+    def test_deployment_without_trailing_segment(self):
+        """Test a base_url ending in the deployment name, and an empty deployment segment."""
+        from aidefense.runtime.agentsec.patchers.openai import _get_azure_deployment_name
+
+        mock_instance = MagicMock()
+        mock_instance._client = MagicMock(spec=["base_url"])
+        mock_instance._client.base_url = "https://res.openai.azure.com/openai/deployments/gpt-4o"
+        assert _get_azure_deployment_name(mock_instance, {}) == "gpt-4o"
+
+        mock_instance._client.base_url = "https://res.openai.azure.com/openai/deployments//chat"
+        assert _get_azure_deployment_name(mock_instance, {}) is None
+
+    @patch("aidefense.runtime.agentsec.patchers.openai._get_azure_deployment_name")
+    @patch("aidefense.runtime.agentsec.patchers.openai._get_azure_api_version")
+    @patch("aidefense.runtime.agentsec.patchers.openai._get_inspector")
+    def test_not_resolved_in_api_mode(self, mock_get_inspector, mock_api_version, mock_deployment):
+        """Test Azure routing info is only extracted for gateway calls."""
+        mock_get_inspector.return_value.inspect_conversation.return_value = Decision.allow(reasons=[])
+        _state.set_state(initialized=True, api_mode_llm="monitor")
+        clear_inspection_context()
+
+        with patch("aidefense.runtime.agentsec.patchers.openai._detect_provider", return_value="azure_openai"):
+            _wrap_chat_completions_create(
+                MagicMock(return_value=MagicMock()),
+                MagicMock(),
+                (),
+                {"model": "gpt-4o", "messages": [{"role": "user", "content": "Hi"}]},
+            )
+
+        mock_api_version.assert_not_called()
+        mock_deployment.assert_not_called()
+
+
+class TestGatewayChatCompletionsUrl:
+    """Test gateway chat completions URL construction."""
+
+    def test_azure_url_with_api_version(self):
+        from aidefense.runtime.agentsec.patchers.openai import _gateway_chat_completions_url
+
+        url = _gateway_chat_completions_url("https://gw.example.com/", "azure_openai", "gpt-4o", "2024-02-01")
+
+        assert url == "https://gw.example.com/openai/deployments/gpt-4o/chat/completions?api-version=2024-02-01"
+
+    def test_openai_url(self):
+        from aidefense.runtime.agentsec.patchers.openai import _gateway_chat_completions_url
+
+        url = _gateway_chat_completions_url("https://gw.example.com", "openai", None, None)
+
+        assert url == "https://gw.example.com/v1/chat/completions"
+
+    def test_full_url_kept_as_is(self):
+        from aidefense.runtime.agentsec.patchers.openai import _gateway_chat_completions_url
+
+        url = _gateway_chat_completions_url("https://gw.example.com/chat/completions/", "azure_openai", "d", "v")
+
+        assert url == "https://gw.example.com/chat/completions"
+
+
+class TestNormalizeMessages:
+    """Test OpenAI message normalization."""
+
+    def test_plain_messages_fast_path(self):
+        """Test plain string messages keep role/content and drop tool and empty messages."""
+        from aidefense.runtime.agentsec.patchers.openai import _normalize_messages
+
+        messages = [
+            {"role": "system", "content": "Be nice", "name": "sys"},
+            {"role": "user", "content": "Hi"},
+            {"role": "tool", "content": "42", "tool_call_id": "t1"},
+            {"role": "assistant", "content": ""},
+            {"role": "assistant", "content": None},
+        ]
+
+        assert _normalize_messages(messages) == [
+            {"role": "system", "content": "Be nice"},
+            {"role": "user", "content": "Hi"},
+        ]
+
+    def test_mixed_messages_fall_back_to_general_path(self):
+        """Test content blocks and tool calls after plain messages are still handled."""
+        from aidefense.runtime.agentsec.patchers.openai import _normalize_messages
+
+        messages = [
+            {"role": "user", "content": "Hi"},
+            {"role": "user", "content": [{"type": "text", "text": "a"}, "b"]},
+            {"role": "assistant", "content": None, "tool_calls": [{"function": {"name": "lookup"}}]},
+        ]
+
+        assert _normalize_messages(messages) == [
+            {"role": "user", "content": "Hi"},
+            {"role": "user", "content": "a\nb"},
+            {"role": "assistant", "content": "[Called tools: lookup]"},
+        ]
+
+
+class TestPostCallSkippedWhenDone:
+    """Test post-call inspection is skipped once inspection is marked done."""
+
+    @patch("aidefense.runtime.agentsec.patchers.openai._get_inspector")
+    def test_sync_skips_post_call_when_done(self, mock_get_inspector):
+        from aidefense.runtime.agentsec._context import set_inspection_context
+
+        mock_inspector = MagicMock()
+        mock_inspector.inspect_conversation.return_value = Decision.allow(reasons=[])
+        mock_get_inspector.return_value = mock_inspector
+        _state.set_state(initialized=True, api_mode_llm="monitor")
+        clear_inspection_context()
+
+        response = MagicMock()
+
+        def wrapped(*args, **kwargs):
+            # Simulate a nested layer that already inspected the response
+            set_inspection_context(decision=Decision.allow(reasons=[]), done=True)
+            return response
+
+        result = _wrap_chat_completions_create(
+            wrapped, MagicMock(), (), {"messages": [{"role": "user", "content": "Hi"}], "stream": True}
+        )
+
+        assert result is response
+        assert mock_inspector.inspect_conversation.call_count == 1
+
+    @pytest.mark.asyncio
+    @patch("aidefense.runtime.agentsec.patchers.openai._get_inspector")
+    async def test_async_skips_post_call_when_done(self, mock_get_inspector):
+        from aidefense.runtime.agentsec._context import set_inspection_context
+        from aidefense.runtime.agentsec.patchers.openai import _wrap_chat_completions_create_async
+
+        mock_inspector = MagicMock()
+        mock_inspector.ainspect_conversation = AsyncMock(return_value=Decision.allow(reasons=[]))
+        mock_get_inspector.return_value = mock_inspector
+        _state.set_state(initialized=True, api_mode_llm="monitor")
+        clear_inspection_context()
+
+        response = MagicMock()
+
+        async def wrapped(*args, **kwargs):
+            set_inspection_context(decision=Decision.allow(reasons=[]), done=True)
+            return response
+
+        result = await _wrap_chat_completions_create_async(
+            wrapped, MagicMock(), (), {"messages": [{"role": "user", "content": "Hi"}]}
+        )
+
+        assert result is response
+        assert mock_inspector.ainspect_conversation.await_count == 1
+
+
+class TestExtractAssistantContent:
+    """Test assistant text extraction from OpenAI-shaped responses."""
+
+    def test_message_content(self):
+        assert _extract_assistant_content(_RESP_HI) == "Hi"
+
+    def test_text_completion_choice(self):
+        assert _extract_assistant_content(_RESP_TEXT_COMPLETION) == "done"
+
+    def test_missing_or_empty_shapes(self):
+        assert _extract_assistant_content(object()) == ""
+        assert _extract_assistant_content(_RESP_EMPTY_CHOICES) == ""
+        assert _extract_assistant_content(_RESP_NONE_CHOICES) == ""
+        assert _extract_assistant_content(_RESP_NONE_MESSAGE) == ""
+
+
+class TestEmptyRequestInspection:
+    """Test an empty normalized request skips pre-call inspection but not the response."""
+
+    @patch("aidefense.runtime.agentsec.patchers.openai._get_inspector")
+    def test_sync_inspects_response_only(self, mock_get_inspector):
+        mock_inspector = MagicMock()
+        mock_inspector.inspect_conversation.return_value = Decision.allow(reasons=[])
+        mock_get_inspector.return_value = mock_inspector
+        _state.set_state(initialized=True, api_mode_llm="monitor")
+        clear_inspection_context()
+
+        response = MagicMock()
+        response.choices = [MagicMock()]
+        response.choices[0].message.content = "Hello"
+
+        result = _wrap_chat_completions_create(
+            MagicMock(return_value=response), MagicMock(), (), {"messages": [{"role": "tool", "content": "42"}]}
+        )
+
+        assert result is response
+        mock_inspector.inspect_conversation.assert_called_once()
+        messages = mock_inspector.inspect_conversation.call_args[0][0]
+        assert messages == [{"role": "assistant", "content": "Hello"}]
+
+    @pytest.mark.asyncio
+    @patch("aidefense.runtime.agentsec.patchers.openai._get_inspector")
+    async def test_async_inspects_response_only(self, mock_get_inspector):
+        from aidefense.runtime.agentsec.patchers.openai import _wrap_chat_completions_create_async
+
+        mock_inspector = MagicMock()
+        mock_inspector.ainspect_conversation = AsyncMock(return_value=Decision.allow(reasons=[]))
+        mock_get_inspector.return_value = mock_inspector
+        _state.set_state(initialized=True, api_mode_llm="monitor")
+        clear_inspection_context()
+
+        response = MagicMock()
+        response.choices = [MagicMock()]
+        response.choices[0].message.content = "Hello"
+
+        async def wrapped(*args, **kwargs):
+            return response
+
+        result = await _wrap_chat_completions_create_async(wrapped, MagicMock(), (), {"messages": []})
+
+        assert result is response
+        assert mock_inspector.ainspect_conversation.await_count == 1
+        messages = mock_inspector.ainspect_conversation.call_args[0][0]
+        assert messages == [{"role": "assistant", "content": "Hello"}]
+
+
+class TestSpeculativeAsyncInspection:
+    """Test the opt-in overlap of async request inspection with the LLM call."""
+
+    @staticmethod
+    def _response(text):
+        response = MagicMock()
+        response.choices = [MagicMock()]
+        response.choices[0].message.content = text
+        return response
+
+    @pytest.mark.asyncio
+    @patch("aidefense.runtime.agentsec.patchers.openai._get_inspector")
+    async def test_call_starts_before_inspection_finishes(self, mock_get_inspector):
+        from aidefense.runtime.agentsec.patchers.openai import _wrap_chat_completions_create_async
+
+        events = []
+        response = self._response("Hello")
+
+        async def ainspect(messages, metadata):
+            events.append("inspect-start")
+            await asyncio.sleep(0.01)
+            events.append("inspect-end")
+            return Decision.allow(reasons=[])
+
+        async def wrapped(*args, **kwargs):
+            events.append("call")
+            return response
+
+        mock_get_inspector.return_value = MagicMock(ainspect_conversation=ainspect)
+        _state.set_state(initialized=True, api_mode_llm="monitor", api_mode_speculative_llm=True)
+        clear_inspection_context()
+
+        result = await _wrap_chat_completions_create_async(
+            wrapped, MagicMock(), (), {"messages": [{"role": "user", "content": "Hi"}]}
+        )
+
+        assert result is response
+        assert events.index("call") < events.index("inspect-end")
+
+    @pytest.mark.asyncio
+    @patch("aidefense.runtime.agentsec.patchers.openai._get_inspector")
+    async def test_fail_closed_error_cancels_in_flight_call(self, mock_get_inspector):
+        from aidefense.runtime.agentsec.patchers.openai import _wrap_chat_completions_create_async
+
+        call_cancelled = asyncio.Event()
+
+        async def wrapped(*args, **kwargs):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                call_cancelled.set()
+                raise
+
+        async def ainspect(messages, metadata):
+            await asyncio.sleep(0.01)
+            raise RuntimeError("inspection down")
+
+        mock_get_inspector.return_value = MagicMock(ainspect_conversation=ainspect)
+        _state.set_state(
+            initialized=True,
+            api_mode_llm="monitor",
+            api_mode_speculative_llm=True,
+            api_mode_fail_open_llm=False,
+        )
+        clear_inspection_context()
+
+        with pytest.raises(SecurityPolicyError):
+            await _wrap_chat_completions_create_async(
+                wrapped, MagicMock(), (), {"messages": [{"role": "user", "content": "Hi"}]}
+            )
+        await asyncio.sleep(0)
+
+        assert call_cancelled.is_set()
+
+    @pytest.mark.asyncio
+    @patch("aidefense.runtime.agentsec.patchers.openai._get_inspector")
+    async def test_fail_closed_error_closes_finished_stream(self, mock_get_inspector):
+        from aidefense.runtime.agentsec.patchers.openai import _wrap_chat_completions_create_async
+
+        stream = MagicMock()
+        stream.close = AsyncMock()
+
+        async def ainspect(messages, metadata):
+            await asyncio.sleep(0.01)
+            raise RuntimeError("inspection down")
+
+        mock_get_inspector.return_value = MagicMock(ainspect_conversation=ainspect)
+        _state.set_state(
+            initialized=True,
+            api_mode_llm="monitor",
+            api_mode_speculative_llm=True,
+            api_mode_fail_open_llm=False,
+        )
+        clear_inspection_context()
+
+        with pytest.raises(SecurityPolicyError):
+            await _wrap_chat_completions_create_async(
+                AsyncMock(return_value=stream),
+                MagicMock(),
+                (),
+                {"messages": [{"role": "user", "content": "Hi"}], "stream": True},
+            )
+
+        stream.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch("aidefense.runtime.agentsec.patchers.openai._get_inspector")
+    async def test_enforce_mode_inspects_before_call(self, mock_get_inspector):
+        from aidefense.runtime.agentsec.patchers.openai import _wrap_chat_completions_create_async
+
+        wrapped = AsyncMock()
+        mock_inspector = MagicMock()
+        mock_inspector.ainspect_conversation = AsyncMock(return_value=Decision.block(reasons=["jailbreak"]))
+        mock_get_inspector.return_value = mock_inspector
+        _state.set_state(initialized=True, api_mode_llm="enforce", api_mode_speculative_llm=True)
+        clear_inspection_context()
+
+        with pytest.raises(SecurityPolicyError):
+            await _wrap_chat_completions_create_async(
+                wrapped, MagicMock(), (), {"messages": [{"role": "user", "content": "Hi"}]}
+            )
+
+        wrapped.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("aidefense.runtime.agentsec.patchers.openai._get_inspector")
+    async def test_sequential_by_default(self, mock_get_inspector):
+        from aidefense.runtime.agentsec.patchers.openai import _wrap_chat_completions_create_async
+
+        wrapped = AsyncMock()
+        mock_inspector = MagicMock()
+        mock_inspector.ainspect_conversation = AsyncMock(return_value=Decision.block(reasons=["jailbreak"]))
+        mock_get_inspector.return_value = mock_inspector
+        _state.set_state(initialized=True, api_mode_llm="enforce")
+        clear_inspection_context()
+
+        with pytest.raises(SecurityPolicyError):
+            await _wrap_chat_completions_create_async(
+                wrapped, MagicMock(), (), {"messages": [{"role": "user", "content": "Hi"}]}
+            )
+
+        wrapped.assert_not_called()
+
+
+class TestSpeculativeSyncInspection:
+    """Test the opt-in overlap of sync request inspection with the LLM call."""
+
+    @patch("aidefense.runtime.agentsec.patchers.openai._get_inspector")
+    def test_inspection_runs_while_call_in_flight(self, mock_get_inspector):
+        call_started = threading.Event()
+
+        def inspect(messages, metadata):
+            # Only completes if the original call started without waiting for us
+            assert call_started.wait(timeout=5)
+            return Decision.allow(reasons=[])
+
+        response = MagicMock()
+        response.choices = [MagicMock()]
+        response.choices[0].message.content = "Hello"
+
+        def wrapped(*args, **kwargs):
+            call_started.set()
+            return response
+
+        mock_get_inspector.return_value = MagicMock(inspect_conversation=MagicMock(side_effect=inspect))
+        _state.set_state(initialized=True, api_mode_llm="monitor", api_mode_speculative_llm=True)
+        clear_inspection_context()
+
+        result = _wrap_chat_completions_create(
+            wrapped, MagicMock(), (), {"messages": [{"role": "user", "content": "Hi"}]}
+        )
+
+        assert result is response
+        assert mock_get_inspector.return_value.inspect_conversation.call_count == 2
+
+    @patch("aidefense.runtime.agentsec.patchers.openai._get_speculative_executor")
+    @patch("aidefense.runtime.agentsec.patchers.openai._get_inspector")
+    def test_enforce_mode_inspects_before_call(self, mock_get_inspector, mock_get_executor):
+        mock_inspector = MagicMock()
+        mock_inspector.inspect_conversation.return_value = Decision.block(reasons=["jailbreak"])
+        mock_get_inspector.return_value = mock_inspector
+        _state.set_state(initialized=True, api_mode_llm="enforce", api_mode_speculative_llm=True)
+        clear_inspection_context()
+        wrapped = MagicMock()
+
+        with pytest.raises(SecurityPolicyError):
+            _wrap_chat_completions_create(
+                wrapped, MagicMock(), (), {"messages": [{"role": "user", "content": "Hi"}]}
+            )
+
+        wrapped.assert_not_called()
+        mock_get_executor.assert_not_called()
+
+    @patch("aidefense.runtime.agentsec.patchers.openai._get_inspector")
+    def test_fail_closed_error_raised_after_call_and_stream_closed(self, mock_get_inspector):
+        stream = MagicMock()
+        mock_inspector = MagicMock()
+        mock_inspector.inspect_conversation.side_effect = RuntimeError("inspection down")
+        mock_get_inspector.return_value = mock_inspector
+        _state.set_state(
+            initialized=True,
+            api_mode_llm="monitor",
+            api_mode_speculative_llm=True,
+            api_mode_fail_open_llm=False,
+        )
+        clear_inspection_context()
+
+        with pytest.raises(SecurityPolicyError):
+            _wrap_chat_completions_create(
+                MagicMock(return_value=stream),
+                MagicMock(),
+                (),
+                {"messages": [{"role": "user", "content": "Hi"}], "stream": True},
+            )
+
+        stream.close.assert_called_once()
+
+    def test_executor_shut_down_at_exit(self):
+        from aidefense.runtime.agentsec.patchers import openai as openai_patcher
+
+        executor = openai_patcher._get_speculative_executor()
+        openai_patcher._shutdown_speculative_executor()
+
+        assert openai_patcher._speculative_executor is None
+        with pytest.raises(RuntimeError):
+            executor.submit(lambda: None)
+
+
+class TestStreamingInspectionThreshold:
+    """Test mid-stream inspection is driven by buffered content size."""
+
+    @staticmethod
+    def _chunk(text):
+        chunk = MagicMock()
+        chunk.choices = [MagicMock()]
+        chunk.choices[0].delta.content = text
+        return chunk
+
+    def _run(self, texts):
+        from aidefense.runtime.agentsec.patchers.openai import StreamingInspectionWrapper
+
+        mock_inspector = MagicMock()
+        mock_inspector.inspect_conversation.return_value = Decision.allow(reasons=[])
+        with patch("aidefense.runtime.agentsec.patchers.openai._get_inspector", return_value=mock_inspector):
+            with patch("aidefense.runtime.agentsec.patchers.openai._should_inspect", return_value=True):
+                wrapper = StreamingInspectionWrapper(iter([self._chunk(t) for t in texts]), [], {})
+                list(wrapper)
+        return [call.args[0][-1]["content"] for call in mock_inspector.inspect_conversation.call_args_list]
+
+    def test_many_small_chunks_only_inspected_at_end(self):
+        inspected = self._run(["tok"] * 25)
+
+        assert inspected == ["tok" * 25]
+
+    def test_large_content_inspected_mid_stream(self):
+        inspected = self._run(["a" * 2000, "b" * 2000, "c" * 2000, "d"])
+
+        assert [len(text) for text in inspected] == [6000, 6001]
+
+
+class TestNormalizeToolCalls:
+    """Test assistant tool call summaries in OpenAI message normalization."""
+
+    def test_tool_call_dicts_and_objects(self):
+        from aidefense.runtime.agentsec.patchers.openai import _normalize_messages
+
+        sdk_tool_call = MagicMock()
+        sdk_tool_call.function.name = "search"
+        messages = [
+            {
+                "role": "assistant",
+                "content": "Looking it up",
+                "tool_calls": [{"function": {"name": "lookup"}}, sdk_tool_call, {"function": None}],
+            },
+        ]
+
+        assert _normalize_messages(messages) == [
+            {"role": "assistant", "content": "Looking it up [Called tools: lookup, search, unknown]"},
+        ]
+
+    def test_assistant_without_tool_calls(self):
+        from aidefense.runtime.agentsec.patchers.openai import _normalize_messages
+
+        messages = [{"role": "assistant", "content": [{"text": "Hi"}], "tool_calls": None}]
+
+        assert _normalize_messages(messages) == [{"role": "assistant", "content": "Hi"}]
@@ -42,10 +42,21 @@ class TestBedrockPatcher:
         
         mock_state.get_llm_mode.return_value = "monitor"
         
-        with patch("aidefense.runtime.agentsec.patchers.bedrock.get_inspection_context") as mock_ctx:
-            mock_ctx.return_value = MagicMock(done=False)
+        with patch("aidefense.runtime.agentsec.patchers.bedrock.is_inspection_done", return_value=False):
             assert _should_inspect() is True
 
+    @patch("aidefense.runtime.agentsec.patchers.bedrock._state")
+    def test_enforce_decision_reads_mode_only_for_block(self, mock_state):
+        """Test _enforce_decision skips the mode lookup for allow decisions."""
+        from aidefense.runtime.agentsec.patchers.bedrock import _enforce_decision
+        
+        mock_state.get_llm_mode.return_value = "enforce"
+        _enforce_decision(Decision.allow())
+        mock_state.get_llm_mode.assert_not_called()
+        
+        with pytest.raises(SecurityPolicyError):
+            _enforce_decision(Decision.block(reasons=["jailbreak"]))
+
     @patch("aidefense.runtime.agentsec.patchers.bedrock._state")
     def test_is_gateway_mode(self, mock_state):
         """Test _is_gateway_mode returns correct value."""
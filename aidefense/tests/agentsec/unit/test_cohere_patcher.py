@@ -1,7 +1,7 @@
 """Unit tests for the Cohere v2 client patcher."""
 
 import pytest
-from unittest.mock import MagicMock, patch, AsyncMock
+from unittest.mock import MagicMock, Mock, patch, AsyncMock
 
 from aidefense.runtime.agentsec.patchers.cohere import (
     patch_cohere,
@@ -15,6 +15,7 @@ from aidefense.runtime.agentsec.decision import Decision
 from aidefense.runtime.agentsec import _state
 from aidefense.runtime.agentsec._context import clear_inspection_context
 from aidefense.runtime.agentsec.patchers import reset_registry
+from aidefense.runtime.agentsec.patchers import cohere as cohere_module
 
 
 @pytest.fixture(autouse=True)
@@ -23,7 +24,6 @@ def reset_state():
     _state.reset()
     reset_registry()
     clear_inspection_context()
-    import aidefense.runtime.agentsec.patchers.cohere as cohere_module
     cohere_module._inspector = None
     yield
     _state.reset()
@@ -35,45 +35,33 @@ def reset_state():
 class TestCohereNormalization:
     """Test message normalization for Cohere v2 formats."""
 
-    def test_normalize_dict_messages(self):
-        """Normalize list of dicts with role/content."""
-        messages = [
-            {"role": "user", "content": "Hello"},
-            {"role": "assistant", "content": "Hi there"},
-        ]
+    @pytest.mark.parametrize(
+        "messages,expected",
+        [
+            pytest.param(
+                [{"role": "user", "content": "Hello"}, {"role": "assistant", "content": "Hi there"}],
+                [("user", "Hello"), ("assistant", "Hi there")],
+                id="dict_messages",
+            ),
+            pytest.param(
+                [{"role": "user", "content": "Hi"}, {"role": "tool", "content": "tool result"}],
+                [("user", "Hi")],
+                id="skips_tool_role",
+            ),
+            pytest.param(
+                [MagicMock(role="user", content="Hello"), MagicMock(role="system", content="You are helpful.")],
+                [("user", "Hello"), ("system", "You are helpful.")],
+                id="object_messages",
+            ),
+            pytest.param([], [], id="empty_list"),
+            pytest.param(None, [], id="none"),
+            pytest.param("not a list", [], id="not_a_list"),
+        ],
+    )
+    def test_normalize_messages(self, messages, expected):
+        """Normalize dicts and message-like objects, skipping tool roles and non-list input."""
         result = _normalize_messages(messages)
-        assert len(result) == 2
-        assert result[0]["role"] == "user" and result[0]["content"] == "Hello"
-        assert result[1]["role"] == "assistant" and result[1]["content"] == "Hi there"
-
-    def test_normalize_skips_tool_role(self):
-        """Tool role messages are skipped."""
-        messages = [
-            {"role": "user", "content": "Hi"},
-            {"role": "tool", "content": "tool result"},
-        ]
-        result = _normalize_messages(messages)
-        assert len(result) == 1
-        assert result[0]["role"] == "user"
-
-    def test_normalize_object_messages(self):
-        """Normalize message-like objects with role and content attributes."""
-        m1 = MagicMock()
-        m1.role = "user"
-        m1.content = "Hello"
-        m2 = MagicMock()
-        m2.role = "system"
-        m2.content = "You are helpful."
-        result = _normalize_messages([m1, m2])
-        assert len(result) == 2
-        assert result[0]["role"] == "user" and result[0]["content"] == "Hello"
-        assert result[1]["role"] == "system" and result[1]["content"] == "You are helpful."
-
-    def test_normalize_empty_or_none(self):
-        """Empty or non-list input returns empty list."""
-        assert _normalize_messages([]) == []
-        assert _normalize_messages(None) == []
-        assert _normalize_messages("not a list") == []
+        assert [(m["role"], m["content"]) for m in result] == expected
 
 
 class TestContentToString:
@@ -125,12 +113,11 @@ class TestExtractAssistantContent:
 class TestCoherePatcherInspection:
     """Test that chat wrapper calls inspector and enforces decision."""
 
-    @patch("aidefense.runtime.agentsec.patchers.cohere._get_inspector")
-    def test_sync_chat_calls_inspector(self, mock_get_inspector):
+    def test_sync_chat_calls_inspector(self, monkeypatch):
         """Sync chat triggers prompt and response inspection."""
-        mock_inspector = MagicMock()
+        mock_inspector = Mock(spec=["inspect_conversation"])
         mock_inspector.inspect_conversation.return_value = Decision.allow(reasons=[])
-        mock_get_inspector.return_value = mock_inspector
+        monkeypatch.setattr(cohere_module, "_get_inspector", lambda: mock_inspector)
 
         _state.set_state(
             initialized=True,
@@ -140,7 +127,7 @@ class TestCoherePatcherInspection:
         )
         clear_inspection_context()
 
-        mock_wrapped = MagicMock()
+        mock_wrapped = Mock()
         mock_response = MagicMock()
         mock_response.message = MagicMock()
         mock_response.message.content = [MagicMock(text="Hi")]
@@ -148,7 +135,7 @@ class TestCoherePatcherInspection:
 
         result = _wrap_chat(
             mock_wrapped,
-            MagicMock(),
+            object(),
             (),
             {"model": "command-a", "messages": [{"role": "user", "content": "Hello"}]},
         )
@@ -156,12 +143,11 @@ class TestCoherePatcherInspection:
         assert mock_inspector.inspect_conversation.call_count >= 1
         assert result == mock_response
 
-    @patch("aidefense.runtime.agentsec.patchers.cohere._get_inspector")
-    def test_enforce_mode_raises_on_block(self, mock_get_inspector):
+    def test_enforce_mode_raises_on_block(self, monkeypatch):
         """Enforce mode raises SecurityPolicyError when decision is block."""
-        mock_inspector = MagicMock()
+        mock_inspector = Mock(spec=["inspect_conversation"])
         mock_inspector.inspect_conversation.return_value = Decision.block(reasons=["jailbreak"])
-        mock_get_inspector.return_value = mock_inspector
+        monkeypatch.setattr(cohere_module, "_get_inspector", lambda: mock_inspector)
 
         _state.set_state(
             initialized=True,
@@ -171,12 +157,12 @@ class TestCoherePatcherInspection:
         )
         clear_inspection_context()
 
-        mock_wrapped = MagicMock()
+        mock_wrapped = Mock()
 
         with pytest.raises(SecurityPolicyError):
             _wrap_chat(
                 mock_wrapped,
-                MagicMock(),
+                object(),
                 (),
                 {"model": "command-a", "messages": [{"role": "user", "content": "Hello"}]},
             )
@@ -67,6 +67,7 @@ class TestEnvConfig:
             "AGENTSEC_API_MODE_MCP": "enforce",
             "AGENTSEC_API_MODE_FAIL_OPEN_LLM": "true",
             "AGENTSEC_API_MODE_FAIL_OPEN_MCP": "false",
+            "AGENTSEC_API_MODE_SPECULATIVE_LLM": "true",
             "AGENTSEC_LLM_RULES": "jailbreak,prompt_injection",
             "AGENTSEC_TENANT_ID": "tenant-123",
             "AGENTSEC_APP_ID": "app-456",
@@ -82,6 +83,7 @@ class TestEnvConfig:
             assert config["mcp_mode"] == "enforce"
             assert config["llm_fail_open"] is True
             assert config["mcp_fail_open"] is False
+            assert config["llm_speculative"] is True
             assert config["llm_rules"] == ["jailbreak", "prompt_injection"]
             assert config["tenant_id"] == "tenant-123"
             assert config["application_id"] == "app-456"
@@ -107,6 +109,7 @@ class TestEnvConfig:
             "AGENTSEC_API_MODE_MCP",
             "AGENTSEC_API_MODE_FAIL_OPEN_LLM",
             "AGENTSEC_API_MODE_FAIL_OPEN_MCP",
+            "AGENTSEC_API_MODE_SPECULATIVE_LLM",
             "AGENTSEC_LLM_RULES",
             "AGENTSEC_TENANT_ID", 
             "AGENTSEC_APP_ID",
@@ -128,6 +131,8 @@ class TestEnvConfig:
             # Boolean defaults to True for fail_open
             assert config["llm_fail_open"] is True
             assert config["mcp_fail_open"] is True
+            # Speculative inspection is opt-in
+            assert config["llm_speculative"] is False
             assert config["llm_rules"] is None
             assert config["tenant_id"] is None
 
@@ -7,6 +7,8 @@ import pytest
 from aidefense.runtime.agentsec._context import (
     clear_inspection_context,
     get_inspection_context,
+    get_inspection_metadata,
+    is_inspection_done,
     merge_metadata,
     set_inspection_context,
 )
@@ -36,6 +38,16 @@ class TestContextPropagation:
         assert ctx.decision == decision
         assert ctx.done is True
 
+    def test_single_field_accessors_match_context(self):
+        """Test metadata/done accessors read the same values as the full context."""
+        assert get_inspection_metadata() == {}
+        assert is_inspection_done() is False
+        
+        set_inspection_context(metadata={"user": "test"}, done=True)
+        
+        assert get_inspection_metadata() == get_inspection_context().metadata == {"user": "test"}
+        assert is_inspection_done() is get_inspection_context().done is True
+
     @pytest.mark.asyncio
     async def test_set_get_inspection_context_async(self):
         """Test set/get inspection context in async code."""
@@ -1,5 +1,9 @@
 """Tests for Decision type and SecurityPolicyError (Task 2.1, Task Group 6)."""
 
+import copy
+import pickle
+from enum import Enum
+
 import pytest
 
 from aidefense.runtime.agentsec import Decision, SecurityPolicyError
@@ -36,6 +40,41 @@ class TestDecision:
         monitor = Decision.monitor_only(reasons=["audit log"])
         assert monitor.action == "monitor_only"
 
+    def test_decision_action_is_interned(self):
+        """Test that dynamically built action strings are interned."""
+        action = "".join(["bl", "ock"])
+        decision = Decision(action=action, reasons=["violation"])
+
+        assert decision.action is Decision.block(reasons=[]).action
+        assert decision.allows() is False
+
+    def test_decision_accepts_non_str_actions(self):
+        """Test that str subclasses and None are accepted as actions, as before interning."""
+        class Action(str, Enum):
+            BLOCK = "block"
+
+        decision = Decision(action=Action.BLOCK)
+        assert decision.action is Action.BLOCK
+        assert decision.allows() is False
+        assert Decision(action=None).action is None
+
+    def test_allow_without_details_is_independent(self):
+        """Test that each detail-less allow decision can be copied, pickled and mutated on its own."""
+        allow = Decision.allow()
+
+        assert allow is not Decision.allow()
+        assert copy.copy(allow) == allow
+        assert copy.deepcopy(allow) == allow
+        assert pickle.loads(pickle.dumps(allow)) == allow
+
+        allow.reasons.append("mutated")
+        assert Decision.allow().reasons == []
+
+    def test_decision_is_not_hashable(self):
+        """Test that decisions, whose reasons are mutable, cannot be used as set members or keys."""
+        with pytest.raises(TypeError):
+            hash(Decision.block(reasons=["violation"]))
+
 
 class TestDecisionParameterized:
     """Parameterized tests for Decision (Task Group 6)."""
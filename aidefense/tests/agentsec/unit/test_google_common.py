@@ -88,6 +88,42 @@ class TestNormalizeGoogleMessages:
         messages = normalize_google_messages([])
         assert messages == []
 
+    def test_mixed_history(self):
+        """Test a history mixing strings, dicts, objects and skippable items."""
+        part = MagicMock()
+        part.text = None
+
+        empty = MagicMock()
+        empty.role = "model"
+        empty.parts = [part]
+
+        contents = [
+            None,
+            "plain",
+            {"role": "model", "parts": ["a", {"text": None}, {"text": "b"}]},
+            {"role": "user", "parts": []},
+            empty,
+            ("tuple", "item"),
+        ]
+
+        messages = normalize_google_messages(contents)
+
+        assert messages == [
+            {"role": "user", "content": "plain"},
+            {"role": "assistant", "content": "a b"},
+            {"role": "user", "content": "('tuple', 'item')"},
+        ]
+
+    def test_single_content_object(self):
+        """Test a single Content object outside a list."""
+        content = MagicMock()
+        content.role = "model"
+        content.parts = "single text"
+
+        messages = normalize_google_messages(content)
+
+        assert messages == [{"role": "assistant", "content": "single text"}]
+
 
 class TestExtractGoogleResponse:
     """Tests for response extraction."""
@@ -144,6 +144,15 @@ class TestModelNameExtraction:
         
         assert result == "gemini-2.0-flash"
     
+    def test_extract_model_and_contents_keyword_or_positional(self):
+        """Test (model, contents) extraction from keyword, positional and missing arguments."""
+        from aidefense.runtime.agentsec.patchers.google_genai import _extract_model_and_contents
+        
+        assert _extract_model_and_contents((), {"model": "m", "contents": "c"}) == ("m", "c")
+        assert _extract_model_and_contents(("m", "c"), {}) == ("m", "c")
+        assert _extract_model_and_contents(("m",), {"contents": []}) == ("m", [])
+        assert _extract_model_and_contents((), {}) == (None, None)
+    
     def test_extract_none_model(self):
         """Test extracting model name from None."""
         from aidefense.runtime.agentsec.patchers.google_genai import _extract_model_name
@@ -218,12 +227,44 @@ class TestResponseWrapper:
         
         assert wrapper.to_dict() == response_data
 
+    def test_response_wrapper_fields_materialized(self):
+        """Test nested wrapper fields are plain slot attributes with defaults."""
+        from aidefense.runtime.agentsec.patchers.google_genai import _GoogleGenAIResponseWrapper
+
+        response_data = {
+            "candidates": [{
+                "content": {"parts": [{}]},
+                "finishReason": "STOP"
+            }]
+        }
+        wrapper = _GoogleGenAIResponseWrapper(response_data)
+        candidate = wrapper.candidates[0]
+
+        assert candidate.finish_reason == "STOP"
+        assert candidate.content.role == "model"
+        assert candidate.content.parts[0].text == ""
+        assert not hasattr(wrapper, "__dict__")
+
+    def test_response_wrapper_malformed_candidates(self):
+        """Test malformed candidates fall back to an empty list."""
+        from aidefense.runtime.agentsec.patchers.google_genai import _GoogleGenAIResponseWrapper
+
+        wrapper = _GoogleGenAIResponseWrapper({"candidates": ["not-a-dict"]})
+
+        assert wrapper.candidates == []
+        assert wrapper.text == ""
+
 
 class TestPatcherInfrastructure:
     """Test the patcher infrastructure functions."""
     
-    def test_should_inspect_off_mode(self):
-        """Test _should_inspect returns False when mode is off."""
+    @pytest.mark.parametrize(
+        "mode,expected",
+        [("off", False), ("monitor", True), ("enforce", True)],
+        ids=["off", "monitor", "enforce"],
+    )
+    def test_should_inspect_by_mode(self, mode, expected):
+        """Test _should_inspect follows the configured API mode."""
         from aidefense.runtime.agentsec.patchers.google_genai import _should_inspect
         from aidefense.runtime.agentsec import _state
         from aidefense.runtime.agentsec.patchers import reset_registry
@@ -232,50 +273,65 @@ class TestPatcherInfrastructure:
         reset_registry()
         _state._initialized = False
         
-        # Initialize with off mode
         _state.set_state(
             initialized=True,
-            api_mode_llm="off",
-            api_mode_mcp="off",
+            api_mode_llm=mode,
+            api_mode_mcp=mode,
             llm_integration_mode="api",
             mcp_integration_mode="api",
         )
         
         result = _should_inspect()
         
-        assert result is False
+        assert result is expected
         
         # Cleanup
         _state._initialized = False
         reset_registry()
     
-    def test_should_inspect_monitor_mode(self):
-        """Test _should_inspect returns True when mode is monitor."""
+    def test_should_inspect_false_when_already_done(self):
+        """Test _should_inspect returns False once inspection is done for the request."""
         from aidefense.runtime.agentsec.patchers.google_genai import _should_inspect
         from aidefense.runtime.agentsec import _state
-        from aidefense.runtime.agentsec.patchers import reset_registry
-        
-        # Reset state
-        reset_registry()
-        _state._initialized = False
-        
-        # Initialize with monitor mode
-        _state.set_state(
-            initialized=True,
-            api_mode_llm="monitor",
-            api_mode_mcp="monitor",
-            llm_integration_mode="api",
-            mcp_integration_mode="api",
-        )
-        
-        result = _should_inspect()
-        
-        assert result is True
-        
-        # Cleanup
-        _state._initialized = False
-        reset_registry()
+        from aidefense.runtime.agentsec._context import clear_inspection_context, set_inspection_context
+        
+        _state.set_state(initialized=True, api_mode_llm="monitor")
+        try:
+            set_inspection_context(done=True)
+            assert _should_inspect() is False
+            clear_inspection_context()
+            assert _should_inspect() is True
+        finally:
+            clear_inspection_context()
+            _state.reset()
 
+    
+    def test_call_metadata_does_not_mutate_shared_context(self):
+        """Test provider/model metadata is passed per call, not written into the context dict."""
+        from aidefense.runtime.agentsec.patchers import google_genai as genai_module
+        from aidefense.runtime.agentsec import _state
+        from aidefense.runtime.agentsec._context import clear_inspection_context, get_inspection_metadata
+        from aidefense.runtime.agentsec.decision import Decision
+        
+        _state.set_state(initialized=True, api_mode_llm="monitor")
+        clear_inspection_context()
+        mock_inspector = MagicMock()
+        mock_inspector.inspect_conversation.return_value = Decision.allow(reasons=[])
+        try:
+            with patch.object(genai_module, "_get_inspector", return_value=mock_inspector):
+                genai_module._wrap_generate_content(
+                    MagicMock(return_value=MagicMock()),
+                    MagicMock(),
+                    (),
+                    {"model": "gemini-2.0-flash", "contents": "Hello"},
+                )
+            metadata = mock_inspector.inspect_conversation.call_args_list[0][0][1]
+            assert metadata["provider"] == "google_genai"
+            assert metadata["model"] == "gemini-2.0-flash"
+            assert "provider" not in get_inspection_metadata()
+        finally:
+            clear_inspection_context()
+            _state.reset()
 
 class TestPatchFunction:
     """Test the main patch_google_genai function."""
@@ -23,6 +23,8 @@ def reset_state():
     # Clear cached clients
     openai_patcher._inspector = None
     openai_patcher._gateway_client = None
+    openai_patcher._http_client = None
+    openai_patcher._http_async_clients.close_all()
     # Clear gateway-related env vars
     for var in ["AGENTSEC_LLM_INTEGRATION_MODE", "AI_DEFENSE_GATEWAY_MODE_LLM_URL", 
                 "AI_DEFENSE_GATEWAY_MODE_LLM_API_KEY"]:
@@ -33,6 +35,8 @@ def reset_state():
     clear_inspection_context()
     openai_patcher._inspector = None
     openai_patcher._gateway_client = None
+    openai_patcher._http_client = None
+    openai_patcher._http_async_clients.close_all()
 
 
 class TestIntegrationModeDetection:
@@ -138,43 +142,110 @@ class TestProviderGatewayConfig:
         assert get_provider_gateway_url("openai") is None
         assert get_provider_gateway_api_key("openai") is None
 
+    def test_provider_gateway_config_is_frozen(self):
+        """Test provider config dicts are stored as immutable ProviderConfig values."""
+        import dataclasses
+        from aidefense.runtime.agentsec import _state
+        
+        set_state(
+            initialized=True,
+            llm_integration_mode="gateway",
+            provider_gateway_config={
+                "openai": {"url": "https://gateway.example.com/openai", "api_key": "openai-key"},
+            },
+        )
+        
+        config = _state._provider_gateway_config["openai"]
+        assert config == _state.ProviderConfig(url="https://gateway.example.com/openai", api_key="openai-key")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.url = "https://other.example.com"
+
+    def test_reset_restores_all_supported_providers(self):
+        """Test reset() keeps an entry for every supported provider."""
+        from aidefense.runtime.agentsec import _state
+        
+        reset()
+        
+        assert set(_state._provider_gateway_config) == set(_state.SUPPORTED_PROVIDERS)
+        assert set(_state._provider_api_config) == set(_state.SUPPORTED_PROVIDERS)
+        _state.set_provider_gateway_config("mistral", "https://gateway.example.com/mistral", "key")
+        assert _state.get_provider_gateway_url("mistral") == "https://gateway.example.com/mistral"
+
+
+@pytest.fixture(scope="module")
+def basic_gateway_response():
+    """Convert a plain gateway chat completion once; the tests only read it."""
+    return openai_patcher._dict_to_openai_response({
+        "id": "chatcmpl-123",
+        "object": "chat.completion",
+        "created": 1234567890,
+        "model": "gpt-4",
+        "choices": [
+            {
+                "index": 0,
+                "message": {
+                    "role": "assistant",
+                    "content": "Hello, how can I help you?",
+                },
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {
+            "prompt_tokens": 10,
+            "completion_tokens": 20,
+            "total_tokens": 30,
+        },
+    })
+
 
 class TestDictToOpenAIResponse:
     """Test dictionary to OpenAI response conversion."""
 
-    def test_converts_basic_response(self):
-        """Test basic response conversion."""
+    def test_converts_top_level_fields(self, basic_gateway_response):
+        """Test top-level response fields are converted."""
+        assert basic_gateway_response.id == "chatcmpl-123"
+        assert basic_gateway_response.model == "gpt-4"
+        assert basic_gateway_response.usage.total_tokens == 30
+
+    def test_converts_choices(self, basic_gateway_response):
+        """Test choices and their messages are converted."""
+        assert len(basic_gateway_response.choices) == 1
+        choice = basic_gateway_response.choices[0]
+        assert choice.message.content == "Hello, how can I help you?"
+        assert choice.message.role == "assistant"
+        assert choice.finish_reason == "stop"
+
+    def test_dict_to_openai_response_tool_calls_and_shared_types(self):
+        """Test tool calls are converted and response types are shared across calls."""
+        from aidefense.runtime.agentsec.patchers import openai as openai_patcher
+        
         response_data = {
-            "id": "chatcmpl-123",
-            "object": "chat.completion",
-            "created": 1234567890,
-            "model": "gpt-4",
+            "id": "chatcmpl-456",
             "choices": [
                 {
-                    "index": 0,
                     "message": {
                         "role": "assistant",
-                        "content": "Hello, how can I help you?",
+                        "content": None,
+                        "tool_calls": [
+                            {"id": "call_1", "function": {"name": "get_weather", "arguments": "{}"}},
+                        ],
                     },
-                    "finish_reason": "stop",
                 }
             ],
-            "usage": {
-                "prompt_tokens": 10,
-                "completion_tokens": 20,
-                "total_tokens": 30,
-            },
         }
         
-        response = openai_patcher._dict_to_openai_response(response_data)
+        first = openai_patcher._dict_to_openai_response(response_data)
+        second = openai_patcher._dict_to_openai_response(response_data)
         
-        assert response.id == "chatcmpl-123"
-        assert response.model == "gpt-4"
-        assert len(response.choices) == 1
-        assert response.choices[0].message.content == "Hello, how can I help you?"
-        assert response.choices[0].message.role == "assistant"
-        assert response.choices[0].finish_reason == "stop"
-        assert response.usage.total_tokens == 30
+        tool_call = first.choices[0].message.tool_calls[0]
+        assert tool_call.id == "call_1"
+        assert tool_call.type == "function"
+        assert tool_call.function.name == "get_weather"
+        assert tool_call.function.arguments == "{}"
+        assert first.usage is None
+        assert dict(first.choices[0].message)["role"] == "assistant"
+        assert type(first) is type(second)
+        assert type(first.choices[0].message) is type(second.choices[0].message)
 
 
 class TestOpenAIPatcherGatewayMode:
@@ -240,7 +311,8 @@ class TestOpenAIPatcherGatewayMode:
         
         wrapped = MagicMock()  # Should NOT be called in gateway mode
         
-        with patch.object(openai_patcher, "_get_inspector", return_value=mock_inspector):
+        with patch.object(openai_patcher, "_get_inspector", return_value=mock_inspector), \
+                patch.object(openai_patcher, "_normalize_messages") as mock_normalize:
             with patch("httpx.Client", return_value=mock_client):
                 result = openai_patcher._wrap_chat_completions_create(
                     wrapped, None, [],
@@ -249,11 +321,55 @@ class TestOpenAIPatcherGatewayMode:
                 
                 # Inspector should NOT have been called
                 assert not mock_inspector.inspect_conversation.called
+                # Messages are only normalized for API-mode inspection
+                assert not mock_normalize.called
                 # HTTP client should have been called
                 assert mock_client.post.called
                 # Original wrapped function should NOT be called (gateway handles it)
                 assert not wrapped.called
 
+    def test_gateway_mode_forwards_optional_params(self):
+        """Test gateway request body only carries whitelisted optional params."""
+        set_state(
+            initialized=True,
+            llm_rules=None,
+            api_mode_llm="monitor",
+            llm_integration_mode="gateway",
+            provider_gateway_config={
+                "openai": {"url": "https://gateway.example.com/openai", "api_key": "test-key"},
+            },
+        )
+
+        mock_response = MagicMock()
+        mock_response.json.return_value = {
+            "id": "gateway-123",
+            "choices": [{"message": {"role": "assistant", "content": "Gateway response"}}],
+        }
+        mock_client = MagicMock()
+        mock_client.__enter__ = MagicMock(return_value=mock_client)
+        mock_client.__exit__ = MagicMock(return_value=False)
+        mock_client.post.return_value = mock_response
+
+        with patch("httpx.Client", return_value=mock_client):
+            openai_patcher._wrap_chat_completions_create(
+                MagicMock(), None, [],
+                {
+                    "model": "gpt-4",
+                    "messages": [{"role": "user", "content": "Hi"}],
+                    "temperature": 0.2,
+                    "seed": 7,
+                    "extra_headers": {"X-Test": "1"},
+                }
+            )
+
+        body = mock_client.post.call_args.kwargs["json"]
+        assert body == {
+            "model": "gpt-4",
+            "messages": [{"role": "user", "content": "Hi"}],
+            "temperature": 0.2,
+            "seed": 7,
+        }
+
     def test_gateway_mode_fallback_when_not_configured(self):
         """Test gateway mode raises error when gateway not configured."""
         set_state(
@@ -332,3 +448,95 @@ class TestOpenAIPatcherAsyncGatewayMode:
             assert not wrapped.called
             # Response should be from gateway
             assert result.id == "async-gateway-123"
+
+
+class TestSharedGatewayHttpClient:
+    """Test the shared HTTP clients used for OpenAI gateway calls."""
+
+    def test_sync_client_reused_across_calls(self):
+        """Test the sync client is created once and not closed per request."""
+        with patch("httpx.Client") as mock_client_cls:
+            first = openai_patcher._get_http_client()
+            second = openai_patcher._get_http_client()
+
+        assert first is second
+        mock_client_cls.assert_called_once()
+        assert not first.close.called
+
+    def test_sync_client_uses_pool_limits_from_state(self):
+        """Test pool limits come from the agentsec pool configuration."""
+        set_state(initialized=True, pool_max_connections=7, pool_max_keepalive=3)
+
+        client = openai_patcher._get_http_client()
+        try:
+            pool = client._transport._pool
+            assert pool._max_connections == 7
+            assert pool._max_keepalive_connections == 3
+        finally:
+            client.close()
+
+    def test_sync_client_rebuilt_when_pool_limits_change(self):
+        """Test a pool settings change replaces the sync client and closes the old one."""
+        set_state(initialized=True, pool_max_connections=7, pool_max_keepalive=3)
+        with patch("httpx.Client", side_effect=lambda **kwargs: MagicMock()) as mock_client_cls:
+            first = openai_patcher._get_http_client()
+            set_state(initialized=True, pool_max_connections=9, pool_max_keepalive=3)
+            second = openai_patcher._get_http_client()
+
+        assert first is not second
+        first.close.assert_called_once()
+        assert mock_client_cls.call_args.kwargs["limits"].max_connections == 9
+
+    @pytest.mark.asyncio
+    async def test_async_client_reused_within_loop(self):
+        """Test the async client is shared within one event loop."""
+        with patch("httpx.AsyncClient") as mock_client_cls:
+            first = await openai_patcher._get_async_http_client()
+            second = await openai_patcher._get_async_http_client()
+
+        assert first is second
+        mock_client_cls.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_async_client_rebuilt_when_pool_limits_change(self):
+        """Test a pool settings change replaces the loop's async client and closes the old one."""
+        with patch("httpx.AsyncClient", side_effect=lambda **kwargs: AsyncMock()):
+            first = await openai_patcher._get_async_http_client()
+            set_state(initialized=True, pool_max_connections=9, pool_max_keepalive=3)
+            second = await openai_patcher._get_async_http_client()
+
+        assert first is not second
+        first.aclose.assert_awaited_once()
+        assert not second.aclose.called
+
+    def test_async_client_per_loop_closed_at_loop_shutdown(self):
+        """Test each event loop gets its own async client, closed when asyncio.run finishes."""
+        import asyncio
+
+        async def get_client():
+            return await openai_patcher._get_async_http_client()
+
+        with patch("httpx.AsyncClient", side_effect=lambda **kwargs: AsyncMock()):
+            first = asyncio.run(get_client())
+            second = asyncio.run(get_client())
+
+        assert first is not second
+        first.aclose.assert_awaited_once()
+        second.aclose.assert_awaited_once()
+
+    def test_close_http_client_closes_async_clients(self):
+        """Test the exit hook closes async clients whose loop is still open."""
+        import asyncio
+
+        async def get_client():
+            return await openai_patcher._get_async_http_client()
+
+        loop = asyncio.new_event_loop()
+        try:
+            with patch("httpx.AsyncClient", side_effect=lambda **kwargs: AsyncMock()):
+                client = loop.run_until_complete(get_client())
+            openai_patcher._close_http_client()
+        finally:
+            loop.close()
+
+        client.aclose.assert_awaited_once()
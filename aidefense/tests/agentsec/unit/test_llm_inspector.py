@@ -23,6 +23,7 @@ from aidefense.runtime.agentsec.inspectors.api_llm import (
     _metadata_to_runtime,
 )
 from aidefense.runtime.models import InspectResponse, Action, Classification
+from aidefense.runtime.chat_models import Role
 
 # 64-char API key required by RuntimeAuth when client is created
 API_KEY_64 = "x" * 64
@@ -148,6 +149,20 @@ class TestLLMInspector:
         assert runtime_metadata.user == "test_user"
         assert runtime_metadata.src_app == "test_app"
 
+    def test_messages_to_runtime_normalizes_roles(self):
+        """Test role strings are case-folded and unknown roles fall back to user."""
+        messages = [
+            {"role": "Assistant", "content": "Hi"},
+            {"role": "tool", "content": "result"},
+            {"role": None, "content": 42},
+            {"role": "", "content": None},
+        ]
+        runtime_messages = _messages_to_runtime(messages)
+        assert [m.role for m in runtime_messages] == [Role.ASSISTANT, Role.USER, Role.USER, Role.USER]
+        assert runtime_messages[0].role is Role.ASSISTANT
+        assert runtime_messages[2].content == "42"
+        assert runtime_messages[3].content == ""
+
 
 class TestLLMInspectorNoConfig:
     """Test LLMInspector behavior without API configuration."""
@@ -307,3 +322,21 @@ class TestLLMInspectorErrorHandling:
 
 
 
+
+
+class TestInspectorCleanupRegistry:
+    """Test the shutdown cleanup registry for inspector instances."""
+
+    def test_same_instance_registered_once(self):
+        from aidefense.runtime.agentsec import inspectors
+
+        first, second = MagicMock(), MagicMock()
+        with patch.object(inspectors, "_inspector_registry", {}):
+            inspectors.register_inspector_for_cleanup(first)
+            inspectors.register_inspector_for_cleanup(first)
+            inspectors.register_inspector_for_cleanup(second)
+            inspectors.cleanup_all_inspectors()
+
+            first.close.assert_called_once()
+            second.close.assert_called_once()
+            assert inspectors._inspector_registry == {}
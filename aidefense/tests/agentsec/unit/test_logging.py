@@ -192,6 +192,13 @@ class TestGetLogger:
         assert logger.name == "aidefense.runtime.agentsec"
         assert len(logger.handlers) > 0
 
+    def test_default_logger_is_cached(self):
+        """Test that get_logger does not consult the logging manager on every call."""
+        first = get_logger()
+        with patch.object(logging, "getLogger") as mock_get_logger:
+            second = get_logger()
+        assert second is first
+        mock_get_logger.assert_not_called()
 
 
 
@@ -199,3 +206,50 @@ class TestGetLogger:
 
 
 
+
+
+
+class TestJSONEncoding:
+    """Tests for JSONFormatter encoding."""
+
+    def test_output_uses_stdlib_json_format(self):
+        """Test that records keep stdlib json separators and ASCII escaping."""
+        from aidefense.runtime.agentsec._logging import JSONFormatter
+
+        record = logging.LogRecord("aidefense.tests", logging.INFO, __file__, 1, "h\u00e9llo", None, None)
+        record.extra_fields = {"count": 1}
+        output = JSONFormatter().format(record)
+
+        assert '"message": "h\\u00e9llo", "count": 1' in output
+
+    def test_timestamp_reused_within_same_microsecond(self):
+        """Test that the timestamp string is cached per microsecond."""
+        from aidefense.runtime.agentsec import _logging
+
+        with patch.object(_logging.time, "time_ns", return_value=1_700_000_000_123_456_789):
+            first = _logging._utc_timestamp()
+            second = _logging._utc_timestamp()
+
+        assert first == "2023-11-14T22:13:20.123456+00:00"
+        assert second is first
+
+        with patch.object(_logging.time, "time_ns", return_value=1_700_000_000_123_457_000):
+            assert _logging._utc_timestamp() == "2023-11-14T22:13:20.123457+00:00"
+
+
+class TestLogAdapter:
+    """Tests for LogAdapter context merging."""
+
+    def test_context_merged_with_call_fields(self):
+        """Test that call-site extra_fields override bound context."""
+        from aidefense.runtime.agentsec._logging import LogAdapter
+
+        adapter = LogAdapter(logging.getLogger("aidefense.tests.log_adapter"), {"a": 1, "b": 2})
+
+        _, kwargs = adapter.process("msg", {"extra": {"extra_fields": {"b": 3}}})
+        assert kwargs["extra"]["extra_fields"] == {"a": 1, "b": 3}
+
+        _, kwargs = adapter.process("msg", {})
+        assert kwargs["extra"]["extra_fields"] == {"a": 1, "b": 2}
+        # Each record gets its own copy, so handlers cannot change the bound context
+        assert kwargs["extra"]["extra_fields"] is not adapter.extra
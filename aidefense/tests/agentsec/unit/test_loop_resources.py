@@ -0,0 +1,85 @@
+"""Tests for per-event-loop async resources."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+from aidefense.runtime.agentsec._loop_resources import LoopResources
+
+
+def _make_resources():
+    created = []
+
+    async def create():
+        resource = AsyncMock()
+        created.append(resource)
+        return resource
+
+    async def close(resource):
+        await resource.aclose()
+
+    return LoopResources(create, close), created
+
+
+class TestLoopResources:
+    """Test LoopResources creation, reuse and cleanup."""
+
+    def test_reused_within_loop_and_closed_at_shutdown(self):
+        """Test one resource per loop, closed when asyncio.run shuts the loop down."""
+        resources, created = _make_resources()
+
+        async def use():
+            first = await resources.get()
+            second = await resources.get()
+            return first is second
+
+        assert asyncio.run(use())
+        assert len(created) == 1
+        created[0].aclose.assert_awaited_once()
+
+    def test_key_change_replaces_and_closes_resource(self):
+        """Test a resource built with other settings is closed and replaced."""
+        resources, created = _make_resources()
+
+        async def use():
+            first = await resources.get(("a",))
+            second = await resources.get(("b",))
+            first.aclose.assert_awaited_once()
+            assert not second.aclose.called
+            return first is not second
+
+        assert asyncio.run(use())
+        created[1].aclose.assert_awaited_once()
+
+    def test_aclose_closes_current_loop_resource(self):
+        """Test aclose() releases the running loop's resource only once."""
+        resources, created = _make_resources()
+
+        async def use():
+            await resources.get()
+            await resources.aclose()
+
+        asyncio.run(use())
+        created[0].aclose.assert_awaited_once()
+
+    def test_close_all_from_sync_code(self):
+        """Test close_all() closes resources whose loop is idle but still open."""
+        resources, created = _make_resources()
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(resources.get())
+            resources.close_all()
+        finally:
+            loop.close()
+
+        created[0].aclose.assert_awaited_once()
+
+    def test_close_errors_are_swallowed(self):
+        """Test a failing close does not propagate."""
+        resources, created = _make_resources()
+
+        async def use():
+            await resources.get()
+            created[0].aclose.side_effect = RuntimeError("boom")
+            await resources.aclose()
+
+        asyncio.run(use())
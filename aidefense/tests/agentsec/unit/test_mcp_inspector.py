@@ -4,9 +4,11 @@ MCPInspector uses MCPInspectionClient; tests mock _get_mcp_client where needed.
 """
 
 import os
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
+import aiohttp
 import pytest
 import httpx
+import requests
 
 from aidefense.runtime.agentsec.inspectors.api_mcp import (
     MCPInspector,
@@ -20,7 +22,7 @@ from aidefense.runtime.agentsec.exceptions import (
     InspectionTimeoutError,
     InspectionNetworkError,
 )
-from aidefense.runtime.models import InspectResponse, Action, Classification
+from aidefense.runtime.models import InspectResponse, Action, Classification, Rule, RuleName
 from aidefense.runtime.mcp_models import MCPInspectResponse
 
 API_KEY_64 = "x" * 64
@@ -65,6 +67,7 @@ class TestMCPInspectorConstructor:
         assert inspector.api_key == "explicit-key"
         assert inspector.endpoint == "https://explicit.example.com"
         assert inspector.timeout_ms == 2000
+        assert inspector._timeout_sec == 2
         assert inspector.retry_attempts == 3
         assert inspector.fail_open is False
         inspector.close()
@@ -119,19 +122,44 @@ class TestMCPInspectorConstructor:
             assert inspector.endpoint is None
             # No timeout set by user or state → SDK uses its default (agentsec leaves None)
             assert inspector.timeout_ms is None
+            assert inspector._timeout_sec is None
             assert inspector.retry_attempts == 1
             assert inspector.fail_open is True
-            # _request_id_counter is now itertools.count() for thread safety
-            assert next(inspector._request_id_counter) == 1
+            # Message ids start at 1 and increase within a thread
+            assert inspector._get_next_id() == 1
+            assert inspector._get_next_id() == 2
             inspector.close()
 
     def test_mcp_client_lazy_created(self):
         """Test that MCP client is created lazily (not in __init__)."""
         inspector = MCPInspector(api_key=API_KEY_64, endpoint="https://test.com")
         assert inspector._mcp_client is None
-        assert inspector._mcp_client_lock is not None
+        assert inspector._mcp_client_key is None
         inspector.close()
 
+    def test_mcp_client_shared_across_inspectors(self):
+        """Test inspectors with identical settings share one pooled client."""
+        from aidefense.runtime.agentsec.inspectors import api_mcp
+
+        first = MCPInspector(api_key=API_KEY_64, endpoint="https://shared.test.com")
+        second = MCPInspector(api_key=API_KEY_64, endpoint="https://shared.test.com")
+        other = MCPInspector(api_key="y" * 64, endpoint="https://shared.test.com")
+
+        client = first._get_mcp_client()
+        assert second._get_mcp_client() is client
+        assert other._get_mcp_client() is not client
+
+        # Closing one inspector keeps the client alive for the other
+        first.close()
+        assert first._mcp_client is None
+        assert second._get_mcp_client() is client
+        assert second._mcp_client_key in api_mcp._client_cache
+
+        key = second._mcp_client_key
+        second.close()
+        other.close()
+        assert key not in api_mcp._client_cache
+
 
 class TestMCPInspectorRequestBuilding:
     """Test result/params helpers used for MCP inspection."""
@@ -162,6 +190,20 @@ class TestMCPInspectorRequestBuilding:
         out = _result_to_content_dict(result)
         assert out["content"] == result
 
+    def test_result_to_content_dict_subclasses_and_other(self):
+        """Test subclasses of str/dict/list and other objects keep their handling."""
+        from collections import OrderedDict
+
+        class Text(str):
+            pass
+
+        assert _result_to_content_dict(Text("hi")) == {"content": [{"type": "text", "text": "hi"}]}
+        ordered = OrderedDict(content=[{"type": "text", "text": "x"}])
+        assert _result_to_content_dict(ordered) is ordered
+        assert _result_to_content_dict(OrderedDict(a=1)) == {"content": [OrderedDict(a=1)]}
+        assert _result_to_content_dict((1, 2)) == {"content": [{"type": "text", "text": "(1, 2)"}]}
+        assert _result_to_content_dict(42) == {"content": [{"type": "text", "text": "42"}]}
+
     def test_request_params_tools_call(self):
         """Test _request_params_for_method for tools/call."""
         params = _request_params_for_method("tools/call", "search_docs", {"query": "test"})
@@ -179,6 +221,13 @@ class TestMCPInspectorRequestBuilding:
         assert params["name"] == "code_review"
         assert params["arguments"] == {"lang": "python"}
 
+    def test_request_params_unknown_method_without_arguments(self):
+        """Test unknown methods fall back to name/arguments with a fresh empty dict."""
+        first = _request_params_for_method("completion/complete", "ref", None)
+        second = _request_params_for_method("completion/complete", "ref", None)
+        assert first == {"name": "ref", "arguments": {}}
+        assert first["arguments"] is not second["arguments"]
+
 
 class TestMCPInspectorResponseParsing:
     """Test _mcp_inspect_response_to_decision mapping."""
@@ -226,6 +275,42 @@ class TestMCPInspectorResponseParsing:
         assert decision.action == "block"
         assert any("SQL_INJECTION" in r for r in decision.reasons)
 
+    def test_parse_response_rules_and_classifications(self):
+        """Test rule objects become dicts and classifications are not aliased to reasons."""
+        mcp_resp = MCPInspectResponse(
+            result=InspectResponse(
+                classifications=[Classification.PRIVACY_VIOLATION],
+                is_safe=False,
+                action=Action.BLOCK,
+                rules=[
+                    Rule(rule_name=RuleName.PII, classification=Classification.PRIVACY_VIOLATION),
+                    Rule(rule_name=RuleName.PCI, classification=Classification.PRIVACY_VIOLATION),
+                ],
+            ),
+            id=1,
+        )
+        decision = _mcp_inspect_response_to_decision(mcp_resp)
+        assert decision.classifications == ["PRIVACY_VIOLATION"]
+        assert decision.reasons == ["PRIVACY_VIOLATION"]
+        assert decision.reasons is not decision.classifications
+        assert [r["rule_name"] for r in decision.rules] == [RuleName.PII, RuleName.PCI]
+
+    def test_parse_response_dict_rules(self):
+        """Test rules already given as dicts are passed through."""
+        rules = [{"rule_name": "PII", "classification": "PRIVACY_VIOLATION"}]
+        mcp_resp = MCPInspectResponse(
+            result=InspectResponse(
+                classifications=[],
+                is_safe=False,
+                action=Action.BLOCK,
+                rules=rules,
+            ),
+            id=1,
+        )
+        decision = _mcp_inspect_response_to_decision(mcp_resp)
+        assert decision.rules == rules
+        assert decision.reasons == ["PII: PRIVACY_VIOLATION"]
+
 
 class TestMCPInspectorInspectRequest:
     """Test inspect_request method (Task Group 3)."""
@@ -301,6 +386,46 @@ class TestMCPInspectorInspectRequest:
             assert any("fail_open" in r for r in decision.reasons)
         inspector.close()
 
+    def test_single_attempt_skips_retry_machinery(self):
+        """Test the default single-attempt path neither classifies errors nor backs off."""
+        inspector = MCPInspector(
+            api_key=API_KEY_64,
+            endpoint="https://test.example.com",
+            fail_open=True,
+        )
+        assert inspector._single_attempt is True
+        mock_client = MagicMock()
+        mock_client.inspect_tool_call.side_effect = httpx.ConnectError("Connection failed")
+        with patch.object(inspector, "_get_mcp_client", return_value=mock_client), \
+                patch.object(inspector, "_should_retry") as should_retry, \
+                patch.object(inspector, "_get_backoff_delay") as backoff:
+            decision = inspector.inspect_request(
+                tool_name="test_tool",
+                arguments={},
+                metadata={},
+            )
+            assert decision.action == "allow"
+            assert mock_client.inspect_tool_call.call_count == 1
+            should_retry.assert_not_called()
+            backoff.assert_not_called()
+        inspector.close()
+
+    def test_fail_open_decision_per_error(self):
+        """Test each fail-open decision is a fresh allow carrying its error type."""
+        inspector = MCPInspector(
+            api_key=API_KEY_64,
+            endpoint="https://test.example.com",
+            fail_open=True,
+        )
+        first = inspector._handle_error(httpx.ConnectError("a"), "tool_a")
+        second = inspector._handle_error(httpx.ConnectError("b"), "tool_b")
+
+        assert first is not second
+        assert first.reasons == ["MCP inspection error (ConnectError), fail_open=True"]
+        first.reasons.append("x")
+        assert second.reasons == ["MCP inspection error (ConnectError), fail_open=True"]
+        inspector.close()
+
     def test_inspect_request_api_error_fail_open_false(self):
         """Test inspect_request raises InspectionNetworkError when fail_open=False."""
         inspector = MCPInspector(
@@ -390,7 +515,7 @@ class TestMCPInspectorInspectResponse:
             endpoint="https://test.example.com",
         )
         mock_client = MagicMock()
-        mock_client.inspect_response.return_value = _mcp_allow()
+        mock_client.inspect_raw.return_value = _mcp_allow()
         with patch.object(inspector, "_get_mcp_client", return_value=mock_client):
             decision = inspector.inspect_response(
                 tool_name="search_docs",
@@ -408,7 +533,7 @@ class TestMCPInspectorInspectResponse:
             endpoint="https://test.example.com",
         )
         mock_client = MagicMock()
-        mock_client.inspect_response.return_value = MCPInspectResponse(
+        mock_client.inspect_raw.return_value = MCPInspectResponse(
             result=InspectResponse(
                 classifications=[Classification.PRIVACY_VIOLATION],
                 is_safe=False,
@@ -428,6 +553,133 @@ class TestMCPInspectorInspectResponse:
             assert any("PRIVACY_VIOLATION" in r or "PII" in r for r in decision.reasons)
         inspector.close()
 
+    def test_inspect_response_serializes_body_once_across_retries(self):
+        """Test the response body is encoded once and resent unchanged on retry."""
+        inspector = MCPInspector(
+            api_key=API_KEY_64,
+            endpoint="https://test.example.com",
+            retry_total=3,
+        )
+        mock_client = MagicMock()
+        mock_client.serialize_message.return_value = b'{"jsonrpc": "2.0"}'
+        mock_client.inspect_raw.side_effect = [
+            httpx.ConnectError("down"),
+            httpx.ConnectError("down"),
+            _mcp_allow(),
+        ]
+        with patch.object(inspector, "_get_mcp_client", return_value=mock_client):
+            decision = inspector.inspect_response(
+                tool_name="get_doc",
+                arguments={"id": 1},
+                result="x" * 10000,
+                metadata={},
+            )
+            assert decision.action == "allow"
+            mock_client.serialize_message.assert_called_once()
+            message = mock_client.serialize_message.call_args.args[0]
+            assert message.method == "tools/call"
+            assert message.result == {"content": [{"type": "text", "text": "x" * 10000}]}
+            bodies = [c.args[0] for c in mock_client.inspect_raw.call_args_list]
+            assert bodies == [b'{"jsonrpc": "2.0"}'] * 3
+        inspector.close()
+
+
+class TestMCPInspectorMessageIds:
+    """Test JSON-RPC message id generation."""
+
+    def test_ids_unique_across_threads(self):
+        """Test ids handed out concurrently from several threads never collide."""
+        import threading
+
+        inspector = MCPInspector(api_key=API_KEY_64, endpoint="https://test.example.com")
+        results = [[] for _ in range(8)]
+
+        def worker(out):
+            for _ in range(500):
+                out.append(inspector._get_next_id())
+
+        threads = [threading.Thread(target=worker, args=(out,)) for out in results]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        all_ids = [i for out in results for i in out]
+        assert len(set(all_ids)) == len(all_ids)
+        for out in results:
+            assert out == sorted(out)
+        inspector.close()
+
+    def test_new_slab_when_exhausted(self):
+        """Test a thread claims a fresh slab after using up its current one."""
+        from aidefense.runtime.agentsec.inspectors import api_mcp
+
+        inspector = MCPInspector(api_key=API_KEY_64, endpoint="https://test.example.com")
+        with patch.object(api_mcp, "_ID_SLAB_SIZE", 2):
+            inspector._id_slabs = iter([0, 10, 20])
+            assert [inspector._get_next_id() for _ in range(5)] == [1, 2, 11, 12, 21]
+        inspector.close()
+
+
+class TestMCPInspectorShouldRetry:
+    """Test retry classification of transport errors."""
+
+    def test_transient_errors_retried(self):
+        """Test timeouts and connection errors from every transport are retried."""
+        import asyncio
+
+        inspector = MCPInspector(api_key=API_KEY_64, endpoint="https://test.example.com")
+        for error in (
+            requests.exceptions.Timeout("t"),
+            requests.exceptions.ConnectionError("c"),
+            aiohttp.ClientConnectionError("c"),
+            asyncio.TimeoutError(),
+            httpx.ConnectError("c"),
+        ):
+            assert inspector._should_retry(error) is True
+        assert inspector._should_retry(ValueError("nope")) is False
+
+    def test_requests_http_error_status_codes(self):
+        """Test requests HTTPError with an error response honours retry_status_codes."""
+        inspector = MCPInspector(api_key=API_KEY_64, endpoint="https://test.example.com")
+        response = requests.Response()
+        response.status_code = 503
+        assert inspector._should_retry(requests.exceptions.HTTPError(response=response)) is True
+        response.status_code = 400
+        assert inspector._should_retry(requests.exceptions.HTTPError(response=response)) is False
+
+
+class TestMCPInspectorBackoff:
+    """Test decorrelated-jitter retry backoff."""
+
+    def test_backoff_disabled_returns_zero(self):
+        """Test no delay when retry_backoff is 0."""
+        inspector = MCPInspector(api_key=API_KEY_64, endpoint="https://test.example.com")
+        assert inspector._get_backoff_delay(0) == 0.0
+        assert inspector._get_backoff_delay(3, 5.0) == 0.0
+
+    def test_backoff_within_decorrelated_bounds(self):
+        """Test each delay lies between the base and three times the previous delay."""
+        inspector = MCPInspector(
+            api_key=API_KEY_64,
+            endpoint="https://test.example.com",
+            retry_backoff=0.5,
+        )
+        delay = 0.0
+        for attempt in range(20):
+            upper = max(0.5, delay) * 3
+            delay = inspector._get_backoff_delay(attempt, delay)
+            assert 0.5 <= delay <= min(upper, MCPInspector.MAX_BACKOFF_DELAY)
+
+    def test_backoff_clamped_to_max(self):
+        """Test delays never exceed MAX_BACKOFF_DELAY."""
+        inspector = MCPInspector(
+            api_key=API_KEY_64,
+            endpoint="https://test.example.com",
+            retry_backoff=20.0,
+        )
+        assert inspector._get_backoff_delay(0, 100.0) <= MCPInspector.MAX_BACKOFF_DELAY
+
 
 class TestMCPInspectorAsync:
     """Test async methods (Task Group 5)."""
@@ -479,9 +731,9 @@ class TestMCPInspectorAsync:
             endpoint="https://test.example.com",
             fail_open=True,
         )
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client.inspect_tool_call.side_effect = httpx.ConnectError("Connection failed")
-        with patch.object(inspector, "_get_mcp_client", return_value=mock_client):
+        with patch.object(inspector, "_get_async_mcp_client", AsyncMock(return_value=mock_client)):
             decision = await inspector.ainspect_request(
                 tool_name="test_tool",
                 arguments={},
@@ -498,9 +750,9 @@ class TestMCPInspectorAsync:
             api_key=API_KEY_64,
             endpoint="https://test.example.com",
         )
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client.inspect.return_value = _mcp_allow()
-        with patch.object(inspector, "_get_mcp_client", return_value=mock_client):
+        with patch.object(inspector, "_get_async_mcp_client", AsyncMock(return_value=mock_client)):
             decision = await inspector.ainspect_request(
                 tool_name="code_review_prompt",
                 arguments={"language": "python"},
@@ -517,9 +769,9 @@ class TestMCPInspectorAsync:
             api_key=API_KEY_64,
             endpoint="https://test.example.com",
         )
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client.inspect_resource_read.return_value = _mcp_allow()
-        with patch.object(inspector, "_get_mcp_client", return_value=mock_client):
+        with patch.object(inspector, "_get_async_mcp_client", AsyncMock(return_value=mock_client)):
             decision = await inspector.ainspect_request(
                 tool_name="file:///config.yaml",
                 arguments={},
@@ -528,3 +780,191 @@ class TestMCPInspectorAsync:
             )
             assert decision.action == "allow"
         inspector.close()
+
+    @pytest.mark.asyncio
+    async def test_ainspect_request_awaits_async_client(self):
+        """Test ainspect_request awaits the async client instead of using a worker thread."""
+        inspector = MCPInspector(
+            api_key=API_KEY_64,
+            endpoint="https://test.example.com",
+        )
+        mock_client = AsyncMock()
+        mock_client.inspect_tool_call.return_value = _mcp_block()
+        with patch.object(inspector, "_get_async_mcp_client", AsyncMock(return_value=mock_client)), \
+                patch.object(inspector, "_get_mcp_client") as sync_client, \
+                patch("asyncio.to_thread") as to_thread:
+            decision = await inspector.ainspect_request(
+                tool_name="test_tool",
+                arguments={"q": "x"},
+                metadata={},
+            )
+            assert decision.action == "block"
+            mock_client.inspect_tool_call.assert_awaited_once()
+            sync_client.assert_not_called()
+            to_thread.assert_not_called()
+        inspector.close()
+
+    @pytest.mark.asyncio
+    async def test_ainspect_response_retries_with_asyncio_sleep(self):
+        """Test ainspect_response retries network errors using asyncio.sleep."""
+        inspector = MCPInspector(
+            api_key=API_KEY_64,
+            endpoint="https://test.example.com",
+            retry_total=2,
+            retry_backoff=0.5,
+        )
+        mock_client = AsyncMock()
+        mock_client.serialize_message = MagicMock(return_value=b"{}")
+        mock_client.inspect_raw.side_effect = [
+            aiohttp.ClientConnectionError("reset"),
+            _mcp_allow(),
+        ]
+        with patch.object(inspector, "_get_async_mcp_client", AsyncMock(return_value=mock_client)), \
+                patch("asyncio.sleep", new_callable=AsyncMock) as sleep, \
+                patch("time.sleep") as time_sleep:
+            decision = await inspector.ainspect_response(
+                tool_name="test_tool",
+                arguments={},
+                result="ok",
+                metadata={},
+            )
+            assert decision.action == "allow"
+            assert mock_client.inspect_raw.await_count == 2
+            mock_client.serialize_message.assert_called_once()
+            sleep.assert_awaited_once()
+            assert 0.5 <= sleep.await_args.args[0] <= 1.5
+            time_sleep.assert_not_called()
+        inspector.close()
+
+    @pytest.mark.asyncio
+    async def test_async_client_reused_within_loop(self):
+        """Test the async client is created once per event loop and closed by aclose."""
+        inspector = MCPInspector(
+            api_key=API_KEY_64,
+            endpoint="https://test.example.com",
+        )
+        first = await inspector._get_async_mcp_client()
+        second = await inspector._get_async_mcp_client()
+        assert first is second
+        assert first.endpoint == "https://test.example.com/api/v1/inspect/mcp"
+        await inspector.aclose()
+        assert first._request_handler._session.closed
+        third = await inspector._get_async_mcp_client()
+        assert third is not first
+        await inspector.aclose()
+
+    def test_async_client_per_loop_closed_at_loop_shutdown(self):
+        """Test each asyncio.run gets its own async client, closed when the loop shuts down."""
+        import asyncio
+
+        inspector = MCPInspector(
+            api_key=API_KEY_64,
+            endpoint="https://test.example.com",
+        )
+        first = asyncio.run(inspector._get_async_mcp_client())
+        second = asyncio.run(inspector._get_async_mcp_client())
+        assert first is not second
+        assert first._request_handler._session.closed
+        assert second._request_handler._session.closed
+        inspector.close()
+
+    def test_sync_close_closes_async_client(self):
+        """Test close() from sync code closes an async client whose loop is still open."""
+        import asyncio
+
+        inspector = MCPInspector(
+            api_key=API_KEY_64,
+            endpoint="https://test.example.com",
+        )
+        loop = asyncio.new_event_loop()
+        try:
+            client = loop.run_until_complete(inspector._get_async_mcp_client())
+            inspector.close()
+            assert client._request_handler._session.closed
+        finally:
+            loop.close()
+
+
+class TestMCPInspectorInspectMany:
+    """Test concurrent inspection of fanned-out tool calls."""
+
+    @pytest.mark.asyncio
+    async def test_ainspect_many_runs_concurrently_in_order(self):
+        """Test ainspect_many overlaps inspections and keeps result order."""
+        import asyncio
+
+        inspector = MCPInspector(api_key=API_KEY_64, endpoint="https://test.example.com")
+        in_flight = 0
+        peak = 0
+
+        async def fake_send(tool_name, arguments, method):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return _mcp_block() if tool_name == "rm" else _mcp_allow()
+
+        with patch.object(inspector, "_asend_request", side_effect=fake_send) as send:
+            decisions = await inspector.ainspect_many([
+                {"tool_name": "ls", "arguments": {"path": "/"}},
+                {"tool_name": "rm", "arguments": {"path": "/"}},
+                {"tool_name": "file:///a", "method": "resources/read"},
+            ])
+
+        assert [d.action for d in decisions] == ["allow", "block", "allow"]
+        assert peak == 3
+        assert send.call_args_list[2].args == ("file:///a", {}, "resources/read")
+        inspector.close()
+
+    @pytest.mark.asyncio
+    async def test_ainspect_many_single_call(self):
+        """Test a single call is inspected directly."""
+        inspector = MCPInspector(api_key=API_KEY_64, endpoint="https://test.example.com")
+        with patch.object(inspector, "_asend_request", AsyncMock(return_value=_mcp_allow())):
+            decisions = await inspector.ainspect_many([{"tool_name": "ls"}])
+        assert [d.action for d in decisions] == ["allow"]
+        inspector.close()
+
+
+class TestMCPInspectorWarmup:
+    """Test opt-in connection warmup."""
+
+    def test_warmup_skipped_without_api(self):
+        """Test warmup is a no-op when no API is configured."""
+        inspector = MCPInspector(api_key=API_KEY_64, endpoint=None)
+        inspector.endpoint = None
+        with patch.object(inspector, "_get_mcp_client") as get_client:
+            assert inspector.warmup() is False
+            get_client.assert_not_called()
+
+    def test_warmup_heads_endpoint(self):
+        """Test warmup sends a HEAD through the inspection client's session."""
+        inspector = MCPInspector(api_key=API_KEY_64, endpoint="https://test.example.com")
+        mock_client = MagicMock()
+        mock_client.endpoint = "https://test.example.com/api/v1/inspect/mcp"
+        with patch.object(inspector, "_get_mcp_client", return_value=mock_client):
+            assert inspector.warmup(timeout=1.5) is True
+        mock_client._request_handler._session.head.assert_called_once_with(
+            "https://test.example.com/api/v1/inspect/mcp", timeout=1.5
+        )
+        inspector.close()
+
+    def test_warmup_swallows_errors(self):
+        """Test warmup failures never propagate."""
+        inspector = MCPInspector(api_key=API_KEY_64, endpoint="https://test.example.com")
+        mock_client = MagicMock()
+        mock_client._request_handler._session.head.side_effect = httpx.ConnectError("down")
+        with patch.object(inspector, "_get_mcp_client", return_value=mock_client):
+            assert inspector.warmup() is False
+        inspector.close()
+
+    @pytest.mark.asyncio
+    async def test_awarmup_swallows_errors(self):
+        """Test async warmup failures never propagate."""
+        inspector = MCPInspector(api_key=API_KEY_64, endpoint="https://test.example.com")
+        with patch.object(
+            inspector, "_get_async_mcp_client", AsyncMock(side_effect=aiohttp.ClientConnectionError("down"))
+        ):
+            assert await inspector.awarmup() is False
+        await inspector.aclose()
@@ -1,7 +1,7 @@
 """Unit tests for the Mistral client patcher."""
 
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 from aidefense.runtime.agentsec.patchers.mistral import (
     patch_mistral,
@@ -14,6 +14,7 @@ from aidefense.runtime.agentsec.decision import Decision
 from aidefense.runtime.agentsec import _state
 from aidefense.runtime.agentsec._context import clear_inspection_context
 from aidefense.runtime.agentsec.patchers import reset_registry
+from aidefense.runtime.agentsec.patchers import mistral as mistral_module
 
 
 @pytest.fixture(autouse=True)
@@ -22,7 +23,6 @@ def reset_state():
     _state.reset()
     reset_registry()
     clear_inspection_context()
-    import aidefense.runtime.agentsec.patchers.mistral as mistral_module
     mistral_module._inspector = None
     yield
     _state.reset()
@@ -34,29 +34,51 @@ def reset_state():
 class TestMistralNormalization:
     """Test message normalization for Mistral/OpenAI-style formats."""
 
-    def test_normalize_dict_messages(self):
-        messages = [
-            {"role": "user", "content": "Hello"},
-            {"role": "assistant", "content": "Hi there"},
-        ]
+    @pytest.mark.parametrize(
+        "messages,expected",
+        [
+            pytest.param(
+                [{"role": "user", "content": "Hello"}, {"role": "assistant", "content": "Hi there"}],
+                [("user", "Hello"), ("assistant", "Hi there")],
+                id="dict_messages",
+            ),
+            pytest.param(
+                [{"role": "user", "content": "Hi"}, {"role": "tool", "content": "tool result"}],
+                [("user", "Hi")],
+                id="skips_tool_role",
+            ),
+            pytest.param(
+                [
+                    MagicMock(
+                        role="user",
+                        content=[{"text": "a"}, "b", MagicMock(spec=["text"], text="from object"), {"type": "image"}, object()],
+                    ),
+                    MagicMock(role="function", content="ignored"),
+                ],
+                [("user", "a\nb\nfrom object")],
+                id="object_messages_with_content_blocks",
+            ),
+            pytest.param([], [], id="empty_list"),
+            pytest.param(None, [], id="none"),
+            pytest.param("not a list", [], id="not_a_list"),
+        ],
+    )
+    def test_normalize_messages(self, messages, expected):
         result = _normalize_messages(messages)
-        assert len(result) == 2
-        assert result[0]["role"] == "user" and result[0]["content"] == "Hello"
-        assert result[1]["role"] == "assistant" and result[1]["content"] == "Hi there"
+        assert [(m["role"], m["content"]) for m in result] == expected
+
+    def test_gateway_serialization_matches_normalization(self):
+        from aidefense.runtime.agentsec.patchers.mistral import _serialize_messages_for_gateway
 
-    def test_normalize_skips_tool_role(self):
         messages = [
-            {"role": "user", "content": "Hi"},
-            {"role": "tool", "content": "tool result"},
+            {"role": "system", "content": "Be brief"},
+            {"role": "tool", "content": "dropped"},
+            MagicMock(role="user", content=[{"text": "a"}, "b"]),
+        ]
+        assert _serialize_messages_for_gateway(messages) == [
+            {"role": "system", "content": "Be brief"},
+            {"role": "user", "content": "a\nb"},
         ]
-        result = _normalize_messages(messages)
-        assert len(result) == 1
-        assert result[0]["role"] == "user"
-
-    def test_normalize_empty_or_none(self):
-        assert _normalize_messages([]) == []
-        assert _normalize_messages(None) == []
-        assert _normalize_messages("not a list") == []
 
 
 class TestMistralExtractAssistantContent:
@@ -84,11 +106,10 @@ class TestMistralExtractAssistantContent:
 class TestMistralPatcherInspection:
     """Test that complete wrapper calls inspector and enforces decision."""
 
-    @patch("aidefense.runtime.agentsec.patchers.mistral._get_inspector")
-    def test_sync_complete_calls_inspector(self, mock_get_inspector):
-        mock_inspector = MagicMock()
+    def test_sync_complete_calls_inspector(self, monkeypatch):
+        mock_inspector = Mock(spec=["inspect_conversation"])
         mock_inspector.inspect_conversation.return_value = Decision.allow(reasons=[])
-        mock_get_inspector.return_value = mock_inspector
+        monkeypatch.setattr(mistral_module, "_get_inspector", lambda: mock_inspector)
 
         _state.set_state(
             initialized=True,
@@ -98,14 +119,14 @@ class TestMistralPatcherInspection:
         )
         clear_inspection_context()
 
-        mock_wrapped = MagicMock()
+        mock_wrapped = Mock()
         mock_response = MagicMock()
         mock_response.choices = [MagicMock(message=MagicMock(content="Hi"))]
         mock_wrapped.return_value = mock_response
 
         result = _wrap_complete(
             mock_wrapped,
-            MagicMock(),
+            object(),
             (),
             {"model": "mistral-large-latest", "messages": [{"role": "user", "content": "Hello"}]},
         )
@@ -113,11 +134,10 @@ class TestMistralPatcherInspection:
         assert mock_inspector.inspect_conversation.call_count >= 1
         assert result == mock_response
 
-    @patch("aidefense.runtime.agentsec.patchers.mistral._get_inspector")
-    def test_enforce_mode_raises_on_block(self, mock_get_inspector):
-        mock_inspector = MagicMock()
+    def test_enforce_mode_raises_on_block(self, monkeypatch):
+        mock_inspector = Mock(spec=["inspect_conversation"])
         mock_inspector.inspect_conversation.return_value = Decision.block(reasons=["jailbreak"])
-        mock_get_inspector.return_value = mock_inspector
+        monkeypatch.setattr(mistral_module, "_get_inspector", lambda: mock_inspector)
 
         _state.set_state(
             initialized=True,
@@ -127,17 +147,75 @@ class TestMistralPatcherInspection:
         )
         clear_inspection_context()
 
-        mock_wrapped = MagicMock()
+        mock_wrapped = Mock()
 
         with pytest.raises(SecurityPolicyError):
             _wrap_complete(
                 mock_wrapped,
-                MagicMock(),
+                object(),
                 (),
                 {"model": "mistral-large-latest", "messages": [{"role": "user", "content": "Hello"}]},
             )
 
 
+    @patch("aidefense.runtime.agentsec.patchers.mistral._get_inspector")
+    def test_off_mode_calls_through_without_inspection(self, mock_get_inspector):
+        _state.set_state(initialized=True, api_mode_llm="off")
+        clear_inspection_context()
+
+        mock_wrapped = Mock()
+        result = _wrap_complete(
+            mock_wrapped,
+            object(),
+            (),
+            {"model": "mistral-large-latest", "messages": [{"role": "user", "content": "Hello"}]},
+        )
+
+        assert result is mock_wrapped.return_value
+        mock_get_inspector.assert_not_called()
+
+
+class TestMistralStreamingBuffer:
+    """Test the streaming wrapper's chunk buffer."""
+
+    @staticmethod
+    def _chunk(text):
+        chunk = MagicMock()
+        chunk.data.choices = [MagicMock(delta=MagicMock(content=text))]
+        return chunk
+
+    @patch("aidefense.runtime.agentsec.patchers.mistral._get_inspector")
+    def test_buffer_joined_for_final_inspection(self, mock_get_inspector):
+        from aidefense.runtime.agentsec.patchers.mistral import _MistralStreamingInspectionWrapper
+
+        mock_inspector = MagicMock()
+        mock_inspector.inspect_conversation.return_value = Decision.allow(reasons=[])
+        mock_get_inspector.return_value = mock_inspector
+        _state.set_state(initialized=True, api_mode_llm="monitor")
+        clear_inspection_context()
+
+        chunks = [self._chunk("Hel"), self._chunk("lo"), self._chunk(" world")]
+        wrapper = _MistralStreamingInspectionWrapper(iter(chunks), [{"role": "user", "content": "Hi"}], {})
+
+        assert list(wrapper) == chunks
+        assert wrapper._buffer_len == len("Hello world")
+        messages = mock_inspector.inspect_conversation.call_args[0][0]
+        assert messages[-1] == {"role": "assistant", "content": "Hello world"}
+
+    @patch("aidefense.runtime.agentsec.patchers.mistral._get_inspector")
+    def test_buffer_capped_at_max_size(self, mock_get_inspector):
+        mock_get_inspector.return_value = MagicMock()
+        with patch.object(mistral_module, "MAX_STREAMING_BUFFER_SIZE", 5):
+            wrapper = mistral_module._MistralStreamingInspectionWrapper(
+                iter([self._chunk("abc"), self._chunk("defg"), self._chunk("hij")]), [], {}
+            )
+            with patch.object(mistral_module, "_should_inspect", return_value=False):
+                list(wrapper)
+
+        assert "".join(wrapper._buffer_parts) == "abcde"
+        assert wrapper._buffer_len == 5
+
+
 class TestMistralGatewayMode:
     """Test gateway mode behavior (parity with OpenAI/Cohere)."""
 
@@ -163,3 +241,20 @@ class TestMistralPatchApply:
     def test_returns_true_when_already_patched(self):
         with patch("aidefense.runtime.agentsec.patchers.mistral.is_patched", return_value=True):
             assert patch_mistral() is True
+
+    def test_falls_back_to_flat_module_and_warms_inspector(self):
+        wrapped_modules = []
+
+        def fake_wrap(module_path, name, wrapper):
+            if module_path == "mistralai.client.chat":
+                raise ImportError(module_path)
+            wrapped_modules.append((module_path, name))
+
+        _state.set_state(initialized=True, api_mode_llm="monitor")
+        with patch.object(mistral_module, "safe_import", return_value=MagicMock()), \
+                patch.object(mistral_module.wrapt, "wrap_function_wrapper", side_effect=fake_wrap), \
+                patch.object(mistral_module, "_get_inspector") as mock_get_inspector:
+            assert patch_mistral() is True
+
+        assert wrapped_modules == [("mistralai.chat", name) for name, _ in mistral_module._MISTRAL_CHAT_TARGETS]
+        mock_get_inspector.assert_called_once()
@@ -31,8 +31,7 @@ class TestOpenAIPatcherErrorHandling:
         # Mock context and state
         with patch("aidefense.runtime.agentsec.patchers.openai._get_inspector", return_value=mock_inspector):
             with patch("aidefense.runtime.agentsec.patchers.openai._should_inspect", return_value=True):
-                with patch("aidefense.runtime.agentsec.patchers.openai.get_inspection_context") as mock_ctx:
-                    mock_ctx.return_value.metadata = {}
+                with patch("aidefense.runtime.agentsec.patchers.openai.get_inspection_metadata", return_value={}):
                     with patch("aidefense.runtime.agentsec.patchers.openai._state") as mock_state:
                         mock_state.get_llm_mode.return_value = "monitor"
                         mock_state.get_config.return_value = MagicMock(llm_fail_open=True)
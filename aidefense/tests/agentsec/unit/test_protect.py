@@ -63,6 +63,17 @@ class TestProtect:
         with pytest.raises(ValueError, match="Invalid api_mode_mcp"):
             protect(api_mode_mcp="invalid")
 
+    def test_set_state_invalid_mode_lists_sorted_choices(self):
+        """Test set_state() validation errors list choices in a stable order."""
+        from aidefense.runtime.agentsec._state import set_state
+        from aidefense.runtime.agentsec.exceptions import ConfigurationError
+        
+        with pytest.raises(ConfigurationError, match="Must be one of: enforce, monitor, off"):
+            set_state(initialized=True, api_mode_llm="invalid")
+        
+        with pytest.raises(ConfigurationError, match="Must be one of: api, gateway"):
+            set_state(initialized=True, llm_integration_mode="invalid")
+
     def test_protect_llm_rules_parameter(self):
         """Test protect() accepts api_mode_llm_rules parameter."""
         protect(
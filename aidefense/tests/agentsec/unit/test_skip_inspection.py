@@ -240,15 +240,32 @@ class TestPatcherSkipIntegration:
         
         # When not skipped and mode is enforce, should inspect
         with patch('aidefense.runtime.agentsec.patchers.openai._state') as mock_state:
-            mock_state.get_llm_mode.return_value = "enforce"
-            with patch('aidefense.runtime.agentsec.patchers.openai.get_inspection_context') as mock_ctx:
-                mock_ctx.return_value = MagicMock(done=False)
+            mock_state.is_llm_inspection_enabled.return_value = True
+            with patch('aidefense.runtime.agentsec.patchers.openai.is_inspection_done', return_value=False):
                 assert _should_inspect() is True
         
         # When skipped, should not inspect
         with skip_inspection(llm=True):
             assert _should_inspect() is False
     
+    def test_openai_should_inspect_respects_off_mode(self):
+        """Test OpenAI patcher's _should_inspect follows the configured LLM mode."""
+        from aidefense.runtime.agentsec import _state
+        from aidefense.runtime.agentsec._context import clear_inspection_context
+        from aidefense.runtime.agentsec.patchers.openai import _should_inspect
+        
+        _skip_llm.set(False)
+        clear_inspection_context()
+        try:
+            _state.set_state(initialized=True, api_mode_llm="off")
+            assert _should_inspect() is False
+            _state.set_state(initialized=True, api_mode_llm="monitor")
+            assert _should_inspect() is True
+            _state.reset()
+            assert _should_inspect() is True
+        finally:
+            _state.reset()
+    
     def test_openai_should_use_gateway_respects_skip(self):
         """Test OpenAI patcher's _should_use_gateway respects skip state."""
         from aidefense.runtime.agentsec.patchers.openai import _should_use_gateway
@@ -328,9 +345,8 @@ class TestEndToEndSkipScenarios:
             # LLM should NOT be skipped (check mode)
             from aidefense.runtime.agentsec.patchers.openai import _should_inspect as openai_should_inspect
             with patch('aidefense.runtime.agentsec.patchers.openai._state') as mock_state:
-                mock_state.get_llm_mode.return_value = "enforce"
-                with patch('aidefense.runtime.agentsec.patchers.openai.get_inspection_context') as mock_ctx:
-                    mock_ctx.return_value = MagicMock(done=False)
+                mock_state.is_llm_inspection_enabled.return_value = True
+                with patch('aidefense.runtime.agentsec.patchers.openai.is_inspection_done', return_value=False):
                     assert openai_should_inspect() is True
     
     @pytest.mark.asyncio
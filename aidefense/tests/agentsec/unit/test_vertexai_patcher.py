@@ -12,6 +12,7 @@ from aidefense.runtime.agentsec.decision import Decision
 from aidefense.runtime.agentsec import _state
 from aidefense.runtime.agentsec._context import clear_inspection_context
 from aidefense.runtime.agentsec.patchers import reset_registry
+from aidefense.runtime.agentsec.patchers import vertexai as vertexai_module
 
 
 @pytest.fixture(autouse=True)
@@ -21,7 +22,6 @@ def reset_state():
     reset_registry()
     clear_inspection_context()
     # Reset global inspector
-    import aidefense.runtime.agentsec.patchers.vertexai as vertexai_module
     vertexai_module._inspector = None
     yield
     _state.reset()
@@ -161,3 +161,19 @@ class TestVertexAIPatcherSkipConditions:
 
 
 
+
+
+class TestVertexAIStreamingBuffer:
+    """Test streaming text collection."""
+
+    def test_streaming_buffer_capped(self):
+        """Test collected text stops at MAX_STREAMING_BUFFER_SIZE across chunks."""
+        import aidefense.runtime.agentsec.patchers.vertexai as vertexai_module
+
+        chunks = [{"text": "abcd"}, {"text": "efgh"}, {"text": "ijkl"}]
+        wrapper = vertexai_module.GoogleStreamingInspectionWrapper(iter(chunks), [], {})
+        with patch.object(vertexai_module, "MAX_STREAMING_BUFFER_SIZE", 6):
+            assert list(wrapper) == chunks
+
+        assert wrapper._collected_text == ["abcd", "ef"]
+        assert wrapper._collected_size == 6
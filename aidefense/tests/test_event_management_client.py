@@ -15,6 +15,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 from datetime import datetime
 
@@ -30,7 +31,7 @@ from aidefense.management.models.event import (
 )
 from aidefense.management.models.common import Paging
 from aidefense.config import Config
-from aidefense.exceptions import ValidationError, ApiError, SDKError
+from aidefense.exceptions import ValidationError, ApiError, SDKError, ResponseParseError
 
 
 # Create a valid format dummy API key for testing
@@ -259,3 +260,162 @@ class TestEventManagementClient:
             event_client.list_events(request)
 
         assert "API Error" in str(excinfo.value)
+
+    def test_iter_events_paginates_until_exhausted(self, event_client):
+        """Test iter_events advances offset across pages and stops on a short page."""
+        pages = [
+            {
+                "events": {
+                    "items": [{"event_id": "event-1"}, {"event_id": "event-2"}],
+                    "paging": {"total": 3, "count": 2, "offset": 0},
+                }
+            },
+            {
+                "events": {
+                    "items": [{"event_id": "event-3"}],
+                    "paging": {"total": 3, "count": 1, "offset": 2},
+                }
+            },
+        ]
+        offsets = []
+
+        def fake_request(method, path, data=None):
+            offsets.append(data["offset"])
+            assert data["limit"] == 2
+            assert data["order"] == "desc"
+            return pages[len(offsets) - 1]
+
+        event_client.make_request.side_effect = fake_request
+
+        request = ListEventsRequest(order="desc")
+        events = list(event_client.iter_events(request, page_size=2))
+
+        assert [e.event_id for e in events] == ["event-1", "event-2", "event-3"]
+        assert offsets == [0, 2]
+        # The caller's request is left untouched
+        assert request.limit is None
+        assert request.offset is None
+
+    def test_iter_events_stops_at_paging_total(self, event_client):
+        """Test iter_events does not request past the reported total."""
+        event_client.make_request.return_value = {
+            "events": {
+                "items": [{"event_id": "event-1"}, {"event_id": "event-2"}],
+                "paging": {"total": 2, "count": 2, "offset": 0},
+            }
+        }
+
+        events = list(event_client.iter_events(page_size=2))
+
+        assert len(events) == 2
+        event_client.make_request.assert_called_once()
+
+    def test_iter_events_invalid_page_size(self, event_client):
+        """Test iter_events rejects non-positive page sizes."""
+        with pytest.raises(ValueError):
+            list(event_client.iter_events(page_size=0))
+
+    def test_iter_events_does_not_prefetch_by_default(self, event_client):
+        """Test iter_events only requests the next page once the current one is consumed."""
+        pages = [
+            {"events": {"items": [{"event_id": "event-1"}], "paging": {"total": 2, "count": 1, "offset": 0}}},
+            {"events": {"items": [{"event_id": "event-2"}], "paging": {"total": 2, "count": 1, "offset": 1}}},
+        ]
+        event_client.make_request.side_effect = pages
+
+        with patch("aidefense.management.events.ThreadPoolExecutor") as mock_executor:
+            for event in event_client.iter_events(page_size=1):
+                break
+
+        assert event.event_id == "event-1"
+        event_client.make_request.assert_called_once()
+        mock_executor.assert_not_called()
+
+    def test_iter_events_prefetches_next_page(self, event_client):
+        """Test the next page is requested before the current page is consumed."""
+        pages = [
+            {"events": {"items": [{"event_id": "event-1"}], "paging": {"total": 2, "count": 1, "offset": 0}}},
+            {"events": {"items": [{"event_id": "event-2"}], "paging": {"total": 2, "count": 1, "offset": 1}}},
+        ]
+        event_client.make_request.side_effect = pages
+        executors = []
+
+        def make_executor(*args, **kwargs):
+            executors.append(ThreadPoolExecutor(*args, **kwargs))
+            return executors[-1]
+
+        with patch("aidefense.management.events.ThreadPoolExecutor", side_effect=make_executor):
+            iterator = event_client.iter_events(page_size=1, prefetch=True)
+            first = next(iterator)
+            executors[0].submit(lambda: None).result()
+            assert event_client.make_request.call_count == 2
+            iterator.close()
+
+        assert first.event_id == "event-1"
+        # Closing the iterator shuts down its prefetch executor
+        with pytest.raises(RuntimeError):
+            executors[0].submit(lambda: None)
+
+    def test_get_event_is_cached(self, event_client):
+        """Test repeated get_event calls for the same event hit the cache."""
+        event_client.make_request.return_value = {"event": {"event_id": "event-123"}}
+        event_id = "456e4567-e89b-12d3-a456-426614174456"
+
+        first = event_client.get_event(event_id, expanded=True)
+        first.event_id = "mutated"
+        second = event_client.get_event(event_id, expanded=True)
+
+        # Each call gets its own copy, so callers cannot change the cached event
+        assert second.event_id == "event-123"
+        assert second is not event_client.get_event(event_id, expanded=True)
+        event_client.make_request.assert_called_once()
+
+        # A different expanded flag is a distinct cache entry
+        event_client.get_event(event_id)
+        assert event_client.make_request.call_count == 2
+
+    def test_invalidate_event(self, event_client):
+        """Test invalidate_event forces the next get_event to refetch."""
+        event_client.make_request.return_value = {"event": {"event_id": "event-123"}}
+        event_id = "456e4567-e89b-12d3-a456-426614174456"
+
+        event_client.get_event(event_id, expanded=True)
+        event_client.invalidate_event(event_id)
+        event_client.get_event(event_id, expanded=True)
+
+        assert event_client.make_request.call_count == 2
+
+    def test_list_events_body_matches_json_payload(self):
+        """Test to_body_dict matches the JSON payload encoding without a string round-trip."""
+        import json
+
+        request = ListEventsRequest(
+            limit=5,
+            start_date=datetime(2025, 1, 1),
+            sort_by=EventSortBy.event_timestamp,
+            resource_types=["MCP_SERVER"],
+        )
+
+        assert request.to_body_dict() == json.loads(request.to_body_json())
+
+    def test_iter_event_conversation_parses_lazily(self, event_client):
+        """Test iter_event_conversation yields messages without parsing ahead."""
+        event_client.make_request.return_value = {
+            "event_conversation_id": "conv-123",
+            "messages": {
+                "items": [
+                    {"message_id": "msg-1", "event_id": "event-1", "content": "hi", "direction": "inbound"},
+                    {"message_id": "msg-2"},  # invalid, only reached if consumed
+                ],
+            },
+        }
+        event_id = "456e4567-e89b-12d3-a456-426614174456"
+
+        iterator = event_client.iter_event_conversation(event_id)
+        first = next(iterator)
+
+        assert isinstance(first, EventMessage)
+        assert first.message_id == "msg-1"
+        event_client.make_request.assert_called_once_with("GET", f"events/{event_id}/conversation")
+        with pytest.raises(ResponseParseError):
+            next(iterator)
@@ -19,12 +19,12 @@ Tests for the MCP (Model Context Protocol) inspection client.
 """
 
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from aidefense.runtime.mcp_inspect import MCPInspectionClient
+from aidefense.runtime.mcp_inspect import MCPInspectionClient, AsyncMCPInspectionClient
 from aidefense.runtime.mcp_models import MCPMessage, MCPError, MCPInspectResponse, MCPInspectError
 from aidefense.runtime.models import InspectResponse, Action, Classification
-from aidefense.config import Config
+from aidefense.config import Config, AsyncConfig
 from aidefense.exceptions import ValidationError
 
 
@@ -90,6 +90,58 @@ class TestMCPInspectionClient:
         assert result.result.is_safe is True
         assert result.id == 1
 
+    def test_inspect_sends_preserialized_body(self, mcp_client, mock_request_handler):
+        """Test the JSON-RPC body is serialized once and passed as bytes."""
+        import json
+
+        mock_request_handler.request.return_value = {
+            "jsonrpc": "2.0",
+            "result": {"is_safe": True, "classifications": [], "action": "ALLOW"},
+            "id": 7,
+        }
+
+        mcp_client.inspect_tool_call(
+            tool_name="search_documentation",
+            arguments={"query": "SSL configuration"},
+            message_id=7,
+        )
+
+        kwargs = mock_request_handler.request.call_args.kwargs
+        assert "json_data" not in kwargs
+        body = json.loads(kwargs["data"])
+        assert body["method"] == "tools/call"
+        assert body["params"] == {"name": "search_documentation", "arguments": {"query": "SSL configuration"}}
+        assert body["id"] == 7
+
+    def test_serialize_message_and_inspect_raw(self, mcp_client, mock_request_handler):
+        """Test a body serialized once can be sent repeatedly via inspect_raw."""
+        mock_request_handler.request.return_value = {
+            "jsonrpc": "2.0",
+            "result": {"is_safe": True, "classifications": [], "action": "ALLOW"},
+            "id": 3,
+        }
+        message = MCPMessage(
+            jsonrpc="2.0",
+            method="tools/call",
+            params={"name": "read_file", "arguments": {}},
+            result={"content": [{"type": "text", "text": "data"}]},
+            id=3,
+        )
+
+        body = mcp_client.serialize_message(message)
+        first = mcp_client.inspect_raw(body)
+        second = mcp_client.inspect_raw(body)
+
+        assert isinstance(body, bytes)
+        assert first.result.is_safe and second.result.is_safe
+        sent = [c.kwargs["data"] for c in mock_request_handler.request.call_args_list]
+        assert sent == [body, body]
+
+    def test_serialize_message_validates(self, mcp_client):
+        """Test serialize_message rejects invalid messages before anything is sent."""
+        with pytest.raises(ValidationError):
+            mcp_client.serialize_message(MCPMessage(jsonrpc="1.0", method="tools/call", id=1))
+
     def test_inspect_resource_read(self, mcp_client, mock_request_handler):
         """Test inspecting an MCP resource read request."""
         mock_request_handler.request.return_value = {
@@ -430,3 +482,44 @@ class TestMCPClientInput:
         )
 
         assert result.result.is_safe is True
+
+
+class TestAsyncMCPInspectionClient:
+    """Tests for the AsyncMCPInspectionClient."""
+
+    def test_requires_async_config(self):
+        """Test a sync Config is rejected."""
+        with pytest.raises(ValueError):
+            AsyncMCPInspectionClient(api_key=TEST_API_KEY, config=Config())
+
+    @pytest.mark.asyncio
+    async def test_inspect_tool_call(self):
+        """Test inspect_tool_call awaits the async request handler with a preserialized body."""
+        client = AsyncMCPInspectionClient(api_key=TEST_API_KEY, config=AsyncConfig())
+        client._request_handler = MagicMock()
+        client._request_handler.request = AsyncMock(return_value={
+            "jsonrpc": "2.0",
+            "result": {"is_safe": True, "classifications": [], "action": "ALLOW"},
+            "id": 7,
+        })
+
+        result = await client.inspect_tool_call(
+            tool_name="search_docs",
+            arguments={"query": "ssl"},
+            message_id=7,
+        )
+
+        assert result.result.is_safe is True
+        assert result.id == 7
+        call_kwargs = client._request_handler.request.call_args.kwargs
+        assert call_kwargs["url"].endswith("/api/v1/inspect/mcp")
+        assert "json_data" not in call_kwargs
+        assert isinstance(call_kwargs["data"], bytes)
+        assert b'"tools/call"' in call_kwargs["data"]
+
+    @pytest.mark.asyncio
+    async def test_inspect_requires_mcp_message(self):
+        """Test inspect raises error for non-MCPMessage input."""
+        client = AsyncMCPInspectionClient(api_key=TEST_API_KEY, config=AsyncConfig())
+        with pytest.raises(ValidationError):
+            await client.inspect({"not": "a message"})
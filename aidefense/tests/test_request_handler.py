@@ -101,6 +101,28 @@ def test_request_success(mock_request):
     assert kwargs["timeout"] == 30
 
 
+@patch("requests.Session.request")
+def test_request_with_preserialized_body(mock_request):
+    # Pre-serialized bodies are sent as-is instead of being JSON-encoded again
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {"success": True}
+    mock_request.return_value = mock_response
+
+    handler = RequestHandler(Config())
+    result = handler.request(
+        method="POST",
+        url="https://api.example.com",
+        auth=None,
+        data=b'{"key":"value"}',
+    )
+
+    assert result == {"success": True}
+    args, kwargs = mock_request.call_args
+    assert kwargs["data"] == b'{"key":"value"}'
+    assert "json" not in kwargs
+
+
 @patch("requests.Session.request")
 def test_request_with_auth(mock_request):
     # Mock response
@@ -16,9 +16,10 @@
 
 import pytest
 import base64
-from aidefense.runtime.utils import to_base64_bytes, convert, ensure_base64_body
+from aidefense.runtime.utils import to_base64_bytes, convert, ensure_base64_body, json_dumps_bytes
 from aidefense.runtime.constants import HTTP_BODY
 from dataclasses import dataclass
+from datetime import datetime
 from enum import Enum
 
 
@@ -117,3 +118,12 @@ def test_ensure_base64_body_with_none_dict():
     # Test with None dict
     ensure_base64_body(None)
     # Should not raise an exception
+
+
+def test_json_dumps_bytes_compact_stdlib_encoding():
+    assert json_dumps_bytes({"a": [1, "é"], "b": float("nan")}) == b'{"a":[1,"\\u00e9"],"b":NaN}'
+
+
+def test_json_dumps_bytes_rejects_unserializable_values():
+    with pytest.raises(TypeError):
+        json_dumps_bytes({"when": datetime(2025, 1, 1)})